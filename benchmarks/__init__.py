@@ -0,0 +1,4 @@
+"""Offline end-to-end benchmarks: record a real run, replay it locally.
+
+See benchmarks/README.md for usage.
+"""
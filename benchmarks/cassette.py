@@ -0,0 +1,125 @@
+"""Cassette: recorded search, web and Claude responses for one research run.
+
+A cassette is a single JSON file with one section per boundary:
+
+    anthropic       request key -> response message JSON (+ latency, stream flag)
+    search          "<provider>|<query>|<max_results>" -> results
+    fetch           url -> FetchedPage fields (or null for a failed fetch)
+    jina            url -> ExtractedContent fields (or null)
+    tavily_extract  url -> ExtractedContent fields
+
+Every entry carries the latency observed while recording so replay can
+reproduce the run's timing profile.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+SECTIONS = ("anthropic", "search", "fetch", "jina", "tavily_extract")
+
+
+def _digest(value: Any) -> str:
+    raw = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:20]
+
+
+def anthropic_key(request: dict) -> str:
+    """Exact-match key for a Messages request (model + system + messages)."""
+    return _digest({
+        "model": request.get("model"),
+        "system": request.get("system"),
+        "messages": request.get("messages"),
+    })
+
+
+def system_key(request: dict) -> str:
+    """Loose key: requests sharing a system prompt (i.e. the same call site)."""
+    return _digest({"model": request.get("model"), "system": request.get("system")})
+
+
+def search_key(provider: str, query: str, max_results: int) -> str:
+    return f"{provider}|{query}|{max_results}"
+
+
+@dataclass
+class Cassette:
+    """Recorded responses plus hit/miss counters for replay."""
+
+    query: str = ""
+    mode: str = ""
+    entries: dict[str, dict[str, dict]] = field(
+        default_factory=lambda: {s: {} for s in SECTIONS}
+    )
+    hits: dict[str, int] = field(default_factory=lambda: {s: 0 for s in SECTIONS})
+    misses: dict[str, int] = field(default_factory=lambda: {s: 0 for s in SECTIONS})
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+        self._by_system: dict[str, deque[dict]] | None = None
+
+    # -- recording ---------------------------------------------------------
+
+    def put(self, section: str, key: str, entry: dict) -> None:
+        with self._lock:
+            self.entries[section][key] = entry
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"query": self.query, "mode": self.mode, **self.entries}
+        path.write_text(json.dumps(data, indent=1, ensure_ascii=False), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path) -> "Cassette":
+        data = json.loads(path.read_text(encoding="utf-8"))
+        cassette = cls(query=data.get("query", ""), mode=data.get("mode", ""))
+        for section in SECTIONS:
+            cassette.entries[section] = dict(data.get(section, {}))
+        return cassette
+
+    # -- replay ------------------------------------------------------------
+
+    def get(self, section: str, key: str) -> dict | None:
+        """Look up an entry, counting the hit or miss."""
+        with self._lock:
+            entry = self.entries[section].get(key)
+            if entry is None:
+                self.misses[section] += 1
+            else:
+                self.hits[section] += 1
+            return entry
+
+    def get_anthropic(self, request: dict) -> dict | None:
+        """Exact request match, else the next unused response for the same call site.
+
+        Prompts embed dates and upstream outputs, so a replayed run rarely
+        reproduces every request byte-for-byte; falling back to responses
+        recorded for the same system prompt keeps the workload shape.
+        """
+        with self._lock:
+            section = self.entries["anthropic"]
+            entry = section.get(anthropic_key(request))
+            if entry is None:
+                if self._by_system is None:
+                    self._by_system = {}
+                    for recorded in section.values():
+                        self._by_system.setdefault(recorded["system_key"], deque()).append(recorded)
+                queue = self._by_system.get(system_key(request))
+                if queue:
+                    entry = queue[0]
+                    queue.rotate(-1)
+            if entry is None:
+                self.misses["anthropic"] += 1
+            else:
+                self.hits["anthropic"] += 1
+            return entry
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {"hits": dict(self.hits), "misses": dict(self.misses)}
@@ -0,0 +1,90 @@
+"""Startup-cost gate: import time of the CLI versus the full pipeline.
+
+    python -m benchmarks.importtime                 # fail if the CLI import regresses
+    python -m benchmarks.importtime --max-ratio 0.3
+
+Informational commands (--list, --cost, --list-contexts, --critique-history)
+only need ``research_agent.cli``. The pipeline's dependencies (anthropic,
+httpx, trafilatura, the search clients) load when a research run builds
+its agent. This script times both imports with ``python -X importtime``.
+It fails when importing the CLI costs more than ``--max-ratio`` of
+importing ``research_agent.agent``, or when a heavy module shows up in the
+CLI's import graph.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+CLI_MODULE = "research_agent.cli"
+FULL_MODULE = "research_agent.agent"
+HEAVY_MODULES = ("anthropic", "httpx", "trafilatura", "ddgs", "tavily", "lxml")
+DEFAULT_RUNS = 5
+DEFAULT_MAX_RATIO = 0.5
+
+
+def import_profile(module: str) -> tuple[float, set[str]]:
+    """Cumulative import seconds of ``module`` and every module it imported."""
+    repo_root = Path(__file__).resolve().parent.parent
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        filter(None, [str(repo_root), os.environ.get("PYTHONPATH")])
+    ))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    # Lines look like: "import time:   self [us] | cumulative | imported package"
+    cumulative_us = 0
+    loaded: set[str] = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        loaded.add(name)
+        if name == module:
+            cumulative_us = int(cumulative)
+    return cumulative_us / 1e6, loaded
+
+
+def best_import_time(module: str, runs: int) -> tuple[float, set[str]]:
+    """Median of ``runs`` cold imports, plus the modules loaded."""
+    timings = []
+    loaded: set[str] = set()
+    for _ in range(runs):
+        seconds, loaded = import_profile(module)
+        timings.append(seconds)
+    return statistics.median(timings), loaded
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Check CLI import time against the full pipeline")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--max-ratio", type=float, default=DEFAULT_MAX_RATIO,
+                        help="Fail when the CLI import exceeds this fraction of the full import")
+    args = parser.parse_args(argv)
+
+    cli_s, cli_loaded = best_import_time(CLI_MODULE, args.runs)
+    full_s, _ = best_import_time(FULL_MODULE, args.runs)
+    ratio = cli_s / full_s if full_s else 0.0
+    print(f"{CLI_MODULE:<22} {cli_s * 1e3:>8.1f} ms  ({len(cli_loaded)} modules)")
+    print(f"{FULL_MODULE:<22} {full_s * 1e3:>8.1f} ms")
+    print(f"ratio {ratio:.2f} (max {args.max_ratio:.2f})")
+
+    heavy = sorted(m for m in cli_loaded if m.split(".")[0] in HEAVY_MODULES)
+    if heavy:
+        print(f"FAIL: {CLI_MODULE} imports {', '.join(heavy[:5])}", file=sys.stderr)
+        return 1
+    if ratio > args.max_ratio:
+        print(f"FAIL: CLI import is {ratio:.2f}x the full import", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
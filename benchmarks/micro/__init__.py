@@ -0,0 +1 @@
+"""Microbenchmarks for pure-Python hot paths (run with pytest benchmarks/micro)."""
@@ -0,0 +1,170 @@
+"""Microbenchmark fixture with baseline regression checks.
+
+Provides a ``benchmark`` fixture with the calling convention of
+pytest-benchmark (``benchmark(fn, *args, **kwargs)`` returns fn's result),
+without the dependency. Each benchmark's best per-call time is divided by
+a fixed pure-Python reference workload timed in the same session, so
+baselines recorded on one machine stay comparable on another.
+
+``memory_benchmark`` has the same calling convention and records the
+tracemalloc peak of one call instead (in bytes, no normalization).
+
+    python -m pytest benchmarks/micro                      # check against baseline
+    python -m pytest benchmarks/micro --micro-save         # rewrite the baseline
+    python -m pytest benchmarks/micro --micro-threshold 2  # allow 2x slowdowns
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+# Each timing round runs the function enough times to take at least this long
+MIN_ROUND_S = 0.02
+ROUNDS = 5
+DEFAULT_THRESHOLD = 1.5
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("micro", "microbenchmarks")
+    group.addoption("--micro-save", action="store_true",
+                    help="Write results to benchmarks/micro/baseline.json")
+    group.addoption("--micro-threshold", type=float, default=DEFAULT_THRESHOLD,
+                    help="Fail when a benchmark is this many times slower than baseline")
+
+
+def _reference_workload() -> int:
+    total = 0
+    for i in range(20_000):
+        total += i * i % 7
+    return len(" ".join(str(i) for i in range(2_000)).split()) + total
+
+
+def _best_per_call(fn: Callable[[], Any]) -> float:
+    """Best-of-ROUNDS per-call time, auto-scaling loops per round."""
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= MIN_ROUND_S or loops >= 1_000_000:
+            break
+        loops *= 10 if elapsed < MIN_ROUND_S / 10 else 2
+    best = elapsed / loops
+    for _ in range(ROUNDS - 1):
+        started = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        best = min(best, (time.perf_counter() - started) / loops)
+    return best
+
+
+class _Session:
+    def __init__(self, config: pytest.Config):
+        # pytest_addoption in a non-root conftest only runs when pytest is
+        # started from or pointed directly at benchmarks/micro
+        self.save = config.getoption("--micro-save", False)
+        self.threshold = config.getoption("--micro-threshold", DEFAULT_THRESHOLD)
+        self.reference_s = _best_per_call(_reference_workload)
+        self.baseline: dict = {}
+        if BASELINE_PATH.exists() and not self.save:
+            self.baseline = json.loads(BASELINE_PATH.read_text())
+        self.results: dict[str, dict[str, float]] = {}
+
+
+@pytest.fixture(scope="session")
+def _micro_session(request: pytest.FixtureRequest) -> _Session:
+    session = _Session(request.config)
+    yield session
+    if session.save:
+        BASELINE_PATH.write_text(json.dumps({
+            "reference_s": session.reference_s,
+            "results": dict(sorted(session.results.items())),
+        }, indent=2) + "\n")
+
+
+class Benchmark:
+    """Times a callable and checks it against the stored baseline."""
+
+    metric = "normalized"
+
+    def __init__(self, name: str, session: _Session):
+        self.name = name
+        self._session = session
+
+    def __call__(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        result = fn(*args, **kwargs)  # warm-up, and the value returned to the test
+        per_call = _best_per_call(lambda: fn(*args, **kwargs))
+        self._check({
+            "per_call_s": per_call, "normalized": per_call / self._session.reference_s,
+        }, f"{per_call * 1e3:.3f} ms/call")
+        return result
+
+    def _check(self, result: dict[str, float], description: str) -> None:
+        self._session.results[self.name] = result
+        baseline = self._session.baseline.get("results", {}).get(self.name)
+        if baseline and self.metric in baseline:
+            ratio = result[self.metric] / baseline[self.metric]
+            result["ratio"] = ratio
+            if ratio > self._session.threshold:
+                pytest.fail(
+                    f"{self.name}: {description} is {ratio:.2f}x the "
+                    f"baseline (threshold {self._session.threshold:.2f}x)",
+                    pytrace=False,
+                )
+
+
+class MemoryBenchmark(Benchmark):
+    """Records the tracemalloc peak of one call and checks it against baseline."""
+
+    metric = "peak_bytes"
+
+    def __call__(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        tracemalloc.start()
+        try:
+            result = fn(*args, **kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self._check({"peak_bytes": peak}, f"{peak / 1024:.0f} KiB peak")
+        return result
+
+
+@pytest.fixture
+def benchmark(request: pytest.FixtureRequest, _micro_session: _Session) -> Benchmark:
+    return Benchmark(request.node.name, _micro_session)
+
+
+@pytest.fixture
+def memory_benchmark(request: pytest.FixtureRequest, _micro_session: _Session) -> MemoryBenchmark:
+    return MemoryBenchmark(request.node.name, _micro_session)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus: int, config: pytest.Config) -> None:
+    session = getattr(config, "_micro_session_ref", None)
+    if session is None or not session.results:
+        return
+    terminalreporter.section("microbenchmarks")
+    terminalreporter.write_line(f"{'benchmark':<45} {'result':>14} {'vs base':>8}")
+    for name, result in sorted(session.results.items()):
+        ratio = result.get("ratio")
+        ratio_text = f"{ratio:.2f}x" if ratio is not None else "new"
+        if "peak_bytes" in result:
+            value = f"{result['peak_bytes'] / 1024:.0f} KiB"
+        else:
+            value = f"{result['per_call_s'] * 1e3:.3f} ms"
+        terminalreporter.write_line(f"{name:<45} {value:>14} {ratio_text:>8}")
+    if session.save:
+        terminalreporter.write_line(f"baseline written to {BASELINE_PATH}")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _expose_session(request: pytest.FixtureRequest, _micro_session: _Session) -> None:
+    request.config._micro_session_ref = _micro_session
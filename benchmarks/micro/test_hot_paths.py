@@ -0,0 +1,132 @@
+"""Microbenchmarks for pure-Python functions that run per chunk or per source.
+
+Inputs are sized like the worst cases the pipeline sees: 5 MB pages (the
+extractor's size cap), 200 summaries in a synthesis prompt, hundreds of
+search results and scoring responses.
+"""
+
+import random
+
+import pytest
+
+from research_agent.query_validation import has_near_duplicate, meaningful_words
+from research_agent.relevance import _parse_score_response
+from research_agent.sanitize import sanitize_content
+from research_agent.search import SearchResult, filter_blocked_urls
+from research_agent.summarize import CHUNK_TOKENS, Summary, _chunk_text
+from research_agent.synthesize import _build_sources_context
+from research_agent.token_budget import truncate_to_budget
+
+from benchmarks.synthetic import page_html, page_markdown
+
+PAGE_BYTES = 5 * 1024 * 1024
+
+
+def _repeat_to(text: str, size: int) -> str:
+    return (text * (size // len(text) + 1))[:size]
+
+
+@pytest.fixture(scope="module")
+def html_page() -> str:
+    """5 MB of HTML with tags and entities, as fetched pages arrive."""
+    unit = page_html("https://site1.bench.example/a/0") + "<p>Fish &amp; chips &lt;3 &#169; 2024</p>"
+    return _repeat_to(unit, PAGE_BYTES)
+
+
+@pytest.fixture(scope="module")
+def markdown_page() -> str:
+    """5 MB of extracted markdown text."""
+    return _repeat_to(page_markdown("https://site2.bench.example/b/0", sections=12), PAGE_BYTES)
+
+
+@pytest.fixture(scope="module")
+def summaries() -> list[Summary]:
+    """200 chunk summaries across 80 sources, with repeats like overlapping chunks."""
+    rng = random.Random(0)
+    result = []
+    for i in range(200):
+        source = rng.randrange(80)
+        body = page_markdown(f"https://site{source}.bench.example/s/{i % 3}", sections=1)
+        result.append(Summary(
+            url=f"https://site{source}.bench.example/s",
+            title=f"Source {source} <b>&amp; co</b>",
+            summary=body[:1200],
+        ))
+    return result
+
+
+def test_sanitize_content_5mb_html(benchmark, html_page):
+    result = benchmark(sanitize_content, html_page)
+    assert "<" not in result
+
+
+def test_sanitize_content_chunk(benchmark, markdown_page):
+    chunk = markdown_page[:4000]
+    assert benchmark(sanitize_content, chunk)
+
+
+def test_chunk_text_5mb(benchmark, markdown_page):
+    chunks = benchmark(_chunk_text, markdown_page, chunk_tokens=CHUNK_TOKENS)
+    assert chunks
+
+
+def test_chunk_text_unbounded_chunks(benchmark, markdown_page):
+    page = markdown_page[:200_000]
+    chunks = benchmark(_chunk_text, page, max_chunks=1000, chunk_tokens=CHUNK_TOKENS)
+    assert len(chunks) > 10
+
+
+def test_build_sources_context_200(benchmark, summaries):
+    context = benchmark(_build_sources_context, summaries)
+    assert context.count("<source id=") <= 80
+
+
+def test_truncate_to_budget_5mb(benchmark, markdown_page):
+    assert "[Content truncated" in benchmark(truncate_to_budget, markdown_page, 8000)
+
+
+def test_truncate_to_budget_fits(benchmark, markdown_page):
+    text = markdown_page[:8000]
+    assert benchmark(truncate_to_budget, text, 100_000) == text
+
+
+def test_parse_score_response_batch(benchmark):
+    rng = random.Random(1)
+    responses = [
+        f"SCORE: {rng.randint(1, 5)}\nEXPLANATION: The source covers pricing in detail {i}."
+        for i in range(200)
+    ]
+
+    def parse_all():
+        return [_parse_score_response(r) for r in responses]
+
+    assert len(benchmark(parse_all)) == 200
+
+
+def test_meaningful_words_near_duplicates(benchmark):
+    rng = random.Random(2)
+    vocab = page_markdown("https://site3.bench.example/q/0").lower().split()
+    candidates = [" ".join(rng.choices(vocab, k=8)) for _ in range(50)]
+
+    def dedupe():
+        kept: list[str] = []
+        for query in candidates:
+            if not has_near_duplicate(meaningful_words(query), kept):
+                kept.append(query)
+        return kept
+
+    assert benchmark(dedupe)
+
+
+def test_filter_blocked_urls_1000(benchmark):
+    rng = random.Random(3)
+    results = [
+        SearchResult(
+            title=f"r{i}", url=f"https://www{i % 7}.site{rng.randrange(300)}.bench.example/p/{i}",
+            snippet="",
+        )
+        for i in range(1000)
+    ]
+    blocked = tuple(f"site{n}.bench.example" for n in range(0, 300, 6))
+    kept = benchmark(filter_blocked_urls, results, blocked)
+    assert 0 < len(kept) < len(results)
@@ -0,0 +1,46 @@
+"""Memory footprint of the pipeline's per-source records.
+
+A synthetic 1,000-source run: one search result, fetched page, extracted
+content, relevance score and three chunk summaries per source, then the
+relevance aggregation over them. Text is built before measuring, so the
+peak reflects the records and containers, not the page bodies.
+"""
+
+import pytest
+
+from research_agent.extract import ExtractedContent
+from research_agent.fetch import FetchedPage
+from research_agent.relevance import SourceScore, _aggregate_by_source
+from research_agent.search import SearchResult
+from research_agent.summarize import Summary
+
+SOURCES = 1000
+CHUNKS_PER_SOURCE = 3
+
+
+@pytest.fixture(scope="module")
+def texts():
+    urls = [f"https://site{i}.bench.example/page" for i in range(SOURCES)]
+    body = "Pricing and demand data for the regional market. " * 20
+    return urls, body, body[:300], body[:600]
+
+
+def _run(urls, body, snippet, summary):
+    results = [SearchResult(title="Title", url=u, snippet=snippet) for u in urls]
+    pages = [FetchedPage(url=u, html=body, status_code=200) for u in urls]
+    contents = [ExtractedContent(url=u, title="Title", text=body) for u in urls]
+    summaries = [
+        Summary(url=u, title="Title", summary=summary)
+        for u in urls for _ in range(CHUNKS_PER_SOURCE)
+    ]
+    scores = [
+        SourceScore(url=s.url, title=s.title, score=4, explanation="Relevant")
+        for s in summaries
+    ]
+    aggregated = _aggregate_by_source(summaries, scores)
+    return results, pages, contents, summaries, scores, aggregated
+
+
+def test_memory_1000_source_run(memory_benchmark, texts):
+    *_, aggregated = memory_benchmark(_run, *texts)
+    assert len(aggregated) == SOURCES
@@ -0,0 +1,227 @@
+"""Record a live research run into a cassette.
+
+Requires real ANTHROPIC_API_KEY (and optionally TAVILY_API_KEY) and spends
+credits once; the cassette can then be replayed offline any number of times.
+
+    python -m benchmarks.record "query" --mode standard -o benchmarks/cassettes/standard.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import sys
+import time
+from contextlib import ExitStack
+from dataclasses import asdict
+from pathlib import Path
+from unittest import mock
+
+from research_agent import ResearchAgent, ResearchMode, cascade, fetch, search
+
+from .cassette import Cassette, anthropic_key, search_key, system_key
+
+
+def _anthropic_entry(kwargs: dict, message, latency: float, stream: bool) -> tuple[str, dict]:
+    return anthropic_key(kwargs), {
+        "system_key": system_key(kwargs),
+        "response": message.model_dump(mode="json"),
+        "latency_s": round(latency, 4),
+        "stream": stream,
+    }
+
+
+class _RecordingStream:
+    """Wraps a MessageStreamManager; records the final message on exit."""
+
+    def __init__(self, manager, kwargs: dict, cassette: Cassette):
+        self._manager = manager
+        self._kwargs = kwargs
+        self._cassette = cassette
+
+    def __enter__(self):
+        self._started = time.monotonic()
+        self._stream = self._manager.__enter__()
+        return self._stream
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            message = self._stream.get_final_message()
+            self._cassette.put("anthropic", *_anthropic_entry(
+                self._kwargs, message, time.monotonic() - self._started, stream=True,
+            ))
+        return self._manager.__exit__(exc_type, exc, tb)
+
+
+class _RecordingAsyncStream:
+    """Wraps an AsyncMessageStreamManager; records the final message on exit."""
+
+    def __init__(self, manager, kwargs: dict, cassette: Cassette):
+        self._manager = manager
+        self._kwargs = kwargs
+        self._cassette = cassette
+
+    async def __aenter__(self):
+        self._started = time.monotonic()
+        self._stream = await self._manager.__aenter__()
+        return self._stream
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            message = await self._stream.get_final_message()
+            self._cassette.put("anthropic", *_anthropic_entry(
+                self._kwargs, message, time.monotonic() - self._started, stream=True,
+            ))
+        return await self._manager.__aexit__(exc_type, exc, tb)
+
+
+class _RecordingMessages:
+    """Proxy for ``client.messages`` that records create() and stream() calls."""
+
+    def __init__(self, inner, cassette: Cassette, is_async: bool):
+        self._inner = inner
+        self._cassette = cassette
+        self._is_async = is_async
+        if is_async:
+            self.create = self._create_async
+        else:
+            self.create = self._create
+
+    def __getattr__(self, name: str):
+        return getattr(self._inner, name)
+
+    def _create(self, **kwargs):
+        started = time.monotonic()
+        message = self._inner.create(**kwargs)
+        self._cassette.put("anthropic", *_anthropic_entry(
+            kwargs, message, time.monotonic() - started, stream=False,
+        ))
+        return message
+
+    async def _create_async(self, **kwargs):
+        started = time.monotonic()
+        message = await self._inner.create(**kwargs)
+        self._cassette.put("anthropic", *_anthropic_entry(
+            kwargs, message, time.monotonic() - started, stream=False,
+        ))
+        return message
+
+    def stream(self, **kwargs):
+        wrapper = _RecordingAsyncStream if self._is_async else _RecordingStream
+        return wrapper(self._inner.stream(**kwargs), kwargs, self._cassette)
+
+
+def _record_sync(cassette: Cassette, section: str, key_fn, to_entry):
+    def wrap(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            started = time.monotonic()
+            result = fn(*args, **kwargs)
+            entry = to_entry(result)
+            entry["latency_s"] = round(time.monotonic() - started, 4)
+            cassette.put(section, key_fn(*args, **kwargs), entry)
+            return result
+        return wrapper
+    return wrap
+
+
+def _record_async(cassette: Cassette, section: str, key_fn, to_entry):
+    def wrap(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            started = time.monotonic()
+            result = await fn(*args, **kwargs)
+            entry = to_entry(result)
+            entry["latency_s"] = round(time.monotonic() - started, 4)
+            cassette.put(section, key_fn(*args, **kwargs), entry)
+            return result
+        return wrapper
+    return wrap
+
+
+def _results_entry(results) -> dict:
+    return {"results": [asdict(r) for r in results]}
+
+
+def record_boundaries(cassette: Cassette) -> ExitStack:
+    """Patch search/fetch/cascade boundaries to record into ``cassette``."""
+    stack = ExitStack()
+
+    def patch(module, name, wrap):
+        stack.enter_context(mock.patch.object(module, name, wrap(getattr(module, name))))
+
+    patch(search, "_search_tavily", _record_sync(
+        cassette, "search",
+        lambda query, max_results, api_key: search_key("tavily", query, max_results),
+        _results_entry,
+    ))
+    patch(search, "_search_duckduckgo", _record_sync(
+        cassette, "search",
+        lambda query, max_results, retries=2: search_key("duckduckgo", query, max_results),
+        _results_entry,
+    ))
+    patch(fetch, "_fetch_single", _record_async(
+        cassette, "fetch",
+        lambda client, url, *a, **kw: url,
+        lambda page: {"page": asdict(page) if page else None},
+    ))
+    patch(cascade, "_jina_single", _record_async(
+        cassette, "jina",
+        lambda client, url, semaphore: url,
+        lambda content: {"content": asdict(content) if content else None},
+    ))
+
+    original_extract = cascade._fetch_via_tavily_extract
+
+    async def extract_wrapper(urls, tavily_key):
+        started = time.monotonic()
+        contents = await original_extract(urls, tavily_key)
+        latency = round(time.monotonic() - started, 4)
+        by_url = {c.url: c for c in contents}
+        for url in urls[:20]:
+            content = by_url.get(url)
+            cassette.put("tavily_extract", url, {
+                "content": asdict(content) if content else None, "latency_s": latency,
+            })
+        return contents
+
+    stack.enter_context(mock.patch.object(cascade, "_fetch_via_tavily_extract", extract_wrapper))
+    return stack
+
+
+def record_clients(agent: ResearchAgent, cassette: Cassette) -> None:
+    """Make ``agent``'s sync and async Claude clients record into ``cassette``."""
+    agent.client.messages = _RecordingMessages(agent.client.messages, cassette, is_async=False)
+    agent.async_client.messages = _RecordingMessages(
+        agent.async_client.messages, cassette, is_async=True,
+    )
+
+
+def record(query: str, mode: ResearchMode, output: Path) -> Cassette:
+    """Run ``query`` live and save every external response to ``output``."""
+    cassette = Cassette(query=query, mode=mode.name)
+    agent = ResearchAgent(mode=mode, no_context=True)
+    record_clients(agent, cassette)
+    with record_boundaries(cassette):
+        try:
+            agent.research(query)
+        finally:
+            cassette.save(output)
+    return cassette
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Record a live research run for offline replay")
+    parser.add_argument("query")
+    parser.add_argument("--mode", choices=("quick", "standard", "deep"), default="standard")
+    parser.add_argument("-o", "--output", type=Path, required=True)
+    args = parser.parse_args(argv)
+
+    cassette = record(args.query, ResearchMode.from_name(args.mode), args.output)
+    counts = ", ".join(f"{k}={len(v)}" for k, v in cassette.entries.items())
+    print(f"Recorded {counts} -> {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+"""Replay benchmark: run research modes against the local stand-ins.
+
+    python -m benchmarks.run                                  # synthetic replay
+    python -m benchmarks.run --cassette benchmarks/cassettes/standard.json
+    python -m benchmarks.run --modes quick --latency-scale 0 --rate-limit-rate 0.1
+
+Each mode runs in its own subprocess so peak RSS is per mode. Reports wall
+time, time per pipeline stage (from the run's trace), peak RSS, Claude calls
+per stage, synthesis prompt tokens, web calls, cassette hits/misses,
+whether deep mode's speculative pass 2 was reused, and which steps
+degraded to stay within the mode's latency budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .cassette import Cassette
+from .standins import AnthropicStandIn, FaultConfig, WebStandIn
+
+DEFAULT_QUERY = "wedding venue pricing trends in southern california"
+MODES = ("quick", "standard", "deep")
+RESULT_PREFIX = "BENCH_RESULT "
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _stage_times(trace_path: Path | None) -> dict[str, float]:
+    """Total seconds per "stage.*" span from a Chrome trace file."""
+    if trace_path is None:
+        return {}
+    events = json.loads(trace_path.read_text())["traceEvents"]
+    stages: dict[str, float] = {}
+    for event in events:
+        if event.get("ph") == "X" and event["name"].startswith("stage."):
+            stages[event["name"]] = stages.get(event["name"], 0.0) + event["dur"] / 1e6
+    return {name: round(seconds, 3) for name, seconds in sorted(stages.items())}
+
+
+def run_replay(
+    mode_name: str,
+    query: str,
+    cassette: Cassette | None = None,
+    faults: FaultConfig | None = None,
+) -> dict:
+    """Run one research query against the stand-ins and return its metrics.
+
+    Writes reports/meta/ under the current directory, so callers should
+    run it from a scratch directory. The run gets a fresh tokenizer so
+    calibration against replayed usage doesn't leak into the caller.
+    """
+    from research_agent import ResearchAgent, ResearchMode
+    from research_agent.token_budget import HeuristicTokenizer, set_tokenizer
+
+    cassette = cassette or Cassette()
+    faults = faults or FaultConfig()
+    os.environ.setdefault("ANTHROPIC_API_KEY", "replay")
+    os.environ.setdefault("TAVILY_API_KEY", "replay")
+
+    previous_tokenizer = set_tokenizer(HeuristicTokenizer())
+    try:
+        with AnthropicStandIn(cassette, faults) as claude, WebStandIn(cassette, faults) as web:
+            agent = ResearchAgent(
+                mode=ResearchMode.from_name(mode_name), no_context=True, trace=True,
+            )
+            agent.client = claude.client()
+            agent.async_client = claude.async_client()
+            started = time.perf_counter()
+            error = ""
+            report = ""
+            try:
+                report = agent.research(query)
+            except Exception as e:  # noqa: BLE001 - reported, not raised
+                error = f"{type(e).__name__}: {e}"
+            wall = time.perf_counter() - started
+    finally:
+        set_tokenizer(previous_tokenizer)
+
+    usage = agent.last_usage
+    speculation = agent.last_speculation
+    budget = agent.last_budget
+    return {
+        "mode": mode_name,
+        "query": query,
+        "wall_s": round(wall, 3),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "report_chars": len(report),
+        "error": error,
+        "stages_s": _stage_times(agent.last_trace_path),
+        "claude_calls": usage.total.calls if usage else 0,
+        "claude_calls_by_stage": (
+            {stage: totals.calls for stage, totals in usage.by_stage.items()} if usage else {}
+        ),
+        "input_tokens_by_stage": (
+            {stage: totals.input_tokens for stage, totals in usage.by_stage.items()} if usage else {}
+        ),
+        "claude_requests": claude.counters.snapshot(),
+        "web_calls": web.counters.snapshot(),
+        "cassette": cassette.stats(),
+        "speculation": (
+            {"reused": speculation.reused, "saved_s": speculation.saved_s} if speculation else None
+        ),
+        "budget": (
+            {
+                "budget_s": budget.budget_s,
+                "over_budget_s": budget.over_budget_s,
+                "degradations": [
+                    {"stage": d.stage, "action": d.action, "duration_s": d.duration_s}
+                    for d in budget.degradations
+                ],
+            } if budget else None
+        ),
+    }
+
+
+def _child(args: argparse.Namespace) -> int:
+    cassette = Cassette.load(args.cassette) if args.cassette else None
+    faults = FaultConfig(
+        latency_scale=args.latency_scale,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed,
+    )
+    with tempfile.TemporaryDirectory(prefix="bench-") as scratch:
+        os.chdir(scratch)
+        # Agent progress goes to stdout; keep it apart from the result line
+        with contextlib.redirect_stdout(sys.stderr):
+            result = run_replay(args.child, args.query, cassette, faults)
+    print(RESULT_PREFIX + json.dumps(result), flush=True)
+    return 0
+
+
+def _run_mode(mode: str, args: argparse.Namespace) -> dict:
+    cmd = [
+        sys.executable, "-m", "benchmarks.run", "--child", mode,
+        "--query", args.query,
+        "--latency-scale", str(args.latency_scale),
+        "--rate-limit-rate", str(args.rate_limit_rate),
+        "--seed", str(args.seed),
+    ]
+    if args.cassette:
+        cmd += ["--cassette", str(args.cassette.resolve())]
+    repo_root = Path(__file__).resolve().parent.parent
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        filter(None, [str(repo_root), os.environ.get("PYTHONPATH")])
+    ))
+    proc = subprocess.run(
+        cmd, env=env, capture_output=True, text=True, check=False,
+    )
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    return {"mode": mode, "error": (proc.stderr.strip().splitlines() or ["no output"])[-1]}
+
+
+def _print_table(results: list[dict]) -> None:
+    print(f"\n{'mode':<9} {'wall s':>8} {'rss MB':>8} {'claude':>7} {'429s':>5} "
+          f"{'search':>7} {'fetch':>6} {'hits':>5} {'miss':>5}")
+    for r in results:
+        if "wall_s" not in r:
+            print(f"{r['mode']:<9} failed: {r['error']}")
+            continue
+        web = r["web_calls"]
+        searches = sum(v for k, v in web.items() if k.startswith("search_"))
+        hits = sum(r["cassette"]["hits"].values())
+        misses = sum(r["cassette"]["misses"].values())
+        print(f"{r['mode']:<9} {r['wall_s']:>8.2f} {r['peak_rss_mb']:>8.1f} "
+              f"{r['claude_calls']:>7} {r['claude_requests'].get('rate_limited', 0):>5} "
+              f"{searches:>7} {web.get('fetch', 0):>6} {hits:>5} {misses:>5}")
+        if r["error"]:
+            print(f"          error: {r['error']}")
+    speculations = [r["speculation"] for r in results if r.get("speculation")]
+    if speculations:
+        reused = [s for s in speculations if s["reused"]]
+        print(f"\nspeculative pass 2: {len(reused)} reused, {len(speculations) - len(reused)} discarded, "
+              f"{sum(s['saved_s'] for s in reused):.2f}s saved")
+    for r in results:
+        budget = r.get("budget")
+        if budget and budget["degradations"]:
+            print(f"\n{r['mode']} latency budget {budget['budget_s']:.0f}s "
+                  f"({budget['over_budget_s']:+.2f}s), degraded:")
+            for d in budget["degradations"]:
+                print(f"  {d['action']:<40} {d['duration_s']:>8.2f}s")
+    for r in results:
+        if r.get("stages_s"):
+            print(f"\n{r['mode']} stages:")
+            for stage, seconds in r["stages_s"].items():
+                print(f"  {stage:<40} {seconds:>8.2f}s")
+            print("  claude calls: " + ", ".join(
+                f"{stage}={n}" for stage, n in sorted(r["claude_calls_by_stage"].items())
+            ))
+            print("  input tokens: " + ", ".join(
+                f"{stage}={n}" for stage, n in sorted(r.get("input_tokens_by_stage", {}).items())
+                if stage.startswith("synthesize")
+            ))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline replay benchmark of research modes")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--cassette", type=Path, help="Recorded run (default: synthetic only)")
+    parser.add_argument("--query", help="Query to run (default: the cassette's query)")
+    parser.add_argument("--latency-scale", type=float, default=1.0,
+                        help="Multiply recorded/synthetic latencies (0 = no latency)")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0,
+                        help="Probability of injecting a 429 per request")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, dest="json_out", help="Write results as JSON")
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.query is None:
+        args.query = Cassette.load(args.cassette).query if args.cassette else DEFAULT_QUERY
+    if args.child:
+        return _child(args)
+
+    results = []
+    for mode in args.modes:
+        print(f"Running {mode}...", file=sys.stderr)
+        results.append(_run_mode(mode, args))
+    _print_table(results)
+    if args.json_out:
+        args.json_out.write_text(json.dumps(results, indent=2))
+    return 0 if all(not r.get("error") for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
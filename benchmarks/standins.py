@@ -0,0 +1,373 @@
+"""Local stand-ins for Claude, search and web fetches during replay.
+
+Claude is served by a real HTTP server speaking the Messages API (JSON and
+SSE streaming), so replayed runs go through the Anthropic SDK's request,
+retry and stream-parsing code exactly as live runs do.
+
+Search and page fetches are replaced at the module boundary instead:
+the fetcher's SSRF guard refuses loopback addresses by design, and search
+goes through the Tavily/DDGS client libraries, so an in-process stand-in
+is the only way to serve them without weakening production code. The
+stand-ins still honour the fetch semaphore and sleep for the recorded
+latency, so concurrency limits shape the timeline the same way.
+
+Both stand-ins can add latency (``latency_scale``) and inject 429s
+(``rate_limit_rate``, a per-request probability).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import threading
+import time
+import uuid
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import httpx
+from anthropic import Anthropic, AsyncAnthropic
+
+from research_agent import cascade, fetch, search
+from research_agent.extract import ExtractedContent
+from research_agent.fetch import FetchedPage
+from research_agent.search import SearchResult
+from research_agent.token_budget import count_tokens
+
+from . import synthetic
+from .cassette import Cassette, search_key
+
+# Synthetic web latencies (seconds) for entries missing from the cassette
+SEARCH_LATENCY_S = 0.8
+FETCH_LATENCY_S = (0.3, 1.2)
+JINA_LATENCY_S = 1.5
+TAVILY_EXTRACT_LATENCY_S = 2.0
+
+# Number of SSE text deltas a streamed reply is split into
+STREAM_DELTAS = 16
+
+
+@dataclass
+class FaultConfig:
+    """Latency and rate-limit injection shared by the stand-ins."""
+
+    latency_scale: float = 1.0
+    rate_limit_rate: float = 0.0
+    retry_after_s: float = 0.0
+    seed: int = 0
+    _rng: random.Random = field(init=False, repr=False)
+    _lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        self._rng = random.Random(self.seed)
+
+    def should_rate_limit(self) -> bool:
+        if self.rate_limit_rate <= 0:
+            return False
+        with self._lock:
+            return self._rng.random() < self.rate_limit_rate
+
+    def uniform(self, low: float, high: float) -> float:
+        with self._lock:
+            return self._rng.uniform(low, high)
+
+
+class _Counters:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.values: dict[str, int] = {}
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            self.values[name] = self.values.get(name, 0) + 1
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self.values)
+
+
+# -- Claude ------------------------------------------------------------------
+
+
+def _prompt_text(request: dict) -> tuple[str, str]:
+    system = request.get("system") or ""
+    if isinstance(system, list):
+        system = " ".join(block.get("text", "") for block in system)
+    parts = []
+    for message in request.get("messages", []):
+        content = message.get("content", "")
+        if isinstance(content, list):
+            content = " ".join(block.get("text", "") for block in content)
+        parts.append(content)
+    return system, "\n".join(parts)
+
+
+def synthetic_message(request: dict) -> dict:
+    """A Messages API response body generated from the request."""
+    system, prompt = _prompt_text(request)
+    max_tokens = int(request.get("max_tokens", 1024))
+    text = synthetic.message_text(system, prompt, max_tokens)
+    return {
+        "id": f"msg_replay_{uuid.uuid4().hex[:16]}",
+        "type": "message",
+        "role": "assistant",
+        "model": request.get("model", "replay"),
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {
+            "input_tokens": count_tokens(system + prompt),
+            "output_tokens": min(max_tokens, count_tokens(text)),
+        },
+    }
+
+
+def _sse(event: str, data: dict) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8")
+
+
+class AnthropicStandIn:
+    """Threaded local server implementing POST /v1/messages.
+
+    Responses come from the cassette (exact match, then same call site),
+    falling back to synthetic replies. Use as a context manager; ``client()``
+    and ``async_client()`` return SDK clients pointed at the server.
+    """
+
+    def __init__(self, cassette: Cassette | None = None, faults: FaultConfig | None = None):
+        self.cassette = cassette or Cassette()
+        self.faults = faults or FaultConfig()
+        self.counters = _Counters()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        assert self._server is not None, "stand-in not started"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "AnthropicStandIn":
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802 - http.server API
+                standin._handle(self)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="anthropic-standin", daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def client(self) -> Anthropic:
+        return Anthropic(
+            api_key="replay", base_url=self.base_url,
+            http_client=httpx.Client(trust_env=False),
+        )
+
+    def async_client(self) -> AsyncAnthropic:
+        return AsyncAnthropic(
+            api_key="replay", base_url=self.base_url,
+            http_client=httpx.AsyncClient(trust_env=False),
+        )
+
+    def _handle(self, handler: BaseHTTPRequestHandler) -> None:
+        if handler.path.split("?", 1)[0] != "/v1/messages":
+            handler.send_error(404)
+            return
+        length = int(handler.headers.get("content-length", 0))
+        request = json.loads(handler.rfile.read(length) or b"{}")
+
+        if self.faults.should_rate_limit():
+            self.counters.incr("rate_limited")
+            body = json.dumps({
+                "type": "error",
+                "error": {"type": "rate_limit_error", "message": "Injected by replay stand-in"},
+            }).encode("utf-8")
+            handler.send_response(429)
+            handler.send_header("content-type", "application/json")
+            handler.send_header("retry-after", str(self.faults.retry_after_s))
+            handler.send_header("content-length", str(len(body)))
+            handler.end_headers()
+            handler.wfile.write(body)
+            return
+
+        entry = self.cassette.get_anthropic(request)
+        if entry is not None:
+            message = entry["response"]
+            latency = entry.get("latency_s", 0.0)
+        else:
+            message = synthetic_message(request)
+            latency = synthetic.latency_for(message["usage"]["output_tokens"])
+        latency *= self.faults.latency_scale
+        self.counters.incr("stream" if request.get("stream") else "create")
+
+        if request.get("stream"):
+            self._stream(handler, message, latency)
+            return
+        time.sleep(latency)
+        body = json.dumps(message).encode("utf-8")
+        handler.send_response(200)
+        handler.send_header("content-type", "application/json")
+        handler.send_header("content-length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def _stream(self, handler: BaseHTTPRequestHandler, message: dict, latency: float) -> None:
+        text = "".join(
+            block.get("text", "") for block in message.get("content", [])
+            if block.get("type") == "text"
+        )
+        usage = message.get("usage", {})
+        first_token = min(latency, synthetic.FIRST_TOKEN_S * self.faults.latency_scale)
+        step = max(0.0, latency - first_token) / STREAM_DELTAS
+        size = max(1, -(-len(text) // STREAM_DELTAS))
+
+        handler.send_response(200)
+        handler.send_header("content-type", "text/event-stream")
+        handler.send_header("cache-control", "no-cache")
+        handler.end_headers()
+        start = dict(message, content=[], stop_reason=None, usage=dict(usage, output_tokens=1))
+        handler.wfile.write(_sse("message_start", {"type": "message_start", "message": start}))
+        time.sleep(first_token)
+        handler.wfile.write(_sse("content_block_start", {
+            "type": "content_block_start", "index": 0,
+            "content_block": {"type": "text", "text": ""},
+        }))
+        for offset in range(0, len(text), size):
+            handler.wfile.write(_sse("content_block_delta", {
+                "type": "content_block_delta", "index": 0,
+                "delta": {"type": "text_delta", "text": text[offset:offset + size]},
+            }))
+            handler.wfile.flush()
+            time.sleep(step)
+        handler.wfile.write(_sse("content_block_stop", {"type": "content_block_stop", "index": 0}))
+        handler.wfile.write(_sse("message_delta", {
+            "type": "message_delta",
+            "delta": {"stop_reason": message.get("stop_reason") or "end_turn", "stop_sequence": None},
+            "usage": {"output_tokens": usage.get("output_tokens", 0)},
+        }))
+        handler.wfile.write(_sse("message_stop", {"type": "message_stop"}))
+        handler.wfile.flush()
+
+
+# -- search and web ----------------------------------------------------------
+
+
+class WebStandIn:
+    """Patches search, fetch and cascade boundaries to serve from the cassette."""
+
+    def __init__(self, cassette: Cassette | None = None, faults: FaultConfig | None = None):
+        self.cassette = cassette or Cassette()
+        self.faults = faults or FaultConfig()
+        self.counters = _Counters()
+        self._stack = ExitStack()
+
+    def __enter__(self) -> "WebStandIn":
+        patches = {
+            (search, "_search_tavily"): self._search_tavily,
+            (search, "_search_duckduckgo"): self._search_duckduckgo,
+            (fetch, "_fetch_single"): self._fetch_single,
+            (cascade, "_filter_forwardable_urls"): self._filter_forwardable_urls,
+            (cascade, "_jina_single"): self._jina_single,
+            (cascade, "_fetch_via_tavily_extract"): self._fetch_via_tavily_extract,
+        }
+        for (module, name), replacement in patches.items():
+            self._stack.enter_context(mock.patch.object(module, name, replacement))
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._stack.close()
+
+    def _search(self, provider: str, query: str, max_results: int) -> list[SearchResult]:
+        self.counters.incr(f"search_{provider}")
+        entry = self.cassette.get("search", search_key(provider, query, max_results))
+        if entry is not None:
+            results, latency = entry["results"], entry.get("latency_s", 0.0)
+        else:
+            results = synthetic.search_results(query, max_results, provider)
+            latency = SEARCH_LATENCY_S
+        time.sleep(latency * self.faults.latency_scale)
+        return [SearchResult(**r) for r in results]
+
+    def _search_tavily(self, query: str, max_results: int, api_key: str) -> list[SearchResult]:
+        return self._search("tavily", query, max_results)
+
+    def _search_duckduckgo(self, query: str, max_results: int, retries: int = 2) -> list[SearchResult]:
+        return self._search("duckduckgo", query, max_results)
+
+    async def _fetch_single(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        semaphore: asyncio.Semaphore,
+        dns_cache: dict[str, bool] | None = None,
+    ) -> FetchedPage | None:
+        async with semaphore:
+            self.counters.incr("fetch")
+            entry = self.cassette.get("fetch", url)
+            if entry is not None:
+                page, latency = entry["page"], entry.get("latency_s", 0.0)
+            else:
+                page = {"url": url, "html": synthetic.page_html(url), "status_code": 200}
+                latency = self.faults.uniform(*FETCH_LATENCY_S)
+            await asyncio.sleep(latency * self.faults.latency_scale)
+            if self.faults.should_rate_limit():
+                # fetch._fetch_single treats a 429 as a failed fetch
+                self.counters.incr("fetch_rate_limited")
+                return None
+            return FetchedPage(**page) if page else None
+
+    async def _filter_forwardable_urls(self, urls: list[str]) -> list[str]:
+        # Skip the DNS half of the check; recorded hosts may no longer resolve
+        return [u for u in urls if not cascade._is_internal_url(u)]
+
+    async def _jina_single(
+        self, client: httpx.AsyncClient, url: str, semaphore: asyncio.Semaphore,
+    ) -> ExtractedContent | None:
+        async with semaphore:
+            self.counters.incr("jina")
+            entry = self.cassette.get("jina", url)
+            if entry is not None:
+                content, latency = entry["content"], entry.get("latency_s", 0.0)
+            else:
+                text = synthetic.page_markdown(url)
+                content = {"url": url, "title": cascade._extract_markdown_title(text), "text": text}
+                latency = JINA_LATENCY_S
+            await asyncio.sleep(latency * self.faults.latency_scale)
+            return ExtractedContent(**content) if content else None
+
+    async def _fetch_via_tavily_extract(
+        self, urls: list[str], tavily_key: str | None,
+    ) -> list[ExtractedContent]:
+        if not tavily_key or not urls:
+            return []
+        self.counters.incr("tavily_extract")
+        contents = []
+        latency = 0.0
+        for url in urls[:20]:
+            entry = self.cassette.get("tavily_extract", url)
+            if entry is not None:
+                latency = max(latency, entry.get("latency_s", 0.0))
+                if entry["content"]:
+                    contents.append(ExtractedContent(**entry["content"]))
+            else:
+                latency = max(latency, TAVILY_EXTRACT_LATENCY_S)
+                contents.append(ExtractedContent(url=url, title="", text=synthetic.page_markdown(url)))
+        await asyncio.sleep(latency * self.faults.latency_scale)
+        return contents
@@ -0,0 +1,181 @@
+"""Deterministic synthetic responses for replay misses.
+
+When a cassette has no entry for a request (or replay runs without a
+cassette), these generators produce responses shaped like the real ones:
+search results point at fetchable pages, and Claude replies follow the
+format each call site parses, so the pipeline exercises the same stages
+it would against live services.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import zlib
+
+# Synthetic pages use a reserved TLD so nothing can leak onto the real web
+SYNTHETIC_DOMAIN = "bench.example"
+
+# Time-to-first-token and per-output-token latency used when a response has
+# no recorded latency (roughly a mid-size model under normal load)
+FIRST_TOKEN_S = 0.5
+PER_TOKEN_S = 0.005
+
+_WORDS = (
+    "market pricing vendors demand survey growth regional costs analysis "
+    "customers segment premium services booking seasonal trends data report "
+    "industry revenue average budget planning venue quality rates compared "
+    "share annual study respondents local national forecast category"
+).split()
+
+_SECTION_INDEX_RE = re.compile(r'<section index="(\d+)">')
+_QUESTION_INDEX_RE = re.compile(r'<question index="(\d+)">')
+_QUERY_TAG_RE = re.compile(r"<(?:query|original_query|research_question)>\s*(.*?)\s*</", re.DOTALL)
+_QUERY_LINE_RE = re.compile(r"^(?:ORIGINAL QUERY|QUERY):\s*(.+)$", re.MULTILINE)
+_NUM_QUESTIONS_RE = re.compile(r"Generate exactly (\d+) follow-up")
+
+
+def _rng(*parts: object) -> random.Random:
+    return random.Random(zlib.crc32("|".join(map(str, parts)).encode("utf-8")))
+
+
+def _sentence(rng: random.Random, words: int = 14) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _paragraph(rng: random.Random, sentences: int = 5) -> str:
+    return " ".join(_sentence(rng, rng.randint(10, 20)) for _ in range(sentences))
+
+
+# -- web ---------------------------------------------------------------------
+
+
+def search_results(query: str, max_results: int, provider: str) -> list[dict]:
+    """Synthetic search hits; even-numbered ones carry Tavily raw_content."""
+    rng = _rng(provider, query, max_results)
+    slug = "-".join(re.findall(r"[a-z0-9]+", query.lower())[:6]) or "page"
+    results = []
+    for i in range(max_results):
+        site = rng.randint(1, 40)
+        url = f"https://site{site}.{SYNTHETIC_DOMAIN}/{slug}/{i}"
+        raw = ""
+        if provider == "tavily" and i % 2 == 0:
+            raw = page_markdown(url)
+        results.append({
+            "title": f"{query.title()} — source {i + 1}",
+            "url": url,
+            "snippet": _paragraph(rng, 2),
+            "raw_content": raw,
+        })
+    return results
+
+
+def page_markdown(url: str, sections: int = 4) -> str:
+    rng = _rng("md", url)
+    parts = [f"# Page {url.rsplit('/', 2)[-2]}"]
+    for n in range(sections):
+        parts.append(f"## Section {n + 1}")
+        parts.extend(_paragraph(rng, rng.randint(4, 8)) for _ in range(3))
+    return "\n\n".join(parts)
+
+
+def page_html(url: str, sections: int = 5) -> str:
+    rng = _rng("html", url)
+    body = []
+    for n in range(sections):
+        body.append(f"<h2>Section {n + 1}</h2>")
+        body.extend(f"<p>{_paragraph(rng, rng.randint(4, 8))}</p>" for _ in range(3))
+    return (
+        f"<!doctype html><html><head><title>Synthetic page {url}</title></head>"
+        f"<body><nav><a href='/'>Home</a></nav><article><h1>{url}</h1>"
+        f"{''.join(body)}</article><footer>Footer</footer></body></html>"
+    )
+
+
+# -- Claude ------------------------------------------------------------------
+
+
+def _original_query(prompt: str) -> str:
+    match = _QUERY_TAG_RE.search(prompt) or _QUERY_LINE_RE.search(prompt)
+    return match.group(1).strip() if match else "research topic"
+
+
+def message_text(system: str, prompt: str, max_tokens: int) -> str:
+    """Reply text in the format the calling stage parses."""
+    rng = _rng(system, prompt[:2000], max_tokens)
+    query = _original_query(prompt)
+    head = " ".join(query.split()[:3])
+
+    if "SCORE:" in prompt:
+        return f"SCORE: {rng.choice((3, 4, 4, 5))}\nEXPLANATION: {_sentence(rng)}"
+    if "SIMPLE (one clear topic)" in system:
+        return (
+            "TYPE: COMPLEX\nREASONING: The query spans pricing and demand angles.\n"
+            f"SUB_QUERIES:\n- {head} pricing statistics data\n"
+            f"- {head} consumer survey behavior"
+        )
+    if "GAP_TYPE:" in prompt:
+        return (
+            "GAP_TYPE: COVERAGE_GAP\nDESCRIPTION: Regional detail is thin.\n"
+            "RETRY_RECOMMENDATION: NO_RETRY\nREASONING: Sources cover the core question.\n"
+            "RETRY_QUERIES:"
+        )
+    if "SOURCE_DIVERSITY:" in prompt:
+        scores = "\n".join(
+            f"{dim}: {rng.randint(2, 5)}" for dim in (
+                "SOURCE_DIVERSITY", "CLAIM_SUPPORT", "COVERAGE",
+                "GEOGRAPHIC_BALANCE", "ACTIONABILITY",
+            )
+        )
+        return f"{scores}\nWEAKNESSES: {_sentence(rng)}\nSUGGESTIONS: {_sentence(rng)}"
+    if "MISSING:" in prompt and "QUERY:" in prompt:
+        return f"MISSING: {_sentence(rng)}\nQUERY: {head} regional cost comparison"
+    if "follow-up research questions" in prompt:
+        count = int(m.group(1)) if (m := _NUM_QUESTIONS_RE.search(prompt)) else 3
+        return "\n".join(
+            f"{i + 1}. How does {head} {rng.choice(_WORDS)} compare across {rng.choice(_WORDS)}?"
+            for i in range(count)
+        )
+    if "search query generator" in system:
+        return f"{head} {rng.choice(_WORDS)} {rng.choice(_WORDS)} data"
+    if "context file" in system:
+        return "none"
+    questions = _QUESTION_INDEX_RE.findall(prompt)
+    if questions:
+        return "\n".join(
+            f'<section_report index="{i}">{_paragraph(rng, 6)}</section_report>'
+            for i in questions
+        )
+    sections = _SECTION_INDEX_RE.findall(prompt)
+    if sections:
+        return "\n".join(
+            f'<section_summary index="{i}">{_paragraph(rng, 3)}</section_summary>'
+            for i in sections
+        )
+    if "FACTS:" in prompt:
+        return (
+            f"FACTS: {_paragraph(rng, 3)}\nKEY QUOTES: \"{_sentence(rng)}\"\n"
+            f"TONE: {_sentence(rng, 8)}"
+        )
+    return _report(rng, max_tokens)
+
+
+def _report(rng: random.Random, max_tokens: int) -> str:
+    """Markdown prose sized to about half the token budget."""
+    target_words = max(30, max_tokens // 2)
+    parts: list[str] = []
+    words = 0
+    section = 1
+    while words < target_words:
+        if max_tokens >= 1000 and (not parts or rng.random() < 0.2):
+            parts.append(f"## {section}. {_sentence(rng, 4)[:-1]}")
+            section += 1
+        paragraph = _paragraph(rng, rng.randint(3, 6)) + f" [Source {rng.randint(1, 8)}]"
+        parts.append(paragraph)
+        words += len(paragraph.split())
+    return "\n\n".join(parts)
+
+
+def latency_for(output_tokens: int) -> float:
+    return FIRST_TOKEN_S + PER_TOKEN_S * output_tokens
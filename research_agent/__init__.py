@@ -1,42 +1,116 @@
 """Research agent — search the web and generate structured reports."""
 
+from __future__ import annotations
+
 __version__ = "0.18.0"
 
 import asyncio
+import importlib
 import os
+import sys
+from typing import TYPE_CHECKING
 
-from .agent import ResearchAgent
-from .report_store import get_reports
+from .report_store import get_reports, search_reports
 from .context import list_available_contexts, load_critique_history, resolve_context_path
 from .context_result import ContextResult, ContextStatus, ReportTemplate
 from .critique import CritiqueResult, critique_report_file
 from .errors import ResearchError, GateDecision
 from .modes import ResearchMode
-from .results import ModeInfo, ReportInfo, ResearchResult
+from .report_index import (
+    CachedReport, FreshnessPolicy, IndexEntry,
+    find_cached_report, get_entry, load_sources, saved_report_path,
+)
+from .results import CacheHit, ModeInfo, RefreshOutcome, ReportInfo, ReportMatch, ResearchResult, StoredSource
+
+if TYPE_CHECKING:
+    from .agent import ResearchAgent
+    from .batch import BatchJobResult, BatchLimits, BatchQuery, BatchResult, run_batch, run_batch_async
+    from .gap_cycle import GapCycleResult, run_gap_cycle, run_gap_cycle_async
+    from .jobs import JobQueue, JobSnapshot, JobStatus
+    from .progress import ResultEvent, SourcesEvent, StageEvent, TextDelta
+
+# Names resolved on first access. ResearchAgent pulls in the whole pipeline
+# (anthropic, httpx, trafilatura, search clients); informational commands
+# like --list and --cost never need it.
+_LAZY_ATTRS = {
+    "ResearchAgent": ".agent",
+    "BatchJobResult": ".batch",
+    "BatchLimits": ".batch",
+    "BatchQuery": ".batch",
+    "BatchResult": ".batch",
+    "run_batch": ".batch",
+    "run_batch_async": ".batch",
+    "GapCycleResult": ".gap_cycle",
+    "run_gap_cycle": ".gap_cycle",
+    "run_gap_cycle_async": ".gap_cycle",
+    "JobQueue": ".jobs",
+    "JobSnapshot": ".jobs",
+    "JobStatus": ".jobs",
+    "ResultEvent": ".progress",
+    "SourcesEvent": ".progress",
+    "StageEvent": ".progress",
+    "TextDelta": ".progress",
+}
 
 __all__ = [
+    "BatchJobResult",
+    "BatchLimits",
+    "BatchQuery",
+    "BatchResult",
+    "CacheHit",
     "ContextResult",
     "ContextStatus",
     "CritiqueResult",
+    "FreshnessPolicy",
+    "GapCycleResult",
+    "JobQueue",
+    "JobSnapshot",
+    "JobStatus",
     "ModeInfo",
+    "RefreshOutcome",
     "ReportInfo",
+    "ReportMatch",
     "ReportTemplate",
     "ResearchAgent",
     "GateDecision",
     "ResearchError",
     "ResearchMode",
     "ResearchResult",
+    "ResultEvent",
+    "SourcesEvent",
+    "StageEvent",
+    "StoredSource",
+    "TextDelta",
     "critique_report_file",
     "get_reports",
     "list_available_contexts",
     "list_modes",
     "load_critique_history",
+    "refresh_report",
+    "refresh_report_async",
     "resolve_context_path",
+    "run_batch",
+    "run_batch_async",
+    "run_gap_cycle",
+    "run_gap_cycle_async",
     "run_research",
     "run_research_async",
+    "search_reports",
 ]
 
 
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
 def run_research(
     query: str,
     mode: str = "standard",
@@ -44,6 +118,7 @@ def run_research(
     skip_critique: bool = False,
     skip_iteration: bool = False,
     max_sources: int | None = None,
+    freshness: FreshnessPolicy | None = None,
 ) -> ResearchResult:
     """Run a research query and return a structured result.
 
@@ -56,6 +131,12 @@ def run_research(
         skip_iteration: If True, skip post-report query refinement and
             follow-up questions.
         max_sources: Override the mode's default source count.
+        freshness: When a saved report for a near-identical query may be
+            returned instead of running the pipeline (result.cache is set
+            when it is), e.g. FreshnessPolicy(). None (the default)
+            always runs the pipeline. With auto_refresh, a report due
+            for a refresh is refreshed incrementally instead
+            (result.refresh is set).
 
     Returns:
         ResearchResult with report, query, mode, sources_used, status.
@@ -78,7 +159,7 @@ def run_research(
         return asyncio.run(run_research_async(
             query, mode=mode, context=context,
             skip_critique=skip_critique, skip_iteration=skip_iteration,
-            max_sources=max_sources,
+            max_sources=max_sources, freshness=freshness,
         ))
     except RuntimeError as e:
         if "cannot be called from a running event loop" in str(e):
@@ -96,6 +177,7 @@ async def run_research_async(
     skip_critique: bool = False,
     skip_iteration: bool = False,
     max_sources: int | None = None,
+    freshness: FreshnessPolicy | None = None,
 ) -> ResearchResult:
     """Async version of run_research for use in async contexts.
 
@@ -103,6 +185,104 @@ async def run_research_async(
     an async context (MCP servers, FastAPI, Jupyter, etc.)
     where asyncio.run() would fail.
     """
+    agent, research_mode = _prepare_agent(
+        query, mode, context,
+        skip_critique=skip_critique, skip_iteration=skip_iteration,
+        max_sources=max_sources,
+    )
+    if freshness is not None:
+        cached = find_cached_report(query, research_mode.name, context, freshness)
+        if cached is not None:
+            if freshness.auto_refresh and cached.hit.refresh_suggested:
+                report = await _refresh_saved(agent, cached.entry)
+                if report is not None:
+                    return _research_result(agent, research_mode, query, report, context)
+            return _cached_result(research_mode, query, context, cached)
+    report = await agent.research_async(query)
+    return _research_result(agent, research_mode, query, report, context)
+
+
+def refresh_report(
+    filename: str,
+    skip_critique: bool = False,
+    skip_iteration: bool = False,
+) -> ResearchResult:
+    """Refresh a saved report, redoing only the work its changed sources need.
+
+    The report's stored sources are revalidated with conditional requests;
+    unchanged ones keep their summaries and scores. Changed pages, plus
+    new pages from one search of the report's query, are summarized and
+    scored, and the report is re-synthesized from old and new summaries.
+    If nothing changed, the saved report is returned as it is.
+
+    Args:
+        filename: Saved report filename (as listed by get_reports()).
+        skip_critique: If True, skip self-critique after re-synthesis.
+        skip_iteration: If True, skip query refinement and follow-ups.
+
+    Returns:
+        ResearchResult with refresh set to the RefreshOutcome.
+
+    Raises:
+        ResearchError: If the report is not in the report index, has no
+            stored sources (run the query again instead), or the refresh
+            fails.
+    """
+    try:
+        return asyncio.run(refresh_report_async(
+            filename, skip_critique=skip_critique, skip_iteration=skip_iteration,
+        ))
+    except RuntimeError as e:
+        if "cannot be called from a running event loop" in str(e):
+            raise ResearchError(
+                "refresh_report() cannot be called from async context. "
+                "Use 'await refresh_report_async()' instead."
+            ) from e
+        raise
+
+
+async def refresh_report_async(
+    filename: str,
+    skip_critique: bool = False,
+    skip_iteration: bool = False,
+) -> ResearchResult:
+    """Async version of refresh_report for use in async contexts."""
+    entry = get_entry(filename)
+    if entry is None:
+        raise ResearchError(f"No indexed report named {filename!r}")
+    context = entry.context or None
+    agent, research_mode = _prepare_agent(
+        entry.query, entry.mode, context,
+        skip_critique=skip_critique, skip_iteration=skip_iteration,
+    )
+    report = await _refresh_saved(agent, entry)
+    if report is None:
+        raise ResearchError(
+            f"No stored sources for {filename!r}; run the query again instead"
+        )
+    return _research_result(agent, research_mode, entry.query, report, context)
+
+
+async def _refresh_saved(agent: ResearchAgent, entry: IndexEntry) -> str | None:
+    """Refresh an indexed report with ``agent``, or None if it has no stored sources."""
+    sources = load_sources(entry.filename)
+    if not sources:
+        return None
+    return await agent.refresh_async(entry.query, sources, saved_report_path(entry.filename))
+
+
+def _prepare_agent(
+    query: str,
+    mode: str,
+    context: str | None,
+    **agent_kwargs,
+) -> tuple[ResearchAgent, ResearchMode]:
+    """Validate run_research arguments and build the agent for them.
+
+    Raises:
+        ResearchError: On an empty query, unknown mode or context, or
+            missing API keys.
+    """
     if not query or not query.strip():
         raise ResearchError("Query cannot be empty")
 
@@ -134,13 +314,22 @@ async def run_research_async(
         if context_path is None:
             no_context = True  # context="none"
 
-    agent = ResearchAgent(
+    # Looked up on the module so the lazy import (and test patches) apply
+    agent = sys.modules[__name__].ResearchAgent(
         mode=research_mode, context_path=context_path, no_context=no_context,
-        skip_critique=skip_critique, skip_iteration=skip_iteration,
-        max_sources=max_sources,
+        **agent_kwargs,
     )
-    report = await agent.research_async(query)
+    return agent, research_mode
+
 
+def _research_result(
+    agent: ResearchAgent,
+    research_mode: ResearchMode,
+    query: str,
+    report: str,
+    context: str | None = None,
+) -> ResearchResult:
+    """Package a finished agent run as a ResearchResult."""
     return ResearchResult(
         report=report,
         query=query,
@@ -151,6 +340,30 @@ async def run_research_async(
         iteration_status=agent.iteration_status,
         iteration_sections=agent.iteration_sections,
         source_counts=agent.source_counts,
+        usage=agent.last_usage,
+        context=context,
+        source_urls=agent.last_source_urls,
+        sources=agent.last_sources,
+        refresh=agent.last_refresh,
+    )
+
+
+def _cached_result(
+    research_mode: ResearchMode,
+    query: str,
+    context: str | None,
+    cached: CachedReport,
+) -> ResearchResult:
+    """Package a saved report served from the report index."""
+    return ResearchResult(
+        report=cached.report,
+        query=query,
+        mode=research_mode.name,
+        sources_used=len(cached.entry.source_urls),
+        status=cached.entry.status,
+        context=context,
+        source_urls=cached.entry.source_urls,
+        cache=cached.hit,
     )
 
 
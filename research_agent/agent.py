@@ -3,38 +3,65 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import time
+from contextlib import nullcontext
+from dataclasses import replace
 from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Sequence
 
 import yaml
 
 from anthropic import Anthropic, AsyncAnthropic, APIError, RateLimitError, APIConnectionError, APITimeoutError
 
-from .search import search, refine_query, extract_noun_phrases, filter_blocked_urls, SearchResult
-from .fetch import fetch_urls
+from .search import search, refine_query_async, extract_noun_phrases, filter_blocked_urls, SearchResult
+from .fetch import fetch_urls, FetchedPage, PageValidators
 from .extract import extract_all, ExtractedContent
 from .summarize import summarize_all, Summary
-from .synthesize import synthesize_report, synthesize_draft, synthesize_final, synthesize_mini_report
+from .synthesize import (
+    synthesize_draft_async,
+    synthesize_final_async,
+    synthesize_mini_report_async,
+    synthesize_mini_reports_async,
+    synthesize_report_async,
+)
 from .relevance import evaluate_sources, generate_insufficient_data_response, RelevanceEvaluation, SourceScore, compute_gate_decision, check_domain_diversity
-from .decompose import decompose_query, DecompositionResult
-from .context import load_full_context, load_critique_history, new_context_cache, auto_detect_context, CONTEXTS_DIR
+from .decompose import decompose_query_async, DecompositionResult
+from .context import load_full_context, load_critique_history, new_context_cache, auto_detect_context_async, CONTEXTS_DIR
 from .context_result import ContextResult, ContextStatus
-from .skeptic import run_deep_skeptic_pass, run_skeptic_combined
+from .skeptic import run_deep_skeptic_pass, run_skeptic_combined, SkepticFinding
 from .cascade import cascade_recover
 from .coverage import identify_coverage_gaps
 from .errors import ResearchError, SearchError, SkepticError, StateError, IterationError, SynthesisError, VagueQueryError, GateDecision
-from .query_validation import check_query_vagueness
-from .critique import evaluate_report, save_critique, CritiqueResult
-from .iterate import generate_refined_queries, generate_followup_questions
+from .query_validation import check_query_vagueness, has_near_duplicate, meaningful_words
+from .critique import evaluate_report_async, save_critique, CritiqueResult
+from .iterate import generate_refined_queries_async, generate_followup_questions_async
 from .modes import ResearchMode
+from .results import RefreshOutcome, SpeculationOutcome, StoredSource
 from .report_store import META_DIR
 from .sanitize import sanitize_content
 from .cycle_config import CycleConfig
-
-from .schema import Gap, GapStatus, SchemaResult, load_schema
-from .state import mark_verified, mark_checked, save_schema
-from .staleness import detect_stale, select_batch, log_flip
+from .usage import UsageLedger, UsageSummary, save_usage, usage_scope
+from .tracing import Trace, span, trace_scope, traced
+from .source_packing import MINI_REPORT_SOURCE_TOKENS, pack_sources
+from .latency_budget import DEGRADED_MAX_CHUNKS, MIN_ITERATION_TIMEOUT, BudgetReport, LatencyBudget
+from .progress import (
+    ProgressEvent,
+    ResultEvent,
+    SourcesEvent,
+    StageEvent,
+    emit,
+    progress_scope,
+    queue_listener,
+)
+from .stage_graph import StageGraph
+from .checkpoint import RUNS_SUBDIR, RunCheckpoint, evaluation_from_dict, evaluation_to_dict, from_rows, to_rows
+
+from .schema import SchemaResult, load_schema
+
+if TYPE_CHECKING:
+    from .gap_cycle import GapCycleResult
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +71,15 @@ MAX_CONCURRENT_SUB_QUERIES = 2
 # Overall timeout for the iteration phase (seconds)
 ITERATION_TIMEOUT = 180.0
 
+# Share of each query's words the other must contain for the speculative
+# pass-2 search results to stand in for the summary-based refined query
+SPECULATION_MIN_OVERLAP = 0.8
+
+
+def _content_hash(text: str) -> str:
+    """Fingerprint of extracted page text, insensitive to whitespace changes."""
+    return hashlib.sha256(" ".join(text.split()).encode("utf-8")).hexdigest()
+
 
 class ResearchAgent:
     """
@@ -69,9 +105,19 @@ class ResearchAgent:
         skip_iteration: bool = False,
         context_path: Path | None = None,
         no_context: bool = False,
+        trace: bool = False,
+        client: Anthropic | None = None,
+        async_client: AsyncAnthropic | None = None,
+        use_gap_schema: bool = True,
+        checkpoint: bool = False,
+        resume_run_id: str | None = None,
     ):
-        self.client = Anthropic(api_key=api_key)
-        self.async_client = AsyncAnthropic(api_key=api_key)
+        # Batches pass a shared async client so every run uses one connection
+        # pool. The pipeline runs entirely on async_client; the sync client is
+        # only built if a caller asks for it.
+        self._api_key = api_key
+        self._client = client
+        self.async_client = async_client or AsyncAnthropic(api_key=api_key)
         self._start_time = 0.0
         self._step_num = 0
         self._step_total = 0
@@ -82,21 +128,66 @@ class ResearchAgent:
         self.context_path = context_path
         self.no_context = no_context
         self.schema_path = Path(schema_path) if schema_path else None
-        self._current_schema_result: SchemaResult | None = None
-        self._current_research_batch: tuple[Gap, ...] | None = None
+        # False when a gap-cycle runner owns the schema and researches each gap itself
+        self._use_gap_schema = use_gap_schema
         self._run_context: ContextResult = ContextResult.not_configured(source="init")
         self._last_source_count: int = 0
+        self._last_source_urls: tuple[str, ...] = ()
+        self._last_sources: tuple[StoredSource, ...] = ()
+        self._last_refresh: RefreshOutcome | None = None
+        # Validators and extracted-text hashes of this run's pages, by URL
+        self._page_validators: dict[str, PageValidators] = {}
+        self._content_hashes: dict[str, str] = {}
         self._last_gate_decision: str = ""
         self._last_critique: CritiqueResult | None = None
         self._iteration_status: str = "skipped"
         self._iteration_sections: tuple[str, ...] = ()
+        self._last_speculation: SpeculationOutcome | None = None
+        # Replaced per run with one for the mode's latency_budget_s
+        self._budget = LatencyBudget(0.0)
+        self._last_budget: BudgetReport | None = None
         self._source_counts: dict[str, int] = {}
+        self._usage_ledger: UsageLedger | None = None
+        self._trace_enabled = trace
+        self._last_trace_path: Path | None = None
+        # Per-stage checkpoints under reports/meta/runs (resume implies checkpointing)
+        self._checkpoint_enabled = checkpoint or resume_run_id is not None
+        self._resume_run_id = resume_run_id
+        self._checkpoint: RunCheckpoint | None = None
+        # The running pipeline's stage graph (set while _run_research runs)
+        self._stages: StageGraph | None = None
+
+    @property
+    def client(self) -> Anthropic:
+        """Sync Anthropic client, created on first use."""
+        if self._client is None:
+            self._client = Anthropic(api_key=self._api_key)
+        return self._client
+
+    @client.setter
+    def client(self, value: Anthropic) -> None:
+        self._client = value
 
     @property
     def last_source_count(self) -> int:
         """Number of sources used in the most recent run."""
         return self._last_source_count
 
+    @property
+    def last_source_urls(self) -> tuple[str, ...]:
+        """URLs of the sources that survived the relevance gate in the most recent run."""
+        return self._last_source_urls
+
+    @property
+    def last_sources(self) -> tuple[StoredSource, ...]:
+        """Surviving sources of the most recent run, in the form refresh_async() takes."""
+        return self._last_sources
+
+    @property
+    def last_refresh(self) -> RefreshOutcome | None:
+        """Outcome of the most recent run if it was a refresh_async(), else None."""
+        return self._last_refresh
+
     @property
     def last_gate_decision(self) -> str:
         """Relevance gate decision from the most recent run."""
@@ -127,6 +218,103 @@ class ResearchAgent:
         """
         return dict(self._source_counts)
 
+    @property
+    def last_speculation(self) -> SpeculationOutcome | None:
+        """Speculative pass-2 outcome of the most recent run (deep mode only)."""
+        return self._last_speculation
+
+    @property
+    def last_budget(self) -> BudgetReport | None:
+        """Latency budget outcome of the most recent run, or None if the mode has no budget."""
+        return self._last_budget
+
+    @property
+    def last_usage(self) -> UsageSummary | None:
+        """Token and cost usage from the most recent run, or None if not run."""
+        if self._usage_ledger is None:
+            return None
+        return self._usage_ledger.summary()
+
+    @property
+    def last_trace_path(self) -> Path | None:
+        """Chrome-trace JSON written for the most recent run (trace=True only)."""
+        return self._last_trace_path
+
+    @property
+    def last_run_id(self) -> str | None:
+        """Checkpoint run ID of the most recent run (checkpointing only).
+
+        Pass it as ``resume_run_id`` to retry a failed run without
+        repeating its finished stages.
+        """
+        return self._checkpoint.run_id if self._checkpoint else None
+
+    def _open_checkpoint(self, query: str) -> RunCheckpoint | None:
+        """Start or reopen this run's stage checkpoints."""
+        if self._resume_run_id is not None:
+            checkpoint = RunCheckpoint.open(self._resume_run_id, META_DIR / RUNS_SUBDIR)
+            if checkpoint.query != query or checkpoint.mode != self.mode.name:
+                raise ResearchError(
+                    f"Run {checkpoint.run_id} was a {checkpoint.mode} run for "
+                    f"{checkpoint.query!r}; resume it with the same query and mode"
+                )
+            logger.info("Resuming run %s (%s)", checkpoint.run_id,
+                        ", ".join(checkpoint.completed_stages()) or "no stages saved")
+            return checkpoint
+        if self._checkpoint_enabled:
+            checkpoint = RunCheckpoint.create(query, self.mode.name, META_DIR / RUNS_SUBDIR)
+            logger.info("Checkpointing run %s", checkpoint.run_id)
+            return checkpoint
+        return None
+
+    def _load_stage(self, stage: str | None) -> dict | None:
+        """Saved output of a finished stage when resuming, else None."""
+        if self._checkpoint is None or stage is None:
+            return None
+        return self._checkpoint.load(stage)
+
+    def _save_stage(self, stage: str | None, build: Callable[[], dict]) -> None:
+        """Checkpoint a finished stage (``build`` runs only when checkpointing)."""
+        if self._checkpoint is not None and stage is not None:
+            self._checkpoint.save(stage, build())
+
+    def _save_trace(self, trace: Trace | None) -> None:
+        """Write the run's span trace to reports/meta/traces."""
+        if trace is None:
+            return
+        try:
+            self._last_trace_path = trace.save(META_DIR / "traces")
+            logger.info("Saved trace to %s", self._last_trace_path)
+        except StateError as e:
+            logger.warning("Could not save trace: %s", e)
+
+    def _finish_budget(self) -> None:
+        """Record and log the run's latency budget outcome."""
+        if not self._budget.budget_s:
+            return
+        self._last_budget = self._budget.report()
+        if self._last_budget.degradations:
+            logger.info(
+                "Latency budget %.0fs: finished in %.1fs after degrading %s",
+                self._last_budget.budget_s, self._last_budget.elapsed_s,
+                ", ".join(d.action for d in self._last_budget.degradations),
+            )
+
+    def _save_usage(self, query: str) -> None:
+        """Log the run's usage totals and persist them to reports/meta."""
+        if self._usage_ledger is None or not self._usage_ledger.records:
+            return
+        summary = self._usage_ledger.summary()
+        logger.info(
+            "Usage: %d calls, %d input / %d output tokens, $%.4f",
+            summary.total.calls, summary.total.input_tokens,
+            summary.total.output_tokens, summary.total.cost_usd,
+        )
+        try:
+            save_usage(summary, query, self.mode.name, META_DIR)
+        except StateError as e:
+            logger.warning("Could not save usage: %s", e)
+
     def _load_context_for(
         self, context_path: Path | None, no_context: bool,
         cache: dict[str, ContextResult] | None = None,
@@ -152,50 +340,22 @@ class ResearchAgent:
             f"Run with `--force` to research anyway, or wait for gaps to become stale."
         )
 
-    def _update_gap_states(self, decision: str) -> None:
-        """Update gap schema after research completes.
-
-        - full_report / short_report -> mark_verified() for researched gaps
-        - no_new_findings -> mark_checked() (searched but found nothing)
-        - insufficient_data -> no state update (search itself failed)
-        """
-        schema_result = self._current_schema_result
-        if not schema_result or self._current_research_batch is None:
-            return
-
-        batch_ids = {g.id for g in self._current_research_batch}
-        updated_gaps: list[Gap] = []
-        audit_log_path = self.schema_path.parent / "gap_audit.log"
-
-        for gap in schema_result.gaps:
-            if gap.id not in batch_ids:
-                updated_gaps.append(gap)
-                continue
-
-            if decision in (GateDecision.FULL_REPORT, GateDecision.SHORT_REPORT):
-                new_gap = mark_verified(gap)
-                if gap.status != new_gap.status:
-                    log_flip(
-                        audit_log_path, gap.id,
-                        gap.status, new_gap.status,
-                        reason=f"Research completed: {decision}",
-                    )
-                updated_gaps.append(new_gap)
-            elif decision == GateDecision.NO_NEW_FINDINGS:
-                new_gap = mark_checked(gap)
-                updated_gaps.append(new_gap)
-                logger.info("Gap '%s' checked (no new findings)", gap.id)
-            else:
-                # insufficient_data -- don't update state
-                updated_gaps.append(gap)
-
-        try:
-            save_schema(self.schema_path, tuple(updated_gaps))
-            logger.info("Updated %d gap states in %s", len(batch_ids), self.schema_path)
-        except StateError as e:
-            logger.warning("Failed to save gap state: %s", e)
-
-    def _run_critique(
+    def _gap_cycle_response(self, cycle: GapCycleResult) -> str:
+        """Combine a gap cycle's per-gap reports into one response."""
+        saved = "updated" if cycle.schema_saved else "unchanged"
+        parts = [
+            f"# Gap Cycle: {len(cycle.gaps)} Gaps Researched\n\n"
+            f"{len(cycle.verified)} verified, {len(cycle.checked)} checked with no new "
+            f"findings; gap schema {saved}."
+        ]
+        for result in cycle.gaps:
+            outcome = result.decision or f"failed: {result.job.error}"
+            parts.append(f"## Gap: {result.gap.id} ({result.gap.category}) — {outcome}")
+            if result.job.result is not None:
+                parts.append(result.job.result.report.strip())
+        return "\n\n".join(parts) + "\n"
+
+    async def _run_critique(
         self,
         query: str,
         surviving_count: int,
@@ -206,10 +366,13 @@ class ResearchAgent:
         """Run self-critique after report synthesis. Never crashes pipeline."""
         if self.mode.is_quick or self._skip_critique:
             return  # Quick mode has no skeptic data; --no-critique opts out
+        if self._budget.behind("critique"):
+            self._budget.skip("critique", "skipped self-critique")
+            return
 
         try:
-            result = evaluate_report(
-                client=self.client,
+            result = await evaluate_report_async(
+                client=self.async_client,
                 query=query,
                 mode_name=self.mode.name,
                 surviving_sources=surviving_count,
@@ -219,7 +382,7 @@ class ResearchAgent:
                 model=self.mode.planning_model,
                 temperature=self.mode.planning_temperature,
             )
-            save_critique(result, META_DIR)
+            await asyncio.to_thread(save_critique, result, META_DIR)
             self._last_critique = result
             logger.info(
                 "Self-critique: mean=%.1f pass=%s", result.mean_score, result.overall_pass
@@ -246,6 +409,37 @@ class ResearchAgent:
                 urls.add(src.url)
         return urls
 
+    async def _iterate(
+        self, query: str, report: str, evaluation: RelevanceEvaluation,
+    ) -> tuple[str, int]:
+        """Run query iteration under its timeout, recording the outcome.
+
+        Returns (report, sources_added); the report is unchanged when
+        iteration fails or times out. Behind the latency budget, the
+        timeout shrinks to what is left of it.
+        """
+        timeout = ITERATION_TIMEOUT
+        step = nullcontext()
+        if self._budget.behind("iteration"):
+            timeout = min(ITERATION_TIMEOUT, max(MIN_ITERATION_TIMEOUT, self._budget.remaining()))
+            step = self._budget.degraded("iteration", f"iteration timeout {timeout:.0f}s")
+        try:
+            with step:
+                report, sources_added = await asyncio.wait_for(
+                    self._run_iteration(query, report, evaluation),
+                    timeout=timeout,
+                )
+        except asyncio.TimeoutError:
+            logger.warning("Iteration timed out after %.0fs", timeout)
+            self._iteration_status = "error"
+            return report, 0
+        except IterationError as e:
+            logger.warning("Iteration failed: %s", e)
+            self._iteration_status = "error"
+            return report, 0
+        self._iteration_status = "completed" if sources_added > 0 else "no_new_sources"
+        return report, sources_added
+
     async def _run_iteration(
         self,
         query: str,
@@ -267,15 +461,13 @@ class ResearchAgent:
         # Generate refined queries and follow-up questions in parallel
         self._next_step("Refining queries...")
         refined_result, followup_result = await asyncio.gather(
-            asyncio.to_thread(
-                generate_refined_queries,
-                self.client, query, report,
+            generate_refined_queries_async(
+                self.async_client, query, report,
                 model=self.mode.planning_model,
                 temperature=self.mode.planning_temperature,
             ),
-            asyncio.to_thread(
-                generate_followup_questions,
-                self.client, query, report,
+            generate_followup_questions_async(
+                self.async_client, query, report,
                 num_questions=self.mode.followup_questions,
                 model=self.mode.planning_model,
                 temperature=self.mode.planning_temperature,
@@ -335,28 +527,56 @@ class ResearchAgent:
             title = f"Deeper Dive: {safe_q}" if q in refined_set else f"Follow-Up: {safe_q}"
             query_titles.append((q, title))
 
-        # Synthesize mini-reports in parallel with bounded concurrency
+        # Every mini-report draws on the same sources, so pack them once
+        packed = pack_sources(new_summaries, max_tokens=MINI_REPORT_SOURCE_TOKENS)
+
+        # One batched call when the mode allows it; sections it misses (or
+        # every section, without batching) are synthesized in parallel with
+        # bounded concurrency
         sem = asyncio.Semaphore(MAX_CONCURRENT_SUB_QUERIES)
 
         async def _synthesize_one(q: str, title: str) -> str | None:
             async with sem:
                 try:
-                    return await asyncio.to_thread(
-                        synthesize_mini_report,
-                        self.client, q, new_summaries,
+                    return await synthesize_mini_report_async(
+                        self.async_client, q, new_summaries,
                         section_title=title,
                         model=self.mode.model,
                         max_tokens=iteration_max_tokens,
                         report_headings=report_headings,
                         temperature=self.mode.synthesis_temperature,
+                        sources=packed,
                     )
                 except SynthesisError as e:
                     logger.warning("Mini-report failed for '%s': %s", q, e)
                     return None
 
-        results = await asyncio.gather(
-            *[_synthesize_one(q, t) for q, t in query_titles]
+        results: list[str | None] = [None] * len(query_titles)
+        pending = list(range(len(query_titles)))
+        if self.mode.batch_mini_reports and len(query_titles) > 1:
+            try:
+                results = await synthesize_mini_reports_async(
+                    self.async_client, query_titles, new_summaries,
+                    model=self.mode.model,
+                    max_tokens=iteration_max_tokens,
+                    report_headings=report_headings,
+                    temperature=self.mode.synthesis_temperature,
+                    sources=packed,
+                )
+            except SynthesisError as e:
+                logger.warning("Batched mini-reports failed: %s", e)
+            pending = [i for i, r in enumerate(results) if r is None]
+            if pending:
+                logger.info(
+                    "Batched mini-reports missing %d of %d sections, synthesizing individually",
+                    len(pending), len(query_titles),
+                )
+
+        individual = await asyncio.gather(
+            *[_synthesize_one(*query_titles[i]) for i in pending]
         )
+        for i, section in zip(pending, individual):
+            results[i] = section
         appended_sections = [r for r in results if r is not None]
 
         if appended_sections:
@@ -370,6 +590,7 @@ class ResearchAgent:
         self._step_num += 1
         elapsed = time.monotonic() - self._start_time
         logger.info("[%d/%d] %s (%.1fs)", self._step_num, self._step_total, message, elapsed)
+        emit(StageEvent(self._step_num, self._step_total, message, round(elapsed, 3)))
 
     def research(self, query: str) -> str:
         """Perform research on a query and return a markdown report."""
@@ -390,18 +611,129 @@ class ResearchAgent:
         """
         return await self._research_async(query)
 
-    async def _research_async(self, query: str) -> str:
-        """Async implementation of research."""
+    def refresh(
+        self, query: str, sources: Sequence[StoredSource], saved_report: Path | None = None,
+    ) -> str:
+        """Refresh a saved report from the sources it was written from."""
+        return asyncio.run(self._research_async(query, refresh=(sources, saved_report)))
+
+    async def refresh_async(
+        self, query: str, sources: Sequence[StoredSource], saved_report: Path | None = None,
+    ) -> str:
+        """
+        Refresh a saved report, redoing only what changed since it was written.
+
+        Each stored source is re-fetched with a conditional request. Pages
+        that come back not modified, or with the same extracted text, keep
+        their stored summaries and scores. Changed pages and the new pages
+        from one delta search of the query are summarized and scored, and
+        the report is re-synthesized from old and new summaries together.
+        If nothing that survives the relevance gate changed, the saved
+        report is returned as it is. last_refresh says what happened.
+
+        Args:
+            query: The saved report's query
+            sources: The report's stored sources (ResearchResult.sources)
+            saved_report: Path of the saved report, returned unchanged
+                when nothing changed
+
+        Returns:
+            Markdown report string
+
+        Raises:
+            ResearchError: If the refresh fails
+        """
+        return await self._research_async(query, refresh=(sources, saved_report))
+
+    async def research_stream(self, query: str) -> AsyncIterator[ProgressEvent]:
+        """Run research, yielding progress events as they happen.
+
+        Yields a StageEvent per pipeline step, a SourcesEvent once the
+        relevance gate has scored the sources, TextDelta chunks while the
+        report streams from the model, and finally a ResultEvent with the
+        full report. Closing the iterator early cancels the run.
+
+        Args:
+            query: The research question
+
+        Raises:
+            ResearchError: If research fails
+        """
+        events: asyncio.Queue[ProgressEvent | None] = asyncio.Queue()
+        # The task copies the current context, so it keeps the listener
+        with progress_scope(queue_listener(events)):
+            task = asyncio.create_task(self._research_async(query))
+        # Queued after any events the run's last callbacks put
+        task.add_done_callback(lambda _: events.put_nowait(None))
+        try:
+            while (event := await events.get()) is not None:
+                yield event
+            report = task.result()
+        finally:
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        yield ResultEvent(report)
+
+    async def _research_async(
+        self, query: str,
+        refresh: tuple[Sequence[StoredSource], Path | None] | None = None,
+    ) -> str:
+        """Async implementation of research, with run-scoped usage and tracing.
+
+        With ``refresh`` (stored sources, saved report path) the run is an
+        incremental refresh instead of a full pipeline run.
+        """
+        self._usage_ledger = UsageLedger()
+        self._last_trace_path = None
+        self._checkpoint = None
+        self._stages = None
+        self._last_speculation = None
+        self._last_budget = None
+        self._budget = LatencyBudget(self.mode.latency_budget_s)
+        trace = Trace() if self._trace_enabled else None
+        with usage_scope(self._usage_ledger), trace_scope(trace):
+            try:
+                with span("research", query=query, mode=self.mode.name):
+                    if refresh is None:
+                        report = await self._run_research(query)
+                    else:
+                        report = await self._run_refresh(query, *refresh)
+            except BaseException:
+                if self._checkpoint is not None:
+                    logger.warning(
+                        "Run %s stopped; finished stages are saved in %s (resume with --resume %s)",
+                        self._checkpoint.run_id, self._checkpoint.directory, self._checkpoint.run_id,
+                    )
+                raise
+            finally:
+                self._stages = None
+                self._finish_budget()
+                self._save_usage(query)
+                self._save_trace(trace)
+        if self._checkpoint is not None:
+            self._checkpoint.discard()
+        return report
+
+    def _reset_run_state(self) -> None:
+        """Clear the previous run's results before a new run starts."""
         self._start_time = time.monotonic()
         self._step_num = 0
-        self._current_schema_result = None
-        self._current_research_batch = None
         self._last_source_count = 0
+        self._last_source_urls = ()
+        self._last_sources = ()
+        self._last_refresh = None
+        self._page_validators = {}
+        self._content_hashes = {}
         self._last_gate_decision = ""
         self._last_critique = None
         self._iteration_status = "skipped"
         self._iteration_sections = ()
         self._source_counts = {}
+
+    async def _run_research(self, query: str) -> str:
+        """Run the research pipeline for one query."""
+        self._reset_run_state()
         context_cache = new_context_cache()
 
         # Pre-flight: reject vague queries before any LLM work
@@ -409,14 +741,268 @@ class ResearchAgent:
         if not vague_check.is_valid:
             raise VagueQueryError(vague_check.message)
 
+        self._checkpoint = self._open_checkpoint(query)
+
+        # Calculate total steps:
+        # Quick=6, Standard=8, Deep=9
+        # +1 if decomposition step is shown (mode.decompose is True)
+        # +2 if iteration is enabled (refine queries + pre-research follow-ups)
+        if self.mode.is_deep:
+            base_steps = 9
+        elif self.mode.is_standard:
+            base_steps = 8
+        else:
+            base_steps = 6
+        iteration_steps = (
+            2 if self.mode.iteration_enabled and not self._skip_iteration else 0
+        )
+        self._step_total = base_steps + (1 if self.mode.decompose else 0) + iteration_steps
+
+        logger.debug(
+            "Model routing: synthesis=%s, planning=%s, relevance=%s",
+            self.mode.model, self.mode.planning_model, self.mode.relevance_model,
+        )
+
+        # Stages start as soon as their inputs are ready: the pass-1 search
+        # needs nothing, so it overlaps context detection and decomposition.
+        # A gap schema hands the run to a gap cycle, which never uses it, so
+        # when one may apply the search waits for the gap check instead of
+        # spending credits.
+        async with StageGraph() as stages:
+            self._stages = stages
+            stages.add("context", lambda: self._resolve_context(query, context_cache))
+            stages.add("critique_history", self._load_critique_context)
+            if not self._may_use_gap_schema(context_cache) and (
+                    self._checkpoint is None
+                    or "search" not in self._checkpoint.completed_stages()):
+                stages.add("pass1_search", lambda: self._search_pass1(query))
+            if self.mode.decompose:
+                stages.add(
+                    "decomposition",
+                    lambda context, critique_history: self._decompose(query, context, critique_history),
+                    inputs=("context", "critique_history"),
+                )
+            stages.add("gap_schema", lambda context: self._check_gap_schema(query, context),
+                       inputs=("context",))
+
+            decomposition = await stages.result("decomposition") if self.mode.decompose else None
+            gap_cycle_report = await stages.result("gap_schema")
+            if gap_cycle_report is not None:
+                return gap_cycle_report
+            critique_context = await stages.result("critique_history")
+
+            self._next_step(f"Searching for: {query}")
+            logger.info("Mode: %s (%d sources, %d passes)", self.mode.name, self.mode.max_sources, self.mode.search_passes)
+
+            if self.mode.is_deep:
+                return await self._research_deep(query, decomposition, critique_context)
+            else:
+                return await self._research_with_refinement(query, decomposition, critique_context)
+
+    async def _run_refresh(
+        self, query: str, sources: Sequence[StoredSource], saved_report: Path | None,
+    ) -> str:
+        """Incrementally refresh a report from its stored sources."""
+        self._reset_run_state()
+        if not sources:
+            raise ResearchError("No stored sources to refresh from")
+        for source in sources:
+            self._page_validators[source.url] = PageValidators(source.etag, source.last_modified)
+            self._content_hashes[source.url] = source.content_hash
+
+        # Revalidate, delta search, summarize, evaluate, then synthesis
+        iteration_steps = (
+            2 if self.mode.iteration_enabled and not self._skip_iteration else 0
+        )
+        self._step_total = 4 + (1 if self.mode.is_quick else 3) + iteration_steps
+
+        async with StageGraph() as stages:
+            self._stages = stages
+            stages.add("context", lambda: self._resolve_context(query, new_context_cache()))
+            stages.add("critique_history", self._load_critique_context)
+            stages.add("revalidate", lambda: self._revalidate(sources))
+            stages.add("delta_search", lambda: self._delta_search(query, sources))
+
+            await stages.result("context")
+            critique_context = await stages.result("critique_history")
+            unchanged, unverified, changed = await stages.result("revalidate")
+            new = await stages.result("delta_search")
+
+        logger.info(
+            "Refresh: %d unchanged, %d unverified, %d changed, %d new",
+            len(unchanged), len(unverified), len(changed), len(new),
+        )
+        kept_urls = {s.url for s in unchanged + unverified}
+        kept = [s for s in sources if s.url in kept_urls]
+        outcome = RefreshOutcome(
+            report=saved_report.name if saved_report else "",
+            unchanged=len(unchanged),
+            unverified=len(unverified),
+            changed=len(changed),
+            new=len(new),
+        )
+
+        new_summaries: list[Summary] = []
+        if changed or new:
+            try:
+                new_summaries = await self._summarize(
+                    changed + new, structured=self.mode.is_deep,
+                    max_chunks=5 if self.mode.is_deep else 3, quiet=False,
+                )
+            except ResearchError as e:
+                logger.warning("Refresh summarize failed: %s", e)
+        self._next_step("Evaluating source relevance...")
+        fresh = await evaluate_sources(
+            query=query,
+            summaries=new_summaries,
+            mode=self.mode,
+            client=self.async_client,
+            refined_query=query,
+            critique_guidance=critique_context,
+        )
+        kept_summaries = [
+            Summary(url=s.url, title=s.title, summary=text) for s in kept for text in s.summaries
+        ]
+        stored = RelevanceEvaluation(
+            decision=GateDecision.FULL_REPORT,
+            decision_rationale="",
+            surviving_sources=tuple(kept_summaries),
+            dropped_sources=(),
+            total_scored=len(kept),
+            total_survived=len(kept),
+            refined_query=query,
+            surviving_scores=tuple(
+                SourceScore(url=s.url, title=s.title, score=s.score,
+                            explanation="Stored from the previous run")
+                for s in kept
+            ),
+        )
+        evaluation = self._merge_evaluations(stored, fresh, verbose=True)
+
+        if saved_report is not None and not changed and not fresh.surviving_sources:
+            try:
+                report = saved_report.read_text(encoding="utf-8")
+            except OSError as e:
+                logger.warning("Could not read saved report %s: %s", saved_report, e)
+            else:
+                logger.info("Nothing changed since %s; reusing it", saved_report.name)
+                self._last_source_count = len(kept)
+                self._last_source_urls = tuple(s.url for s in kept)
+                self._last_sources = self._stored_sources(evaluation)
+                self._last_gate_decision = evaluation.decision
+                self._last_refresh = replace(outcome, reused_report=True)
+                return report
+
+        report = await self._evaluate_and_synthesize(
+            query, kept_summaries + new_summaries, query, critique_context,
+            evaluation=evaluation,
+        )
+        self._last_refresh = outcome
+        return report
+
+    async def _revalidate(
+        self, sources: Sequence[StoredSource],
+    ) -> tuple[list[StoredSource], list[StoredSource], list[ExtractedContent]]:
+        """Re-fetch stored sources with conditional requests.
+
+        Returns:
+            (unchanged, unverified, changed): sources that were not
+            modified or extract to the same text, sources that could not
+            be re-fetched or extracted (their stored summaries still
+            stand), and the new extracted content of those that changed.
+        """
+        self._next_step(f"Revalidating {len(sources)} sources...")
+        validators = {s.url: PageValidators(s.etag, s.last_modified) for s in sources}
+        pages = await fetch_urls(list(validators), validators=validators)
+        by_url = {p.url: p for p in pages}
+        modified = [p for p in pages if not p.not_modified]
+        extracted = {
+            c.url: c for c in await asyncio.to_thread(extract_all, modified)
+        } if modified else {}
+
+        unchanged: list[StoredSource] = []
+        unverified: list[StoredSource] = []
+        changed: list[ExtractedContent] = []
+        for source in sources:
+            page = by_url.get(source.url)
+            if page is not None and page.not_modified:
+                unchanged.append(source)
+                continue
+            content = extracted.get(source.url)
+            if content is None:
+                logger.info("Could not revalidate %s; keeping stored summaries", source.url)
+                unverified.append(source)
+                continue
+            self._page_validators[source.url] = PageValidators(page.etag, page.last_modified)
+            digest = _content_hash(content.text)
+            if digest == source.content_hash:
+                unchanged.append(source)
+            else:
+                self._content_hashes[source.url] = digest
+                changed.append(content)
+        return unchanged, unverified, changed
+
+    async def _delta_search(
+        self, query: str, sources: Sequence[StoredSource],
+    ) -> list[ExtractedContent]:
+        """One search for pages the stored report does not cite yet."""
+        self._next_step(f"Searching for new sources: {query}")
+        known = {s.url for s in sources}
+        try:
+            results = await asyncio.to_thread(search, query, self.mode.pass1_sources)
+        except SearchError as e:
+            logger.warning("Delta search failed: %s", e)
+            return []
+        results = [r for r in results if r.url not in known]
+        if not results:
+            logger.info("Delta search found no new sources")
+            return []
+        try:
+            contents = await self._fetch_extract(results, quiet=True)
+        except ResearchError as e:
+            logger.warning("Delta fetch failed: %s", e)
+            return []
+        for content in contents:
+            self._content_hashes[content.url] = _content_hash(content.text)
+        return contents
+
+    def _stored_sources(self, evaluation: RelevanceEvaluation) -> tuple[StoredSource, ...]:
+        """The evaluation's surviving sources, in the form a refresh reuses."""
+        scores = {s.url: s.score for s in evaluation.surviving_scores}
+        grouped: dict[str, list[Summary]] = {}
+        for summary in evaluation.surviving_sources:
+            grouped.setdefault(summary.url, []).append(summary)
+        stored = []
+        for url, summaries in grouped.items():
+            validators = self._page_validators.get(url, PageValidators())
+            stored.append(StoredSource(
+                url=url,
+                title=summaries[0].title,
+                score=scores.get(url, self.mode.relevance_cutoff),
+                summaries=tuple(s.summary for s in summaries),
+                etag=validators.etag,
+                last_modified=validators.last_modified,
+                content_hash=self._content_hashes.get(url, ""),
+            ))
+        return tuple(stored)
+
+    async def _resolve_context(
+        self, query: str, context_cache: dict[str, ContextResult],
+    ) -> ContextResult:
+        """Pick the run's context (auto-detecting it if needed) and load it."""
         # Auto-detect context when no --context flag was given.
         # Use local variables to avoid mutating self (preserves agent reuse).
         effective_context_path = self.context_path
         effective_no_context = self.no_context
 
-        if effective_context_path is None and not effective_no_context and CONTEXTS_DIR.is_dir():
-            detected = await asyncio.to_thread(
-                auto_detect_context, self.client, query,
+        saved_context = self._load_stage("context")
+        if saved_context is not None:
+            # A resumed run keeps the context it started with
+            effective_context_path = Path(saved_context["path"]) if saved_context["path"] else None
+            effective_no_context = saved_context["no_context"]
+        elif effective_context_path is None and not effective_no_context and CONTEXTS_DIR.is_dir():
+            detected = await auto_detect_context_async(
+                self.async_client, query,
                 temperature=self.mode.planning_temperature,
             )
             if detected is not None:
@@ -426,69 +1012,105 @@ class ResearchAgent:
                 # contexts/ exists but nothing matched — skip context
                 effective_no_context = True
                 logger.info("Auto-detect found no matching context; running without context")
+        if saved_context is None:
+            self._save_stage("context", lambda: {
+                "path": str(effective_context_path) if effective_context_path else None,
+                "no_context": effective_no_context,
+            })
 
         # Load context once for the entire run using effective (post-auto-detect) state
-        logger.debug(
-            "Model routing: synthesis=%s, planning=%s, relevance=%s",
-            self.mode.model, self.mode.planning_model, self.mode.relevance_model,
-        )
-
         self._run_context = self._load_context_for(
             effective_context_path, effective_no_context, cache=context_cache,
         )
         if self._run_context.status == ContextStatus.FAILED:
             logger.warning("Context file could not be read: %s — continuing without context",
                            self._run_context.error)
+        return self._run_context
 
-        critique_context: str | None = None
-        if not self.mode.is_quick:
-            critique_ctx = await asyncio.to_thread(load_critique_history, META_DIR)
-            if critique_ctx:
-                critique_context = critique_ctx.content
-                logger.info("Loaded critique history for adaptive prompts")
-
-        # Calculate total steps:
-        # Quick=6, Standard=8, Deep=9
-        # +1 if decomposition step is shown (mode.decompose is True)
-        # +2 if iteration is enabled (refine queries + pre-research follow-ups)
-        if self.mode.is_deep:
-            base_steps = 9
-        elif self.mode.is_standard:
-            base_steps = 8
+    async def _load_critique_context(self) -> str | None:
+        """Critique history that adapts prompts, or None (always None in quick mode)."""
+        if self.mode.is_quick:
+            return None
+        critique_ctx = await asyncio.to_thread(load_critique_history, META_DIR)
+        if not critique_ctx:
+            return None
+        logger.info("Loaded critique history for adaptive prompts")
+        return critique_ctx.content
+
+    async def _decompose(
+        self, query: str, context: ContextResult, critique_context: str | None,
+    ) -> DecompositionResult:
+        """Split the query into sub-queries when it is complex."""
+        self._next_step("Analyzing query...")
+        saved = self._load_stage("decomposition")
+        if saved is not None:
+            decomposition = DecompositionResult(
+                sub_queries=tuple(saved["sub_queries"]),
+                is_complex=saved["is_complex"],
+                reasoning=saved["reasoning"],
+            )
         else:
-            base_steps = 6
-        iteration_steps = (
-            2 if self.mode.iteration_enabled and not self._skip_iteration else 0
-        )
-        self._step_total = base_steps + (1 if self.mode.decompose else 0) + iteration_steps
-
-        # Try query decomposition if mode supports it
-        decomposition = None
-        if self.mode.decompose:
-            self._next_step("Analyzing query...")
-            decomposition = await asyncio.to_thread(
-                decompose_query, self.client, query,
-                context_content=self._run_context.content,
+            decomposition = await decompose_query_async(
+                self.async_client, query,
+                context_content=context.content,
                 model=self.mode.planning_model,
                 critique_guidance=critique_context,
                 temperature=self.mode.planning_temperature,
                 novelty_queries=self.mode.novelty_queries,
             )
-            if decomposition.is_complex:
-                sub_queries = decomposition.sub_queries
-                reasoning = decomposition.reasoning
-                if reasoning:
-                    logger.info("%s", reasoning)
-                logger.info("Decomposed into %d sub-queries:", len(sub_queries))
-                for sq in sub_queries:
-                    logger.info("  → %s", sq)
-            else:
-                logger.info("Simple query — skipping decomposition")
+            self._save_stage("decomposition", lambda: to_rows([decomposition])[0])
+        if decomposition.is_complex:
+            sub_queries = decomposition.sub_queries
+            reasoning = decomposition.reasoning
+            if reasoning:
+                logger.info("%s", reasoning)
+            logger.info("Decomposed into %d sub-queries:", len(sub_queries))
+            for sq in sub_queries:
+                logger.info("  → %s", sq)
+        else:
+            logger.info("Simple query — skipping decomposition")
+        return decomposition
+
+    def _may_use_gap_schema(self, context_cache: dict[str, ContextResult]) -> bool:
+        """Whether this run may be handed to a gap cycle, before context is resolved.
+
+        True for an explicit schema, or when the run's context file (or,
+        when it will be auto-detected, any file in contexts/) has a
+        profile gap_schema. Loads go through the run's context cache.
+        """
+        if self.schema_path:
+            return True
+        if not self._use_gap_schema or self.no_context:
+            return False
+        if self.context_path is not None:
+            candidates = [self.context_path]
+        elif CONTEXTS_DIR.is_dir():
+            candidates = sorted(CONTEXTS_DIR.glob("*.md"))
+        else:
+            return False
+        for path in candidates:
+            profile = load_full_context(path, cache=context_cache).profile
+            if profile and profile.gap_schema:
+                return True
+        return False
+
+    async def _check_gap_schema(self, query: str, context: ContextResult) -> str | None:
+        """Run a gap cycle instead of the query, if a gap schema is configured.
 
+        Each selected gap is researched as its own query (see
+        gap_cycle.run_gap_cycle_async) and marked from its own gate
+        decision; ``query`` becomes the topic of every gap's query.
+
+        Returns:
+            The gap cycle's combined response (or the "all intelligence
+            current" response when no gap needs research), else None
+            to research the query itself.
+        """
         # Pre-research gap check (if schema configured)
         # Gap schema fallback: if no --schema was passed, check profile
-        if not self.schema_path and self._run_context.profile and self._run_context.profile.gap_schema:
-            gap_rel = self._run_context.profile.gap_schema
+        if (self._use_gap_schema and not self.schema_path
+                and context.profile and context.profile.gap_schema):
+            gap_rel = context.profile.gap_schema
             project_root = Path.cwd()
             gap_path = (project_root / gap_rel).resolve()
             if gap_path.is_relative_to(project_root.resolve()) and gap_path.is_file():
@@ -497,34 +1119,44 @@ class ResearchAgent:
             else:
                 logger.warning("gap_schema file not found or outside project: %s", gap_rel)
 
-        if self.schema_path:
-            schema_result = load_schema(self.schema_path)
-            if schema_result.is_loaded:
-                stale = detect_stale(
-                    schema_result.gaps,
-                    default_ttl_days=self.cycle_config.default_ttl_days,
-                )
-                stale_ids = {g.id for g in stale}
-                candidates = tuple(
-                    g for g in schema_result.gaps
-                    if g.id in stale_ids or g.status == GapStatus.UNKNOWN
-                )
-                if not candidates:
-                    return self._already_covered_response(schema_result)
-                research_batch = select_batch(candidates, self.cycle_config.max_gaps_per_run)
-                unknown_count = sum(1 for g in candidates if g.status == GapStatus.UNKNOWN)
-                logger.info("Gap schema: %d gaps to research (%d stale, %d unknown)",
-                            len(research_batch), len(stale), unknown_count)
-                self._current_schema_result = schema_result
-                self._current_research_batch = research_batch
-
-        self._next_step(f"Searching for: {query}")
-        logger.info("Mode: %s (%d sources, %d passes)", self.mode.name, self.mode.max_sources, self.mode.search_passes)
+        if not self.schema_path:
+            return None
+        schema_result = load_schema(self.schema_path)
+        if not schema_result.is_loaded:
+            return None
 
-        if self.mode.is_deep:
-            return await self._research_deep(query, decomposition, critique_context)
-        else:
-            return await self._research_with_refinement(query, decomposition, critique_context)
+        # Deferred: the gap cycle runs its gaps through the batch runner,
+        # which builds agents of its own
+        from .gap_cycle import run_gap_cycle_async
+
+        cycle = await run_gap_cycle_async(
+            self.schema_path, topic=query, mode=self.mode.name,
+            # Every gap uses this run's context; its gap_schema is ignored there
+            context=Path(context.source).stem if context else "none",
+            cycle_config=self.cycle_config,
+            skip_critique=self._skip_critique, skip_iteration=self._skip_iteration,
+        )
+        if not cycle.gaps:
+            return self._already_covered_response(schema_result)
+        return self._gap_cycle_response(cycle)
+
+    async def _search_pass1(self, query: str) -> list[SearchResult]:
+        """Search the original query (pass 1)."""
+        logger.info("Original query: %s", query)
+        try:
+            results = await asyncio.to_thread(
+                search, query, self.mode.pass1_sources
+            )
+            logger.info("Pass 1 found %d results", len(results))
+        except SearchError as e:
+            raise ResearchError(f"Search failed: {e}")
+        return results
+
+    async def _pass1_results(self, query: str) -> list[SearchResult]:
+        """Pass-1 results, from the pass1_search stage when it was started."""
+        if self._stages is not None and "pass1_search" in self._stages:
+            return list(await self._stages.result("pass1_search"))
+        return await self._search_pass1(query)
 
     @staticmethod
     def _split_prefetched(
@@ -545,6 +1177,7 @@ class ResearchAgent:
         return prefetched, urls_to_fetch
 
     @staticmethod
+    @traced("stage.search_sub_queries")
     async def _search_sub_queries(
         sub_queries: list[str],
         per_sq_sources: int,
@@ -583,26 +1216,111 @@ class ResearchAgent:
 
         return new_results
 
+    @traced("stage.fetch_extract_summarize")
     async def _fetch_extract_summarize(
         self,
         results: list[SearchResult],
         structured: bool = False,
         max_chunks: int = 3,
         quiet: bool = False,
+        stage: str | None = None,
+        early_fetch: str | None = None,
     ) -> list[Summary]:
         """Shared pipeline: split prefetched, fetch, extract, cascade, summarize.
 
         Args:
             quiet: If True, suppress step headers (used by deep mode pass 2).
+            stage: Checkpoint name for the extracted contents and summaries,
+                so a resumed run skips whichever of them already finished.
+            early_fetch: Name of a stage that already fetched some of the
+                pages (see _fetch_early()); only the rest are fetched here.
+        """
+        saved = self._load_stage(f"{stage}_summaries" if stage else None)
+        if saved is not None:
+            return from_rows(Summary, saved["summaries"])
+
+        saved = self._load_stage(f"{stage}_contents" if stage else None)
+        if saved is not None:
+            contents = from_rows(ExtractedContent, saved["contents"])
+        else:
+            contents = await self._fetch_extract(results, quiet=quiet, early_fetch=early_fetch)
+            self._save_stage(f"{stage}_contents" if stage else None,
+                             lambda: {"contents": to_rows(contents)})
+        for content in contents:
+            self._content_hashes[content.url] = _content_hash(content.text)
+
+        summaries = await self._summarize(contents, structured, max_chunks, quiet)
+        self._save_stage(f"{stage}_summaries" if stage else None,
+                         lambda: {"summaries": to_rows(summaries)})
+        return summaries
+
+    async def _summarize(
+        self,
+        contents: list[ExtractedContent],
+        structured: bool,
+        max_chunks: int,
+        quiet: bool,
+    ) -> list[Summary]:
+        """Summarize extracted contents, with fewer chunks when behind budget."""
+        logger.info("Summarizing content with %s...", self.mode.model)
+        if not quiet:
+            self._next_step(f"Summarizing content with {self.mode.model}...")
+        step = nullcontext()
+        if max_chunks > DEGRADED_MAX_CHUNKS and self._budget.behind("summarize"):
+            max_chunks = DEGRADED_MAX_CHUNKS
+            step = self._budget.degraded("summarize", f"summarized {max_chunks} chunk per page")
+        with step:
+            summaries = await summarize_all(
+                self.async_client,
+                contents,
+                model=self.mode.model,
+                structured=structured,
+                max_chunks=max_chunks,
+                temperature=self.mode.summarize_temperature,
+                chunk_mode=self.mode.chunk_mode,
+                stitch=self.mode.stitch_chunks,
+            )
+        logger.info("Generated %d summaries", len(summaries))
+
+        if not summaries:
+            raise ResearchError("Could not generate any summaries")
+        return summaries
+
+    @staticmethod
+    async def _fetch_early(urls: list[str]) -> tuple[frozenset[str], list[FetchedPage]]:
+        """Fetch pages ahead of _fetch_extract(); returns (URLs tried, pages)."""
+        return frozenset(urls), await fetch_urls(urls)
+
+    async def _fetch_pages(self, urls: list[str], early_fetch: str | None) -> list[FetchedPage]:
+        """Fetch ``urls``, reusing whatever the ``early_fetch`` stage fetched.
+
+        The stage's result starts with (URLs tried, pages), as from
+        _fetch_early().
         """
+        pages: list[FetchedPage] = []
+        if early_fetch is not None and self._stages is not None:
+            tried, early_pages, *_ = await self._stages.result(early_fetch)
+            pages = list(early_pages)
+            urls = [u for u in urls if u not in tried]
+        if urls:
+            pages.extend(await fetch_urls(urls))
+        return pages
+
+    async def _fetch_extract(
+        self, results: list[SearchResult], quiet: bool = False,
+        early_fetch: str | None = None,
+    ) -> list[ExtractedContent]:
+        """Fetch and extract search results, recovering failures via cascade."""
         # Single blocked-domain filter — covers ALL search paths
         results = self._filter_blocked(results)
 
         prefetched, urls_to_fetch = self._split_prefetched(results)
         if not quiet:
             self._next_step(f"Fetching {len(results)} pages...")
-        pages = await fetch_urls(urls_to_fetch) if urls_to_fetch else []
+        pages = await self._fetch_pages(urls_to_fetch, early_fetch) if urls_to_fetch else []
         logger.info("Successfully fetched %d pages (%d from search cache)", len(pages), len(prefetched))
+        for page in pages:
+            self._page_validators[page.url] = PageValidators(page.etag, page.last_modified)
 
         if not pages and not prefetched:
             raise ResearchError("Could not fetch any pages")
@@ -663,23 +1381,7 @@ class ResearchAgent:
         if not contents:
             raise ResearchError("Could not extract content from any pages")
 
-        logger.info("Summarizing content with %s...", self.mode.model)
-        if not quiet:
-            self._next_step(f"Summarizing content with {self.mode.model}...")
-        summaries = await summarize_all(
-            self.async_client,
-            contents,
-            model=self.mode.model,
-            structured=structured,
-            max_chunks=max_chunks,
-            temperature=self.mode.summarize_temperature,
-        )
-        logger.info("Generated %d summaries", len(summaries))
-
-        if not summaries:
-            raise ResearchError("Could not generate any summaries")
-
-        return summaries
+        return contents
 
     @staticmethod
     def _collect_tried_queries(
@@ -694,6 +1396,7 @@ class ResearchAgent:
             tried.extend(decomposition.sub_queries)
         return tried
 
+    @traced("stage.coverage_retry")
     async def _try_coverage_retry(
         self,
         query: str,
@@ -767,15 +1470,25 @@ class ResearchAgent:
             critique_guidance=critique_context,
         )
 
-        # Merge surviving/dropped from original + retry evaluations
-        merged_surviving = evaluation.surviving_sources + retry_eval.surviving_sources
-        merged_dropped = evaluation.dropped_sources + retry_eval.dropped_sources
-        total_scored = evaluation.total_scored + retry_eval.total_scored
-        total_survived = evaluation.total_survived + retry_eval.total_survived
+        return combined, self._merge_evaluations(evaluation, retry_eval, verbose=False)
 
-        # Determine combined decision using mode thresholds (terse for retry)
+    def _merge_evaluations(
+        self, base: RelevanceEvaluation, extra: RelevanceEvaluation, verbose: bool,
+    ) -> RelevanceEvaluation:
+        """Combine two evaluations of disjoint sources and re-decide the gate.
+
+        Each source keeps the score it already had; only the decision is
+        recomputed from the combined totals, with the same domain
+        diversity rule evaluate_sources() applies.
+        """
+        merged_surviving = base.surviving_sources + extra.surviving_sources
+        merged_dropped = base.dropped_sources + extra.dropped_sources
+        total_scored = base.total_scored + extra.total_scored
+        total_survived = base.total_survived + extra.total_survived
+
+        # Determine combined decision using mode thresholds
         decision, rationale = compute_gate_decision(
-            total_survived, total_scored, self.mode, verbose=False,
+            total_survived, total_scored, self.mode, verbose=verbose,
         )
 
         # Apply diversity gate to merged results (same rule as evaluate_sources)
@@ -793,18 +1506,53 @@ class ResearchAgent:
 
         logger.info("Merged decision: %s (%d/%d sources passed)", decision, total_survived, total_scored)
 
-        merged_eval = RelevanceEvaluation(
+        return RelevanceEvaluation(
             decision=decision,
             decision_rationale=rationale,
             surviving_sources=merged_surviving,
             dropped_sources=merged_dropped,
             total_scored=total_scored,
             total_survived=total_survived,
-            refined_query=evaluation.refined_query,
+            refined_query=base.refined_query,
+            surviving_scores=base.surviving_scores + extra.surviving_scores,
         )
 
-        return combined, merged_eval
+    async def _run_skeptic(self, draft: str, research_context: str | None) -> list[SkepticFinding]:
+        """Review the draft: three skeptic passes in deep mode, one combined otherwise.
 
+        Deep mode falls back to the combined pass when behind the latency budget.
+        """
+        step = nullcontext()
+        deep = self.mode.is_deep
+        if deep and self._budget.behind("skeptic"):
+            deep = False
+            step = self._budget.degraded("skeptic", "combined skeptic pass instead of three")
+        try:
+            if deep:
+                findings = await run_deep_skeptic_pass(
+                    self.async_client, draft, research_context,
+                    model=self.mode.model,
+                    temperature=self.mode.synthesis_temperature,
+                )
+                total_critical = sum(f.critical_count for f in findings)
+                total_concern = sum(f.concern_count for f in findings)
+                logger.info("3 skeptic passes complete (%d critical, %d concerns)", total_critical, total_concern)
+            else:
+                with step:
+                    finding = await run_skeptic_combined(
+                        self.async_client, draft, research_context,
+                        model=self.mode.model,
+                        temperature=self.mode.synthesis_temperature,
+                    )
+                findings = [finding]
+                logger.info("Combined skeptic pass complete (%d critical, %d concerns)", finding.critical_count, finding.concern_count)
+        except SkepticError as e:
+            logger.warning("Skeptic review failed: %s, continuing without it", e)
+            logger.info("Skeptic review failed, continuing with standard synthesis")
+            findings = []
+        return findings
+
+    @traced("stage.evaluate_and_synthesize")
     async def _evaluate_and_synthesize(
         self,
         query: str,
@@ -812,34 +1560,53 @@ class ResearchAgent:
         refined_query: str,
         critique_context: str | None = None,
         tried_queries: list[str] | None = None,
+        evaluation: RelevanceEvaluation | None = None,
     ) -> str:
-        """Evaluate source relevance and synthesize report."""
-        self._next_step("Evaluating source relevance...")
-        evaluation = await evaluate_sources(
-            query=query,
-            summaries=summaries,
-            mode=self.mode,
-            client=self.async_client,
-            refined_query=refined_query,
-            critique_guidance=critique_context,
-        )
+        """Evaluate source relevance and synthesize report.
 
-        # Coverage gap retry for insufficient_data or short_report
-        if not self.mode.is_quick and evaluation.decision in (GateDecision.INSUFFICIENT_DATA, GateDecision.SHORT_REPORT):
-            retry_result = await self._try_coverage_retry(
-                query, summaries, evaluation,
-                tried_queries or [],
-                critique_context=critique_context,
+        A refresh passes the ``evaluation`` it already has, which skips
+        scoring and the coverage retry.
+        """
+        saved = self._load_stage("evaluation") if evaluation is None else None
+        if saved is not None:
+            evaluation = evaluation_from_dict(saved)
+        elif evaluation is None:
+            self._next_step("Evaluating source relevance...")
+            evaluation = await evaluate_sources(
+                query=query,
+                summaries=summaries,
+                mode=self.mode,
+                client=self.async_client,
+                refined_query=refined_query,
+                critique_guidance=critique_context,
             )
-            if retry_result is not None:
-                summaries, evaluation = retry_result
+
+            # Coverage gap retry for insufficient_data or short_report
+            retry = not self.mode.is_quick and evaluation.decision in (GateDecision.INSUFFICIENT_DATA, GateDecision.SHORT_REPORT)
+            if retry and self._budget.behind("coverage_retry"):
+                self._budget.skip("coverage_retry", "skipped coverage retry")
+                retry = False
+            if retry:
+                retry_result = await self._try_coverage_retry(
+                    query, summaries, evaluation,
+                    tried_queries or [],
+                    critique_context=critique_context,
+                )
+                if retry_result is not None:
+                    summaries, evaluation = retry_result
+            self._save_stage("evaluation", lambda: evaluation_to_dict(evaluation))
+        emit(SourcesEvent(
+            decision=str(evaluation.decision),
+            kept=len(evaluation.surviving_sources),
+            dropped=len(evaluation.dropped_sources),
+            urls=tuple(dict.fromkeys(s.url for s in evaluation.surviving_sources)),
+        ))
 
         # Branch based on relevance gate decision
         if evaluation.decision in (GateDecision.INSUFFICIENT_DATA, GateDecision.NO_NEW_FINDINGS):
             self._last_source_count = 0
+            self._last_sources = ()
             self._last_gate_decision = evaluation.decision
-            if evaluation.decision == GateDecision.NO_NEW_FINDINGS and self.schema_path and self._current_research_batch:
-                self._update_gap_states(evaluation.decision)
             self._next_step("Generating insufficient data response...")
             return await generate_insufficient_data_response(
                 query=query,
@@ -853,12 +1620,20 @@ class ResearchAgent:
 
         # Synthesize report (full or short)
         self._last_source_count = len(evaluation.surviving_sources)
+        self._last_source_urls = tuple(dict.fromkeys(s.url for s in evaluation.surviving_sources))
+        self._last_sources = self._stored_sources(evaluation)
         self._last_gate_decision = evaluation.decision
         logger.info("Synthesizing report with %s...", self.mode.model)
         limited_sources = evaluation.decision == GateDecision.SHORT_REPORT
         surviving = evaluation.surviving_sources
         dropped_count = len(evaluation.dropped_sources)
         total_count = evaluation.total_scored
+        # Packed once so the draft and final prompts cite the same [Source N] ids
+        packed = pack_sources(
+            list(surviving),
+            {score.url: score.score for score in evaluation.surviving_scores},
+            max_tokens=self.mode.source_tokens,
+        )
 
         # Quick mode: single-pass synthesis (no skeptic)
         if self.mode.is_quick:
@@ -866,8 +1641,8 @@ class ResearchAgent:
             self._next_step(f"Synthesizing {label} with {self.mode.model}...")
 
             profile = self._run_context.profile
-            report = synthesize_report(
-                self.client, query, surviving,
+            report = await synthesize_report_async(
+                self.async_client, query, surviving,
                 model=self.mode.model,
                 max_tokens=self.mode.max_tokens,
                 mode_instructions=self.mode.synthesis_instructions,
@@ -878,54 +1653,43 @@ class ResearchAgent:
                 template=self._run_context.template,
                 synthesis_tone=profile.synthesis_tone if profile else "",
                 temperature=self.mode.synthesis_temperature,
+                sources=packed,
             )
-            if self.schema_path and self._current_research_batch:
-                self._update_gap_states(evaluation.decision)
             return report
 
         # Standard/deep mode: draft -> skeptic -> final synthesis
         research_context = self._run_context.content
         template = self._run_context.template
 
-        self._next_step("Generating draft analysis...")
-        draft = await asyncio.to_thread(
-            synthesize_draft, self.client, query, surviving,
-            model=self.mode.model,
-            template=template,
-            temperature=self.mode.synthesis_temperature,
-        )
-
-        self._next_step("Running skeptic review...")
+        saved = self._load_stage("draft")
+        if saved is not None:
+            draft = saved["draft"]
+        else:
+            self._next_step("Generating draft analysis...")
+            draft = await synthesize_draft_async(
+                self.async_client, query, surviving,
+                model=self.mode.model,
+                template=template,
+                temperature=self.mode.synthesis_temperature,
+                sources=packed,
+            )
+            self._save_stage("draft", lambda: {"draft": draft})
 
-        try:
-            if self.mode.is_deep:
-                findings = await run_deep_skeptic_pass(
-                    self.async_client, draft, research_context,
-                    model=self.mode.model,
-                    temperature=self.mode.synthesis_temperature,
-                )
-                total_critical = sum(f.critical_count for f in findings)
-                total_concern = sum(f.concern_count for f in findings)
-                logger.info("3 skeptic passes complete (%d critical, %d concerns)", total_critical, total_concern)
-            else:
-                finding = await run_skeptic_combined(
-                    self.async_client, draft, research_context,
-                    model=self.mode.model,
-                    temperature=self.mode.synthesis_temperature,
-                )
-                findings = [finding]
-                logger.info("Combined skeptic pass complete (%d critical, %d concerns)", finding.critical_count, finding.concern_count)
-        except SkepticError as e:
-            logger.warning("Skeptic review failed: %s, continuing without it", e)
-            logger.info("Skeptic review failed, continuing with standard synthesis")
-            findings = []
+        saved = self._load_stage("findings")
+        if saved is not None:
+            findings = from_rows(SkepticFinding, saved["findings"])
+        else:
+            self._next_step("Running skeptic review...")
+            findings = await self._run_skeptic(draft, research_context)
+            if findings:
+                # A failed review isn't saved, so a resumed run retries it
+                self._save_stage("findings", lambda: {"findings": to_rows(findings)})
 
         self._next_step(f"Synthesizing final report with {self.mode.model}...")
 
         profile = self._run_context.profile
-        result = await asyncio.to_thread(
-            synthesize_final,
-            self.client, query, draft, findings, surviving,
+        result = await synthesize_final_async(
+            self.async_client, query, draft, findings, surviving,
             model=self.mode.model,
             max_tokens=self.mode.max_tokens,
             context=research_context,
@@ -937,57 +1701,77 @@ class ResearchAgent:
             template=template,
             synthesis_tone=profile.synthesis_tone if profile else "",
             temperature=self.mode.synthesis_temperature,
+            sources=packed,
         )
 
-        # Query iteration: refine + follow-up after main synthesis
+        # Query iteration (refine + follow-up) and self-critique both read
+        # only the synthesized run, so they run side by side
         iteration_sources_added = 0
-        if (self.mode.iteration_enabled
-                and not self._skip_iteration
-                and evaluation.decision in (GateDecision.FULL_REPORT, GateDecision.SHORT_REPORT)):
-            try:
-                result, iteration_sources_added = await asyncio.wait_for(
-                    self._run_iteration(query, result, evaluation),
-                    timeout=ITERATION_TIMEOUT,
-                )
-                if iteration_sources_added > 0:
-                    self._iteration_status = "completed"
-                else:
-                    self._iteration_status = "no_new_sources"
-            except asyncio.TimeoutError:
-                logger.warning("Iteration timed out after %.0fs", ITERATION_TIMEOUT)
-                self._iteration_status = "error"
-            except IterationError as e:
-                logger.warning("Iteration failed: %s", e)
-                self._iteration_status = "error"
-        self._last_source_count += iteration_sources_added
-
-        await asyncio.to_thread(
-            self._run_critique,
-            query=query,
-            surviving_count=len(surviving),
-            dropped_count=dropped_count,
-            skeptic_findings=findings,
-            gate_decision=evaluation.decision,
+        iterate = (
+            self.mode.iteration_enabled
+            and not self._skip_iteration
+            and evaluation.decision in (GateDecision.FULL_REPORT, GateDecision.SHORT_REPORT)
         )
-        if self.schema_path and self._current_research_batch:
-            self._update_gap_states(evaluation.decision)
+        async with StageGraph() as stages:
+            if iterate:
+                stages.add("iteration", lambda: self._iterate(query, result, evaluation))
+            stages.add("critique", lambda: self._run_critique(
+                query=query,
+                surviving_count=len(surviving),
+                dropped_count=dropped_count,
+                skeptic_findings=findings,
+                gate_decision=evaluation.decision,
+            ))
+            if iterate:
+                result, iteration_sources_added = await stages.result("iteration")
+            await stages.result("critique")
+        self._last_source_count += iteration_sources_added
         return result
 
+    @traced("stage.research_with_refinement")
     async def _research_with_refinement(
         self, query: str, decomposition: DecompositionResult | None = None,
         critique_context: str | None = None,
     ) -> str:
         """Quick/standard mode: refine query using snippets before fetching."""
-        # Search pass 1
-        logger.info("Original query: %s", query)
-        try:
-            pass1_results = await asyncio.to_thread(
-                search, query, self.mode.pass1_sources
-            )
-            logger.info("Pass 1 found %d results", len(pass1_results))
-        except SearchError as e:
-            raise ResearchError(f"Search failed: {e}")
+        saved = self._load_stage("search")
+        if saved is not None:
+            all_results = from_rows(SearchResult, saved["results"])
+            refined_query = saved["refined_query"]
+            self._source_counts.update(saved["source_counts"])
+        else:
+            all_results, refined_query = await self._search_with_refinement(query, decomposition)
+            self._save_stage("search", lambda: {
+                "results": to_rows(all_results),
+                "refined_query": refined_query,
+                "source_counts": self._source_counts,
+            })
+
+        # Fetch -> extract -> cascade -> summarize
+        early_fetch = "pass1_fetch" if self._stages is not None and "pass1_fetch" in self._stages else None
+        summaries = await self._fetch_extract_summarize(
+            all_results, stage="sources", early_fetch=early_fetch,
+        )
+
+        tried = self._collect_tried_queries(query, refined_query, decomposition)
+
+        return await self._evaluate_and_synthesize(
+            query=query,
+            summaries=summaries,
+            refined_query=refined_query,
+            critique_context=critique_context,
+            tried_queries=tried,
+        )
+
+    async def _search_with_refinement(
+        self, query: str, decomposition: DecompositionResult | None,
+    ) -> tuple[list[SearchResult], str]:
+        """Search, refine the query from snippets, and search again.
 
+        Returns:
+            (all unique results, refined query)
+        """
+        pass1_results = await self._pass1_results(query)
         self._source_counts[query] = len(pass1_results)
 
         # Filter blocked domains BEFORE building seen_urls/snippets
@@ -1006,16 +1790,13 @@ class ResearchAgent:
             self._source_counts["(sub-queries)"] = len(new_from_subs)
             pass1_results.extend(new_from_subs)
 
-        # Refine query using snippets (with quality gate)
-        snippets = [r.snippet for r in pass1_results if r.snippet]
-        avg_snippet_len = sum(len(s) for s in snippets) / max(len(snippets), 1)
-        if avg_snippet_len < 50:
-            logger.info("Snippet quality below threshold (avg %.0f chars), using noun-phrase fallback", avg_snippet_len)
-            refined_query = extract_noun_phrases(query)
-        else:
-            refined_query = await asyncio.to_thread(
-                refine_query, self.client, query, snippets, model=self.mode.planning_model, temperature=self.mode.planning_temperature
-            )
+        # Start fetching pass-1 pages while the query is refined and re-searched
+        if self._stages is not None:
+            _, pass1_urls = self._split_prefetched(pass1_results)
+            if pass1_urls:
+                self._stages.add("pass1_fetch", lambda: self._fetch_early(pass1_urls))
+
+        refined_query = await self._refine_from_snippets(query, pass1_results)
         if refined_query == query:
             logger.info("Query refinement skipped (using original query)")
         else:
@@ -1037,9 +1818,69 @@ class ResearchAgent:
             self._source_counts[refined_query] = len(new_results)
         all_results = pass1_results + new_results
         logger.info("Total: %d unique sources", len(all_results))
+        return all_results, refined_query
 
-        # Fetch -> extract -> cascade -> summarize
-        summaries = await self._fetch_extract_summarize(all_results)
+    async def _refine_from_snippets(self, query: str, results: list[SearchResult]) -> str:
+        """Refine the query from search snippets (with quality gate)."""
+        snippets = [r.snippet for r in results if r.snippet]
+        avg_snippet_len = sum(len(s) for s in snippets) / max(len(snippets), 1)
+        if avg_snippet_len < 50:
+            logger.info("Snippet quality below threshold (avg %.0f chars), using noun-phrase fallback", avg_snippet_len)
+            return extract_noun_phrases(query)
+        return await refine_query_async(
+            self.async_client, query, snippets,
+            model=self.mode.planning_model, temperature=self.mode.planning_temperature,
+        )
+
+    @traced("stage.research_deep")
+    async def _research_deep(
+        self, query: str, decomposition: DecompositionResult | None = None,
+        critique_context: str | None = None,
+    ) -> str:
+        """Deep mode: two-pass search with full fetch/summarize between passes."""
+        saved = self._load_stage("search")
+        if saved is not None:
+            results = from_rows(SearchResult, saved["results"])
+            self._source_counts.update(saved["source_counts"])
+        else:
+            results = await self._search_deep_pass1(query, decomposition)
+            self._save_stage("search", lambda: {
+                "results": to_rows(results), "source_counts": self._source_counts,
+            })
+
+        saved = self._load_stage("pass2")
+
+        # Refine from snippets and search/fetch pass 2 while pass 1 is
+        # summarized; _deep_pass2() keeps the results if the summaries
+        # lead to the same query
+        if self.mode.speculative_pass2 and self._stages is not None and saved is None:
+            seen_urls = {r.url for r in results}
+            self._stages.add(
+                "speculative_search",
+                lambda: self._speculative_search(query, list(results), seen_urls),
+            )
+            self._stages.add(
+                "speculative_fetch",
+                lambda speculative_search: self._speculative_fetch(speculative_search, seen_urls),
+                inputs=("speculative_search",),
+            )
+
+        # Pass 1: fetch -> extract -> cascade -> summarize
+        summaries = await self._fetch_extract_summarize(
+            results, structured=True, max_chunks=5, stage="pass1",
+        )
+
+        if saved is not None:
+            summaries = from_rows(Summary, saved["summaries"])
+            refined_query = saved["refined_query"]
+            self._source_counts.update(saved["source_counts"])
+        else:
+            refined_query = await self._deep_pass2(query, summaries, {r.url for r in results})
+            self._save_stage("pass2", lambda: {
+                "summaries": to_rows(summaries),
+                "refined_query": refined_query,
+                "source_counts": self._source_counts,
+            })
 
         tried = self._collect_tried_queries(query, refined_query, decomposition)
 
@@ -1051,20 +1892,11 @@ class ResearchAgent:
             tried_queries=tried,
         )
 
-    async def _research_deep(
-        self, query: str, decomposition: DecompositionResult | None = None,
-        critique_context: str | None = None,
-    ) -> str:
-        """Deep mode: two-pass search with full fetch/summarize between passes."""
-        # Search pass 1
-        try:
-            results = await asyncio.to_thread(
-                search, query, self.mode.pass1_sources
-            )
-            logger.info("Found %d results", len(results))
-        except SearchError as e:
-            raise ResearchError(f"Search failed: {e}")
-
+    async def _search_deep_pass1(
+        self, query: str, decomposition: DecompositionResult | None,
+    ) -> list[SearchResult]:
+        """Deep mode pass 1: search the query and any sub-queries."""
+        results = await self._pass1_results(query)
         self._source_counts[query] = len(results)
 
         # Filter blocked domains BEFORE building seen_urls
@@ -1082,12 +1914,18 @@ class ResearchAgent:
             )
             self._source_counts["(sub-queries)"] = len(new_from_subs)
             results.extend(new_from_subs)
+        return results
 
-        # Pass 1: fetch -> extract -> cascade -> summarize
-        summaries = await self._fetch_extract_summarize(
-            results, structured=True, max_chunks=5
-        )
+    async def _deep_pass2(
+        self, query: str, summaries: list[Summary], seen_urls: set[str],
+    ) -> str:
+        """Deep mode pass 2: refine from pass 1 summaries and research new URLs.
+
+        Extends ``summaries`` in place with any new summaries.
 
+        Returns:
+            The refined query.
+        """
         # Deep mode refinement and pass 2
         self._next_step("Deep mode: refining search...")
 
@@ -1097,19 +1935,27 @@ class ResearchAgent:
             logger.info("Summary quality below threshold (avg %.0f chars), using noun-phrase fallback", avg_summary_len)
             refined_query = extract_noun_phrases(query)
         else:
-            refined_query = await asyncio.to_thread(
-                refine_query, self.client, query, summary_texts, model=self.mode.planning_model, temperature=self.mode.planning_temperature
+            refined_query = await refine_query_async(
+                self.async_client, query, summary_texts,
+                model=self.mode.planning_model, temperature=self.mode.planning_temperature,
             )
         if refined_query == query:
             logger.info("Query refinement skipped (using original query)")
         else:
             logger.info("Refined query: %s", refined_query)
 
+        speculation = await self._reconcile_speculation(refined_query)
+        early_fetch = None
+        if speculation is not None:
+            refined_query, pass2_results = speculation
+            early_fetch = "speculative_fetch"
+
         # Search pass 2 (reuses shared pipeline in quiet mode)
         try:
-            pass2_results = await asyncio.to_thread(
-                search, refined_query, self.mode.pass2_sources
-            )
+            if speculation is None:
+                pass2_results = await asyncio.to_thread(
+                    search, refined_query, self.mode.pass2_sources
+                )
             new_results = [r for r in pass2_results if r.url not in seen_urls]
             logger.info("Pass 2 found %d results (%d new)", len(pass2_results), len(new_results))
             if refined_query != query:
@@ -1119,6 +1965,7 @@ class ResearchAgent:
                 try:
                     new_summaries = await self._fetch_extract_summarize(
                         new_results, structured=True, max_chunks=5, quiet=True,
+                        early_fetch=early_fetch,
                     )
                     summaries.extend(new_summaries)
                     logger.info("Total summaries: %d", len(summaries))
@@ -1133,12 +1980,92 @@ class ResearchAgent:
             logger.warning("Pass 2 search failed: %s, continuing with pass 1 results", e)
             logger.info("Pass 2 search failed, continuing with %d summaries", len(summaries))
 
-        tried = self._collect_tried_queries(query, refined_query, decomposition)
+        return refined_query
 
-        return await self._evaluate_and_synthesize(
-            query=query,
-            summaries=summaries,
-            refined_query=refined_query,
-            critique_context=critique_context,
-            tried_queries=tried,
+    async def _speculative_search(
+        self, query: str, pass1_results: list[SearchResult], seen_urls: set[str],
+    ) -> tuple[str, list[SearchResult], float] | None:
+        """Refine from pass-1 snippets and search pass 2 ahead of the summaries.
+
+        Returns:
+            (speculative query, pass-2 results, search seconds), or None
+            if the search failed.
+        """
+        speculative_query = await self._refine_from_snippets(query, pass1_results)
+        started = time.perf_counter()
+        try:
+            results = await asyncio.to_thread(
+                search, speculative_query, self.mode.pass2_sources
+            )
+        except SearchError as e:
+            logger.info("Speculative pass 2 search failed: %s", e)
+            return None
+        logger.debug("Speculative pass 2 (%s) found %d results", speculative_query, len(results))
+        return speculative_query, results, time.perf_counter() - started
+
+    async def _speculative_fetch(
+        self, speculation: tuple[str, list[SearchResult], float] | None,
+        seen_urls: set[str],
+    ) -> tuple[frozenset[str], list[FetchedPage], float]:
+        """Prefetch the speculative pass-2 pages not already found in pass 1.
+
+        Returns:
+            (URLs tried, pages, fetch seconds); usable as an early_fetch stage.
+        """
+        if speculation is None:
+            return frozenset(), [], 0.0
+        _, results, _ = speculation
+        new_results = [r for r in results if r.url not in seen_urls]
+        _, urls = self._split_prefetched(self._filter_blocked(new_results))
+        started = time.perf_counter()
+        tried, pages = await self._fetch_early(urls) if urls else (frozenset(), [])
+        return tried, pages, time.perf_counter() - started
+
+    async def _reconcile_speculation(
+        self, refined_query: str,
+    ) -> tuple[str, list[SearchResult]] | None:
+        """Keep the speculative pass 2 if it searched the same query.
+
+        Records the outcome as last_speculation. Returns (speculative
+        query, its search results) when reused, else None after
+        cancelling the speculative fetch. A failed speculative search
+        counts as discarded, with an empty speculative query.
+        """
+        if self._stages is None or "speculative_search" not in self._stages:
+            return None
+        refined_at = time.perf_counter()
+        speculation = await self._stages.result("speculative_search")
+        if speculation is None:
+            self._stages.cancel("speculative_fetch")
+            self._last_speculation = SpeculationOutcome(
+                reused=False, speculative_query="", refined_query=refined_query,
+            )
+            return None
+        speculative_query, results, search_s = speculation
+
+        refined_words = meaningful_words(refined_query)
+        speculative_words = meaningful_words(speculative_query)
+        # Checked both ways so a broader or narrower query is not taken as the same
+        same_query = refined_query == speculative_query or (
+            bool(refined_words) and bool(speculative_words)
+            and has_near_duplicate(refined_words, [speculative_query], threshold=SPECULATION_MIN_OVERLAP)
+            and has_near_duplicate(speculative_words, [refined_query], threshold=SPECULATION_MIN_OVERLAP)
+        )
+        if not same_query:
+            self._stages.cancel("speculative_fetch")
+            self._last_speculation = SpeculationOutcome(
+                reused=False, speculative_query=speculative_query, refined_query=refined_query,
+            )
+            logger.info("Speculative pass 2 discarded (searched %r, summaries suggest %r)",
+                        speculative_query, refined_query)
+            return None
+
+        _, _, fetch_s = await self._stages.result("speculative_fetch")
+        # Run serially, the search and fetch would have started at refined_at
+        saved_s = max(0.0, refined_at + search_s + fetch_s - time.perf_counter())
+        self._last_speculation = SpeculationOutcome(
+            reused=True, speculative_query=speculative_query,
+            refined_query=refined_query, saved_s=round(saved_s, 3),
         )
+        logger.info("Speculative pass 2 reused (%s), saved %.1fs", speculative_query, saved_s)
+        return speculative_query, results
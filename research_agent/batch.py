@@ -0,0 +1,339 @@
+"""Run many research queries concurrently with shared caches and limits.
+
+Every job in a batch shares one async Anthropic client and one
+SharedResources. Search results, fetched pages, DNS checks and page
+summaries are computed once for the whole batch. Concurrent Claude
+calls, search calls and page fetches are capped globally rather than
+per run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, Callable, Sequence
+
+from anthropic import AsyncAnthropic
+
+from .errors import ANTHROPIC_ERRORS, ResearchError
+from .results import ResearchResult
+from .shared import CallSlots, SharedResources, shared_scope
+from .usage import UsageSummary, combine_usage
+
+logger = logging.getLogger(__name__)
+
+# Errors that fail one job without stopping the rest of the batch
+_JOB_ERRORS = (ResearchError, OSError, *ANTHROPIC_ERRORS)
+
+
+@dataclass(frozen=True)
+class BatchLimits:
+    """Global concurrency limits for a batch.
+
+    Attributes:
+        max_concurrent_queries: Research runs in flight at once.
+        max_claude_calls: Claude requests in flight across all runs.
+        max_search_calls: Search API requests in flight across all runs.
+        max_fetch_connections: Page fetches in flight across all runs.
+    """
+    max_concurrent_queries: int = 3
+    max_claude_calls: int = 8
+    max_search_calls: int = 4
+    max_fetch_connections: int = 10
+
+    def __post_init__(self) -> None:
+        for name in (
+            "max_concurrent_queries", "max_claude_calls",
+            "max_search_calls", "max_fetch_connections",
+        ):
+            if getattr(self, name) < 1:
+                raise ValueError(f"{name} must be at least 1")
+
+
+@dataclass(frozen=True)
+class BatchQuery:
+    """One query in a batch, with optional per-query overrides."""
+    query: str
+    mode: str | None = None
+    context: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchJobResult:
+    """Outcome of one query in a batch.
+
+    Attributes:
+        query: The research question.
+        mode: Research mode name the job ran (or tried to run) in.
+        result: The research result, or None if the job failed.
+        error: Error message when the job failed, else "".
+        elapsed_s: Wall-clock seconds the job took.
+    """
+    query: str
+    mode: str
+    result: ResearchResult | None = None
+    error: str = ""
+    elapsed_s: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.result is not None
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Results of a batch, in input order, with throughput and cost.
+
+    Attributes:
+        jobs: Per-query outcomes, in the order the queries were given.
+        elapsed_s: Wall-clock seconds for the whole batch.
+        usage: Token and cost usage summed over every job.
+        cache_stats: Hits, misses and size of the shared search, fetch
+            and summary caches.
+    """
+    jobs: tuple[BatchJobResult, ...]
+    elapsed_s: float
+    usage: UsageSummary = field(default_factory=UsageSummary)
+    cache_stats: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for job in self.jobs if job.ok)
+
+    @property
+    def failed(self) -> int:
+        return len(self.jobs) - self.succeeded
+
+    @property
+    def queries_per_minute(self) -> float:
+        """Completed queries per minute of batch wall time."""
+        if self.elapsed_s <= 0:
+            return 0.0
+        return self.succeeded * 60.0 / self.elapsed_s
+
+
+def load_batch_file(path: Path) -> list[BatchQuery]:
+    """Read a batch file of queries.
+
+    ``.jsonl`` files hold one object per line with a ``query`` key and
+    optional ``mode`` and ``context`` keys (a bare JSON string is also
+    accepted). Any other file holds one query per line. Blank lines and
+    lines starting with ``#`` are skipped in both formats.
+
+    Raises:
+        ResearchError: If the file can't be read, a line is malformed,
+            or the file has no queries.
+    """
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError as e:
+        raise ResearchError(f"Could not read batch file {path}: {e}") from e
+
+    queries: list[BatchQuery] = []
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if path.suffix != ".jsonl":
+            queries.append(BatchQuery(query=line))
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ResearchError(f"{path}:{line_no}: invalid JSON: {e}") from e
+        if isinstance(entry, str):
+            entry = {"query": entry}
+        if not isinstance(entry, dict) or not isinstance(entry.get("query"), str):
+            raise ResearchError(f'{path}:{line_no}: expected an object with a "query" string')
+        queries.append(BatchQuery(
+            query=entry["query"],
+            mode=entry.get("mode"),
+            context=entry.get("context"),
+        ))
+
+    if not queries:
+        raise ResearchError(f"No queries found in batch file {path}")
+    return queries
+
+
+class _LimitedAsyncMessages:
+    """``client.messages`` for an async client, holding a call slot per request."""
+
+    def __init__(self, messages, slots: CallSlots) -> None:
+        self._messages = messages
+        self._slots = slots
+
+    async def create(self, **kwargs):
+        async with self._slots.hold_async():
+            return await self._messages.create(**kwargs)
+
+    @asynccontextmanager
+    async def stream(self, **kwargs) -> AsyncIterator:
+        async with self._slots.hold_async(), self._messages.stream(**kwargs) as stream:
+            yield stream
+
+    def __getattr__(self, name: str):
+        return getattr(self._messages, name)
+
+
+def limited_client(slots: CallSlots, async_client: AsyncAnthropic | None = None) -> AsyncAnthropic:
+    """Return an async Anthropic client whose requests share ``slots``.
+
+    Builds a new client unless given one. ``messages`` is replaced on
+    this instance only.
+    """
+    async_client = async_client or AsyncAnthropic()
+    async_client.messages = _LimitedAsyncMessages(async_client.messages, slots)
+    return async_client
+
+
+def _as_batch_query(item: str | BatchQuery) -> BatchQuery:
+    return item if isinstance(item, BatchQuery) else BatchQuery(query=item)
+
+
+async def run_batch_async(
+    queries: Sequence[str | BatchQuery],
+    mode: str = "standard",
+    context: str | None = None,
+    skip_critique: bool = False,
+    skip_iteration: bool = False,
+    limits: BatchLimits | None = None,
+    on_result: Callable[[BatchJobResult], None] | None = None,
+) -> BatchResult:
+    """Run research queries concurrently and return every outcome.
+
+    Args:
+        queries: Query strings, or BatchQuery entries with per-query
+            mode and context overrides.
+        mode: Default research mode for queries without their own.
+        context: Default context name ("none" to skip, None to auto-detect).
+        skip_critique: Skip self-critique in every job.
+        skip_iteration: Skip query iteration in every job.
+        limits: Global concurrency limits (defaults to BatchLimits()).
+        on_result: Called with each job's outcome as soon as it finishes,
+            e.g. to save reports before the rest of the batch completes.
+
+    Returns:
+        BatchResult with per-query results in input order. A failed query
+        is recorded as a job error; it doesn't stop the batch.
+
+    Raises:
+        ResearchError: If ``queries`` is empty or ANTHROPIC_API_KEY is
+            not set (the shared client needs it up front).
+    """
+    return await _run_batch(
+        [_as_batch_query(q) for q in queries], mode, context, limits, on_result,
+        skip_critique=skip_critique, skip_iteration=skip_iteration,
+    )
+
+
+async def _run_batch(
+    items: list[BatchQuery],
+    mode: str,
+    context: str | None,
+    limits: BatchLimits | None,
+    on_result: Callable[[BatchJobResult], None] | None,
+    **agent_kwargs,
+) -> BatchResult:
+    """run_batch_async() with extra ResearchAgent keyword arguments per job."""
+    # Deferred: the package root imports this module lazily
+    from . import _prepare_agent, _research_result
+
+    if not items:
+        raise ResearchError("Batch has no queries")
+    if not os.environ.get("ANTHROPIC_API_KEY"):
+        raise ResearchError("ANTHROPIC_API_KEY environment variable is required")
+    limits = limits or BatchLimits()
+
+    resources = SharedResources(
+        max_search_calls=limits.max_search_calls,
+        max_fetch_connections=limits.max_fetch_connections,
+        max_claude_calls=limits.max_claude_calls,
+    )
+    async_client = limited_client(resources.claude_slots)
+    job_slots = asyncio.Semaphore(limits.max_concurrent_queries)
+
+    async def _run_job(item: BatchQuery) -> BatchJobResult:
+        job_mode = item.mode or mode
+        async with job_slots:
+            started = time.monotonic()
+            job_context = item.context if item.context is not None else context
+            try:
+                agent, research_mode = _prepare_agent(
+                    item.query, job_mode, job_context,
+                    async_client=async_client, **agent_kwargs,
+                )
+                report = await agent.research_async(item.query)
+                job = BatchJobResult(
+                    query=item.query,
+                    mode=research_mode.name,
+                    result=_research_result(agent, research_mode, item.query, report, job_context),
+                    elapsed_s=round(time.monotonic() - started, 3),
+                )
+            except _JOB_ERRORS as e:
+                logger.warning("Batch query failed (%s): %s", item.query, e)
+                job = BatchJobResult(
+                    query=item.query,
+                    mode=job_mode,
+                    error=str(e) or type(e).__name__,
+                    elapsed_s=round(time.monotonic() - started, 3),
+                )
+        if on_result is not None:
+            on_result(job)
+        return job
+
+    started = time.monotonic()
+    with shared_scope(resources):
+        jobs = await asyncio.gather(*[_run_job(item) for item in items])
+    elapsed = time.monotonic() - started
+
+    result = BatchResult(
+        jobs=tuple(jobs),
+        elapsed_s=round(elapsed, 3),
+        usage=combine_usage(
+            job.result.usage for job in jobs if job.result and job.result.usage
+        ),
+        cache_stats=resources.stats(),
+    )
+    logger.info(
+        "Batch: %d/%d queries in %.1fs (%.2f/min), $%.4f",
+        result.succeeded, len(jobs), result.elapsed_s,
+        result.queries_per_minute, result.usage.total.cost_usd,
+    )
+    return result
+
+
+def run_batch(
+    queries: Sequence[str | BatchQuery],
+    mode: str = "standard",
+    context: str | None = None,
+    skip_critique: bool = False,
+    skip_iteration: bool = False,
+    limits: BatchLimits | None = None,
+    on_result: Callable[[BatchJobResult], None] | None = None,
+) -> BatchResult:
+    """Run research queries concurrently. See run_batch_async().
+
+    Raises:
+        ResearchError: As run_batch_async(), or if called from a running
+            event loop (use run_batch_async there).
+    """
+    try:
+        return asyncio.run(run_batch_async(
+            queries, mode=mode, context=context,
+            skip_critique=skip_critique, skip_iteration=skip_iteration,
+            limits=limits, on_result=on_result,
+        ))
+    except RuntimeError as e:
+        if "cannot be called from a running event loop" in str(e):
+            raise ResearchError(
+                "run_batch() cannot be called from async context. "
+                "Use 'await run_batch_async()' instead."
+            ) from e
+        raise
@@ -19,6 +19,8 @@ from tavily.errors import (
 from .extract import ExtractedContent
 from .fetch import ALLOWED_SCHEMES, BLOCKED_HOSTS, is_safe_url
 from .search import SearchResult, get_tavily_client
+from .shared import current_shared
+from .tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +64,8 @@ async def _filter_forwardable_urls(urls: list[str]) -> list[str]:
     if not urls:
         return []
 
-    dns_cache: dict[str, bool] = {}
+    shared = current_shared()
+    dns_cache: dict[str, bool] = shared.dns_cache if shared is not None else {}
     candidates = [u for u in urls if not _is_internal_url(u)]
     if not candidates:
         return []
@@ -73,6 +76,7 @@ async def _filter_forwardable_urls(urls: list[str]) -> list[str]:
     return [url for url, is_safe in zip(candidates, checks) if is_safe]
 
 
+@traced("cascade.recover")
 async def cascade_recover(
     failed_urls: list[str],
     all_results: list[SearchResult],
@@ -134,6 +138,7 @@ async def cascade_recover(
     return recovered
 
 
+@traced("cascade.jina")
 async def _fetch_via_jina(urls: list[str]) -> list[ExtractedContent]:
     """Fetch URLs via Jina Reader proxy (free, returns markdown)."""
     if not urls:
@@ -179,6 +184,7 @@ def _extract_markdown_title(text: str) -> str:
     return ""
 
 
+@traced("cascade.tavily_extract")
 async def _fetch_via_tavily_extract(
     urls: list[str], tavily_key: str | None
 ) -> list[ExtractedContent]:
@@ -220,6 +226,7 @@ def _is_extract_domain(url: str, extract_domains: tuple[str, ...]) -> bool:
     return any(host == d or host.endswith("." + d) for d in extract_domains)
 
 
+@traced("cascade.snippet")
 def _snippet_fallback(
     failed_urls: set[str],
     all_results: list[SearchResult],
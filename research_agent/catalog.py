@@ -0,0 +1,910 @@
+"""SQLite catalog of saved reports, critiques and run usage.
+
+Listing reports, loading critique history, showing usage history and
+looking up saved reports for a query used to glob reports/ or
+reports/meta/ and parse every matching file (or the whole JSON report
+index) on every call. The catalog keeps what those calls need in one
+SQLite database (WAL mode) at reports/meta/catalog/catalog.db:
+
+- reports: each reports/*.md with the date and query name from its
+  filename and its title. Reports the pipeline saved also carry their
+  index entry (query, mode, context, gate decision, source URLs and
+  query fingerprint, see report_index.py), with the fingerprint's
+  words in report_words for cache lookups and the sources the report
+  was written from in report_sources. Titles, bodies and domains are
+  also in an FTS5 full-text index, which search_reports() ranks with
+  BM25.
+- critiques: each critique-*.yaml, as parsed (None if unreadable).
+- runs: each usage-*.json run summary.
+
+Saves add their file directly. Reads first compare the directory's
+mtime with the one recorded at the last sync and only when it moved
+(a file was added, removed or replaced) rescan it, re-reading just the
+files whose inode, mtime or size changed. So a deleted report is never
+listed (its index entry goes with it) and a report copied in by hand
+still shows up. Files that resolve outside their directory (symlinks)
+are not indexed.
+
+Everything but the index entries can be recreated from the files. If
+the catalog can't be opened, the call falls back to an in-memory
+catalog (the old full scan, with no saved-report lookups), and
+rebuild_catalog() (``--rebuild-index``) recreates it, keeping the
+index entries it can still read.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass
+from datetime import date
+from pathlib import Path
+from urllib.parse import urlparse
+
+import yaml
+
+from .errors import GateDecision
+from .report_store import parse_report_filename
+from .results import ReportInfo, ReportMatch, StoredSource
+
+logger = logging.getLogger(__name__)
+
+CATALOG_SUBDIR = "catalog"
+CATALOG_FILENAME = "catalog.db"
+SCHEMA_VERSION = 2
+
+CRITIQUE_PREFIX = "critique-"
+USAGE_PREFIX = "usage-"
+
+# Seconds to wait for another process's write before giving up
+_BUSY_TIMEOUT_S = 5.0
+
+# Column weights for BM25 ranking: title, body, domains
+_BM25_WEIGHTS = (10.0, 1.0, 5.0)
+# Tokens of context on each side of a snippet's matched words
+_SNIPPET_TOKENS = 24
+
+# A directory modified this recently may change again within the same
+# mtime tick, so its mtime isn't trusted to skip the next rescan
+_RACY_MTIME_NS = 2_000_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY,
+    filename TEXT NOT NULL UNIQUE,
+    date TEXT NOT NULL,
+    query_name TEXT NOT NULL,
+    title TEXT NOT NULL,
+    query TEXT,
+    mode TEXT,
+    context TEXT,
+    status TEXT,
+    source_domains TEXT NOT NULL DEFAULT '',
+    saved_at REAL NOT NULL,
+    file_key TEXT NOT NULL,
+    normalized_query TEXT,
+    fingerprint TEXT NOT NULL DEFAULT '',
+    source_urls TEXT NOT NULL DEFAULT '[]'
+);
+CREATE INDEX IF NOT EXISTS reports_by_date ON reports (date DESC, filename);
+CREATE INDEX IF NOT EXISTS reports_by_mode ON reports (mode, context);
+CREATE TABLE IF NOT EXISTS report_words (
+    word TEXT NOT NULL,
+    report_id INTEGER NOT NULL,
+    PRIMARY KEY (word, report_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS report_sources (
+    report_id INTEGER PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS critiques (
+    name TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    overall_pass INTEGER,
+    mean_score REAL,
+    data TEXT,
+    file_key TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS critiques_by_mtime ON critiques (mtime DESC, name DESC);
+CREATE TABLE IF NOT EXISTS runs (
+    name TEXT PRIMARY KEY,
+    timestamp REAL,
+    query TEXT,
+    mode TEXT,
+    cost_usd REAL,
+    data TEXT NOT NULL,
+    file_key TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    kind TEXT PRIMARY KEY,
+    directory TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+"""
+
+_TABLES = (
+    "reports", "report_words", "report_sources", "report_text", "critiques", "runs", "sync_state",
+)
+
+# rowid is reports.id, so a report's text is replaced without a scan
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS report_text
+    USING fts5(title, body, domains, tokenize = 'porter unicode61')
+"""
+
+
+@dataclass(frozen=True)
+class CatalogStats:
+    """What a catalog rebuild indexed."""
+    reports: int
+    critiques: int
+    runs: int
+    full_text: bool
+    index_entries: int = 0
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """One saved report's entry in the report index."""
+    filename: str
+    query: str
+    normalized_query: str
+    mode: str
+    context: str
+    timestamp: float
+    status: str
+    fingerprint: tuple[str, ...]
+    source_urls: tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict) -> IndexEntry:
+        return cls(
+            filename=str(data["filename"]),
+            query=str(data["query"]),
+            normalized_query=str(data["normalized_query"]),
+            mode=str(data["mode"]),
+            context=str(data["context"]),
+            timestamp=float(data["timestamp"]),
+            status=str(data["status"]),
+            fingerprint=tuple(data["fingerprint"]),
+            source_urls=tuple(data.get("source_urls", ())),
+        )
+
+
+def catalog_path(meta_dir: Path) -> Path:
+    """Where the catalog for a meta directory lives."""
+    return meta_dir / CATALOG_SUBDIR / CATALOG_FILENAME
+
+
+def _create_schema(conn: sqlite3.Connection) -> None:
+    """Create the tables, unless the catalog already has this schema.
+
+    Checking first keeps opening the catalog for a read free of writes,
+    so readers don't queue for the WAL write lock.
+    """
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version == SCHEMA_VERSION:
+        return
+    if version != 0:
+        # Rebuilt rather than migrated; report_index re-imports a legacy index
+        for table in _TABLES:
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+    conn.executescript(_SCHEMA)
+    try:
+        conn.execute(_FTS_SCHEMA)
+    except sqlite3.OperationalError as e:
+        logger.info("SQLite has no FTS5 (%s); reports are indexed without full text", e)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.commit()
+
+
+def _open(meta_dir: Path) -> sqlite3.Connection:
+    """Open (creating if needed) the catalog, or an in-memory one if that fails."""
+    path = catalog_path(meta_dir)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path, timeout=_BUSY_TIMEOUT_S)
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            _create_schema(conn)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(
+            "Could not open report catalog %s (%s); scanning files instead. "
+            "Run with --rebuild-index to recreate it.", path, e,
+        )
+    conn = sqlite3.connect(":memory:")
+    _create_schema(conn)
+    return conn
+
+
+def is_persistent(conn: sqlite3.Connection) -> bool:
+    """False for the in-memory fallback catalog."""
+    return conn.execute("PRAGMA database_list").fetchone()[2] != ""
+
+
+def has_full_text(conn: sqlite3.Connection) -> bool:
+    """Whether the catalog has the FTS5 report_text table."""
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'report_text'"
+    ).fetchone() is not None
+
+
+# Tables synced from a directory, by the column holding the file name
+_KEY_COLUMN = {"reports": "filename", "critiques": "name", "runs": "name"}
+
+
+def _file_key(entry: os.DirEntry) -> str:
+    # lstat, so replacing a file with a symlink is a change
+    st = entry.stat(follow_symlinks=False)
+    return f"{st.st_ino}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _resolves_within(path: Path, directory: Path) -> bool:
+    try:
+        return path.resolve().is_relative_to(directory.resolve())
+    except OSError:
+        return False
+
+
+def _sync(
+    conn: sqlite3.Connection,
+    kind: str,
+    directory: Path,
+    matches: Callable[[str], bool],
+    index: Callable[[sqlite3.Connection, Path, str], None],
+) -> None:
+    """Bring one table in line with the matching files of ``directory``.
+
+    ``kind`` is both the table name and the sync_state key. Nothing is
+    read when the directory's mtime is the one recorded last time.
+    """
+    directory_key = str(directory.absolute())
+    try:
+        # Read before scanning: a file added mid-scan moves it again
+        mtime_ns = directory.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    state = conn.execute(
+        "SELECT directory, mtime_ns FROM sync_state WHERE kind = ?", (kind,),
+    ).fetchone()
+    if mtime_ns is not None and state == (directory_key, mtime_ns):
+        return
+
+    with conn:
+        if state is not None and state[0] != directory_key:
+            _clear(conn, kind)
+        known = dict(conn.execute(f"SELECT {_KEY_COLUMN[kind]}, file_key FROM {kind}"))
+        seen: set[str] = set()
+        if mtime_ns is not None:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not matches(entry.name):
+                        continue
+                    path = Path(entry.path)
+                    try:
+                        key = _file_key(entry)
+                    except OSError:
+                        continue
+                    if not _resolves_within(path, directory):
+                        logger.warning("Not indexing %s: it resolves outside %s", path, directory)
+                        continue
+                    seen.add(entry.name)
+                    if known.get(entry.name) != key:
+                        index(conn, path, key)
+        for name in known.keys() - seen:
+            _delete(conn, kind, name)
+        if mtime_ns is not None:
+            if time.time_ns() - mtime_ns < _RACY_MTIME_NS:
+                mtime_ns = -1
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_state (kind, directory, mtime_ns) VALUES (?, ?, ?)",
+                (kind, directory_key, mtime_ns),
+            )
+
+
+def _clear(conn: sqlite3.Connection, kind: str) -> None:
+    conn.execute(f"DELETE FROM {kind}")
+    if kind == "reports":
+        conn.execute("DELETE FROM report_words")
+        conn.execute("DELETE FROM report_sources")
+        if has_full_text(conn):
+            conn.execute("DELETE FROM report_text")
+
+
+def _delete(conn: sqlite3.Connection, kind: str, name: str) -> None:
+    if kind == "reports":
+        row = conn.execute("SELECT id FROM reports WHERE filename = ?", (name,)).fetchone()
+        if row is not None:
+            conn.execute("DELETE FROM report_words WHERE report_id = ?", (row[0],))
+            conn.execute("DELETE FROM report_sources WHERE report_id = ?", (row[0],))
+            if has_full_text(conn):
+                conn.execute("DELETE FROM report_text WHERE rowid = ?", (row[0],))
+    conn.execute(f"DELETE FROM {kind} WHERE {_KEY_COLUMN[kind]} = ?", (name,))
+
+
+def _entry_key(path: Path) -> str | None:
+    """file_key for a path, as _sync() would compute it."""
+    try:
+        st = path.lstat()
+    except OSError:
+        return None
+    return f"{st.st_ino}:{st.st_mtime_ns}:{st.st_size}"
+
+
+# --- Reports ---
+
+
+def _is_report(name: str) -> bool:
+    return name.endswith(".md") and not name.startswith(".")
+
+
+def _title(body: str, fallback: str) -> str:
+    for line in body.splitlines():
+        if line.startswith("# "):
+            return line[2:].strip()
+    return fallback
+
+
+def source_domains(urls: Sequence[str]) -> tuple[str, ...]:
+    """Distinct host names of ``urls`` (without www.), in first-seen order."""
+    domains = []
+    for url in urls:
+        host = (urlparse(url).hostname or "").removeprefix("www.")
+        if host:
+            domains.append(host)
+    return tuple(dict.fromkeys(domains))
+
+
+def _index_report_file(conn: sqlite3.Connection, path: Path, key: str) -> None:
+    """Insert or update a report row and its full text.
+
+    An existing row keeps its index entry: only the title and text
+    come from the file.
+    """
+    try:
+        body = path.read_text(encoding="utf-8", errors="replace")
+    except OSError as e:
+        logger.warning("Could not index report %s: %s", path, e)
+        return
+    info = parse_report_filename(path.name)
+    title = _title(body, info.query_name)
+    row = conn.execute(
+        "SELECT id, source_domains FROM reports WHERE filename = ?", (path.name,),
+    ).fetchone()
+    if row is None:
+        report_id = conn.execute(
+            "INSERT INTO reports (filename, date, query_name, title, saved_at, file_key)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (path.name, info.date, info.query_name, title, _mtime(path), key),
+        ).lastrowid
+        domains = ""
+    else:
+        report_id, domains = row
+        conn.execute(
+            "UPDATE reports SET title = ?, file_key = ? WHERE id = ?", (title, key, report_id),
+        )
+    if has_full_text(conn):
+        conn.execute("DELETE FROM report_text WHERE rowid = ?", (report_id,))
+        conn.execute(
+            "INSERT INTO report_text (rowid, title, body, domains) VALUES (?, ?, ?, ?)",
+            # The title has its own column; keep it out of body snippets
+            (report_id, title, body.replace(f"# {title}\n", "", 1), domains),
+        )
+
+
+def save_entry(
+    conn: sqlite3.Connection,
+    entry: IndexEntry,
+    sources: Sequence[StoredSource] = (),
+) -> bool:
+    """Attach an index entry, and its sources, to an indexed report.
+
+    Replaces the report's previous entry and sources.
+
+    Returns:
+        False if the catalog has no report with the entry's filename.
+    """
+    row = conn.execute("SELECT id FROM reports WHERE filename = ?", (entry.filename,)).fetchone()
+    if row is None:
+        return False
+    report_id = row[0]
+    domains = " ".join(source_domains(entry.source_urls))
+    conn.execute(
+        "UPDATE reports SET query = ?, normalized_query = ?, mode = ?, context = ?, status = ?,"
+        " source_domains = ?, source_urls = ?, fingerprint = ?, saved_at = ? WHERE id = ?",
+        (
+            entry.query, entry.normalized_query, entry.mode, entry.context, entry.status,
+            domains, json.dumps(list(entry.source_urls)), " ".join(entry.fingerprint),
+            entry.timestamp, report_id,
+        ),
+    )
+    conn.execute("DELETE FROM report_words WHERE report_id = ?", (report_id,))
+    conn.executemany(
+        "INSERT INTO report_words (word, report_id) VALUES (?, ?)",
+        [(word, report_id) for word in set(entry.fingerprint)],
+    )
+    conn.execute("DELETE FROM report_sources WHERE report_id = ?", (report_id,))
+    if sources:
+        conn.execute(
+            "INSERT INTO report_sources (report_id, data) VALUES (?, ?)",
+            (report_id, json.dumps([asdict(s) for s in sources])),
+        )
+    if has_full_text(conn):
+        conn.execute("UPDATE report_text SET domains = ? WHERE rowid = ?", (domains, report_id))
+    return True
+
+
+_ENTRY_COLUMNS = (
+    "r.filename, r.query, r.normalized_query, r.mode, r.context, r.saved_at, r.status,"
+    " r.fingerprint, r.source_urls"
+)
+
+
+def _entry(row: tuple) -> IndexEntry:
+    filename, query, normalized, mode, context, saved_at, status, fingerprint, urls = row
+    return IndexEntry(
+        filename=filename,
+        query=query,
+        normalized_query=normalized or "",
+        mode=mode or "",
+        context=context or "",
+        timestamp=saved_at,
+        status=status or "",
+        fingerprint=tuple(fingerprint.split()),
+        source_urls=tuple(json.loads(urls)),
+    )
+
+
+def index_entries(conn: sqlite3.Connection, filename: str | None = None) -> list[IndexEntry]:
+    """Index entries of the catalog's reports, oldest save first.
+
+    Only reports the pipeline saved have one. With ``filename``, just
+    that report's entry (if any).
+    """
+    sql = f"SELECT {_ENTRY_COLUMNS} FROM reports r WHERE r.query IS NOT NULL"
+    params: list[object] = []
+    if filename is not None:
+        sql += " AND r.filename = ?"
+        params.append(filename)
+    return [_entry(row) for row in conn.execute(sql + " ORDER BY r.saved_at, r.id", params)]
+
+
+def cache_candidates(
+    conn: sqlite3.Connection,
+    *,
+    mode: str,
+    context: str,
+    statuses: Sequence[str],
+    saved_since: float,
+    normalized_query: str,
+    fingerprint: Sequence[str],
+    min_shared_words: int,
+) -> list[IndexEntry]:
+    """Index entries that could stand in for a query.
+
+    They match mode and context exactly, have one of ``statuses``, were
+    saved at or after ``saved_since``, and either have the same
+    normalized query or share at least ``min_shared_words`` of the
+    fingerprint's words. Found through the mode and word indexes, not
+    by reading every entry.
+    """
+    words = sorted(set(fingerprint))
+    sql = (
+        f"SELECT {_ENTRY_COLUMNS} FROM reports r"
+        " WHERE r.query IS NOT NULL AND r.mode = ? AND r.context = ?"
+        f" AND r.status IN ({', '.join('?' * len(statuses))}) AND r.saved_at >= ?"
+        " AND (r.normalized_query = ?"
+    )
+    params: list[object] = [mode, context, *statuses, saved_since, normalized_query]
+    if words:
+        sql += (
+            " OR r.id IN (SELECT report_id FROM report_words"
+            f" WHERE word IN ({', '.join('?' * len(words))})"
+            " GROUP BY report_id HAVING COUNT(*) >= ?)"
+        )
+        params += [*words, max(1, min_shared_words)]
+    return [_entry(row) for row in conn.execute(sql + ")", params)]
+
+
+def report_sources(conn: sqlite3.Connection, filename: str) -> tuple[StoredSource, ...]:
+    """The stored sources of a report (empty if none were kept).
+
+    Raises:
+        ValueError: If the stored sources can't be parsed.
+    """
+    row = conn.execute(
+        "SELECT s.data FROM report_sources s JOIN reports r ON r.id = s.report_id"
+        " WHERE r.filename = ?", (filename,),
+    ).fetchone()
+    if row is None:
+        return ()
+    try:
+        return tuple(
+            StoredSource(**{**item, "summaries": tuple(item["summaries"])})
+            for item in json.loads(row[0])
+        )
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"malformed stored sources: {e}") from None
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return time.time()
+
+
+def sync_reports(conn: sqlite3.Connection, reports_dir: Path) -> None:
+    """Rescan reports_dir into the catalog if it changed since the last sync."""
+    _sync(conn, "reports", reports_dir, _is_report, _index_report_file)
+
+
+def open_reports_catalog(reports_dir: Path) -> sqlite3.Connection:
+    """A connection to the catalog of reports_dir, synced with its files."""
+    conn = _open(reports_dir / "meta")
+    sync_reports(conn, reports_dir)
+    return conn
+
+
+def list_reports(reports_dir: Path) -> list[ReportInfo]:
+    """Saved reports in reports_dir, newest date first (undated last)."""
+    conn = open_reports_catalog(reports_dir)
+    try:
+        rows = conn.execute(
+            "SELECT filename, date, query_name FROM reports ORDER BY date DESC, filename"
+        ).fetchall()
+    finally:
+        conn.close()
+    return [ReportInfo(filename=f, date=d, query_name=q) for f, d, q in rows]
+
+
+_PHRASE_OR_WORD = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def _fts_query(text: str) -> str:
+    """An FTS5 query matching every word and "quoted phrase" of text.
+
+    Words are quoted, so FTS5 operators and punctuation in text are
+    searched for as plain words rather than parsed.
+    """
+    terms = []
+    for phrase, word in _PHRASE_OR_WORD.findall(text):
+        words = re.findall(r"\w+", phrase or word)
+        if words:
+            terms.append('"' + " ".join(words) + '"')
+    return " ".join(terms)
+
+
+def _like_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _check_date(name: str, value: str | None) -> None:
+    if value is None:
+        return
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a YYYY-MM-DD date, got {value!r}") from None
+
+
+def search_reports(
+    reports_dir: Path,
+    text: str = "",
+    *,
+    mode: str | None = None,
+    status: str | None = None,
+    domain: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    limit: int = 20,
+) -> list[ReportMatch]:
+    """Search the saved reports of reports_dir.
+
+    Args:
+        reports_dir: The reports directory.
+        text: Words and "quoted phrases" that must all appear in a
+            report's title, body or source domains. Empty to match
+            every report that passes the filters.
+        mode: Only reports saved in this mode.
+        status: Only reports with this gate decision.
+        domain: Only reports citing this domain or a subdomain of it.
+        since: Only reports dated on or after this YYYY-MM-DD date.
+        until: Only reports dated on or before this YYYY-MM-DD date.
+        limit: Maximum number of results.
+
+    Returns:
+        Matches, best first (newest first when text is empty).
+
+    Raises:
+        ValueError: If a filter or limit is invalid.
+    """
+    if limit < 1:
+        raise ValueError(f"limit must be >= 1, got {limit}")
+    if status is not None and status not in {d.value for d in GateDecision}:
+        valid = ", ".join(d.value for d in GateDecision)
+        raise ValueError(f"status must be one of {valid}, got {status!r}")
+    _check_date("since", since)
+    _check_date("until", until)
+
+    where: list[str] = []
+    params: list[object] = []
+    if mode is not None:
+        where.append("r.mode = ?")
+        params.append(mode.strip().lower())
+    if status is not None:
+        where.append("r.status = ?")
+        params.append(status)
+    if domain is not None:
+        host = (urlparse(domain).hostname if "://" in domain else domain.strip().lower()) or ""
+        host = _like_escape(host.removeprefix("www."))
+        where.append(
+            "((' ' || r.source_domains || ' ') LIKE ? ESCAPE '\\'"
+            " OR (' ' || r.source_domains || ' ') LIKE ? ESCAPE '\\')"
+        )
+        params += [f"% {host} %", f"%.{host} %"]
+    if since is not None:
+        where.append("r.date != '' AND r.date >= ?")
+        params.append(since)
+    if until is not None:
+        where.append("r.date != '' AND r.date <= ?")
+        params.append(until)
+
+    columns = "r.filename, r.date, r.title, r.query, r.mode, r.status, r.source_domains"
+    match = _fts_query(text)
+    conn = open_reports_catalog(reports_dir)
+    try:
+        if match and has_full_text(conn):
+            sql = (
+                f"SELECT {columns},"
+                f" snippet(report_text, -1, '**', '**', '…', {_SNIPPET_TOKENS}),"
+                f" bm25(report_text, {', '.join(map(str, _BM25_WEIGHTS))}) AS rank"
+                " FROM report_text JOIN reports r ON r.id = report_text.rowid"
+                " WHERE report_text MATCH ?"
+                + "".join(f" AND {w}" for w in where)
+                + " ORDER BY rank LIMIT ?"
+            )
+            params = [match, *params, limit]
+        else:
+            if match:
+                # No FTS5: match words against titles and queries only
+                for word in re.findall(r"\w+", text):
+                    where.append("(r.title LIKE ? ESCAPE '\\' OR r.query LIKE ? ESCAPE '\\')")
+                    params += [f"%{_like_escape(word)}%"] * 2
+            sql = (
+                f"SELECT {columns}, '', 0.0 FROM reports r"
+                + (" WHERE " + " AND ".join(where) if where else "")
+                + " ORDER BY r.date DESC, r.filename LIMIT ?"
+            )
+            params.append(limit)
+        rows = conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+
+    return [
+        ReportMatch(
+            filename=filename,
+            date=report_date,
+            title=title,
+            query=query or "",
+            mode=report_mode or "",
+            status=report_status or "",
+            source_domains=tuple(domains.split()),
+            snippet=" ".join(snippet.split()),
+            score=-rank if rank else 0.0,
+        )
+        for filename, report_date, title, query, report_mode, report_status, domains, snippet, rank in rows
+    ]
+
+
+def add_report(
+    conn: sqlite3.Connection,
+    path: Path,
+    entry: IndexEntry,
+    sources: Sequence[StoredSource] = (),
+) -> None:
+    """Index a just-saved report with its index entry and sources.
+
+    A missing file is ignored. report_index.record_report() builds the
+    entry.
+    """
+    key = _entry_key(path)
+    if key is None:
+        return
+    with conn:
+        row = conn.execute("SELECT file_key FROM reports WHERE filename = ?", (path.name,)).fetchone()
+        if row is None or row[0] != key:
+            _index_report_file(conn, path, key)
+        save_entry(conn, entry, sources)
+
+
+# --- Critiques ---
+
+
+def _is_critique(name: str) -> bool:
+    return name.startswith(CRITIQUE_PREFIX) and name.endswith(".yaml")
+
+
+def _index_critique_file(
+    conn: sqlite3.Connection, path: Path, key: str, data: object = None,
+) -> None:
+    if data is None:
+        try:
+            data = yaml.safe_load(path.read_text())
+        except (yaml.YAMLError, OSError):
+            logger.debug("Indexing unreadable critique file: %s", path)
+            data = None
+    is_dict = isinstance(data, dict)
+    conn.execute(
+        "INSERT OR REPLACE INTO critiques (name, mtime, overall_pass, mean_score, data, file_key)"
+        " VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            path.name,
+            _mtime(path),
+            data.get("overall_pass") if is_dict and isinstance(data.get("overall_pass"), bool) else None,
+            data.get("mean_score") if is_dict and isinstance(data.get("mean_score"), (int, float)) else None,
+            json.dumps(data, default=str) if is_dict else None,
+            key,
+        ),
+    )
+
+
+def recent_critiques(meta_dir: Path, limit: int) -> list[dict | None]:
+    """The ``limit`` newest critique files of meta_dir (by mtime), as parsed.
+
+    Unreadable files are included as None, so they count toward limit.
+    """
+    conn = _open(meta_dir)
+    try:
+        _sync(conn, "critiques", meta_dir, _is_critique, _index_critique_file)
+        rows = conn.execute(
+            "SELECT data FROM critiques ORDER BY mtime DESC, name DESC LIMIT ?", (limit,),
+        ).fetchall()
+    finally:
+        conn.close()
+    return [json.loads(data) if data is not None else None for (data,) in rows]
+
+
+def index_critique(path: Path, data: dict) -> None:
+    """Add a just-saved critique file to the catalog of its directory."""
+    _index_saved(path, "critiques", lambda conn, key: _index_critique_file(conn, path, key, data))
+
+
+# --- Runs ---
+
+
+def _is_usage(name: str) -> bool:
+    return name.startswith(USAGE_PREFIX) and name.endswith(".json")
+
+
+def _index_usage_file(
+    conn: sqlite3.Connection, path: Path, key: str, data: object = None,
+) -> None:
+    if data is None:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning("Skipping unreadable usage file %s: %s", path, e)
+            data = None
+    if not (isinstance(data, dict) and isinstance(data.get("total"), dict)):
+        # Remember the file so it isn't re-read until it changes
+        conn.execute(
+            "INSERT OR REPLACE INTO runs (name, data, file_key) VALUES (?, '', ?)",
+            (path.name, key),
+        )
+        return
+    conn.execute(
+        "INSERT OR REPLACE INTO runs (name, timestamp, query, mode, cost_usd, data, file_key)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (
+            path.name, data.get("timestamp"), data.get("query"), data.get("mode"),
+            data["total"].get("cost_usd"), json.dumps(data), key,
+        ),
+    )
+
+
+def recent_runs(meta_dir: Path, limit: int) -> list[dict]:
+    """The ``limit`` newest run usage summaries of meta_dir, newest first."""
+    conn = _open(meta_dir)
+    try:
+        _sync(conn, "runs", meta_dir, _is_usage, _index_usage_file)
+        rows = conn.execute(
+            "SELECT data FROM runs WHERE data != '' ORDER BY name DESC LIMIT ?", (limit,),
+        ).fetchall()
+    finally:
+        conn.close()
+    return [json.loads(data) for (data,) in rows]
+
+
+def index_run(path: Path, data: dict) -> None:
+    """Add a just-saved usage file to the catalog of its directory."""
+    _index_saved(path, "runs", lambda conn, key: _index_usage_file(conn, path, key, data))
+
+
+def _index_saved(path: Path, kind: str, index: Callable[[sqlite3.Connection, str], None]) -> None:
+    """Index one just-written file of a meta directory; failures are logged."""
+    path = Path(path)
+    key = _entry_key(path)
+    if key is None:
+        return
+    conn = _open(path.parent)
+    try:
+        with conn:
+            index(conn, key)
+    except sqlite3.Error as e:
+        logger.warning("Could not add %s to the %s catalog: %s", path.name, kind, e)
+    finally:
+        conn.close()
+
+
+# --- Rebuild ---
+
+
+def _read_entries(path: Path) -> list[tuple[IndexEntry, tuple[StoredSource, ...]]]:
+    """Index entries and sources from an existing catalog file, if readable."""
+    if not path.is_file():
+        return []
+    try:
+        conn = sqlite3.connect(f"{path.absolute().as_uri()}?mode=ro", uri=True)
+    except sqlite3.Error:
+        return []
+    try:
+        saved = []
+        for entry in index_entries(conn):
+            try:
+                sources = report_sources(conn, entry.filename)
+            except ValueError:
+                sources = ()
+            saved.append((entry, sources))
+        return saved
+    except (sqlite3.Error, ValueError) as e:
+        logger.warning("Could not read index entries from %s: %s", path, e)
+        return []
+    finally:
+        conn.close()
+
+
+def rebuild_catalog(reports_dir: Path) -> CatalogStats:
+    """Recreate the catalog of reports_dir from its files.
+
+    Index entries (and sources) that can still be read from the old
+    catalog are kept for the reports that still exist.
+
+    Raises:
+        OSError: If the catalog can't be written.
+    """
+    meta_dir = reports_dir / "meta"
+    path = catalog_path(meta_dir)
+    saved = _read_entries(path)
+    for stale in (path, path.with_name(path.name + "-wal"), path.with_name(path.name + "-shm")):
+        stale.unlink(missing_ok=True)
+    conn = _open(meta_dir)
+    if not is_persistent(conn):
+        conn.close()
+        raise OSError(f"Could not create report catalog {path}")
+    try:
+        sync_reports(conn, reports_dir)
+        _sync(conn, "critiques", meta_dir, _is_critique, _index_critique_file)
+        _sync(conn, "runs", meta_dir, _is_usage, _index_usage_file)
+        with conn:
+            kept = sum(save_entry(conn, entry, sources) for entry, sources in saved)
+        counts = [
+            conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("reports", "critiques")
+        ]
+        runs = conn.execute("SELECT COUNT(*) FROM runs WHERE data != ''").fetchone()[0]
+        return CatalogStats(
+            reports=counts[0], critiques=counts[1], runs=runs,
+            full_text=has_full_text(conn), index_entries=kept,
+        )
+    finally:
+        conn.close()
@@ -0,0 +1,168 @@
+"""Stage checkpoints so a failed run can resume without redoing finished stages.
+
+A checkpointed run gets a directory under reports/meta/runs/<run-id>/
+holding a manifest (query and mode) and one JSON file per completed
+stage: search results, extracted contents, summaries, the relevance
+evaluation, the draft and the skeptic findings. Every file is written
+with atomic_write(), so a crash never leaves a half-written stage behind.
+Resuming the run loads finished stages instead of paying for them again.
+The directory is removed once the run returns a report.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import secrets
+import shutil
+from dataclasses import fields
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, TypeVar
+
+from .errors import GateDecision, ResearchError, StateError
+from .relevance import RelevanceEvaluation, SourceScore
+from .report_store import META_DIR
+from .safe_io import atomic_write
+from .summarize import Summary
+
+logger = logging.getLogger(__name__)
+
+RUNS_SUBDIR = "runs"
+RUNS_DIR = META_DIR / RUNS_SUBDIR
+MANIFEST_NAME = "run.json"
+
+# Run IDs become directory names, so keep them to a safe alphabet
+_RUN_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_-]{0,63}$")
+
+T = TypeVar("T")
+
+
+def new_run_id() -> str:
+    """Return a fresh run ID: timestamp plus a short random suffix."""
+    return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(3)}"
+
+
+def _check_run_id(run_id: str) -> str:
+    if not _RUN_ID_PATTERN.match(run_id):
+        raise ResearchError(f"Invalid run ID: {run_id!r}")
+    return run_id
+
+
+def to_rows(items: Iterable[Any]) -> list[dict]:
+    """Convert dataclass instances to JSON-ready dicts of their init fields."""
+    return [
+        {f.name: getattr(item, f.name) for f in fields(item) if f.init}
+        for item in items
+    ]
+
+
+def from_rows(cls: type[T], rows: Iterable[dict]) -> list[T]:
+    """Rebuild dataclass instances from to_rows() output."""
+    return [cls(**row) for row in rows]
+
+
+def evaluation_to_dict(evaluation: RelevanceEvaluation) -> dict:
+    """JSON-ready form of a RelevanceEvaluation."""
+    return {
+        "decision": str(evaluation.decision),
+        "decision_rationale": evaluation.decision_rationale,
+        "surviving_sources": to_rows(evaluation.surviving_sources),
+        "dropped_sources": to_rows(evaluation.dropped_sources),
+        "total_scored": evaluation.total_scored,
+        "total_survived": evaluation.total_survived,
+        "refined_query": evaluation.refined_query,
+        "surviving_scores": to_rows(evaluation.surviving_scores),
+    }
+
+
+def evaluation_from_dict(data: dict) -> RelevanceEvaluation:
+    """Rebuild a RelevanceEvaluation from evaluation_to_dict() output."""
+    return RelevanceEvaluation(
+        decision=GateDecision(data["decision"]),
+        decision_rationale=data["decision_rationale"],
+        surviving_sources=tuple(from_rows(Summary, data["surviving_sources"])),
+        dropped_sources=tuple(from_rows(SourceScore, data["dropped_sources"])),
+        total_scored=data["total_scored"],
+        total_survived=data["total_survived"],
+        refined_query=data["refined_query"],
+        surviving_scores=tuple(from_rows(SourceScore, data.get("surviving_scores", []))),
+    )
+
+
+class RunCheckpoint:
+    """Per-stage checkpoint files for one research run.
+
+    Writes never fail the run: a stage that can't be saved is logged and
+    simply recomputed on resume.
+    """
+
+    def __init__(self, run_id: str, query: str, mode: str, runs_dir: Path = RUNS_DIR) -> None:
+        self.run_id = _check_run_id(run_id)
+        self.query = query
+        self.mode = mode
+        self.directory = runs_dir / run_id
+
+    @classmethod
+    def create(cls, query: str, mode: str, runs_dir: Path = RUNS_DIR) -> RunCheckpoint:
+        """Start a new checkpointed run and write its manifest."""
+        checkpoint = cls(new_run_id(), query, mode, runs_dir)
+        checkpoint._write(MANIFEST_NAME, {
+            "run_id": checkpoint.run_id,
+            "query": query,
+            "mode": mode,
+            "created": datetime.now().isoformat(timespec="seconds"),
+        })
+        return checkpoint
+
+    @classmethod
+    def open(cls, run_id: str, runs_dir: Path = RUNS_DIR) -> RunCheckpoint:
+        """Open an existing run to resume it.
+
+        Raises:
+            ResearchError: If the run ID is invalid or has no readable
+                manifest (unknown, finished, or already cleaned up).
+        """
+        directory = runs_dir / _check_run_id(run_id)
+        try:
+            manifest = json.loads((directory / MANIFEST_NAME).read_text(encoding="utf-8"))
+            return cls(run_id, manifest["query"], manifest["mode"], runs_dir)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise ResearchError(f"No resumable run {run_id!r} in {runs_dir}") from e
+
+    def _write(self, name: str, data: dict) -> None:
+        try:
+            atomic_write(self.directory / name, json.dumps(data))
+        except (StateError, OSError) as e:
+            logger.warning("Could not write checkpoint %s: %s", name, e)
+
+    def save(self, stage: str, data: dict) -> None:
+        """Record a completed stage's output."""
+        self._write(f"{stage}.json", data)
+        logger.debug("Checkpointed stage %s for run %s", stage, self.run_id)
+
+    def load(self, stage: str) -> dict | None:
+        """Return a completed stage's output, or None if it must be (re)run."""
+        path = self.directory / f"{stage}.json"
+        if not path.is_file():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable checkpoint %s: %s", path, e)
+            return None
+        logger.info("Resuming run %s: reusing %s", self.run_id, stage)
+        return data
+
+    def completed_stages(self) -> tuple[str, ...]:
+        """Names of the stages with a checkpoint, sorted."""
+        if not self.directory.is_dir():
+            return ()
+        return tuple(sorted(
+            p.stem for p in self.directory.glob("*.json") if p.name != MANIFEST_NAME
+        ))
+
+    def discard(self) -> None:
+        """Delete the run's checkpoints (after the run succeeded)."""
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -11,7 +11,7 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-from research_agent import ResearchAgent
+from research_agent.catalog import rebuild_catalog
 from research_agent.report_store import META_DIR
 from research_agent.context import (
     CONTEXTS_DIR,
@@ -23,13 +23,16 @@ from research_agent.context import (
 from research_agent.critique import critique_report_file, save_critique
 from research_agent.errors import ResearchError
 from research_agent.modes import ResearchMode
+from research_agent.report_index import record_report
 from research_agent.report_store import (
     REPORTS_DIR,
     get_auto_save_path,
     get_reports,
     sanitize_filename,
+    search_reports,
 )
 from research_agent.safe_io import atomic_write
+from research_agent.usage import load_usage_history
 
 RESEARCH_LOG_PATH = Path("research_log.md")
 
@@ -76,6 +79,45 @@ def list_reports() -> None:
             print(f"  {r.filename}")
 
 
+# field:value terms of --search that filter instead of matching text
+_SEARCH_FILTER = re.compile(r"(?<!\S)(mode|status|domain|since|until):(\S+)")
+
+
+def search_saved_reports(terms: str, limit: int = 20) -> None:
+    """Print saved reports matching a --search string, best first.
+
+    Raises:
+        ValueError: If a filter term is invalid.
+    """
+    filters = {name: value for name, value in _SEARCH_FILTER.findall(terms)}
+    text = _SEARCH_FILTER.sub("", terms).strip()
+    matches = search_reports(text, limit=limit, **filters)
+    if not matches:
+        print("No matching reports." if REPORTS_DIR.is_dir() else "No reports directory found.")
+        return
+    print(f"Matching reports ({len(matches)}):")
+    for m in matches:
+        print(f"  {m.date or '----------'}  {m.mode or '-':<9} {m.status or '-':<17} {m.filename}")
+        print(f"      {m.title}")
+        if m.snippet:
+            print(f"      {m.snippet}")
+
+
+def rebuild_index() -> None:
+    """Recreate the report catalog from the files in reports/."""
+    if not REPORTS_DIR.is_dir():
+        print("No reports directory found.")
+        return
+    try:
+        stats = rebuild_catalog(REPORTS_DIR)
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    full_text = "" if stats.full_text else " (no full-text search: SQLite lacks FTS5)"
+    print(f"Rebuilt report catalog: {stats.reports} reports, {stats.critiques} critiques, "
+          f"{stats.runs} runs, {stats.index_entries} index entries kept{full_text}")
+
+
 def show_costs() -> None:
     """Print estimated costs for all research modes and exit."""
     modes = [ResearchMode.quick(), ResearchMode.standard(), ResearchMode.deep()]
@@ -86,6 +128,100 @@ def show_costs() -> None:
               f"({m.max_sources} sources, ~{m.word_target} words){default}")
 
 
+def show_usage_history(limit: int, meta_dir: Path = META_DIR) -> None:
+    """Print measured token usage and cost for the last `limit` runs."""
+    history = load_usage_history(meta_dir, limit=limit)
+    if not history:
+        print("\nNo recorded runs yet.")
+        return
+    print(f"\nMeasured usage (last {len(history)} runs):")
+    for run in history:
+        total = run["total"]
+        when = datetime.fromtimestamp(run.get("timestamp", 0)).strftime("%Y-%m-%d %H:%M")
+        query = str(run.get("query", ""))[:50]
+        print(f"  {when}  {run.get('mode', '?'):<9} ${total['cost_usd']:.4f}  "
+              f"{total['input_tokens']:>7} in / {total['output_tokens']:>6} out  "
+              f"{total['calls']:>3} calls  {query}")
+        stages = sorted(
+            run.get("by_stage", {}).items(),
+            key=lambda item: item[1].get("cost_usd", 0), reverse=True,
+        )
+        for stage, t in stages:
+            print(f"      {stage:<22} ${t['cost_usd']:.4f}  "
+                  f"{t['input_tokens']:>7} in / {t['output_tokens']:>6} out  "
+                  f"cache {t['cache_read_input_tokens']} read  {t['latency_s']:.1f}s")
+
+
+def run_batch_file(
+    path: Path,
+    mode: ResearchMode,
+    context: str | None = None,
+    skip_critique: bool = False,
+    skip_iteration: bool = False,
+    concurrency: int | None = None,
+) -> int:
+    """Run every query in a batch file, saving each report as it finishes.
+
+    Reports always go to reports/ (there is no single stdout to print
+    them to). Returns the exit code: 1 if any query failed.
+    """
+    from research_agent.batch import BatchLimits, load_batch_file, run_batch
+
+    queries = load_batch_file(path)
+    limits = BatchLimits(max_concurrent_queries=concurrency) if concurrency else BatchLimits()
+    print(f"Running {len(queries)} queries ({limits.max_concurrent_queries} at a time)...",
+          file=sys.stderr)
+
+    def _save(job) -> None:
+        if not job.ok:
+            print(f"Failed: {job.query}: {job.error}", file=sys.stderr)
+            return
+        append_research_log(job.query, ResearchMode.from_name(job.mode), job.result.report)
+        try:
+            output_path = get_auto_save_path(job.query)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(output_path, job.result.report)
+        except OSError as e:
+            print(f"File error for {job.query}: {e}", file=sys.stderr)
+            return
+        record_report(
+            output_path, job.query, job.mode, job.result.context,
+            job.result.source_urls, job.result.status, sources=job.result.sources,
+        )
+        print(f"Saved: {output_path} ({job.elapsed_s:.0f}s)", file=sys.stderr)
+
+    result = run_batch(
+        queries, mode=mode.name, context=context,
+        skip_critique=skip_critique, skip_iteration=skip_iteration,
+        limits=limits, on_result=_save,
+    )
+
+    print(f"\nBatch: {result.succeeded}/{len(result.jobs)} queries in {result.elapsed_s:.1f}s "
+          f"({result.queries_per_minute:.2f}/min), ${result.usage.total.cost_usd:.4f}, "
+          f"{result.usage.total.calls} Claude calls")
+    for job in result.jobs:
+        if job.ok:
+            usage = job.result.usage
+            cost = usage.total.cost_usd if usage else 0.0
+            status = f"{job.result.status:<17} {job.result.sources_used:>3} sources  ${cost:.4f}"
+        else:
+            status = f"{'error':<17} {job.error[:60]}"
+        print(f"  {job.mode:<9} {job.elapsed_s:>7.1f}s  {status}  {job.query[:60]}")
+    cache = ", ".join(
+        f"{name} {stats['hits']} hits/{stats['misses']} misses"
+        for name, stats in result.cache_stats.items()
+    )
+    print(f"  shared cache: {cache}")
+    return 1 if result.failed else 0
+
+
+def _print_resume_hint(agent) -> None:
+    """Tell the user how to resume a failed checkpointed run."""
+    run_id = agent.last_run_id if agent is not None else None
+    if isinstance(run_id, str):
+        print(f"Finished stages were saved; resume with: --resume {run_id}", file=sys.stderr)
+
+
 def main() -> None:
     # Load environment variables from .env file
     load_dotenv()
@@ -110,6 +246,8 @@ Examples:
   python main.py "Quick summary of React hooks" --quick
   python main.py "Comprehensive analysis of Kubernetes security" --deep
   python main.py "Compare React vs Vue" --standard -o comparison.md
+  python main.py --resume 20260301-101500-a1b2c3   # retry a failed run
+  python main.py --refresh graphql_vs_rest_2026-02-03_183703056652.md
         """,
     )
     parser.add_argument(
@@ -160,14 +298,23 @@ Examples:
     )
     parser.add_argument(
         "--cost",
-        action="store_true",
-        help="Show estimated costs for all modes and exit",
+        nargs="?",
+        const=5,
+        type=int,
+        metavar="N",
+        help="Show estimated costs for all modes plus measured usage "
+             "for the last N runs (default 5) and exit",
     )
     parser.add_argument(
         "--open",
         action="store_true",
         help="Open saved report after generation (macOS)",
     )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Write a Chrome/Perfetto trace of pipeline stages to reports/meta/traces/",
+    )
     parser.add_argument(
         "--critique",
         type=Path,
@@ -196,11 +343,56 @@ Examples:
         metavar="NAME",
         help='Context file to load from contexts/ (e.g. "pfe", "none" for no context)',
     )
+    parser.add_argument(
+        "--search",
+        type=str,
+        default=None,
+        metavar="TERMS",
+        help='Search saved reports and exit. Words and "phrases" match report text; '
+             "mode:, status:, domain:, since: and until: terms filter "
+             '(e.g. "solar recycling domain:epa.gov since:2026-01-01")',
+    )
+    parser.add_argument(
+        "--rebuild-index",
+        action="store_true",
+        help="Rebuild the report catalog in reports/meta/catalog/ from the "
+             "files in reports/, keeping readable index entries, and exit",
+    )
     parser.add_argument(
         "--list-contexts",
         action="store_true",
         help="List available context profiles with configured fields and exit",
     )
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        metavar="FILE",
+        help="Research every query in FILE (one per line, or JSONL with "
+             "query/mode/context keys) concurrently; reports auto-save",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Queries to run at once with --batch (default 3)",
+    )
+    parser.add_argument(
+        "--resume",
+        type=str,
+        default=None,
+        metavar="RUN_ID",
+        help="Resume a failed standard/deep run from its checkpoints in "
+             "reports/meta/runs/, skipping the stages it finished",
+    )
+    parser.add_argument(
+        "--refresh",
+        type=str,
+        default=None,
+        metavar="FILENAME",
+        help="Update a saved report in reports/: re-check its sources and "
+             "re-summarize only the changed and new ones",
+    )
 
     args = parser.parse_args()
 
@@ -209,6 +401,20 @@ Examples:
         list_reports()
         sys.exit(0)
 
+    # --search: search saved reports and exit
+    if args.search is not None:
+        try:
+            search_saved_reports(args.search)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        sys.exit(0)
+
+    # --rebuild-index: recreate the report catalog and exit
+    if args.rebuild_index:
+        rebuild_index()
+        sys.exit(0)
+
     # --list-contexts: show context profiles with field summary and exit
     if args.list_contexts:
         if not CONTEXTS_DIR.is_dir():
@@ -248,8 +454,12 @@ Examples:
         sys.exit(0)
 
     # --cost: show costs and exit (no API keys needed)
-    if args.cost:
+    if args.cost is not None:
+        if args.cost < 1:
+            print("Error: --cost N must be at least 1", file=sys.stderr)
+            sys.exit(1)
         show_costs()
+        show_usage_history(args.cost)
         sys.exit(0)
 
     # --critique-history: print aggregated critique patterns and exit
@@ -282,9 +492,20 @@ Examples:
         sys.exit(0)
 
     # Require query for research
-    if args.query is None:
+    if args.query is None and args.batch is None and args.resume is None and args.refresh is None:
         parser.print_help()
         sys.exit(2)
+    if args.batch is not None and (args.query is not None or args.resume is not None):
+        print("Error: give either a query or --batch, not both", file=sys.stderr)
+        sys.exit(2)
+    if args.refresh is not None and (
+            args.query is not None or args.resume is not None or args.batch is not None):
+        print("Error: --refresh takes its query from the saved report; give it alone",
+              file=sys.stderr)
+        sys.exit(2)
+    if args.concurrency is not None and args.concurrency < 1:
+        print("Error: --concurrency N must be at least 1", file=sys.stderr)
+        sys.exit(1)
 
     # Configure logging (after parsing so --verbose is available)
     # Default: INFO to stderr with clean format (preserves old print() UX).
@@ -312,6 +533,58 @@ Examples:
         print(f"Note: --max-sources ignored when using --{mode.name} (uses {mode.max_sources} sources)",
               file=sys.stderr)
 
+    # --resume: the query and mode come from the run's checkpoint manifest
+    if args.resume is not None:
+        from research_agent.checkpoint import RUNS_SUBDIR, RunCheckpoint
+        try:
+            checkpoint = RunCheckpoint.open(args.resume, META_DIR / RUNS_SUBDIR)
+        except ResearchError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        if args.query is not None and args.query != checkpoint.query:
+            print(f"Error: run {checkpoint.run_id} was for {checkpoint.query!r}, not {args.query!r}",
+                  file=sys.stderr)
+            sys.exit(2)
+        if mode_flag_used and mode.name != checkpoint.mode:
+            print(f"Note: resuming in {checkpoint.mode} mode (the run's original mode)",
+                  file=sys.stderr)
+        args.query = checkpoint.query
+        mode = ResearchMode.from_name(checkpoint.mode)
+
+    # --refresh: the query, mode and context come from the report index
+    refresh_sources = ()
+    refresh_path = None
+    if args.refresh is not None:
+        from research_agent.report_index import get_entry, load_sources, saved_report_path
+        entry = get_entry(args.refresh)
+        refresh_path = saved_report_path(args.refresh)
+        refresh_sources = load_sources(args.refresh) if entry is not None else ()
+        if refresh_path is None or not refresh_sources:
+            print(f"Error: no stored sources for {args.refresh!r} in {META_DIR}/; "
+                  "run the query again instead", file=sys.stderr)
+            sys.exit(1)
+        args.query = entry.query
+        mode = ResearchMode.from_name(entry.mode)
+        if args.context is None:
+            args.context = entry.context or None
+
+    if args.batch is not None:
+        if args.output is not None:
+            print("Note: --output ignored with --batch (reports auto-save to reports/)",
+                  file=sys.stderr)
+        try:
+            sys.exit(run_batch_file(
+                args.batch, mode, context=args.context,
+                skip_critique=args.no_critique, skip_iteration=args.no_iteration,
+                concurrency=args.concurrency,
+            ))
+        except ResearchError as e:
+            print(f"\nError: {e}", file=sys.stderr)
+            sys.exit(1)
+        except KeyboardInterrupt:
+            print("\nInterrupted", file=sys.stderr)
+            sys.exit(130)
+
     # Resolve context path from --context flag
     context_path = None  # means "use default"
     no_context = False
@@ -324,6 +597,9 @@ Examples:
         if context_path is None:
             no_context = True  # --context none: explicitly skip context
 
+    from research_agent import ResearchAgent
+
+    agent = None
     try:
         agent = ResearchAgent(
             mode=mode,
@@ -332,9 +608,22 @@ Examples:
             skip_iteration=args.no_iteration,
             context_path=context_path,
             no_context=no_context,
+            trace=args.trace,
+            # Standard/deep runs are long enough to be worth resuming
+            checkpoint=not mode.is_quick,
+            resume_run_id=args.resume,
         )
 
-        report = agent.research(args.query)
+        if args.refresh is not None:
+            report = agent.refresh(args.query, refresh_sources, refresh_path)
+            r = agent.last_refresh
+            print(f"Refresh: {r.unchanged} unchanged, {r.unverified} unverified, "
+                  f"{r.changed} changed, {r.new} new", file=sys.stderr)
+        else:
+            report = agent.research(args.query)
+
+        if args.trace and agent.last_trace_path is not None:
+            print(f"Trace saved to: {agent.last_trace_path}", file=sys.stderr)
 
         # Print critique summary if available
         critique = agent.last_critique
@@ -351,7 +640,10 @@ Examples:
 
         # Determine output path
         output_path = args.output
-        if output_path is None and mode.auto_save:
+        if output_path is None and args.refresh is not None and agent.last_refresh.reused_report:
+            # Nothing changed: re-index the saved report in place
+            output_path = refresh_path
+        elif output_path is None and mode.auto_save:
             # Deep mode auto-save
             output_path = get_auto_save_path(args.query)
 
@@ -360,6 +652,12 @@ Examples:
             # Create directory if needed
             output_path.parent.mkdir(parents=True, exist_ok=True)
             atomic_write(output_path, report)
+            if args.output is None:
+                record_report(
+                    output_path, args.query, mode.name, args.context,
+                    agent.last_source_urls, agent.last_gate_decision,
+                    sources=agent.last_sources,
+                )
             print(f"\n\nReport saved to: {output_path}")
             if args.open:
                 if output_path.suffix != ".md":
@@ -373,9 +671,11 @@ Examples:
 
     except ResearchError as e:
         print(f"\nError: {e}", file=sys.stderr)
+        _print_resume_hint(agent)
         sys.exit(1)
     except KeyboardInterrupt:
         print("\nInterrupted", file=sys.stderr)
+        _print_resume_hint(agent)
         sys.exit(130)
     except OSError as e:
         # Handle file system errors (disk full, permissions, etc.)
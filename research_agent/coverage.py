@@ -1,6 +1,7 @@
 """Coverage gap identification for iterative research loops."""
 
 import logging
+import time
 from dataclasses import dataclass
 
 from anthropic import AsyncAnthropic
@@ -11,6 +12,8 @@ from .query_validation import validate_query_list
 from .sanitize import sanitize_content
 from .summarize import Summary
 from .token_budget import truncate_to_budget
+from .usage import record_usage
+from .tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -161,7 +164,7 @@ def _build_gap_prompt(
         for i, s in enumerate(summaries, 1):
             safe_title = sanitize_content(s.title or "Untitled")
             safe_summary = truncate_to_budget(
-                sanitize_content(s.summary), _SUMMARY_TOKEN_BUDGET,
+                s.safe_summary, _SUMMARY_TOKEN_BUDGET,
             )
             source_lines.append(f"Source {i}: {safe_title}\n{safe_summary}")
         sources_block = "\n\n".join(source_lines)
@@ -218,6 +221,7 @@ RETRY_QUERIES:
     return system_prompt, user_prompt
 
 
+@traced("coverage.identify_gaps")
 async def identify_coverage_gaps(
     query: str,
     summaries: list[Summary],
@@ -246,6 +250,7 @@ async def identify_coverage_gaps(
     system_prompt, user_prompt = _build_gap_prompt(query, summaries, tried_queries)
 
     try:
+        started = time.monotonic()
         response = await client.messages.create(
             model=model,
             max_tokens=300,
@@ -254,6 +259,7 @@ async def identify_coverage_gaps(
             system=system_prompt,
             messages=[{"role": "user", "content": user_prompt}],
         )
+        record_usage("coverage", model, response, started)
 
         if not response.content:
             logger.warning("Empty response from gap identification")
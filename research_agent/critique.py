@@ -4,21 +4,28 @@ After each report, evaluates 5 quality dimensions and saves a YAML critique
 to reports/meta/ for future adaptive prompts (Tier 2).
 """
 
+from __future__ import annotations
+
 import dataclasses
 import logging
 import re
 import time
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import yaml
 
-from anthropic import Anthropic
-
-from .errors import ANTHROPIC_ERRORS, ANTHROPIC_TIMEOUT
+from .catalog import index_critique
+from .errors import ANTHROPIC_TIMEOUT
 from .modes import DEFAULT_MODEL
 from .sanitize import sanitize_content
 from .safe_io import atomic_write
+from .usage import record_usage
+from .tracing import traced
+
+if TYPE_CHECKING:
+    from anthropic import Anthropic, AsyncAnthropic
 
 logger = logging.getLogger(__name__)
 
@@ -130,6 +137,7 @@ def _parse_critique_response(text: str) -> dict:
     return result
 
 
+@traced("critique.evaluate")
 def evaluate_report(
     client: Anthropic,
     query: str,
@@ -156,6 +164,62 @@ def evaluate_report(
     Returns:
         CritiqueResult with sanitized, truncated text fields.
     """
+    request = _evaluate_request(
+        query, mode_name, surviving_sources, dropped_sources,
+        skeptic_findings, gate_decision, model, temperature,
+    )
+    from .errors import ANTHROPIC_ERRORS
+
+    try:
+        started = time.monotonic()
+        response = client.messages.create(**request)
+        record_usage("critique", model, response, started)
+    except ANTHROPIC_ERRORS as e:
+        logger.warning(f"Critique API call failed: {e}, using defaults")
+        return CritiqueResult.fallback()
+    return _critique_from_response(response)
+
+
+@traced("critique.evaluate")
+async def evaluate_report_async(
+    client: AsyncAnthropic,
+    query: str,
+    mode_name: str,
+    surviving_sources: int,
+    dropped_sources: int,
+    skeptic_findings: list | None,
+    gate_decision: str,
+    model: str = DEFAULT_MODEL,
+    temperature: float = 1.0,
+) -> CritiqueResult:
+    """Async evaluate_report() on the async client; same arguments and result."""
+    request = _evaluate_request(
+        query, mode_name, surviving_sources, dropped_sources,
+        skeptic_findings, gate_decision, model, temperature,
+    )
+    from .errors import ANTHROPIC_ERRORS
+
+    try:
+        started = time.monotonic()
+        response = await client.messages.create(**request)
+        record_usage("critique", model, response, started)
+    except ANTHROPIC_ERRORS as e:
+        logger.warning(f"Critique API call failed: {e}, using defaults")
+        return CritiqueResult.fallback()
+    return _critique_from_response(response)
+
+
+def _evaluate_request(
+    query: str,
+    mode_name: str,
+    surviving_sources: int,
+    dropped_sources: int,
+    skeptic_findings: list | None,
+    gate_decision: str,
+    model: str,
+    temperature: float,
+) -> dict:
+    """messages.create() arguments for the run evaluation."""
     safe_query = sanitize_content(query)
 
     skeptic_summary = "No skeptic review performed."
@@ -202,26 +266,23 @@ ACTIONABILITY: [1-5]
 WEAKNESSES: [one sentence, max 200 chars]
 SUGGESTIONS: [one sentence, max 200 chars]"""
 
-    try:
-        response = client.messages.create(
-            model=model,
-            max_tokens=300,
-            timeout=ANTHROPIC_TIMEOUT,
-            temperature=temperature,
-            system=system_prompt,
-            messages=[{"role": "user", "content": user_prompt}],
-        )
-
-        if not response.content:
-            logger.warning("Empty critique response, using defaults")
-            return CritiqueResult.fallback()
+    return dict(
+        model=model,
+        max_tokens=300,
+        timeout=ANTHROPIC_TIMEOUT,
+        temperature=temperature,
+        system=system_prompt,
+        messages=[{"role": "user", "content": user_prompt}],
+    )
 
-        parsed = _parse_critique_response(response.content[0].text)
 
-    except ANTHROPIC_ERRORS as e:
-        logger.warning(f"Critique API call failed: {e}, using defaults")
+def _critique_from_response(response) -> CritiqueResult:
+    if not response.content:
+        logger.warning("Empty critique response, using defaults")
         return CritiqueResult.fallback()
 
+    parsed = _parse_critique_response(response.content[0].text)
+
     # Truncate free-text fields (sanitization happens at consumption boundary
     # in _summarize_patterns, not at write time — avoids double-encoding)
     weaknesses = parsed.get("weaknesses", "")[:MAX_TEXT_LENGTH]
@@ -280,6 +341,7 @@ ACTIONABILITY: [1-5]
 WEAKNESSES: [one sentence, max 200 chars]
 SUGGESTIONS: [one sentence, max 200 chars]"""
 
+    started = time.monotonic()
     response = client.messages.create(
         model=model,
         max_tokens=300,
@@ -288,6 +350,7 @@ SUGGESTIONS: [one sentence, max 200 chars]"""
         system=system_prompt,
         messages=[{"role": "user", "content": user_prompt}],
     )
+    record_usage("critique", model, response, started)
 
     if not response.content:
         return CritiqueResult.fallback()
@@ -321,5 +384,6 @@ def save_critique(result: CritiqueResult, meta_dir: Path) -> Path:
 
     content = yaml.dump(data, default_flow_style=False, allow_unicode=True)
     atomic_write(path, content)
+    index_critique(path, data)
     logger.info(f"Saved critique to {path}")
     return path
@@ -1,14 +1,17 @@
 """Query decomposition for complex multi-topic research queries."""
 
 import logging
+import time
 from dataclasses import dataclass
 
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 
 from .errors import ANTHROPIC_ERRORS, ANTHROPIC_TIMEOUT
 from .modes import DEFAULT_MODEL
 from .query_validation import validate_query_list
 from .sanitize import sanitize_content, build_context_block
+from .usage import record_usage
+from .tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +73,7 @@ def _validate_sub_queries(sub_queries: list[str], original_query: str) -> list[s
     return validated
 
 
+@traced("decompose.query")
 def decompose_query(
     client: Anthropic,
     query: str,
@@ -100,6 +104,56 @@ def decompose_query(
             - is_complex: bool whether decomposition occurred
             - reasoning: str brief explanation of the decision
     """
+    request = _decompose_request(
+        query, context_content, model, critique_guidance, temperature, novelty_queries,
+    )
+    try:
+        started = time.monotonic()
+        response = client.messages.create(**request)
+        record_usage("decompose", model, response, started)
+    except ANTHROPIC_ERRORS as e:
+        logger.warning(f"Query decomposition failed: {e}, using original query")
+        return DecompositionResult(sub_queries=(query,), is_complex=False, reasoning="")
+    return _decomposition_from_response(response, query)
+
+
+@traced("decompose.query")
+async def decompose_query_async(
+    client: AsyncAnthropic,
+    query: str,
+    context_content: str | None = None,
+    model: str = DEFAULT_MODEL,
+    critique_guidance: str | None = None,
+    temperature: float = 1.0,
+    novelty_queries: int = 0,
+) -> DecompositionResult:
+    """Async decompose_query() on the async client; same arguments and result."""
+    request = _decompose_request(
+        query, context_content, model, critique_guidance, temperature, novelty_queries,
+    )
+    try:
+        started = time.monotonic()
+        response = await client.messages.create(**request)
+        record_usage("decompose", model, response, started)
+    except ANTHROPIC_ERRORS as e:
+        logger.warning(f"Query decomposition failed: {e}, using original query")
+        return DecompositionResult(sub_queries=(query,), is_complex=False, reasoning="")
+    return _decomposition_from_response(response, query)
+
+
+def _decompose_request(
+    query: str,
+    context_content: str | None,
+    model: str,
+    critique_guidance: str | None,
+    temperature: float,
+    novelty_queries: int,
+) -> dict:
+    """messages.create() arguments for decomposition.
+
+    Raises:
+        ValueError: If novelty_queries is out of range.
+    """
     if not isinstance(novelty_queries, int) or not (0 <= novelty_queries <= MAX_SUB_QUERIES):
         raise ValueError(f"novelty_queries must be int 0-{MAX_SUB_QUERIES}, got {novelty_queries!r}")
 
@@ -142,16 +196,15 @@ def decompose_query(
         # Safe: novelty_queries is a validated int from ResearchMode.__post_init__
         system_prompt += f"\n{NOVELTY_INSTRUCTION_TEMPLATE.format(novelty_queries=novelty_queries)}"
 
-    try:
-        response = client.messages.create(
-            model=model,
-            max_tokens=300,
-            timeout=ANTHROPIC_TIMEOUT,
-            temperature=temperature,
-            system=system_prompt,
-            messages=[{
-                "role": "user",
-                "content": f"""{context_block}{critique_block}<query>
+    return dict(
+        model=model,
+        max_tokens=300,
+        timeout=ANTHROPIC_TIMEOUT,
+        temperature=temperature,
+        system=system_prompt,
+        messages=[{
+            "role": "user",
+            "content": f"""{context_block}{critique_block}<query>
 {safe_query}
 </query>
 
@@ -163,20 +216,18 @@ SUB_QUERIES:
 - first sub-query (only if COMPLEX)
 - second sub-query (only if COMPLEX)
 - third sub-query (only if COMPLEX, optional)"""
-            }],
-        )
-
-        if not response.content:
-            logger.warning("Empty response from decomposition, using original query")
-            return DecompositionResult(sub_queries=(query,), is_complex=False, reasoning="")
+        }],
+    )
 
-        text = response.content[0].text.strip()
-        return _parse_decomposition_response(text, query)
 
-    except ANTHROPIC_ERRORS as e:
-        logger.warning(f"Query decomposition failed: {e}, using original query")
+def _decomposition_from_response(response, query: str) -> DecompositionResult:
+    if not response.content:
+        logger.warning("Empty response from decomposition, using original query")
         return DecompositionResult(sub_queries=(query,), is_complex=False, reasoning="")
 
+    text = response.content[0].text.strip()
+    return _parse_decomposition_response(text, query)
+
 
 def _parse_decomposition_response(text: str, original_query: str) -> DecompositionResult:
     """
@@ -2,13 +2,21 @@
 
 from enum import StrEnum
 
-from anthropic import APIError, RateLimitError, APIConnectionError, APITimeoutError
-
 # Timeout for Anthropic API calls (seconds)
 ANTHROPIC_TIMEOUT = 30.0
 
-# Shared exception tuple for Anthropic API errors — use in except clauses
-ANTHROPIC_ERRORS = (APIError, RateLimitError, APIConnectionError, APITimeoutError)
+
+def __getattr__(name: str):
+    # ANTHROPIC_ERRORS — shared exception tuple for Anthropic API errors, for
+    # use in except clauses — is built on first access. Every module imports
+    # this one, and the anthropic SDK is most of the package's import time.
+    if name == "ANTHROPIC_ERRORS":
+        from anthropic import APIError, RateLimitError, APIConnectionError, APITimeoutError
+
+        value = (APIError, RateLimitError, APIConnectionError, APITimeoutError)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class GateDecision(StrEnum):
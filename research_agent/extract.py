@@ -1,5 +1,6 @@
 """Content extraction from HTML using trafilatura with fallback."""
 
+import contextvars
 import logging
 import re
 from concurrent.futures import ThreadPoolExecutor
@@ -11,6 +12,7 @@ import trafilatura
 from readability import Document
 
 from .fetch import FetchedPage
+from .tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +26,7 @@ MIN_EXTRACTED_TEXT_LENGTH = 100
 SourceTier = Literal["full", "snippet"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExtractedContent:
     """Extracted content from a web page."""
     url: str
@@ -33,6 +35,7 @@ class ExtractedContent:
     source_tier: SourceTier = "full"
 
 
+@traced("extract.page", args=("page.url",))
 def extract_content(page: FetchedPage) -> ExtractedContent | None:
     """
     Extract main content from a fetched page.
@@ -115,6 +118,7 @@ def _extract_with_readability(page: FetchedPage) -> ExtractedContent | None:
         return None
 
 
+@traced("extract.all")
 def extract_all(pages: list[FetchedPage]) -> list[ExtractedContent]:
     """
     Extract content from multiple pages using parallel threads.
@@ -128,7 +132,12 @@ def extract_all(pages: list[FetchedPage]) -> list[ExtractedContent]:
     if not pages:
         return []
 
+    # Pool threads don't inherit contextvars; give each page a copy of
+    # the caller's context so run-scoped tracing follows the work.
+    contexts = [contextvars.copy_context() for _ in pages]
     with ThreadPoolExecutor(max_workers=min(len(pages), 4)) as executor:
-        results = list(executor.map(extract_content, pages))
+        results = list(executor.map(
+            lambda ctx, page: ctx.run(extract_content, page), contexts, pages,
+        ))
 
     return [r for r in results if r is not None]
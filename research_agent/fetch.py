@@ -6,22 +6,52 @@ import logging
 import random
 import socket
 import typing
+from collections.abc import Mapping
 from dataclasses import dataclass
 from urllib.parse import urlparse
 
 import httpcore
 import httpx
 
+from .shared import current_shared
+from .tracing import traced
+
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FetchedPage:
-    """A fetched web page."""
+    """A fetched web page.
+
+    A conditional fetch of an unchanged page has status_code 304
+    (NOT_MODIFIED) and empty html.
+    """
     url: str
     html: str
     status_code: int
+    etag: str = ""
+    last_modified: str = ""
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status_code == NOT_MODIFIED
+
+
+@dataclass(frozen=True, slots=True)
+class PageValidators:
+    """HTTP cache validators from an earlier fetch of a page."""
+    etag: str = ""
+    last_modified: str = ""
+
+    def headers(self) -> dict[str, str]:
+        """Conditional request headers (empty if there are no validators)."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
 
 
 # Pool of common browser User-Agents to rotate through
@@ -69,6 +99,9 @@ def _get_random_headers() -> dict[str, str]:
 # Status codes that indicate we should skip this URL
 SKIP_STATUS_CODES = {403, 404, 410, 451}
 
+# Answer to a conditional request for a page that hasn't changed
+NOT_MODIFIED = 304
+
 # Maximum concurrent requests
 MAX_CONCURRENT_REQUESTS = 5
 
@@ -246,17 +279,22 @@ async def is_safe_url(
         return False
 
 
+@traced("fetch.url", args=("url",))
 async def _fetch_single(
     client: httpx.AsyncClient,
     url: str,
     semaphore: asyncio.Semaphore,
     dns_cache: dict[str, bool] | None = None,
+    validators: PageValidators | None = None,
 ) -> FetchedPage | None:
     """Fetch a single URL with SSRF-safe redirect handling and size limits.
 
     Handles redirects manually so each hop is validated against SSRF checks.
     Uses streaming to enforce response size limits before reading into memory.
+    With validators, the request is conditional and an unchanged page
+    comes back as a body-less NOT_MODIFIED page.
     """
+    conditional = validators.headers() if validators else {}
     # Pre-flight SSRF check on the original URL
     if not await is_safe_url(url, dns_cache=dns_cache):
         return None
@@ -265,7 +303,7 @@ async def _fetch_single(
         current_url = url
         for _ in range(MAX_REDIRECTS + 1):
             try:
-                async with client.stream("GET", current_url) as response:
+                async with client.stream("GET", current_url, headers=conditional) as response:
                     # Handle redirects manually — validate each target
                     if response.is_redirect:
                         location = response.headers.get("location", "")
@@ -281,6 +319,14 @@ async def _fetch_single(
                         continue
 
                     # Non-redirect response
+                    if response.status_code == NOT_MODIFIED and conditional:
+                        return FetchedPage(
+                            url=str(response.url),
+                            html="",
+                            status_code=NOT_MODIFIED,
+                            etag=response.headers.get("etag", validators.etag),
+                            last_modified=response.headers.get("last-modified", validators.last_modified),
+                        )
                     if response.status_code in SKIP_STATUS_CODES:
                         return None
                     if response.status_code == 429:
@@ -332,6 +378,8 @@ async def _fetch_single(
                         url=str(response.url),
                         html=text,
                         status_code=response.status_code,
+                        etag=response.headers.get("etag", ""),
+                        last_modified=response.headers.get("last-modified", ""),
                     )
 
             except httpx.TimeoutException:
@@ -348,10 +396,12 @@ async def _fetch_single(
         return None
 
 
+@traced("fetch.all")
 async def fetch_urls(
     urls: list[str],
     timeout: float = 15.0,
     max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+    validators: Mapping[str, PageValidators] | None = None,
 ) -> list[FetchedPage]:
     """
     Fetch multiple URLs concurrently with SSRF protection and size limits.
@@ -360,12 +410,25 @@ async def fetch_urls(
         urls: List of URLs to fetch
         timeout: Request timeout per URL
         max_concurrent: Maximum concurrent requests
+        validators: Validators from an earlier fetch, by URL. Those URLs
+            are fetched conditionally and may come back not_modified.
 
     Returns:
         List of successfully fetched pages
+
+    Inside a batch, pages (and failures) are shared across runs, and
+    the batch's connection limit replaces ``max_concurrent``.
+    Conditional fetches bypass the shared pages, whose bodies another
+    run may need.
     """
-    dns_cache: dict[str, bool] = {}
-    semaphore = asyncio.Semaphore(max_concurrent)
+    validators = validators or {}
+    shared = current_shared()
+    if shared is not None:
+        dns_cache = shared.dns_cache
+        semaphore = shared.fetch_slots
+    else:
+        dns_cache = {}
+        semaphore = asyncio.Semaphore(max_concurrent)
 
     transport = httpx.AsyncHTTPTransport(
         limits=httpx.Limits(max_connections=max_concurrent),
@@ -386,7 +449,17 @@ async def fetch_urls(
         headers=_get_random_headers(),
         transport=transport,
     ) as client:
-        tasks = [_fetch_single(client, url, semaphore, dns_cache=dns_cache) for url in urls]
-        results = await asyncio.gather(*tasks)
+        async def _fetch(url: str) -> FetchedPage | None:
+            if url in validators:
+                return await _fetch_single(
+                    client, url, semaphore, dns_cache=dns_cache, validators=validators[url],
+                )
+            if shared is None:
+                return await _fetch_single(client, url, semaphore, dns_cache=dns_cache)
+            return await shared.pages.get_or_compute_async(
+                url, lambda: _fetch_single(client, url, semaphore, dns_cache=dns_cache),
+            )
+
+        results = await asyncio.gather(*[_fetch(url) for url in urls])
 
     return [r for r in results if r is not None]
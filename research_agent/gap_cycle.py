@@ -0,0 +1,220 @@
+"""Gap-cycle runner: research each selected gap in a schema as its own query.
+
+A cycle loads the schema and picks stale and unknown gaps with
+select_batch(). It then runs one research job per gap through the batch
+runner, so the gaps share Claude, search and fetch limits, and
+overlapping searches and fetches are made once. Each gap's state follows
+its own gate decision, and the schema is saved once, atomically, at the
+end. ResearchAgent runs a cycle in place of its query whenever a gap
+schema is configured (--schema or a profile gap_schema).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from .batch import BatchJobResult, BatchLimits, BatchQuery, BatchResult, _run_batch
+from .cycle_config import CycleConfig
+from .errors import GateDecision, ResearchError, StateError
+from .schema import Gap, GapStatus, load_schema
+from .staleness import detect_stale, log_flip, select_batch
+from .state import mark_checked, mark_verified, save_schema
+
+logger = logging.getLogger(__name__)
+
+AUDIT_LOG_NAME = "gap_audit.log"
+
+
+@dataclass(frozen=True)
+class GapJobResult:
+    """One gap's research and its resulting state.
+
+    Attributes:
+        gap: The gap as selected for research.
+        updated: The gap after its gate decision was applied (equal to
+            ``gap`` when the state didn't change).
+        job: The research job for the gap's query.
+    """
+    gap: Gap
+    updated: Gap
+    job: BatchJobResult
+
+    @property
+    def decision(self) -> str:
+        """Gate decision of the gap's research, or "" if the job failed."""
+        return self.job.result.status if self.job.result else ""
+
+
+@dataclass(frozen=True)
+class GapCycleResult:
+    """Outcome of one gap cycle.
+
+    Attributes:
+        gaps: Per-gap results, in selection (priority) order. Empty when
+            every gap was verified and fresh.
+        schema_saved: Whether the updated schema was written.
+        batch: The underlying batch run, with usage and cache stats, or
+            None when nothing needed research.
+    """
+    gaps: tuple[GapJobResult, ...] = ()
+    schema_saved: bool = False
+    batch: BatchResult | None = None
+
+    @property
+    def verified(self) -> tuple[str, ...]:
+        """IDs of gaps marked verified this cycle."""
+        return tuple(
+            g.gap.id for g in self.gaps
+            if g.decision in (GateDecision.FULL_REPORT, GateDecision.SHORT_REPORT)
+        )
+
+    @property
+    def checked(self) -> tuple[str, ...]:
+        """IDs of gaps marked checked (researched, nothing new) this cycle."""
+        return tuple(g.gap.id for g in self.gaps if g.decision == GateDecision.NO_NEW_FINDINGS)
+
+
+def gap_query(gap: Gap, topic: str = "") -> str:
+    """Research query for one gap: the topic, the gap's category and its ID as words."""
+    subject = gap.id.replace("_", " ").replace("-", " ").strip()
+    query = f"{gap.category}: {subject}"
+    return f"{topic.strip()} — {query}" if topic.strip() else query
+
+
+def _apply_decision(gap: Gap, decision: str, audit_log_path: Path) -> Gap:
+    """Mark a gap verified or checked from its gate decision."""
+    if decision in (GateDecision.FULL_REPORT, GateDecision.SHORT_REPORT):
+        updated = mark_verified(gap)
+        if gap.status != updated.status:
+            try:
+                log_flip(
+                    audit_log_path, gap.id, gap.status, updated.status,
+                    reason=f"Research completed: {decision}",
+                )
+            except StateError as e:
+                logger.warning("Could not log status flip for '%s': %s", gap.id, e)
+        return updated
+    if decision == GateDecision.NO_NEW_FINDINGS:
+        logger.info("Gap '%s' checked (no new findings)", gap.id)
+        return mark_checked(gap)
+    # insufficient_data or a failed job -- don't update state
+    return gap
+
+
+async def run_gap_cycle_async(
+    schema_path: Path | str,
+    topic: str = "",
+    mode: str = "standard",
+    context: str | None = None,
+    cycle_config: CycleConfig | None = None,
+    limits: BatchLimits | None = None,
+    skip_critique: bool = False,
+    skip_iteration: bool = False,
+    on_result: Callable[[BatchJobResult], None] | None = None,
+) -> GapCycleResult:
+    """Research every selected gap in a schema concurrently.
+
+    Args:
+        schema_path: Gap schema YAML file.
+        topic: Prefix for every gap's query (e.g. the business or market
+            the schema describes).
+        mode: Research mode for each gap.
+        context: Context name for each gap ("none" to skip, None to
+            auto-detect). The context's own gap_schema is ignored.
+        cycle_config: Gap selection limits (defaults to CycleConfig()).
+        limits: Concurrency limits shared by all gaps.
+        skip_critique: Skip self-critique for each gap.
+        skip_iteration: Skip query iteration for each gap.
+        on_result: Called with each gap's research job as it finishes.
+
+    Returns:
+        GapCycleResult with each gap's research and updated state. The
+        schema is written once, and only if some gap's state changed.
+
+    Raises:
+        ResearchError: If the schema file doesn't exist or has no gaps.
+        SchemaError: If the schema file is invalid.
+    """
+    schema_path = Path(schema_path)
+    cycle_config = cycle_config or CycleConfig()
+    schema_result = load_schema(schema_path)
+    if not schema_result.is_loaded:
+        raise ResearchError(f"No gaps found in schema {schema_path}")
+
+    stale = detect_stale(schema_result.gaps, default_ttl_days=cycle_config.default_ttl_days)
+    stale_ids = {g.id for g in stale}
+    candidates = tuple(
+        g for g in schema_result.gaps
+        if g.id in stale_ids or g.status == GapStatus.UNKNOWN
+    )
+    if not candidates:
+        logger.info("All %d gaps are verified and fresh", len(schema_result.gaps))
+        return GapCycleResult()
+
+    selected = select_batch(candidates, cycle_config.max_gaps_per_run)
+    logger.info("Gap cycle: researching %d of %d candidate gaps", len(selected), len(candidates))
+
+    batch = await _run_batch(
+        [BatchQuery(query=gap_query(g, topic)) for g in selected],
+        mode, context, limits, on_result,
+        skip_critique=skip_critique, skip_iteration=skip_iteration,
+        use_gap_schema=False,
+    )
+
+    audit_log_path = schema_path.parent / AUDIT_LOG_NAME
+    results = tuple(
+        GapJobResult(
+            gap=gap, job=job,
+            updated=_apply_decision(gap, job.result.status if job.result else "", audit_log_path),
+        )
+        for gap, job in zip(selected, batch.jobs)
+    )
+
+    updates = {r.gap.id: r.updated for r in results if r.updated != r.gap}
+    saved = False
+    if updates:
+        try:
+            save_schema(schema_path, tuple(updates.get(g.id, g) for g in schema_result.gaps))
+            saved = True
+            logger.info("Updated %d gap states in %s", len(updates), schema_path)
+        except StateError as e:
+            logger.warning("Failed to save gap state: %s", e)
+
+    return GapCycleResult(gaps=results, schema_saved=saved, batch=batch)
+
+
+def run_gap_cycle(
+    schema_path: Path | str,
+    topic: str = "",
+    mode: str = "standard",
+    context: str | None = None,
+    cycle_config: CycleConfig | None = None,
+    limits: BatchLimits | None = None,
+    skip_critique: bool = False,
+    skip_iteration: bool = False,
+    on_result: Callable[[BatchJobResult], None] | None = None,
+) -> GapCycleResult:
+    """Research every selected gap in a schema. See run_gap_cycle_async().
+
+    Raises:
+        ResearchError: As run_gap_cycle_async(), or if called from a
+            running event loop (use run_gap_cycle_async there).
+    """
+    try:
+        return asyncio.run(run_gap_cycle_async(
+            schema_path, topic=topic, mode=mode, context=context,
+            cycle_config=cycle_config, limits=limits,
+            skip_critique=skip_critique, skip_iteration=skip_iteration,
+            on_result=on_result,
+        ))
+    except RuntimeError as e:
+        if "cannot be called from a running event loop" in str(e):
+            raise ResearchError(
+                "run_gap_cycle() cannot be called from async context. "
+                "Use 'await run_gap_cycle_async()' instead."
+            ) from e
+        raise
@@ -0,0 +1,296 @@
+"""Background research jobs with a bounded worker pool.
+
+A JobQueue runs research queries as asyncio tasks on the caller's event
+loop. At most ``max_workers`` run at once; later jobs wait in the queue,
+and submissions beyond ``max_queued`` waiting jobs are refused. Each job
+tracks its current pipeline step through progress events. Callers poll
+status() for the step, partial results and an ETA, collect the result
+later, and can cancel queued or running jobs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import secrets
+import time
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Callable
+
+from .errors import ANTHROPIC_ERRORS, ResearchError
+from .progress import ProgressEvent, SourcesEvent, StageEvent, progress_scope
+from .results import ResearchResult
+
+logger = logging.getLogger(__name__)
+
+# Errors that fail one job; anything else is logged as unexpected
+_JOB_ERRORS = (ResearchError, OSError, *ANTHROPIC_ERRORS)
+
+
+class JobStatus(StrEnum):
+    """Lifecycle state of a research job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def is_finished(self) -> bool:
+        return self in (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+@dataclass(frozen=True)
+class JobSnapshot:
+    """Point-in-time view of a research job.
+
+    Attributes:
+        job_id: Identifier returned by JobQueue.submit().
+        query: The research question.
+        mode: Research mode name.
+        status: Lifecycle state.
+        stage: Description of the current pipeline step ("" before the
+            first step).
+        step: Current step number (0 before the first step).
+        step_total: Planned steps for the mode (0 before the first step).
+        elapsed_s: Seconds since the job started running (0 while queued).
+        eta_s: Estimated seconds until the job finishes, extrapolated from
+            the steps completed so far, or None when unknown.
+        sources_kept: Sources that passed the relevance gate, once scored.
+        gate_decision: Relevance gate decision, once scored.
+        queue_position: Jobs ahead of this one while queued, else 0.
+        error: Error message when the job failed.
+        saved_to: What the queue's on_success hook returned (e.g. the
+            saved report's filename), or None.
+        result: The research result once the job succeeded.
+    """
+    job_id: str
+    query: str
+    mode: str
+    status: JobStatus
+    stage: str = ""
+    step: int = 0
+    step_total: int = 0
+    elapsed_s: float = 0.0
+    eta_s: float | None = None
+    sources_kept: int | None = None
+    gate_decision: str = ""
+    queue_position: int = 0
+    error: str = ""
+    saved_to: str | None = None
+    result: ResearchResult | None = None
+
+
+@dataclass
+class _Job:
+    """Mutable state of one job, updated by its task and progress events."""
+    job_id: str
+    query: str
+    mode: str
+    submitted: float
+    status: JobStatus = JobStatus.QUEUED
+    started: float | None = None
+    finished: float | None = None
+    last_stage: StageEvent | None = None
+    sources: SourcesEvent | None = None
+    error: str = ""
+    saved_to: str | None = None
+    result: ResearchResult | None = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+    def on_progress(self, event: ProgressEvent) -> None:
+        if isinstance(event, StageEvent):
+            self.last_stage = event
+        elif isinstance(event, SourcesEvent):
+            self.sources = event
+
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.monotonic()) - self.started
+
+    def eta(self) -> float | None:
+        """Linear extrapolation from the steps started so far."""
+        if self.status is not JobStatus.RUNNING or self.last_stage is None:
+            return None
+        stage = self.last_stage
+        if stage.step < 1 or stage.total < 1:
+            return None
+        elapsed = self.elapsed()
+        # The current step is under way, so count it as half done
+        done = max(stage.step - 0.5, 0.5)
+        return round(max(elapsed / done * stage.total - elapsed, 0.0), 1)
+
+
+class JobQueue:
+    """Runs research jobs in the background with a bounded worker pool.
+
+    Must be used from within a running event loop; jobs are tasks on it.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_queued: int = 20,
+        max_finished: int = 100,
+        on_success: Callable[[str, ResearchResult], str | None] | None = None,
+    ) -> None:
+        """
+        Args:
+            max_workers: Jobs that may run at once.
+            max_queued: Jobs that may wait for a worker; submit() refuses
+                more.
+            max_finished: Finished jobs kept for status and result lookups;
+                the oldest are forgotten first.
+            on_success: Called with (query, result) when a job succeeds,
+                e.g. to save the report. Its return value is reported as
+                the job's ``saved_to``.
+        """
+        if max_workers < 1 or max_finished < 1:
+            raise ValueError("max_workers and max_finished must be at least 1")
+        if max_queued < 0:
+            raise ValueError("max_queued must not be negative")
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.max_finished = max_finished
+        self._on_success = on_success
+        self._workers = asyncio.Semaphore(max_workers)
+        self._jobs: dict[str, _Job] = {}
+
+    def submit(
+        self,
+        query: str,
+        mode: str = "standard",
+        context: str | None = None,
+        **research_kwargs,
+    ) -> str:
+        """Queue a research job and return its ID immediately.
+
+        Extra keyword arguments go to run_research_async() (e.g.
+        skip_critique, max_sources).
+
+        Raises:
+            ResearchError: If the queue is full.
+        """
+        active = sum(1 for job in self._jobs.values() if not job.status.is_finished)
+        if active >= self.max_workers + self.max_queued:
+            raise ResearchError(
+                f"Job queue is full ({active - self.max_workers} jobs waiting); try again later"
+            )
+        job = _Job(
+            job_id=secrets.token_hex(6), query=query, mode=mode,
+            submitted=time.monotonic(),
+        )
+        self._jobs[job.job_id] = job
+        job.task = asyncio.get_running_loop().create_task(
+            self._run(job, context, research_kwargs),
+            name=f"research-job-{job.job_id}",
+        )
+        logger.info("Queued research job %s (%s): %s", job.job_id, mode, query)
+        self._prune()
+        return job.job_id
+
+    async def _run(self, job: _Job, context: str | None, research_kwargs: dict) -> None:
+        # Deferred: the package root imports this module lazily
+        from . import run_research_async
+
+        try:
+            async with self._workers:
+                job.status = JobStatus.RUNNING
+                job.started = time.monotonic()
+                with progress_scope(job.on_progress):
+                    result = await run_research_async(
+                        job.query, mode=job.mode, context=context, **research_kwargs,
+                    )
+            job.result = result
+            if self._on_success is not None:
+                job.saved_to = self._on_success(job.query, result)
+            job.status = JobStatus.SUCCEEDED
+        except asyncio.CancelledError:
+            job.status = JobStatus.CANCELLED
+            raise
+        except _JOB_ERRORS as e:
+            logger.warning("Research job %s failed: %s", job.job_id, e)
+            job.error = str(e) or type(e).__name__
+            job.status = JobStatus.FAILED
+        except Exception:
+            # Task boundary: an unrecorded error would leave the job "running"
+            logger.exception("Unexpected error in research job %s", job.job_id)
+            job.error = "Research failed unexpectedly"
+            job.status = JobStatus.FAILED
+        finally:
+            job.finished = time.monotonic()
+
+    def _get(self, job_id: str) -> _Job:
+        try:
+            return self._jobs[job_id]
+        except KeyError:
+            raise ResearchError(f"Unknown job ID: {job_id!r}") from None
+
+    def status(self, job_id: str) -> JobSnapshot:
+        """Return the current state of a job.
+
+        Raises:
+            ResearchError: If the job ID is unknown (or was pruned).
+        """
+        job = self._get(job_id)
+        stage = job.last_stage
+        position = 0
+        if job.status is JobStatus.QUEUED:
+            position = sum(
+                1 for other in self._jobs.values()
+                if other.status is JobStatus.QUEUED and other.submitted < job.submitted
+            )
+        return JobSnapshot(
+            job_id=job.job_id,
+            query=job.query,
+            mode=job.mode,
+            status=job.status,
+            stage=stage.message if stage else "",
+            step=stage.step if stage else 0,
+            step_total=stage.total if stage else 0,
+            elapsed_s=round(job.elapsed(), 1),
+            eta_s=job.eta(),
+            sources_kept=job.sources.kept if job.sources else None,
+            gate_decision=job.sources.decision if job.sources else "",
+            queue_position=position,
+            error=job.error,
+            saved_to=job.saved_to,
+            result=job.result,
+        )
+
+    def snapshots(self) -> list[JobSnapshot]:
+        """Snapshots of every known job, oldest first."""
+        return [self.status(job_id) for job_id in self._jobs]
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job.
+
+        Returns:
+            True if the job was cancelled, False if it had already finished.
+
+        Raises:
+            ResearchError: If the job ID is unknown.
+        """
+        job = self._get(job_id)
+        if job.status.is_finished or job.task is None:
+            return False
+        job.task.cancel()
+        # Reflect the cancel now; the task records it too once it unwinds
+        job.status = JobStatus.CANCELLED
+        logger.info("Cancelled research job %s", job_id)
+        return True
+
+    async def wait(self, job_id: str) -> JobSnapshot:
+        """Wait for a job to finish and return its final state."""
+        job = self._get(job_id)
+        if job.task is not None:
+            await asyncio.gather(job.task, return_exceptions=True)
+        return self.status(job_id)
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs beyond max_finished."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.status.is_finished]
+        for job_id in finished[:max(len(finished) - self.max_finished, 0)]:
+            del self._jobs[job_id]
@@ -0,0 +1,131 @@
+"""Run-level latency budget with graceful degradation.
+
+A mode's ``latency_budget_s`` is a time target for the whole run. At a
+few fixed decision points the pipeline asks the run's LatencyBudget
+whether it is behind schedule: each point has an allowance, the share of
+the budget that may have elapsed by the time that step starts. A step
+that starts past its allowance takes its cheaper variant (fewer chunks
+per page, no coverage retry, one combined skeptic pass, a shorter
+iteration timeout, or no self-critique) and the budget records the
+degradation, with how long the degraded step took.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+from .tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Share of the budget that may have elapsed when each step starts
+STAGE_ALLOWANCES: dict[str, float] = {
+    "summarize": 0.35,
+    "coverage_retry": 0.5,
+    "skeptic": 0.6,
+    "iteration": 0.75,
+    "critique": 0.75,
+}
+
+# Chunks summarized per page once summarization is behind schedule
+DEGRADED_MAX_CHUNKS = 1
+
+# Floor for the iteration timeout when shortened to the remaining budget
+MIN_ITERATION_TIMEOUT = 15.0
+
+
+@dataclass(frozen=True)
+class Degradation:
+    """A step that ran its cheaper variant because the run was behind.
+
+    Attributes:
+        stage: Decision point (a STAGE_ALLOWANCES key).
+        action: What was done instead, e.g. "skipped coverage retry".
+        elapsed_s: Run time when the step started.
+        allowance_s: Run time the step was allowed to start by.
+        duration_s: Time the degraded step took (0.0 when skipped).
+    """
+
+    stage: str
+    action: str
+    elapsed_s: float
+    allowance_s: float
+    duration_s: float = 0.0
+
+
+@dataclass(frozen=True)
+class BudgetReport:
+    """How a run did against its latency budget."""
+
+    budget_s: float
+    elapsed_s: float
+    degradations: tuple[Degradation, ...] = field(default=())
+
+    @property
+    def over_budget_s(self) -> float:
+        """Seconds past the budget (negative when the run finished early)."""
+        return round(self.elapsed_s - self.budget_s, 3)
+
+
+class LatencyBudget:
+    """Tracks one run's elapsed time against its budget.
+
+    A budget of 0 disables it: behind() is always False.
+    """
+
+    def __init__(self, budget_s: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.budget_s = budget_s
+        self._clock = clock
+        self._started = clock()
+        self._degradations: list[Degradation] = []
+
+    def elapsed(self) -> float:
+        return self._clock() - self._started
+
+    def remaining(self) -> float:
+        """Seconds left in the budget (negative once it is spent)."""
+        return self.budget_s - self.elapsed()
+
+    def allowance(self, stage: str) -> float:
+        """Run time a stage may start by."""
+        return self.budget_s * STAGE_ALLOWANCES[stage]
+
+    def behind(self, stage: str) -> bool:
+        """True if the run is past the stage's allowance."""
+        return self.budget_s > 0 and self.elapsed() > self.allowance(stage)
+
+    @contextmanager
+    def degraded(self, stage: str, action: str) -> Iterator[None]:
+        """Record a degraded step, timing the work done inside the block."""
+        elapsed = self.elapsed()
+        logger.warning(
+            "Behind latency budget at %s (%.1fs elapsed, %.1fs allowed): %s",
+            stage, elapsed, self.allowance(stage), action,
+        )
+        try:
+            with span(f"budget.{stage}", action=action):
+                yield
+        finally:
+            self._degradations.append(Degradation(
+                stage=stage,
+                action=action,
+                elapsed_s=round(elapsed, 3),
+                allowance_s=round(self.allowance(stage), 3),
+                duration_s=round(self.elapsed() - elapsed, 3),
+            ))
+
+    def skip(self, stage: str, action: str) -> None:
+        """Record a step that was skipped to stay within the budget."""
+        with self.degraded(stage, action):
+            pass
+
+    def report(self) -> BudgetReport:
+        return BudgetReport(
+            budget_s=self.budget_s,
+            elapsed_s=round(self.elapsed(), 3),
+            degradations=tuple(self._degradations),
+        )
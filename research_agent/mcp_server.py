@@ -1,26 +1,40 @@
 """MCP server for the research agent."""
 
+import asyncio
 import logging
 import os
 import re
 import sys
+from collections import deque
 from pathlib import Path
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
 logger = logging.getLogger(__name__)
 
 MAX_QUERY_LENGTH = 2000
 VALID_MODES = {"quick", "standard", "deep"}
 
+# Background research jobs (start_research): runs at once, and jobs that may wait
+MAX_CONCURRENT_JOBS = 2
+MAX_QUEUED_JOBS = 20
+
 mcp = FastMCP(
     "Research Agent",
     instructions=(
         "Research agent that searches the web and generates structured markdown reports. "
         "Use run_research to execute a query in quick/standard/deep mode. "
+        "For long or many queries, use start_research to queue a background job and get a job ID at once; "
+        "poll get_research_status for its current stage and ETA, fetch the report with get_research_result, "
+        "and stop it with cancel_research. "
         "Use list_research_modes to see available modes before running research. "
         "Use list_contexts to discover domain-specific context files. "
-        "Reports auto-save for standard/deep modes — use list_saved_reports to find them. "
+        "Reports auto-save for standard/deep modes — use list_saved_reports to find them, "
+        "or search_reports to find past research on a topic before starting a new run. "
+        "With use_cache=true, run_research returns a recent saved report for a near-identical query "
+        "(marked 'Cache: hit') instead of a new run. "
+        "Use refresh_report to bring a saved report up to date: it re-checks the report's sources "
+        "and only re-summarizes what changed, which is cheaper than a new run. "
         "Use get_report to retrieve a saved report by filename. "
         "Use critique_report to evaluate report quality after research completes. "
         "Use generate_followups to suggest what to research next based on a report. "
@@ -40,10 +54,14 @@ async def run_research(
     skip_critique: bool = False,
     skip_iteration: bool = False,
     max_sources: int | None = None,
+    use_cache: bool = False,
+    ctx: Context | None = None,
 ) -> str:
     """Run a research query and get a structured markdown report.
 
     Expected duration: quick ~10-20s, standard ~30-60s, deep ~90-180s.
+    Clients that send a progress token get each pipeline step, the kept
+    sources and the report text as progress notifications while it runs.
 
     Args:
         query: The research question to investigate.
@@ -60,13 +78,95 @@ async def run_research(
         skip_critique: If True, skip post-report quality evaluation (~$0.02 savings).
         skip_iteration: If True, skip post-report query refinement and follow-up questions.
         max_sources: Override the mode's default source count (e.g., 6 for a lighter standard run).
+        use_cache: If True, a saved report for a near-identical query in the
+                   same mode and context is returned instead of a new run when it is
+                   under 3 days old, or under 30 days old with a refresh suggested.
+                   The header's "Cache:" field says when that happened. Default
+                   False always runs fresh research; use refresh_report to update
+                   a saved report.
     """
     from fastmcp.exceptions import ToolError
 
     from research_agent import ResearchError, run_research_async
-    from research_agent.errors import StateError
-    from research_agent.report_store import REPORTS_DIR, get_auto_save_path
-    from research_agent.safe_io import atomic_write
+    from research_agent.progress import progress_scope, queue_listener
+    from research_agent.report_index import DEFAULT_FRESHNESS
+
+    context = _validate_research_args(query, mode, context)
+
+    events: asyncio.Queue = asyncio.Queue()
+    relay = asyncio.create_task(_relay_progress(ctx, events)) if ctx is not None else None
+    try:
+        with progress_scope(queue_listener(events) if relay is not None else None):
+            result = await run_research_async(
+                query, mode=mode, context=context,
+                skip_critique=skip_critique, skip_iteration=skip_iteration,
+                max_sources=max_sources,
+                freshness=DEFAULT_FRESHNESS if use_cache else None,
+            )
+    except ResearchError as e:
+        raise ToolError(_strip_paths(str(e)))
+    except Exception:
+        logger.exception("Unexpected error in run_research")
+        # Server boundary catch-all. Don't expose raw exception message
+        # (may contain filesystem paths from third-party libs).
+        # See CLAUDE.md: "Never bare except Exception" — this is the one
+        # justified exception: an MCP server boundary where unhandled errors
+        # would crash the entire server process.
+        raise ToolError(
+            "Research failed unexpectedly. Try again, or use a different mode/query. "
+            "If the error persists, check that API keys are configured."
+        )
+    finally:
+        if relay is not None:
+            # Scheduled like the listener's puts, so it lands after them
+            asyncio.get_running_loop().call_soon(events.put_nowait, None)
+            await relay
+
+    return _format_result(result, _auto_save(query, result))
+
+
+async def _relay_progress(ctx: Context, events: asyncio.Queue) -> None:
+    """Send queued research progress events as MCP progress notifications.
+
+    Progress is the pipeline step number, out of the mode's planned steps.
+    Events within a step (kept sources, report text) move it by fractions
+    that never reach the next step, so progress keeps increasing as the
+    protocol requires. Text that arrives while a notification is being
+    sent is batched into the next one. Stops at a None event.
+    """
+    from research_agent.progress import SourcesEvent, StageEvent, TextDelta
+
+    step, total, sent_in_step = 0, None, 0
+    pending: deque = deque()
+    while (event := pending.popleft() if pending else await events.get()) is not None:
+        if isinstance(event, StageEvent):
+            step, total, sent_in_step = event.step, event.total, 0
+            message = f"[{event.step}/{event.total}] {event.message}"
+        elif isinstance(event, SourcesEvent):
+            message = f"Kept {event.kept} sources ({event.decision})"
+        elif isinstance(event, TextDelta):
+            chunks = [event.text]
+            while not events.empty():
+                queued = events.get_nowait()
+                if not isinstance(queued, TextDelta):
+                    pending.append(queued)
+                    break
+                chunks.append(queued.text)
+            message = "".join(chunks)
+        else:
+            continue
+        sent_in_step += 1
+        try:
+            await ctx.report_progress(step + 1 - 1 / sent_in_step, total, message)
+        except Exception:
+            # Progress is best-effort: a client that stopped listening must
+            # not fail the research it asked for.
+            logger.debug("Could not send progress notification", exc_info=True)
+
+
+def _validate_research_args(query: str, mode: str, context: str | None) -> str | None:
+    """Check query length and mode; return the normalized context."""
+    from fastmcp.exceptions import ToolError
 
     if len(query) > MAX_QUERY_LENGTH:
         raise ToolError(
@@ -84,44 +184,56 @@ async def run_research(
         context = context.strip()
         if context.lower() in ("null", ""):
             context = None
+    return context
 
-    try:
-        result = await run_research_async(
-            query, mode=mode, context=context,
-            skip_critique=skip_critique, skip_iteration=skip_iteration,
-            max_sources=max_sources,
-        )
-    except ResearchError as e:
-        # Strip absolute filesystem paths to avoid leaking server directory structure.
-        # Matches multi-segment Unix paths like /opt/app/file.py, /var/log/err,
-        # /Users/name/project — but not URLs (which contain ://).
-        msg = re.sub(r'(?<!:/)(?<!/)/(?:[\w.-]+/)+[\w.-]+', '<path>', str(e))
-        raise ToolError(msg)
-    except Exception:
-        logger.exception("Unexpected error in run_research")
-        # Server boundary catch-all. Don't expose raw exception message
-        # (may contain filesystem paths from third-party libs).
-        # See CLAUDE.md: "Never bare except Exception" — this is the one
-        # justified exception: an MCP server boundary where unhandled errors
-        # would crash the entire server process.
-        raise ToolError(
-            "Research failed unexpectedly. Try again, or use a different mode/query. "
-            "If the error persists, check that API keys are configured."
+
+def _strip_paths(message: str) -> str:
+    """Strip absolute filesystem paths to avoid leaking server directory structure.
+
+    Matches multi-segment Unix paths like /opt/app/file.py, /var/log/err,
+    /Users/name/project — but not URLs (which contain ://).
+    """
+    return re.sub(r'(?<!:/)(?<!/)/(?:[\w.-]+/)+[\w.-]+', '<path>', message)
+
+
+def _auto_save(query: str, result) -> str | None:
+    """Auto-save standard/deep reports; return the saved filename or None.
+
+    Intentionally omits the research log — that's a CLI convenience
+    feature, not an MCP concern.
+    """
+    from research_agent.errors import StateError
+    from research_agent.report_index import record_report
+    from research_agent.report_store import get_auto_save_path
+    from research_agent.safe_io import atomic_write
+
+    if result.cache is not None:
+        return result.cache.filename  # Served from a report that is already saved
+    if result.refresh is not None and result.refresh.reused_report:
+        # Nothing changed: re-index the saved report with its revalidated sources
+        record_report(
+            Path(result.refresh.report), query, result.mode, result.context,
+            result.source_urls, result.status, sources=result.sources,
         )
+        return result.refresh.report
+    if result.mode not in ("standard", "deep"):
+        return None
+    try:
+        save_path = get_auto_save_path(query)
+        save_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(save_path, result.report)
+    except (OSError, StateError) as e:
+        logger.warning("Auto-save failed: %s", e)
+        return None
+    record_report(
+        save_path, query, result.mode, result.context, result.source_urls, result.status,
+        sources=result.sources,
+    )
+    return save_path.name
 
-    # Auto-save for standard/deep modes (intentionally omits research log —
-    # that's a CLI convenience feature, not an MCP concern)
-    saved_to = None
-    if result.mode in ("standard", "deep"):
-        try:
-            save_path = get_auto_save_path(query)
-            save_path.parent.mkdir(parents=True, exist_ok=True)
-            atomic_write(save_path, result.report)
-            saved_to = save_path.name
-        except (OSError, StateError) as e:
-            logger.warning("Auto-save failed: %s", e)
-
-    # Format metadata header
+
+def _format_result(result, saved_to: str | None) -> str:
+    """Metadata header plus report body, as returned by run_research."""
     save_info = saved_to or "(not auto-saved, use mode=standard to save)"
     critique_info = ""
     if result.critique is not None:
@@ -130,13 +242,159 @@ async def run_research(
         f" | Iteration: {result.iteration_status}"
         if result.iteration_status != "skipped" else ""
     )
+    cache_info = ""
+    if result.cache is not None:
+        cache_info = f" | Cache: hit ({result.cache.age_s / 3600:.1f}h old"
+        if result.cache.refresh_suggested:
+            cache_info += ", refresh suggested: call refresh_report"
+        cache_info += ")"
+    refresh_info = ""
+    if result.refresh is not None:
+        r = result.refresh
+        refresh_info = (
+            f" | Refresh: {r.unchanged} unchanged, {r.unverified} unverified, "
+            f"{r.changed} changed, {r.new} new"
+        )
+        if r.reused_report:
+            refresh_info += " (report unchanged)"
     header = (
         f"Mode: {result.mode} | Sources: {result.sources_used} | "
-        f"Status: {result.status} | Saved: {save_info}{critique_info}{iteration_info}"
+        f"Status: {result.status} | Saved: {save_info}"
+        f"{critique_info}{iteration_info}{cache_info}{refresh_info}"
     )
     return f"{header}\n\n{result.report}"
 
 
+_job_queue = None
+
+
+def _jobs():
+    """The server's JobQueue, created on first use (it needs the running loop)."""
+    global _job_queue
+    if _job_queue is None:
+        from research_agent.jobs import JobQueue
+
+        _job_queue = JobQueue(
+            max_workers=MAX_CONCURRENT_JOBS,
+            max_queued=MAX_QUEUED_JOBS,
+            on_success=_auto_save,
+        )
+    return _job_queue
+
+
+def _job_status(job_id: str):
+    """Snapshot of a job, or ToolError for an unknown ID."""
+    from fastmcp.exceptions import ToolError
+
+    from research_agent import ResearchError
+
+    try:
+        return _jobs().status(job_id)
+    except ResearchError as e:
+        raise ToolError(f"{e}. Job IDs come from start_research.")
+
+
+@mcp.tool
+async def start_research(
+    query: str,
+    mode: str = "standard",
+    context: str | None = None,
+    skip_critique: bool = False,
+    skip_iteration: bool = False,
+    max_sources: int | None = None,
+) -> str:
+    """Start a research query in the background and return a job ID immediately.
+
+    Takes the same arguments as run_research. Jobs run a few at a time;
+    the rest wait in a queue. Poll get_research_status with the job ID,
+    then fetch the report with get_research_result. Standard and deep
+    reports auto-save as with run_research.
+    """
+    from fastmcp.exceptions import ToolError
+
+    from research_agent import ResearchError
+
+    context = _validate_research_args(query, mode, context)
+    try:
+        job_id = _jobs().submit(
+            query, mode=mode, context=context,
+            skip_critique=skip_critique, skip_iteration=skip_iteration,
+            max_sources=max_sources,
+        )
+    except ResearchError as e:
+        raise ToolError(str(e))
+    snapshot = _jobs().status(job_id)
+    return (
+        f"Job {job_id} started ({mode}, {snapshot.queue_position} jobs ahead). "
+        f"Poll get_research_status(\"{job_id}\") for progress, "
+        f"then get_research_result(\"{job_id}\") for the report."
+    )
+
+
+@mcp.tool
+def get_research_status(job_id: str) -> str:
+    """Report a background research job's state, current stage, partial results and ETA.
+
+    Args:
+        job_id: ID returned by start_research.
+    """
+    snapshot = _job_status(job_id)
+    parts = [f"Job {snapshot.job_id}: {snapshot.status}", f"Mode: {snapshot.mode}"]
+    if snapshot.status == "queued":
+        parts.append(f"Queue position: {snapshot.queue_position + 1}")
+    if snapshot.stage:
+        parts.append(f"Step {snapshot.step}/{snapshot.step_total}: {snapshot.stage}")
+    if snapshot.elapsed_s:
+        parts.append(f"Elapsed: {snapshot.elapsed_s:.0f}s")
+    if snapshot.eta_s is not None:
+        parts.append(f"ETA: ~{snapshot.eta_s:.0f}s")
+    if snapshot.sources_kept is not None:
+        parts.append(f"Sources kept: {snapshot.sources_kept} ({snapshot.gate_decision})")
+    if snapshot.error:
+        parts.append(f"Error: {_strip_paths(snapshot.error)}")
+    if snapshot.status == "succeeded":
+        parts.append("Report ready: use get_research_result")
+    return " | ".join(parts)
+
+
+@mcp.tool
+def get_research_result(job_id: str) -> str:
+    """Fetch the report of a finished background research job.
+
+    Returns the same metadata header and report as run_research.
+
+    Args:
+        job_id: ID returned by start_research.
+    """
+    from fastmcp.exceptions import ToolError
+
+    snapshot = _job_status(job_id)
+    if snapshot.status == "succeeded":
+        return _format_result(snapshot.result, snapshot.saved_to)
+    if snapshot.status == "failed":
+        raise ToolError(f"Job {job_id} failed: {_strip_paths(snapshot.error)}")
+    if snapshot.status == "cancelled":
+        raise ToolError(f"Job {job_id} was cancelled.")
+    raise ToolError(
+        f"Job {job_id} is still {snapshot.status}"
+        + (f" (step {snapshot.step}/{snapshot.step_total})" if snapshot.step else "")
+        + ". Poll get_research_status until it succeeds."
+    )
+
+
+@mcp.tool
+def cancel_research(job_id: str) -> str:
+    """Cancel a queued or running background research job.
+
+    Args:
+        job_id: ID returned by start_research.
+    """
+    snapshot = _job_status(job_id)
+    if _jobs().cancel(job_id):
+        return f"Cancelled job {job_id}."
+    return f"Job {job_id} already finished ({snapshot.status})."
+
+
 @mcp.tool
 def list_saved_reports() -> str:
     """List all saved research reports with dates and query names.
@@ -155,6 +413,61 @@ def list_saved_reports() -> str:
     return "\n".join(lines)
 
 
+@mcp.tool
+def search_reports(
+    query: str = "",
+    mode: str | None = None,
+    status: str | None = None,
+    domain: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    limit: int = 10,
+) -> str:
+    """Search saved research reports, best match first.
+
+    Check here before running research: a saved report on the topic can
+    be read with get_report (or updated with refresh_report) instead.
+
+    Args:
+        query: Words and "quoted phrases" that must all appear in a report's
+               title, text or source domains. Empty to filter only.
+        mode: Only reports from this mode (quick, standard, deep).
+        status: Only reports with this gate decision (full_report,
+                short_report, insufficient_data, no_new_findings).
+        domain: Only reports citing this domain (e.g., "epa.gov").
+        since: Only reports dated on or after this date (YYYY-MM-DD).
+        until: Only reports dated on or before this date (YYYY-MM-DD).
+        limit: Maximum number of results (1-50).
+    """
+    from fastmcp.exceptions import ToolError
+
+    from research_agent import search_reports as search
+
+    if not 1 <= limit <= 50:
+        raise ToolError(f"limit must be between 1 and 50, got {limit}")
+    try:
+        matches = search(
+            query, mode=mode, status=status, domain=domain, since=since, until=until, limit=limit,
+        )
+    except ValueError as e:
+        raise ToolError(str(e))
+    if not matches:
+        return "No saved reports match. Use list_saved_reports to see all reports."
+
+    blocks = []
+    for m in matches:
+        details = ", ".join(v for v in (m.date or "unknown date", m.mode, m.status) if v)
+        lines = [f"- {m.filename} ({details})", f"  Title: {m.title}"]
+        if m.query:
+            lines.append(f"  Query: {m.query}")
+        if m.source_domains:
+            lines.append(f"  Sources: {', '.join(m.source_domains[:8])}")
+        if m.snippet:
+            lines.append(f"  Match: {m.snippet}")
+        blocks.append("\n".join(lines))
+    return f"{len(matches)} matching reports:\n\n" + "\n\n".join(blocks)
+
+
 @mcp.tool
 def get_report(filename: str) -> str:
     """Retrieve a saved research report by filename.
@@ -172,6 +485,48 @@ def get_report(filename: str) -> str:
     return path.read_text()
 
 
+@mcp.tool
+async def refresh_report(
+    filename: str,
+    skip_critique: bool = False,
+    skip_iteration: bool = False,
+) -> str:
+    """Bring a saved research report up to date, redoing only what changed.
+
+    Re-checks each of the report's sources with a conditional request and
+    searches its query once for new sources. Only changed and new pages
+    are summarized and scored; if nothing changed, the saved report is
+    returned as it is. Much cheaper than a new run of the same query.
+    The header's "Refresh:" field gives the source counts.
+
+    Args:
+        filename: Report filename (e.g., "query_name_2026-02-28_143052.md").
+                  Use list_saved_reports to see available files.
+        skip_critique: If True, skip post-report quality evaluation.
+        skip_iteration: If True, skip post-report query refinement and follow-up questions.
+    """
+    from fastmcp.exceptions import ToolError
+
+    from research_agent import ResearchError, refresh_report_async
+
+    try:
+        _validate_report_filename(filename)
+    except (ValueError, FileNotFoundError) as e:
+        raise ToolError(str(e))
+
+    try:
+        result = await refresh_report_async(
+            filename, skip_critique=skip_critique, skip_iteration=skip_iteration,
+        )
+    except ResearchError as e:
+        raise ToolError(_strip_paths(str(e)))
+    except Exception:
+        logger.exception("Unexpected error in refresh_report")
+        raise ToolError("Refresh failed unexpectedly. Try again, or rerun the research query.")
+
+    return _format_result(result, _auto_save(result.query, result))
+
+
 @mcp.tool
 def critique_report(filename: str) -> str:
     """Evaluate quality of a saved research report.
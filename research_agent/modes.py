@@ -40,6 +40,12 @@ class ResearchMode:
     summarize_temperature: float = 0.5  # Mid temp for chunk summarization
     synthesis_temperature: float = 0.8  # Higher temp for report synthesis, skeptic, critique
     novelty_queries: int = 0  # How many sub-queries get novelty framing (0 = none)
+    chunk_mode: str = "sequential"  # "sequential", "parallel" or "single_call" chunk summarization
+    stitch_chunks: bool = False  # Merge parallel chunk summaries with one extra call per source
+    speculative_pass2: bool = False  # Deep mode: search pass 2 from snippets while pass 1 summarizes
+    latency_budget_s: float = 0.0  # Run time target; later stages degrade when behind (0 = no budget)
+    source_tokens: int = 0  # Token budget for source summaries in synthesis prompts (0 = no limit)
+    batch_mini_reports: bool = False  # Write all iteration mini-reports in one call
 
     @property
     def is_quick(self) -> bool:
@@ -72,6 +78,7 @@ class ResearchMode:
             min_sources_short_report=self.min_sources_short_report,
             min_unique_domains=self.min_unique_domains,
             novelty_queries=self.novelty_queries,
+            latency_budget_s=self.latency_budget_s,
         )
 
     def __post_init__(self) -> None:
@@ -112,6 +119,19 @@ class ResearchMode:
         # Must match decompose.MAX_SUB_QUERIES
         if not (0 <= self.novelty_queries <= 3):
             errors.append(f"novelty_queries must be between 0 and 3, got {self.novelty_queries}")
+        # Must match summarize.CHUNK_MODES
+        if self.chunk_mode not in ("sequential", "parallel", "single_call"):
+            errors.append(
+                f"chunk_mode must be 'sequential', 'parallel' or 'single_call', got {self.chunk_mode!r}"
+            )
+        if self.stitch_chunks and self.chunk_mode != "parallel":
+            errors.append("stitch_chunks requires chunk_mode='parallel'")
+        if self.latency_budget_s < 0:
+            errors.append(f"latency_budget_s must be >= 0, got {self.latency_budget_s}")
+        if self.source_tokens < 0:
+            errors.append(f"source_tokens must be >= 0, got {self.source_tokens}")
+        if self.speculative_pass2 and self.pass2_sources < 1:
+            errors.append("speculative_pass2 requires pass2_sources >= 1")
         for temp_field in ("planning_temperature", "summarize_temperature", "synthesis_temperature"):
             val = getattr(self, temp_field)
             if not (0.0 <= val <= 1.0):
@@ -143,6 +163,8 @@ class ResearchMode:
             decompose=False,  # Skip decomposition for speed
             retry_sources_per_query=2,
             cost_estimate="~$0.12",
+            latency_budget_s=30.0,
+            source_tokens=4_000,
             iteration_enabled=False,
             followup_questions=0,
             novelty_queries=0,
@@ -171,6 +193,9 @@ class ResearchMode:
             relevance_cutoff=4,  # Raised from 3 — filters low-quality sources more aggressively
             min_unique_domains=3,
             cost_estimate="~$0.45",
+            latency_budget_s=60.0,
+            source_tokens=10_000,
+            batch_mini_reports=True,
             iteration_enabled=True,
             followup_questions=2,
             novelty_queries=1,
@@ -200,9 +225,13 @@ class ResearchMode:
             min_unique_domains=4,
             retry_sources_per_query=5,
             cost_estimate="~$0.95",
+            latency_budget_s=300.0,
+            source_tokens=20_000,
+            batch_mini_reports=True,
             iteration_enabled=True,
             followup_questions=3,
             novelty_queries=2,
+            speculative_pass2=True,
         )
 
     @classmethod
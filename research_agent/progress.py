@@ -0,0 +1,127 @@
+"""Progress events from a running research pipeline.
+
+The agent reports each pipeline step, the sources that passed the
+relevance gate, and report text as it streams to the run-scoped listener. Like the usage ledger, the
+listener lives in a ContextVar, so events from asyncio tasks and
+``asyncio.to_thread`` calls reach it without a callback being threaded
+through every function signature. Outside a progress scope, emit() does
+nothing.
+
+ResearchAgent.research_stream() turns these events into an async
+iterator that ends with a ResultEvent.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Iterator, Union
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StageEvent:
+    """The pipeline started a new step.
+
+    Attributes:
+        step: 1-based step number.
+        total: Planned number of steps for the run's mode.
+        message: Step description, e.g. "Fetching 10 pages...".
+        elapsed_s: Seconds since the run started.
+    """
+    step: int
+    total: int
+    message: str
+    elapsed_s: float
+
+
+@dataclass(frozen=True)
+class SourcesEvent:
+    """The relevance gate scored the sources.
+
+    Attributes:
+        decision: Gate decision ("full_report", "short_report", ...).
+        kept: Sources that passed the relevance cutoff.
+        dropped: Sources that were dropped.
+        urls: URLs of the kept sources.
+    """
+    decision: str
+    kept: int
+    dropped: int
+    urls: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class TextDelta:
+    """A chunk of report text streamed from the synthesis model.
+
+    Attributes:
+        text: The new text, in stream order.
+    """
+    text: str
+
+
+@dataclass(frozen=True)
+class ResultEvent:
+    """The run finished; the last event from research_stream().
+
+    Attributes:
+        report: The full markdown report.
+    """
+    report: str
+
+
+ProgressEvent = Union[StageEvent, SourcesEvent, TextDelta, ResultEvent]
+ProgressListener = Callable[[ProgressEvent], None]
+
+_current_listener: ContextVar[ProgressListener | None] = ContextVar(
+    "research_agent_progress_listener", default=None,
+)
+
+
+def emit(event: ProgressEvent) -> bool:
+    """Send an event to the active listener, if any.
+
+    A failing listener is logged and ignored; progress reporting must
+    never break the run it observes.
+
+    Returns:
+        True if a listener was active (even if it failed), else False.
+    """
+    listener = _current_listener.get()
+    if listener is None:
+        return False
+    try:
+        listener(event)
+    except Exception:
+        logger.exception("Progress listener failed")
+    return True
+
+
+@contextmanager
+def progress_scope(listener: ProgressListener | None) -> Iterator[None]:
+    """Send progress events from the enclosed code to ``listener``."""
+    token = _current_listener.set(listener)
+    try:
+        yield
+    finally:
+        _current_listener.reset(token)
+
+
+def queue_listener(events: asyncio.Queue) -> ProgressListener:
+    """A listener that puts events on ``events`` from any thread.
+
+    Pipeline stages run partly in worker threads (asyncio.to_thread), so
+    events are handed to the queue's loop rather than put directly. Call
+    this on the loop that consumes the queue.
+    """
+    loop = asyncio.get_running_loop()
+
+    def listener(event: ProgressEvent) -> None:
+        loop.call_soon_threadsafe(events.put_nowait, event)
+
+    return listener
@@ -2,7 +2,8 @@
 
 import logging
 import re
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from urllib.parse import urlparse
 
 import asyncio
@@ -15,6 +16,8 @@ from .summarize import Summary
 from .modes import DEFAULT_MODEL, ResearchMode
 from .sanitize import sanitize_content
 from .token_budget import truncate_to_budget
+from .usage import record_usage
+from .tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +35,7 @@ INSUFFICIENT_RESPONSE_TIMEOUT = 30.0
 SNIPPET_SCORE_CAP: int = 3
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceScore:
     """Score for a single source's relevance to the research query."""
     url: str
@@ -51,6 +54,7 @@ class RelevanceEvaluation:
     total_scored: int
     total_survived: int
     refined_query: str | None
+    surviving_scores: tuple[SourceScore, ...] = ()  # One per surviving URL
 
 
 def compute_gate_decision(
@@ -199,6 +203,7 @@ def _parse_score_response(response_text: str) -> tuple[int, str]:
     return score, explanation
 
 
+@traced("relevance.score", args=("summary.url",))
 async def score_source(
     query: str,
     summary: Summary,
@@ -222,7 +227,7 @@ async def score_source(
     """
     # query is pre-sanitized by caller (evaluate_sources)
     safe_title = sanitize_content(summary.title or "Untitled")
-    safe_summary = sanitize_content(summary.summary)
+    safe_summary = summary.safe_summary
 
     system_prompt = (
         "You are evaluating whether a web source is relevant to a research query. "
@@ -257,6 +262,7 @@ SCORE: [number]
 EXPLANATION: [one sentence explaining why]"""
 
     try:
+        started = time.monotonic()
         response = await retry_api_call(
             lambda: client.messages.create(
                 model=model,
@@ -269,6 +275,7 @@ EXPLANATION: [one sentence explaining why]"""
             rate_limit_event=rate_limit_event,
             context=f"Scoring {summary.url}",
         )
+        record_usage("relevance", model, response, started)
 
         if not response.content:
             logger.warning("Empty response when scoring %s", summary.url)
@@ -295,10 +302,21 @@ EXPLANATION: [one sentence explaining why]"""
     )
 
 
+@dataclass(slots=True)
+class _SourceAggregate:
+    """Chunk-level scores for one URL, reduced to the best chunk's score."""
+    url: str
+    title: str
+    score: int
+    explanation: str
+    chunk_count: int = 0
+    all_summaries: list[Summary] = field(default_factory=list)
+
+
 def _aggregate_by_source(
     summaries: list[Summary],
     scored_results: list,
-) -> list[dict]:
+) -> list[_SourceAggregate]:
     """
     Aggregate chunk-level scores to source-level (by URL).
 
@@ -311,12 +329,12 @@ def _aggregate_by_source(
         scored_results: Parallel list of score dicts or Exceptions from gather
 
     Returns:
-        List of source-level dicts (one per unique URL), each with keys:
-            url, title, score (max across chunks), explanation (from best chunk),
-            chunk_count, all_summaries (list of Summary objects for this URL)
+        One _SourceAggregate per unique URL, in first-seen order: score is the
+        max across chunks, explanation comes from the best chunk, and
+        all_summaries holds every Summary for the URL
     """
     # Build per-URL aggregation preserving insertion order
-    by_url: dict[str, dict] = {}
+    by_url: dict[str, _SourceAggregate] = {}
 
     for summary, result in zip(summaries, scored_results):
         # Handle exceptions from gather
@@ -328,28 +346,26 @@ def _aggregate_by_source(
             score = result.score
             explanation = result.explanation
 
-        if summary.url not in by_url:
-            by_url[summary.url] = {
-                "url": summary.url,
-                "title": summary.title or "Untitled",
-                "score": score,
-                "explanation": explanation,
-                "chunk_count": 0,
-                "all_summaries": [],
-            }
-
-        entry = by_url[summary.url]
-        entry["chunk_count"] += 1
-        entry["all_summaries"].append(summary)
+        entry = by_url.get(summary.url)
+        if entry is None:
+            entry = by_url[summary.url] = _SourceAggregate(
+                url=summary.url,
+                title=summary.title or "Untitled",
+                score=score,
+                explanation=explanation,
+            )
+        entry.chunk_count += 1
+        entry.all_summaries.append(summary)
 
         # Keep the max score and its explanation
-        if score > entry["score"]:
-            entry["score"] = score
-            entry["explanation"] = explanation
+        if score > entry.score:
+            entry.score = score
+            entry.explanation = explanation
 
     return list(by_url.values())
 
 
+@traced("relevance.evaluate")
 async def evaluate_sources(
     query: str,
     summaries: list[Summary],
@@ -412,16 +428,21 @@ async def evaluate_sources(
     source_scores = _aggregate_by_source(summaries, scored_results)
 
     surviving_sources = []
-    dropped_sources = []
+    surviving_scores: list[SourceScore] = []
+    dropped_sources: list[_SourceAggregate] = []
 
     for i, source in enumerate(source_scores, 1):
-        domain = _extract_domain(source["url"])
-        score = source["score"]
-        chunks = source["chunk_count"]
+        domain = _extract_domain(source.url)
+        score = source.score
+        chunks = source.chunk_count
         chunk_label = f", {chunks} chunks" if chunks > 1 else ""
 
         if score >= mode.relevance_cutoff:
-            surviving_sources.extend(source["all_summaries"])
+            surviving_sources.extend(source.all_summaries)
+            surviving_scores.append(SourceScore(
+                url=source.url, title=source.title,
+                score=score, explanation=source.explanation,
+            ))
             status = "KEEP"
         else:
             dropped_sources.append(source)
@@ -454,11 +475,11 @@ async def evaluate_sources(
 
     logger.info("Decision: %s (%d/%d sources passed)", decision, total_survived, total_scored)
 
-    # Convert dropped aggregation dicts to SourceScore objects
+    # Convert dropped aggregates to SourceScore objects
     dropped_as_scores = tuple(
         SourceScore(
-            url=d["url"], title=d["title"],
-            score=d["score"], explanation=d["explanation"],
+            url=d.url, title=d.title,
+            score=d.score, explanation=d.explanation,
         )
         for d in dropped_sources
     )
@@ -471,6 +492,7 @@ async def evaluate_sources(
         total_scored=total_scored,
         total_survived=total_survived,
         refined_query=refined_query,
+        surviving_scores=tuple(surviving_scores),
     )
 
 
@@ -489,7 +511,7 @@ async def generate_insufficient_data_response(
     Args:
         query: The original research query
         refined_query: The refined query used in pass 2 (if any)
-        dropped_sources: List of dicts with url, title, score, explanation
+        dropped_sources: SourceScore objects for sources that failed the gate
         client: Async Anthropic client for API calls
         surviving_sources: Sources that passed relevance but below count threshold
 
@@ -551,6 +573,7 @@ Write a short response (150-250 words) that:
 Do NOT pad the response. Keep it concise and honest."""
 
     try:
+        started = time.monotonic()
         response = await client.messages.create(
             model=model,
             max_tokens=500,
@@ -559,6 +582,7 @@ Do NOT pad the response. Keep it concise and honest."""
             system=system_prompt,
             messages=[{"role": "user", "content": user_prompt}],
         )
+        record_usage("insufficient_response", model, response, started)
 
         if not response.content:
             return _fallback_insufficient_response(query, refined_query, dropped_sources, surviving_sources)
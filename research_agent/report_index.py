@@ -0,0 +1,363 @@
+"""Index of saved reports, consulted before re-running a query.
+
+Every auto-saved report gets an entry with its normalized query, mode,
+context, save time, source URLs and a lexical fingerprint of the query.
+run_research_async() looks a new query up here first: a saved report
+for a near-identical query, in the same mode and context, that is
+still fresh under the FreshnessPolicy is served instead of running the
+pipeline again.
+
+The sources a report was written from (summaries, scores, HTTP
+validators) are kept with its entry, so refresh_report() can update
+the report without redoing the unchanged ones.
+
+Entries and sources live in the report catalog (see catalog.py), on the
+report's row: a lookup reads only the candidates sharing the query's
+mode, context and fingerprint words, and deleting a report drops its
+entry. An index left by older versions in reports/meta/report_index.json
+(with sources in reports/meta/sources/) is imported the first time the
+catalog is used, then renamed to report_index.json.migrated.
+
+The index is best-effort. A missing or unreadable index, or an entry
+whose report file is gone, is treated as a miss, and a failure to
+update the index never fails the save it follows.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import sqlite3
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from . import report_store
+from .catalog import (
+    IndexEntry,
+    add_report,
+    cache_candidates,
+    index_entries,
+    is_persistent,
+    open_reports_catalog,
+    report_sources,
+    save_entry,
+)
+from .query_validation import meaningful_words
+from .report_store import META_DIR
+from .results import CacheHit, StoredSource
+
+logger = logging.getLogger(__name__)
+
+# Where older versions kept the index; imported into the catalog once
+INDEX_FILENAME = "report_index.json"
+SOURCES_SUBDIR = "sources"
+MIGRATED_SUFFIX = ".migrated"
+DAY_S = 24 * 60 * 60
+
+# Only reports that answered the query are worth serving again
+_SERVABLE_STATUSES = frozenset({"full_report", "short_report"})
+
+# "is X safe" and "is X not safe" share most words but ask opposite things
+_NEGATIONS = frozenset({
+    "not", "no", "never", "without", "nor", "cannot", "can't", "don't",
+    "doesn't", "isn't", "aren't", "won't", "shouldn't",
+})
+
+
+@dataclass(frozen=True)
+class FreshnessPolicy:
+    """When a saved report may stand in for a new run.
+
+    Attributes:
+        max_age_s: Reports younger than this are served as-is.
+        refresh_window_s: Reports older than max_age_s but younger than
+            this are still served, flagged refresh_suggested. Older
+            reports are ignored. Set it to max_age_s to never serve a
+            report that needs a refresh.
+        min_similarity: Lowest fingerprint similarity (0-1) that counts
+            as the same question.
+        auto_refresh: Refresh a report in the refresh window incrementally
+            (see refresh_report_async()) instead of serving it as-is.
+    """
+    max_age_s: float = 3 * DAY_S
+    refresh_window_s: float = 30 * DAY_S
+    min_similarity: float = 0.8
+    auto_refresh: bool = False
+
+    def __post_init__(self) -> None:
+        if self.max_age_s < 0:
+            raise ValueError(f"max_age_s must be >= 0, got {self.max_age_s}")
+        if self.refresh_window_s < self.max_age_s:
+            raise ValueError(
+                f"refresh_window_s ({self.refresh_window_s}) must be >= max_age_s ({self.max_age_s})"
+            )
+        if not 0 < self.min_similarity <= 1:
+            raise ValueError(f"min_similarity must be in (0, 1], got {self.min_similarity}")
+
+
+DEFAULT_FRESHNESS = FreshnessPolicy()
+
+
+@dataclass(frozen=True)
+class CachedReport:
+    """A saved report found for a query, with its index entry."""
+    hit: CacheHit
+    entry: IndexEntry
+    report: str
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase, collapse whitespace and drop trailing punctuation."""
+    return " ".join(query.lower().split()).rstrip("?!.")
+
+
+def _stem(word: str) -> str:
+    # Plural-only stemming: "effects" and "effect" are the same question
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def query_fingerprint(query: str) -> tuple[str, ...]:
+    """Sorted, stemmed meaningful words of a query."""
+    return tuple(sorted({_stem(w) for w in meaningful_words(query)}))
+
+
+def fingerprint_similarity(a: tuple[str, ...], b: tuple[str, ...]) -> float:
+    """Jaccard similarity of two fingerprints.
+
+    0.0 when either is empty or they differ in negation words.
+    """
+    if not a or not b:
+        return 0.0
+    sa, sb = set(a), set(b)
+    if sa & _NEGATIONS != sb & _NEGATIONS:
+        return 0.0
+    return len(sa & sb) / len(sa | sb)
+
+
+def _context_key(context: str | None) -> str:
+    """Index key for a context argument ("" means auto-detect)."""
+    return (context or "").strip().lower()
+
+
+def _legacy_index_path() -> Path:
+    return META_DIR / INDEX_FILENAME
+
+
+def _legacy_sources(filename: str) -> tuple[StoredSource, ...]:
+    path = META_DIR / SOURCES_SUBDIR / f"{Path(filename).stem}.json"
+    if not path.is_file():
+        return ()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return tuple(
+            StoredSource(**{**row, "summaries": tuple(row["summaries"])})
+            for row in data["sources"]
+        )
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning("Not importing unreadable stored sources %s: %s", path, e)
+        return ()
+
+
+def _import_legacy_index(conn: sqlite3.Connection) -> None:
+    """Move a JSON index left by an older version into the catalog.
+
+    Runs once: the JSON file is renamed afterwards (kept as a backup)
+    and the per-report source files are removed. Nothing is moved into
+    the in-memory fallback catalog.
+    """
+    path = _legacy_index_path()
+    if not path.is_file() or not is_persistent(conn):
+        return
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning("Not importing unreadable report index %s: %s", path, e)
+        data = {}
+    entries: list[IndexEntry] = []
+    for item in data.get("reports", []) if isinstance(data, dict) else []:
+        try:
+            entries.append(IndexEntry.from_dict(item))
+        except (KeyError, TypeError, ValueError):
+            logger.debug("Skipping malformed report index entry: %r", item)
+    with conn:
+        imported = sum(save_entry(conn, e, _legacy_sources(e.filename)) for e in entries)
+    try:
+        path.replace(path.with_name(path.name + MIGRATED_SUFFIX))
+        sources_dir = META_DIR / SOURCES_SUBDIR
+        if sources_dir.is_dir():
+            for f in sources_dir.glob("*.json"):
+                f.unlink()
+            sources_dir.rmdir()
+    except OSError as e:
+        logger.warning("Could not retire the old report index %s: %s", path, e)
+    logger.info("Imported %d report index entries from %s into the catalog", imported, path)
+
+
+@contextmanager
+def _catalog() -> Iterator[sqlite3.Connection | None]:
+    """The catalog of reports/ (None if there is no reports/ directory)."""
+    reports_dir = report_store.REPORTS_DIR
+    if not reports_dir.is_dir() or not report_store._resolves_within_reports_root(reports_dir):
+        yield None
+        return
+    conn = open_reports_catalog(reports_dir)
+    try:
+        _import_legacy_index(conn)
+        yield conn
+    finally:
+        conn.close()
+
+
+def load_index() -> list[IndexEntry]:
+    """All index entries, oldest first."""
+    try:
+        with _catalog() as conn:
+            return index_entries(conn) if conn is not None else []
+    except sqlite3.Error as e:
+        logger.warning("Could not read the report index: %s", e)
+        return []
+
+
+def get_entry(filename: str) -> IndexEntry | None:
+    """The index entry for a saved report's filename, or None."""
+    try:
+        with _catalog() as conn:
+            entries = index_entries(conn, filename) if conn is not None else []
+    except sqlite3.Error as e:
+        logger.warning("Could not read the report index: %s", e)
+        return None
+    return entries[0] if entries else None
+
+
+def load_sources(filename: str) -> tuple[StoredSource, ...]:
+    """The stored sources of a saved report (empty if none were kept)."""
+    try:
+        with _catalog() as conn:
+            return report_sources(conn, filename) if conn is not None else ()
+    except (sqlite3.Error, ValueError) as e:
+        logger.warning("Ignoring unreadable stored sources of %s: %s", filename, e)
+        return ()
+
+
+def saved_report_path(filename: str) -> Path | None:
+    """Path of a saved report, or None if it is gone or outside reports/."""
+    path = report_store.REPORTS_DIR / filename
+    if not path.is_file() or not report_store._resolves_within_reports_root(path):
+        return None
+    return path
+
+
+def record_report(
+    path: Path,
+    query: str,
+    mode: str,
+    context: str | None,
+    source_urls: tuple[str, ...],
+    status: str,
+    sources: Sequence[StoredSource] = (),
+) -> None:
+    """Add a just-saved report, and the sources it was written from, to the index.
+
+    The report is looked up by filename in reports/. Recording a
+    filename that is already indexed replaces its entry and sources.
+    Failures are logged, not raised: the report itself is already saved.
+    """
+    filename = Path(path).name
+    entry = IndexEntry(
+        filename=filename,
+        query=query,
+        normalized_query=normalize_query(query),
+        mode=mode,
+        context=_context_key(context),
+        timestamp=time.time(),
+        status=str(status),
+        fingerprint=query_fingerprint(query),
+        source_urls=tuple(source_urls),
+    )
+    try:
+        with _catalog() as conn:
+            if conn is not None:
+                add_report(conn, report_store.REPORTS_DIR / filename, entry, sources)
+    except sqlite3.Error as e:
+        logger.warning("Could not update report index: %s", e)
+
+
+def find_cached_report(
+    query: str,
+    mode: str,
+    context: str | None,
+    policy: FreshnessPolicy = DEFAULT_FRESHNESS,
+    now: float | None = None,
+) -> CachedReport | None:
+    """Find a fresh-enough saved report for a near-identical query.
+
+    Candidates must match mode and context exactly, have a servable
+    status, be within the policy's refresh window and reach its
+    min_similarity. The most similar wins, then the newest.
+
+    Returns:
+        The CachedReport, or None if nothing qualifies.
+    """
+    now = time.time() if now is None else now
+    normalized = normalize_query(query)
+    fingerprint = query_fingerprint(query)
+    context_key = _context_key(context)
+
+    try:
+        with _catalog() as conn:
+            if conn is None:
+                return None
+            # Jaccard >= s needs at least s * len(fingerprint) shared words
+            entries = cache_candidates(
+                conn,
+                mode=mode,
+                context=context_key,
+                statuses=sorted(_SERVABLE_STATUSES),
+                saved_since=now - policy.refresh_window_s,
+                normalized_query=normalized,
+                fingerprint=fingerprint,
+                min_shared_words=math.ceil(policy.min_similarity * len(fingerprint) - 1e-9),
+            )
+    except sqlite3.Error as e:
+        logger.warning("Could not read the report index: %s", e)
+        return None
+
+    candidates: list[tuple[float, IndexEntry]] = []
+    for entry in entries:
+        if entry.normalized_query == normalized:
+            similarity = 1.0
+        else:
+            similarity = fingerprint_similarity(fingerprint, entry.fingerprint)
+        if similarity >= policy.min_similarity:
+            candidates.append((similarity, entry))
+
+    for similarity, entry in sorted(candidates, key=lambda c: (c[0], c[1].timestamp), reverse=True):
+        path = saved_report_path(entry.filename)
+        if path is None:
+            continue
+        try:
+            report = path.read_text(encoding="utf-8")
+        except OSError as e:
+            logger.warning("Could not read cached report %s: %s", entry.filename, e)
+            continue
+        age = max(0.0, now - entry.timestamp)
+        hit = CacheHit(
+            filename=entry.filename,
+            matched_query=entry.query,
+            similarity=round(similarity, 3),
+            timestamp=entry.timestamp,
+            age_s=round(age, 1),
+            refresh_suggested=age > policy.max_age_s,
+        )
+        logger.info(
+            "Serving saved report %s (%.1f days old) for %r",
+            entry.filename, age / DAY_S, query,
+        )
+        return CachedReport(hit=hit, entry=entry, report=report)
+    return None
@@ -4,7 +4,7 @@ import re
 from datetime import datetime
 from pathlib import Path
 
-from .results import ReportInfo
+from .results import ReportInfo, ReportMatch
 
 REPORTS_DIR = Path("reports")
 META_DIR = Path("reports/meta")
@@ -70,37 +70,49 @@ _OLD_FORMAT = re.compile(r"^(\d{4}-\d{2}-\d{2})_\d{6,}_(.+)\.md$")
 _NEW_FORMAT = re.compile(r"^(.+)_(\d{4}-\d{2}-\d{2})_\d{6,}\.md$")
 
 
+def parse_report_filename(name: str) -> ReportInfo:
+    """Date and query name of a report from its filename (date "" if none)."""
+    old_match = _OLD_FORMAT.match(name)
+    if old_match:
+        return ReportInfo(filename=name, date=old_match.group(1), query_name=old_match.group(2))
+    new_match = _NEW_FORMAT.match(name)
+    if new_match:
+        return ReportInfo(filename=name, date=new_match.group(2), query_name=new_match.group(1))
+    return ReportInfo(filename=name, date="", query_name=name)
+
+
 def get_reports() -> list[ReportInfo]:
     """Return metadata for all saved reports, sorted newest-first.
 
+    Read from the report catalog (see catalog.py), which rescans
+    reports/ only when its contents changed.
+
     Returns:
-        List of ReportInfo objects. Empty list if no reports directory
-        or no report files exist.
+        List of ReportInfo objects, undated files last. Empty list if
+        no reports directory or no report files exist.
     """
+    from .catalog import list_reports
+
     if not REPORTS_DIR.is_dir():
         return []
     if not _resolves_within_reports_root(REPORTS_DIR):
         return []
+    return list_reports(REPORTS_DIR)
 
-    md_files = sorted(REPORTS_DIR.glob("*.md"))
-    if not md_files:
-        return []
 
-    results: list[ReportInfo] = []
-    for f in md_files:
-        if not _resolves_within_reports_root(f):
-            continue
-        name = f.name
-        old_match = _OLD_FORMAT.match(name)
-        new_match = _NEW_FORMAT.match(name)
-
-        if old_match:
-            results.append(ReportInfo(filename=name, date=old_match.group(1), query_name=old_match.group(2)))
-        elif new_match:
-            results.append(ReportInfo(filename=name, date=new_match.group(2), query_name=new_match.group(1)))
-        else:
-            results.append(ReportInfo(filename=name, date="", query_name=name))
-
-    # Sort by date newest-first (undated files sort to beginning)
-    results.sort(key=lambda r: r.date, reverse=True)
-    return results
+def search_reports(text: str = "", **filters) -> list[ReportMatch]:
+    """Search saved reports by text and metadata, best match first.
+
+    Takes the text and keyword filters (mode, status, domain, since,
+    until, limit) of catalog.search_reports().
+
+    Raises:
+        ValueError: If a filter is invalid.
+    """
+    from .catalog import search_reports as search_catalog
+
+    if not REPORTS_DIR.is_dir():
+        return []
+    if not _resolves_within_reports_root(REPORTS_DIR):
+        return []
+    return search_catalog(REPORTS_DIR, text, **filters)
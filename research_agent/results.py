@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .critique import CritiqueResult
+    from .usage import UsageSummary
 
 
 @dataclass(frozen=True)
@@ -24,6 +25,17 @@ class ResearchResult:
                 "short_report", "insufficient_data", or "no_new_findings".
         critique: Self-critique result, or None if critique was skipped
             (quick mode) or failed.
+        usage: Token and cost usage per stage and model, from the API's
+            response.usage, or None if no usage was recorded.
+        context: The context argument the run was asked for (None for
+            auto-detect, "none" for no context, or a context name).
+        source_urls: URLs of the sources that survived the relevance gate.
+        cache: Where the report came from when it was served from the
+            report index instead of a new run, or None.
+        sources: The surviving sources with their summaries, stored with
+            the saved report so it can be refreshed later.
+        refresh: How a refresh of a saved report went, or None if the
+            report came from a full run.
     """
     report: str
     query: str
@@ -34,6 +46,78 @@ class ResearchResult:
     iteration_status: str = field(default="skipped")
     iteration_sections: tuple[str, ...] = field(default=())
     source_counts: dict[str, int] = field(default_factory=dict)
+    usage: UsageSummary | None = field(default=None)
+    context: str | None = field(default=None)
+    source_urls: tuple[str, ...] = field(default=())
+    cache: CacheHit | None = field(default=None)
+    sources: tuple[StoredSource, ...] = field(default=())
+    refresh: RefreshOutcome | None = field(default=None)
+
+
+@dataclass(frozen=True)
+class StoredSource:
+    """A source a report was written from, kept for refreshing the report.
+
+    Attributes:
+        url: The page URL.
+        title: The page title.
+        score: Relevance score the source passed the gate with.
+        summaries: Its chunk summaries, in order.
+        etag: ETag from when the page was fetched ("" if none).
+        last_modified: Last-Modified from when the page was fetched.
+        content_hash: Hash of the page's extracted text ("" if unknown).
+    """
+    url: str
+    title: str
+    score: int
+    summaries: tuple[str, ...]
+    etag: str = ""
+    last_modified: str = ""
+    content_hash: str = ""
+
+
+@dataclass(frozen=True)
+class RefreshOutcome:
+    """How an incremental refresh of a saved report went.
+
+    Attributes:
+        report: Filename of the saved report that was refreshed.
+        unchanged: Sources confirmed unchanged (not modified, or the same
+            extracted text); their summaries and scores were reused.
+        unverified: Sources that could not be re-fetched; kept as stored.
+        changed: Sources whose content changed and were re-summarized.
+        new: Pages from the delta search that were summarized and scored.
+        reused_report: True if nothing that survived the gate changed, so
+            the saved report was returned without re-synthesis.
+    """
+    report: str
+    unchanged: int
+    unverified: int
+    changed: int
+    new: int
+    reused_report: bool = False
+
+
+@dataclass(frozen=True)
+class CacheHit:
+    """A saved report served in place of a new research run.
+
+    Attributes:
+        filename: The saved report's filename in reports/.
+        matched_query: The query the saved report answered.
+        similarity: Lexical similarity of the two queries (0-1).
+        timestamp: When the saved report was written (Unix time).
+        age_s: Age of the saved report when it was served.
+        refresh_suggested: True if the report is past the freshness
+            policy's max age but within its refresh window, so it was
+            served anyway and a refresh is worth running.
+    """
+    filename: str
+    matched_query: str
+    similarity: float
+    timestamp: float
+    age_s: float
+    refresh_suggested: bool = False
 
 
 @dataclass(frozen=True)
@@ -55,6 +139,7 @@ class ModeInfo:
     min_sources_short_report: int = 1
     min_unique_domains: int = 2
     novelty_queries: int = 0
+    latency_budget_s: float = 0.0
 
 
 @dataclass(frozen=True)
@@ -63,3 +148,46 @@ class ReportInfo:
     filename: str
     date: str
     query_name: str
+
+
+@dataclass(frozen=True)
+class ReportMatch:
+    """A saved report found by search_reports().
+
+    query, mode and status are empty for reports the pipeline didn't
+    save (copied into reports/ by hand).
+
+    Attributes:
+        snippet: Text around the matched words, which are wrapped in
+            ** **. Empty when the search had no text.
+        score: Relevance (higher is better); 0.0 when the search had
+            no text and results are newest first.
+    """
+    filename: str
+    date: str
+    title: str
+    query: str
+    mode: str
+    status: str
+    source_domains: tuple[str, ...]
+    snippet: str
+    score: float
+
+
+@dataclass(frozen=True)
+class SpeculationOutcome:
+    """How a deep-mode run's speculative pass-2 search turned out.
+
+    Attributes:
+        reused: True if the speculative results were used, False if they
+            were discarded because the summary-based refinement differed.
+        speculative_query: Query refined from pass-1 snippets and searched
+            while pass 1 was summarized ("" if that search failed).
+        refined_query: Query refined from the pass-1 summaries.
+        saved_s: Seconds of pass-2 search and fetch that overlapped pass 1
+            instead of running after it (0.0 when discarded).
+    """
+    reused: bool
+    speculative_query: str
+    refined_query: str
+    saved_s: float = 0.0
@@ -17,9 +17,21 @@ def sanitize_content(text: str) -> str:
     Normalizes any pre-escaped HTML entities before re-escaping, so
     double-sanitization no longer causes corruption (& → &amp; → &amp;amp;).
     """
-    text = text.replace("\x00", "")
-    normalized = html.unescape(text)
-    return normalized.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    # Each pass runs only if its character is present (a C-level memchr), so
+    # clean text is returned without copying. str.translate and re.sub were
+    # measured slower: both fall back to per-character Python-level work
+    # for multi-character replacements.
+    if "\x00" in text:
+        text = text.replace("\x00", "")
+    if "&" in text:
+        text = html.unescape(text)
+        if "&" in text:
+            text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
 
 
 def build_context_block(content: str | None) -> str:
@@ -0,0 +1,178 @@
+"""Caches and concurrency limits shared by concurrent research runs.
+
+A batch installs one SharedResources for all of its runs. Like the usage
+ledger, it lives in a ContextVar, so it follows asyncio tasks and
+``asyncio.to_thread`` calls. search(), fetch_urls(), cascade recovery and
+summarize_all() consult it without it being threaded through every
+function signature. Outside a shared scope, each call behaves as before:
+nothing is cached across calls, and limits are per call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Awaitable, Callable, Generic, Hashable, Iterator, TypeVar
+
+V = TypeVar("V")
+
+def _always(_value: object) -> bool:
+    return True
+
+
+class SharedCache(Generic[V]):
+    """Dict cache that also collapses concurrent computations of one key.
+
+    The first caller for a key computes it; callers arriving while that
+    computation is in flight wait for it instead of repeating the work.
+    If the computation raises, or ``keep`` rejects its value, the next
+    waiter computes the value itself.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[Hashable, V] = {}
+        self._lock = threading.Lock()
+        self._thread_flights: dict[Hashable, threading.Event] = {}
+        self._task_flights: dict[Hashable, asyncio.Event] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._values)
+
+    def get_or_compute(
+        self, key: Hashable, compute: Callable[[], V],
+        keep: Callable[[V], bool] = _always,
+    ) -> V:
+        """Return the cached value for ``key``, computing it in this thread if needed."""
+        while True:
+            with self._lock:
+                if key in self._values:
+                    self.hits += 1
+                    return self._values[key]
+                flight = self._thread_flights.get(key)
+                if flight is None:
+                    flight = self._thread_flights[key] = threading.Event()
+                    self.misses += 1
+                    break
+            flight.wait()
+        try:
+            value = compute()
+            if keep(value):
+                with self._lock:
+                    self._values[key] = value
+            return value
+        finally:
+            with self._lock:
+                del self._thread_flights[key]
+            flight.set()
+
+    async def get_or_compute_async(
+        self, key: Hashable, compute: Callable[[], Awaitable[V]],
+        keep: Callable[[V], bool] = _always,
+    ) -> V:
+        """Async get_or_compute for callers on the event loop."""
+        while True:
+            with self._lock:
+                if key in self._values:
+                    self.hits += 1
+                    return self._values[key]
+                flight = self._task_flights.get(key)
+                if flight is None:
+                    flight = self._task_flights[key] = asyncio.Event()
+                    self.misses += 1
+                    break
+            await flight.wait()
+        try:
+            value = await compute()
+            if keep(value):
+                with self._lock:
+                    self._values[key] = value
+            return value
+        finally:
+            with self._lock:
+                del self._task_flights[key]
+            flight.set()
+
+
+class CallSlots:
+    """Caps in-flight Claude calls across every run in a batch.
+
+    Every Claude call goes through the async client, so one asyncio
+    semaphore counts them; waiting calls get a slot in arrival order.
+    """
+
+    def __init__(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError(f"Call limit must be at least 1, got {limit}")
+        self.limit = limit
+        self._semaphore = asyncio.Semaphore(limit)
+
+    @asynccontextmanager
+    async def hold_async(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of an awaited call."""
+        async with self._semaphore:
+            yield
+
+
+class SharedResources:
+    """Caches and limits shared by every run in a batch.
+
+    Attributes:
+        searches: (query, max_results) -> search results.
+        pages: URL -> fetched page, or None when the fetch failed.
+        summaries: Content and summarize settings -> chunk summaries.
+        dns_cache: Host/port -> whether it resolved to a public address.
+        search_slots: Caps concurrent search API calls.
+        fetch_slots: Caps concurrent page fetches.
+        claude_slots: Caps concurrent Claude calls, for the client
+            wrapped by the batch runner.
+    """
+
+    def __init__(
+        self,
+        max_search_calls: int = 4,
+        max_fetch_connections: int = 10,
+        max_claude_calls: int = 8,
+    ) -> None:
+        if max_search_calls < 1 or max_fetch_connections < 1:
+            raise ValueError("Search and fetch limits must be at least 1")
+        self.searches: SharedCache[list] = SharedCache()
+        self.pages: SharedCache[object] = SharedCache()
+        self.summaries: SharedCache[list] = SharedCache()
+        self.dns_cache: dict[str, bool] = {}
+        self.search_slots = threading.BoundedSemaphore(max_search_calls)
+        self.fetch_slots = asyncio.Semaphore(max_fetch_connections)
+        self.claude_slots = CallSlots(max_claude_calls)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Hits, misses and size of each cache."""
+        return {
+            name: {"hits": cache.hits, "misses": cache.misses, "size": len(cache)}
+            for name, cache in (
+                ("search", self.searches), ("fetch", self.pages), ("summary", self.summaries),
+            )
+        }
+
+
+_current_shared: ContextVar[SharedResources | None] = ContextVar(
+    "research_agent_shared_resources", default=None,
+)
+
+
+def current_shared() -> SharedResources | None:
+    """Return the active SharedResources, or None outside a batch."""
+    return _current_shared.get()
+
+
+@contextmanager
+def shared_scope(resources: SharedResources) -> Iterator[SharedResources]:
+    """Make ``resources`` the active shared caches for the enclosed code."""
+    token = _current_shared.set(resources)
+    try:
+        yield resources
+    finally:
+        _current_shared.reset(token)
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import re
+import time
 from dataclasses import dataclass
 
 from anthropic import (
@@ -17,6 +18,8 @@ from .api_helpers import retry_api_call
 from .modes import DEFAULT_MODEL
 from .sanitize import sanitize_content, build_context_block
 from .errors import SkepticError
+from .usage import record_usage
+from .tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +85,7 @@ def _build_prior_block(prior_findings: list[SkepticFinding] | None) -> str:
 SKEPTIC_MAX_RETRIES = 1
 
 
+@traced("skeptic.call", args=("lens",))
 async def _call_skeptic(
     client: AsyncAnthropic,
     system_prompt: str,
@@ -96,6 +100,7 @@ async def _call_skeptic(
     Retries once on rate limit, timeout, or connection errors before raising.
     """
     try:
+        started = time.monotonic()
         response = await retry_api_call(
             lambda: client.messages.create(
                 model=model,
@@ -109,6 +114,7 @@ async def _call_skeptic(
             retry_on=(RateLimitError, APITimeoutError, APIConnectionError),
             context=f"Skeptic ({lens})",
         )
+        record_usage("skeptic", model, response, started)
 
         if not response.content:
             raise SkepticError(f"Skeptic ({lens}) returned empty response")
@@ -309,6 +315,7 @@ List findings from most to least severe. Include at least 3 findings.
     return await _call_skeptic(client, _ADVERSARIAL_SYSTEM, prompt, "strategic_frame", model, temperature=temperature)
 
 
+@traced("skeptic.combined")
 async def run_skeptic_combined(
     client: AsyncAnthropic,
     draft: str,
@@ -364,6 +371,7 @@ List all findings from most to least severe. Include at least 3 findings total.
     )
 
 
+@traced("skeptic.deep")
 async def run_deep_skeptic_pass(
     client: AsyncAnthropic,
     draft: str,
@@ -0,0 +1,205 @@
+"""Budget-aware packing of source summaries into synthesis prompts.
+
+Synthesis prompts used to carry every surviving chunk summary, and an
+oversize prompt was cut from the tail, so whichever sources happened to
+come first survived. The packer spends a token budget on the sources
+that matter instead:
+
+- sources are ranked by relevance score, losing a point for each source
+  already packed from the same domain, so one site can't crowd out the
+  rest;
+- every source's lead chunk is packed before any source's second chunk;
+- chunks that mostly repeat a chunk already packed (overlapping page
+  chunks, syndicated copies) are left out.
+
+Sources keep their original order and are numbered 1..N among those
+packed. A PackedSources is built once and shared by the prompts that
+cite it (draft and final synthesis, or a round of mini-reports), so
+their [Source N] ids agree.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Mapping
+from urllib.parse import urlparse
+
+from .query_validation import meaningful_words
+from .sanitize import sanitize_content
+from .summarize import Summary
+from .token_budget import count_tokens, truncate_to_budget
+
+logger = logging.getLogger(__name__)
+
+# Score assumed for a source the relevance gate didn't score
+DEFAULT_SCORE = 3
+# Priority lost for each source already packed from the same domain
+DOMAIN_REPEAT_PENALTY = 1
+# Share of a chunk's words already packed at which it counts as redundant
+REDUNDANT_OVERLAP = 0.8
+# Chunks with fewer meaningful words are too short to call redundant
+MIN_REDUNDANCY_WORDS = 8
+# A lead chunk is cut to fit only if at least this many tokens are left
+MIN_LEAD_TOKENS = 100
+# Source budget for an iteration mini-report prompt
+MINI_REPORT_SOURCE_TOKENS = 4_000
+
+
+@dataclass(frozen=True)
+class PackedSources:
+    """Source summaries packed into a prompt's <source> blocks.
+
+    Attributes:
+        text: The <source> blocks, numbered 1..N.
+        urls: URL of each packed source, in [Source N] order.
+        omitted: URLs of sources left out entirely (over budget, or a
+            redundant lead chunk).
+        dropped_chunks: Chunks left out as redundant or over budget.
+        tokens: Estimated tokens of text.
+    """
+
+    text: str
+    urls: tuple[str, ...] = ()
+    omitted: tuple[str, ...] = ()
+    dropped_chunks: int = 0
+    tokens: int = 0
+
+
+@dataclass
+class _Source:
+    index: int
+    url: str
+    title: str
+    domain: str
+    score: int
+    chunks: list[str] = field(default_factory=list)  # sanitized, exact duplicates removed
+    packed: dict[int, str] = field(default_factory=dict)  # chunk position -> packed text
+
+
+def _domain(url: str) -> str:
+    try:
+        return urlparse(url).netloc.lower().removeprefix("www.") or url
+    except ValueError:
+        return url
+
+
+def _group_sources(summaries: list[Summary], scores: Mapping[str, int]) -> list[_Source]:
+    """One _Source per URL in first-seen order, exact duplicate chunks removed."""
+    by_url: dict[str, _Source] = {}
+    seen: dict[str, set[str]] = {}
+    for s in summaries:
+        source = by_url.get(s.url)
+        if source is None:
+            source = by_url[s.url] = _Source(
+                index=len(by_url),
+                url=s.url,
+                title=s.title,
+                domain=_domain(s.url),
+                score=scores.get(s.url, DEFAULT_SCORE),
+            )
+            seen[s.url] = set()
+        # Overlapping chunks of one page may repeat a summary verbatim
+        normalized = " ".join(s.summary.split())
+        if normalized not in seen[s.url]:
+            seen[s.url].add(normalized)
+            source.chunks.append(s.safe_summary)
+    return list(by_url.values())
+
+
+def _rank(sources: list[_Source]) -> list[_Source]:
+    """Order sources by score, discounting domains already ranked higher."""
+    remaining = list(sources)
+    domain_counts: dict[str, int] = {}
+    ranked = []
+    while remaining:
+        best = max(
+            remaining,
+            key=lambda s: (s.score - DOMAIN_REPEAT_PENALTY * domain_counts.get(s.domain, 0), -s.index),
+        )
+        remaining.remove(best)
+        domain_counts[best.domain] = domain_counts.get(best.domain, 0) + 1
+        ranked.append(best)
+    return ranked
+
+
+def _render(source: _Source, source_id: int) -> str:
+    combined = " ".join(source.packed[i] for i in sorted(source.packed))
+    # Sanitize title and URL to prevent prompt injection
+    title = sanitize_content(source.title or "Untitled")
+    safe_url = sanitize_content(source.url)
+    return f"""<source id="{source_id}">
+<title>{title}</title>
+<url>{safe_url}</url>
+<summary>{combined}</summary>
+</source>
+"""
+
+
+def pack_sources(
+    summaries: list[Summary],
+    scores: Mapping[str, int] | None = None,
+    max_tokens: int = 0,
+) -> PackedSources:
+    """Pack chunk summaries into <source> blocks within a token budget.
+
+    Args:
+        summaries: Chunk summaries; several may share a URL.
+        scores: Relevance score per URL (DEFAULT_SCORE when missing).
+        max_tokens: Budget for the summary text (0 = no limit; redundant
+            chunks are still left out).
+
+    Returns:
+        PackedSources with the blocks and what was left out.
+    """
+    sources = _rank(_group_sources(summaries, scores or {}))
+    budget = max_tokens if max_tokens > 0 else None
+    packed_words: list[set[str]] = []
+    dropped = 0
+
+    def try_pack(source: _Source, position: int, lead: bool) -> None:
+        nonlocal budget, dropped
+        text = source.chunks[position]
+        words = meaningful_words(text)
+        if len(words) >= MIN_REDUNDANCY_WORDS and any(
+            len(words & prior) >= len(words) * REDUNDANT_OVERLAP for prior in packed_words
+        ):
+            dropped += 1
+            return
+        tokens = count_tokens(text)
+        if budget is not None and tokens > budget:
+            if not lead or budget < MIN_LEAD_TOKENS:
+                dropped += 1
+                return
+            text = truncate_to_budget(text, budget)
+            tokens = budget
+        source.packed[position] = text
+        packed_words.append(words)
+        if budget is not None:
+            budget -= tokens
+
+    # Every source's lead chunk first, then the rest, both in rank order
+    for source in sources:
+        try_pack(source, 0, lead=True)
+    for source in sources:
+        if source.packed:
+            for position in range(1, len(source.chunks)):
+                try_pack(source, position, lead=False)
+        else:
+            dropped += len(source.chunks) - 1
+
+    included = sorted((s for s in sources if s.packed), key=lambda s: s.index)
+    omitted = tuple(s.url for s in sorted(sources, key=lambda s: s.index) if not s.packed)
+    text = "\n".join(_render(s, i) for i, s in enumerate(included, 1))
+    if omitted or dropped:
+        logger.info(
+            "Packed %d of %d sources (%d chunks left out)",
+            len(included), len(sources), dropped,
+        )
+    return PackedSources(
+        text=text,
+        urls=tuple(s.url for s in included),
+        omitted=omitted,
+        dropped_chunks=dropped,
+        tokens=count_tokens(text),
+    )
@@ -0,0 +1,121 @@
+"""Dependency-graph scheduling of pipeline stages.
+
+A StageGraph runs each stage as an asyncio task that starts as soon as
+the stages it declares as inputs have finished, so stages without a data
+dependency overlap instead of running in a fixed serial order. A stage
+receives its inputs' results as keyword arguments. Inputs must be added
+before the stages that use them, which keeps the graph acyclic.
+
+Each stage is recorded as a ``stage.<name>`` span covering its own work;
+the time it spent waiting for inputs is recorded on the span as
+``waited_s``. Leaving the graph's ``async with`` block cancels any stage
+nobody awaited, e.g. speculative work made moot by an early return.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from types import TracebackType
+from typing import Any, Awaitable, Callable
+
+from .tracing import span
+
+logger = logging.getLogger(__name__)
+
+
+class StageGraph:
+    """Runs async pipeline stages as soon as their inputs are ready.
+
+    Must be used from within a running event loop, as an async context
+    manager:
+
+        async with StageGraph() as stages:
+            stages.add("context", load_context)
+            stages.add("plan", make_plan, inputs=("context",))
+            plan = await stages.result("plan")
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._tasks
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[..., Awaitable[Any]],
+        inputs: tuple[str, ...] = (),
+    ) -> None:
+        """Schedule a stage.
+
+        Args:
+            name: Stage name, unique within the graph.
+            fn: Returns the stage's awaitable; called with each input's
+                result as a keyword argument named after the input.
+            inputs: Names of previously added stages this one needs.
+
+        Raises:
+            ValueError: If the name is taken or an input is unknown.
+        """
+        if name in self._tasks:
+            raise ValueError(f"Stage {name!r} was already added")
+        unknown = [i for i in inputs if i not in self._tasks]
+        if unknown:
+            raise ValueError(f"Stage {name!r} has unknown inputs: {', '.join(unknown)}")
+        deps = {i: self._tasks[i] for i in inputs}
+        self._tasks[name] = asyncio.get_running_loop().create_task(
+            self._run(name, fn, deps), name=f"stage-{name}",
+        )
+
+    @staticmethod
+    async def _run(
+        name: str, fn: Callable[..., Awaitable[Any]], deps: dict[str, asyncio.Task],
+    ) -> Any:
+        started = time.perf_counter()
+        # Shielded: cancelling one dependent must not cancel a shared input
+        values = {dep: await asyncio.shield(task) for dep, task in deps.items()}
+        waited = time.perf_counter() - started
+        with span(f"stage.{name}", waited_s=f"{waited:.3f}"):
+            return await fn(**values)
+
+    async def result(self, name: str) -> Any:
+        """Wait for a stage and return its result (or raise its error).
+
+        Raises:
+            KeyError: If no stage has that name.
+        """
+        return await asyncio.shield(self._tasks[name])
+
+    def cancel(self, name: str) -> None:
+        """Cancel a stage whose result is no longer wanted.
+
+        Stages that use it as an input fail with CancelledError.
+
+        Raises:
+            KeyError: If no stage has that name.
+        """
+        self._tasks[name].cancel()
+
+    async def aclose(self) -> None:
+        """Cancel unfinished stages and wait for them to unwind."""
+        pending = [task for task in self._tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.debug("Cancelled unused stages: %s", ", ".join(t.get_name() for t in pending))
+        # Also retrieves errors from stages nobody awaited
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def __aenter__(self) -> StageGraph:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
@@ -1,26 +1,206 @@
 """Token counting and budget allocation for synthesis prompts.
 
-Provides token counting with graceful fallback and priority-based budget
-allocation to prevent context window overflow (risk F5.2).
+Provides a pluggable local tokenizer (calibrated against real API usage)
+and priority-based budget allocation to prevent context window overflow
+(risk F5.2).
 """
 
+import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from typing import Protocol
 
 from .modes import DEFAULT_MODEL
 
 
+class Tokenizer(Protocol):
+    """Anything that can estimate the token count of a string."""
+
+    name: str
+
+    def count(self, text: str) -> int: ...
+
+
+class CharRatioTokenizer:
+    """Fixed characters-per-token estimate (the original 1 token ≈ 4 chars)."""
+
+    name = "char_ratio"
+
+    def __init__(self, chars_per_token: int = 4) -> None:
+        self.chars_per_token = chars_per_token
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        return max(1, len(text) // self.chars_per_token)
+
+
+# Character classes for the heuristic estimator, roughly following how
+# BPE vocabularies split text: short ASCII words are one token, long ones
+# ~4 chars/token, digits ~3/token, CJK ~1 token/char, other scripts
+# ~2 chars/token, punctuation ~1 token per 1-2 chars. Each class is a
+# separate C-level findall so estimation stays cheap on large pages.
+_WORD_RE = re.compile(r"[A-Za-z]+")
+_LONG_WORD_RE = re.compile(r"[A-Za-z]{7,}")
+_DIGITS_RE = re.compile(r"[0-9]+")
+_MULTI_SPACE_RE = re.compile(r" {2,}|[^\S ]+")
+_CJK_RE = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uff00-\uffef]")
+_OTHER_WORD_RE = re.compile(r"[^\W\d_A-Za-z\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uff00-\uffef]+")
+_PUNCT_RE = re.compile(r"[!-/:-@\[-`{-~]+")
+_SYMBOL_RE = re.compile(r"[^\w\s!-/:-@\[-`{-~\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uff00-\uffef]")
+
+# Calibration scale bounds and smoothing (exponential moving average)
+MIN_SCALE = 0.5
+MAX_SCALE = 2.0
+CALIBRATION_ALPHA = 0.2
+# Per-request framing tokens the API adds around system + user text
+MESSAGE_OVERHEAD_TOKENS = 8
+# Memoized text kept by one tokenizer, in characters
+MEMO_MAX_CHARS = 4_000_000
+
+
+def _ceil_div_sum(runs: list[str], per_token: int) -> int:
+    return sum(-(-len(run) // per_token) for run in runs)
+
+
+def _raw_estimate(text: str) -> int:
+    """Uncalibrated char-class token estimate."""
+    if text.isascii():
+        cjk = other_words = symbols = 0
+    else:
+        cjk = len(_CJK_RE.findall(text))
+        other_words = _ceil_div_sum(_OTHER_WORD_RE.findall(text), 2)
+        symbols = 2 * len(_SYMBOL_RE.findall(text))  # emoji etc. are multi-byte
+    long_words = _LONG_WORD_RE.findall(text)
+    words = len(_WORD_RE.findall(text)) - len(long_words) + _ceil_div_sum(long_words, 4)
+    digits = _ceil_div_sum(_DIGITS_RE.findall(text), 3)
+    # Single spaces merge into the next word; other whitespace runs cost one
+    spaces = len(_MULTI_SPACE_RE.findall(text))
+    punct = sum(len(r) if len(r) <= 2 else -(-len(r) // 2) for r in _PUNCT_RE.findall(text))
+    return words + digits + spaces + punct + cjk + other_words + symbols
+
+
+class HeuristicTokenizer:
+    """Character-class token estimator with usage-based calibration.
+
+    Raw estimates are memoized in a small LRU keyed by the text so
+    repeated prompt components (sources, context, critique guidance) are
+    only scanned once. The LRU holds at most memo_size strings and
+    MEMO_MAX_CHARS characters; longer texts are not memoized.
+    A multiplicative scale, learned from ``usage.input_tokens`` via
+    ``calibrate()``, is applied on top of the raw estimate.
+    """
+
+    name = "heuristic"
+
+    def __init__(self, scale: float = 1.0, memo_size: int = 4096) -> None:
+        self.scale = scale
+        self.samples = 0
+        self._memo: OrderedDict[str, int] = OrderedDict()
+        self._memo_size = memo_size
+        self._memo_chars = 0
+        self._lock = threading.Lock()
+
+    def estimate(self, text: str) -> int:
+        """Uncalibrated estimate (memoized)."""
+        with self._lock:
+            cached = self._memo.get(text)
+            if cached is not None:
+                self._memo.move_to_end(text)
+                return cached
+        raw = _raw_estimate(text)
+        if len(text) > MEMO_MAX_CHARS:
+            return raw
+        with self._lock:
+            if text not in self._memo:
+                self._memo[text] = raw
+                self._memo_chars += len(text)
+                while len(self._memo) > self._memo_size or self._memo_chars > MEMO_MAX_CHARS:
+                    evicted, _ = self._memo.popitem(last=False)
+                    self._memo_chars -= len(evicted)
+        return raw
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        return max(1, round(self.estimate(text) * self.scale))
+
+    def calibrate(self, text: str, actual_tokens: int) -> None:
+        """Fold one (prompt text, real input_tokens) observation into the scale."""
+        raw = self.estimate(text)
+        actual = actual_tokens - MESSAGE_OVERHEAD_TOKENS
+        if raw <= 0 or actual <= 0:
+            return
+        ratio = min(MAX_SCALE, max(MIN_SCALE, actual / raw))
+        with self._lock:
+            if self.samples == 0:
+                self.scale = ratio
+            else:
+                self.scale += CALIBRATION_ALPHA * (ratio - self.scale)
+            self.samples += 1
+
+
+_tokenizer: Tokenizer = HeuristicTokenizer()
+
+
+def get_tokenizer() -> Tokenizer:
+    """Return the process-wide tokenizer used for budgeting and chunking."""
+    return _tokenizer
+
+
+def set_tokenizer(tokenizer: Tokenizer) -> Tokenizer:
+    """Replace the process-wide tokenizer. Returns the previous one."""
+    global _tokenizer
+    previous, _tokenizer = _tokenizer, tokenizer
+    return previous
+
+
 def count_tokens(text: str, model: str = DEFAULT_MODEL) -> int:
-    """Count tokens in text using anthropic's token counting.
+    """Estimate tokens in text with the active local tokenizer.
 
-    Falls back to a conservative character-based estimate (1 token ≈ 4 chars)
-    if the anthropic tokenizer is unavailable.
+    Budget allocation is approximate — avoids per-call API round-trips.
+    Returns 0 for empty text and at least 1 otherwise.
     """
     if not text:
         return 0
+    return get_tokenizer().count(text)
+
+
+def calibrate_from_usage(prompt_text: str, usage: object) -> None:
+    """Calibrate the active tokenizer from a response's ``usage`` block.
 
-    # Conservative estimate: 1 token ≈ 4 characters.
-    # Budget allocation is approximate — avoids per-call API round-trips.
-    return max(1, len(text) // 4)
+    No-op if the tokenizer doesn't support calibration or ``usage`` has
+    no integer ``input_tokens`` (e.g. mocked responses).
+    """
+    input_tokens = getattr(usage, "input_tokens", None)
+    calibrate = getattr(get_tokenizer(), "calibrate", None)
+    if calibrate is None or not isinstance(input_tokens, int) or not prompt_text:
+        return
+    calibrate(prompt_text, input_tokens)
+
+
+# Upper bound on characters per token when searching for a prefix length
+_MAX_CHARS_PER_TOKEN = 8
+_MAX_PREFIX_STEPS = 8
+
+
+def prefix_chars_for_tokens(text: str, max_tokens: int, start: int = 0) -> int:
+    """Return an end offset such that text[start:end] fits max_tokens.
+
+    Sizes the window from the measured token density of the text at
+    ``start``, so dense text (tables, code, non-English) yields shorter
+    prefixes than prose. Shrinks until the prefix fits; the result is
+    within a few percent of the longest fitting prefix.
+    """
+    end = min(len(text), start + max(1, max_tokens) * _MAX_CHARS_PER_TOKEN)
+    for _ in range(_MAX_PREFIX_STEPS):
+        tokens = count_tokens(text[start:end])
+        if tokens <= max_tokens:
+            return end
+        # Aim slightly under the target so the next step usually fits
+        end = start + int((end - start) * max_tokens / tokens * 0.98)
+    return end
 
 
 # Priority order for pruning (lowest priority number pruned first)
@@ -143,9 +323,8 @@ def allocate_budget(
 def truncate_to_budget(text: str, max_tokens: int) -> str:
     """Truncate text to fit within a token budget.
 
-    Uses the conservative 4-chars-per-token estimate for truncation
-    (avoids an API call per truncation). Appends "[truncated]" marker
-    when content is cut.
+    The cut point is found with the active tokenizer (avoids an API call
+    per truncation). Appends "[truncated]" marker when content is cut.
 
     Args:
         text: Content to potentially truncate.
@@ -159,8 +338,7 @@ def truncate_to_budget(text: str, max_tokens: int) -> str:
     current = count_tokens(text)
     if current <= max_tokens:
         return text
-    # Truncate by character estimate (conservative: 4 chars/token)
-    max_chars = max_tokens * 4
+    max_chars = prefix_chars_for_tokens(text, max_tokens)
     min_chars = int(max_chars * 0.6)  # Use at least 60% of budget
 
     # Tiered boundary detection (matches _chunk_text pattern in summarize.py)
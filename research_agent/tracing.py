@@ -0,0 +1,213 @@
+"""Hierarchical span tracing of pipeline stages.
+
+Spans are opened with the ``span()`` context manager or the ``@traced``
+decorator and recorded into the run's Trace, which lives in a ContextVar
+so it follows asyncio tasks and ``asyncio.to_thread`` calls. When no
+trace is active, both reduce to a single ContextVar lookup.
+
+Traces export as Chrome trace-event JSON, viewable in chrome://tracing
+or https://ui.perfetto.dev. Each asyncio task (or thread, outside a
+task) gets its own lane so concurrent spans nest correctly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+from .safe_io import atomic_write
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+TRACE_FILE_PREFIX = "trace-"
+# Span args are stringified and capped so traces stay small
+MAX_ARG_CHARS = 200
+
+
+@dataclass
+class Span:
+    """A completed or in-progress span."""
+
+    name: str
+    start_ns: int
+    lane: int
+    parent: str = ""
+    args: dict[str, str] = field(default_factory=dict)
+    end_ns: int = 0
+    error: str = ""
+
+
+class Trace:
+    """Thread-safe collection of spans for one research run."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._origin_ns = time.perf_counter_ns()
+        self._lanes: dict[int, int] = {}
+        self._lane_names: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def _lane(self) -> int:
+        """Small integer id for the current asyncio task, or thread."""
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        key = id(task) if task is not None else threading.get_ident()
+        with self._lock:
+            lane = self._lanes.get(key)
+            if lane is None:
+                lane = len(self._lanes) + 1
+                self._lanes[key] = lane
+                self._lane_names[lane] = (
+                    task.get_name() if task is not None
+                    else threading.current_thread().name
+                )
+            return lane
+
+    def start(self, name: str, parent: str, args: dict[str, Any]) -> Span:
+        span = Span(
+            name=name,
+            start_ns=time.perf_counter_ns(),
+            lane=self._lane(),
+            parent=parent,
+            args={k: str(v)[:MAX_ARG_CHARS] for k, v in args.items()},
+        )
+        with self._lock:
+            self.spans.append(span)
+        return span
+
+    def to_chrome_trace(self) -> dict:
+        """Chrome trace-event format (complete "X" events, microseconds)."""
+        now = time.perf_counter_ns()
+        events: list[dict] = []
+        with self._lock:
+            spans = list(self.spans)
+            lane_names = dict(self._lane_names)
+        for s in spans:
+            args = dict(s.args)
+            if s.parent:
+                args["parent"] = s.parent
+            if s.error:
+                args["error"] = s.error
+            events.append({
+                "name": s.name,
+                "cat": s.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (s.start_ns - self._origin_ns) / 1000,
+                "dur": ((s.end_ns or now) - s.start_ns) / 1000,
+                "pid": 1,
+                "tid": s.lane,
+                "args": args,
+            })
+        for lane, lane_name in lane_names.items():
+            events.append({
+                "name": "thread_name", "ph": "M", "pid": 1, "tid": lane,
+                "args": {"name": lane_name},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, directory: Path) -> Path:
+        """Write the trace as JSON to directory. Raises StateError on failure."""
+        path = directory / f"{TRACE_FILE_PREFIX}{int(time.time() * 1000)}.json"
+        atomic_write(path, json.dumps(self.to_chrome_trace()))
+        return path
+
+
+_current_trace: ContextVar[Trace | None] = ContextVar(
+    "research_agent_trace", default=None,
+)
+_current_span: ContextVar[Span | None] = ContextVar(
+    "research_agent_span", default=None,
+)
+
+
+def current_trace() -> Trace | None:
+    """Return the trace for the active run, or None when tracing is off."""
+    return _current_trace.get()
+
+
+@contextmanager
+def trace_scope(trace: Trace | None) -> Iterator[Trace | None]:
+    """Make ``trace`` the active trace for the enclosed code (None disables)."""
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+@contextmanager
+def span(name: str, **args: Any) -> Iterator[Span | None]:
+    """Record a span around the enclosed code if a trace is active."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+    parent = _current_span.get()
+    s = trace.start(name, parent.name if parent else "", args)
+    token = _current_span.set(s)
+    try:
+        yield s
+    except BaseException as e:
+        s.error = type(e).__name__
+        raise
+    finally:
+        s.end_ns = time.perf_counter_ns()
+        _current_span.reset(token)
+
+
+def traced(name: str | None = None, args: tuple[str, ...] = ()) -> Callable[[F], F]:
+    """Decorator: record a span around each call of a sync or async function.
+
+    Args:
+        name: Span name (default: "<module>.<qualname>" without the package).
+        args: Parameter names whose values are recorded on the span.
+            Dotted names read an attribute (e.g. "summary.url").
+    """
+    def decorator(fn: F) -> F:
+        span_name = name or f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__qualname__}"
+        signature = inspect.signature(fn) if args else None
+
+        def _span_args(call_args: tuple, call_kwargs: dict) -> dict[str, Any]:
+            if signature is None:
+                return {}
+            try:
+                bound = signature.bind_partial(*call_args, **call_kwargs).arguments
+            except TypeError:
+                return {}
+            values: dict[str, Any] = {}
+            for key in args:
+                param, _, attr = key.partition(".")
+                if param in bound:
+                    value = bound[param]
+                    values[key] = getattr(value, attr, "") if attr else value
+            return values
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*a: Any, **kw: Any) -> Any:
+                if _current_trace.get() is None:
+                    return await fn(*a, **kw)
+                with span(span_name, **_span_args(a, kw)):
+                    return await fn(*a, **kw)
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def wrapper(*a: Any, **kw: Any) -> Any:
+            if _current_trace.get() is None:
+                return fn(*a, **kw)
+            with span(span_name, **_span_args(a, kw)):
+                return fn(*a, **kw)
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
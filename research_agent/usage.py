@@ -0,0 +1,257 @@
+"""Token and cost accounting from Claude API responses.
+
+Every call site reports ``response.usage`` plus latency into the
+run-scoped UsageLedger. The ledger lives in a ContextVar, so it follows
+asyncio tasks and ``asyncio.to_thread`` calls without being threaded
+through every function signature.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .catalog import index_run, recent_runs
+from .safe_io import atomic_write
+
+logger = logging.getLogger(__name__)
+
+# USD per million tokens: (input, output). Matched by longest model-name prefix.
+PRICING: dict[str, tuple[float, float]] = {
+    "claude-opus-4": (15.0, 75.0),
+    "claude-sonnet-4": (3.0, 15.0),
+    "claude-3-7-sonnet": (3.0, 15.0),
+    "claude-3-5-sonnet": (3.0, 15.0),
+    "claude-haiku-4-5": (1.0, 5.0),
+    "claude-3-5-haiku": (0.8, 4.0),
+}
+# Prompt-cache multipliers relative to the input price
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.1
+
+USAGE_FILE_PREFIX = "usage-"
+
+
+def model_pricing(model: str) -> tuple[float, float] | None:
+    """Return (input, output) USD per MTok for a model, or None if unknown."""
+    matches = [prefix for prefix in PRICING if model.startswith(prefix)]
+    if not matches:
+        return None
+    return PRICING[max(matches, key=len)]
+
+
+@dataclass(frozen=True)
+class UsageRecord:
+    """Token usage and latency of a single API call."""
+
+    stage: str
+    model: str
+    input_tokens: int
+    output_tokens: int
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    latency_s: float = 0.0
+
+    @property
+    def cost_usd(self) -> float:
+        """Cost from PRICING; 0.0 for unknown models."""
+        pricing = model_pricing(self.model)
+        if pricing is None:
+            return 0.0
+        input_price, output_price = pricing
+        return (
+            self.input_tokens * input_price
+            + self.cache_creation_input_tokens * input_price * CACHE_WRITE_MULTIPLIER
+            + self.cache_read_input_tokens * input_price * CACHE_READ_MULTIPLIER
+            + self.output_tokens * output_price
+        ) / 1_000_000
+
+
+@dataclass(frozen=True)
+class UsageTotals:
+    """Aggregated usage across a group of calls."""
+
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    latency_s: float = 0.0
+    cost_usd: float = 0.0
+
+
+@dataclass(frozen=True)
+class UsageSummary:
+    """Usage for one research run, in total and per pipeline stage.
+
+    Attributes:
+        total: Totals across every call in the run.
+        by_stage: Stage name -> totals (e.g. "summarize", "relevance").
+        by_model: Model name -> totals.
+    """
+
+    total: UsageTotals = field(default_factory=UsageTotals)
+    by_stage: dict[str, UsageTotals] = field(default_factory=dict)
+    by_model: dict[str, UsageTotals] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _totals(records: list[UsageRecord]) -> UsageTotals:
+    return UsageTotals(
+        calls=len(records),
+        input_tokens=sum(r.input_tokens for r in records),
+        output_tokens=sum(r.output_tokens for r in records),
+        cache_creation_input_tokens=sum(r.cache_creation_input_tokens for r in records),
+        cache_read_input_tokens=sum(r.cache_read_input_tokens for r in records),
+        latency_s=round(sum(r.latency_s for r in records), 3),
+        cost_usd=round(sum(r.cost_usd for r in records), 6),
+    )
+
+
+def _add_totals(a: UsageTotals, b: UsageTotals) -> UsageTotals:
+    return UsageTotals(
+        calls=a.calls + b.calls,
+        input_tokens=a.input_tokens + b.input_tokens,
+        output_tokens=a.output_tokens + b.output_tokens,
+        cache_creation_input_tokens=a.cache_creation_input_tokens + b.cache_creation_input_tokens,
+        cache_read_input_tokens=a.cache_read_input_tokens + b.cache_read_input_tokens,
+        latency_s=round(a.latency_s + b.latency_s, 3),
+        cost_usd=round(a.cost_usd + b.cost_usd, 6),
+    )
+
+
+def combine_usage(summaries: Iterable[UsageSummary]) -> UsageSummary:
+    """Sum several runs' usage, per stage and per model (e.g. for a batch)."""
+    total = UsageTotals()
+    by_stage: dict[str, UsageTotals] = {}
+    by_model: dict[str, UsageTotals] = {}
+    for summary in summaries:
+        total = _add_totals(total, summary.total)
+        for stage, totals in summary.by_stage.items():
+            by_stage[stage] = _add_totals(by_stage.get(stage, UsageTotals()), totals)
+        for model, totals in summary.by_model.items():
+            by_model[model] = _add_totals(by_model.get(model, UsageTotals()), totals)
+    return UsageSummary(total=total, by_stage=by_stage, by_model=by_model)
+
+
+class UsageLedger:
+    """Thread-safe collection of UsageRecords for one research run."""
+
+    def __init__(self) -> None:
+        self._records: list[UsageRecord] = []
+        self._lock = threading.Lock()
+
+    def add(self, record: UsageRecord) -> None:
+        with self._lock:
+            self._records.append(record)
+
+    @property
+    def records(self) -> tuple[UsageRecord, ...]:
+        with self._lock:
+            return tuple(self._records)
+
+    def summary(self) -> UsageSummary:
+        records = list(self.records)
+        by_stage: dict[str, list[UsageRecord]] = {}
+        by_model: dict[str, list[UsageRecord]] = {}
+        for r in records:
+            by_stage.setdefault(r.stage, []).append(r)
+            by_model.setdefault(r.model, []).append(r)
+        return UsageSummary(
+            total=_totals(records),
+            by_stage={k: _totals(v) for k, v in by_stage.items()},
+            by_model={k: _totals(v) for k, v in by_model.items()},
+        )
+
+
+_current_ledger: ContextVar[UsageLedger | None] = ContextVar(
+    "research_agent_usage_ledger", default=None,
+)
+
+
+def current_ledger() -> UsageLedger | None:
+    """Return the ledger for the active run, or None outside a run."""
+    return _current_ledger.get()
+
+
+@contextmanager
+def usage_scope(ledger: UsageLedger) -> Iterator[UsageLedger]:
+    """Make ``ledger`` the active ledger for the enclosed code."""
+    token = _current_ledger.set(ledger)
+    try:
+        yield ledger
+    finally:
+        _current_ledger.reset(token)
+
+
+def _int_attr(obj: object, name: str) -> int:
+    value = getattr(obj, name, None)
+    return value if isinstance(value, int) else 0
+
+
+def record_usage(stage: str, model: str, response: object, started: float) -> None:
+    """Record a response's token usage in the active ledger.
+
+    Args:
+        stage: Pipeline stage name (e.g. "summarize", "synthesize").
+        model: Model the request was sent to.
+        response: API response (or final streamed message) with ``.usage``.
+        started: ``time.monotonic()`` taken just before the request.
+
+    No-op outside a run or when ``usage.input_tokens`` isn't an int
+    (e.g. mocked responses).
+    """
+    ledger = _current_ledger.get()
+    if ledger is None:
+        return
+    usage = getattr(response, "usage", None)
+    if not isinstance(getattr(usage, "input_tokens", None), int):
+        return
+    ledger.add(UsageRecord(
+        stage=stage,
+        model=model,
+        input_tokens=usage.input_tokens,
+        output_tokens=_int_attr(usage, "output_tokens"),
+        cache_creation_input_tokens=_int_attr(usage, "cache_creation_input_tokens"),
+        cache_read_input_tokens=_int_attr(usage, "cache_read_input_tokens"),
+        latency_s=round(time.monotonic() - started, 3),
+    ))
+
+
+def save_usage(summary: UsageSummary, query: str, mode: str, meta_dir: Path) -> Path:
+    """Write a run's usage summary as JSON to meta_dir.
+
+    Returns:
+        Path to the written file.
+
+    Raises:
+        StateError: If the file cannot be written.
+    """
+    timestamp = time.time()
+    path = meta_dir / f"{USAGE_FILE_PREFIX}{int(timestamp * 1000)}.json"
+    data = {"timestamp": timestamp, "query": query, "mode": mode, **summary.to_dict()}
+    atomic_write(path, json.dumps(data, indent=2))
+    index_run(path, data)
+    logger.info("Saved usage to %s", path)
+    return path
+
+
+def load_usage_history(meta_dir: Path, limit: int = 5) -> list[dict]:
+    """Load the most recent saved usage summaries, newest first.
+
+    Read from the run catalog (see catalog.py). Unreadable or malformed
+    files are skipped.
+    """
+    if not meta_dir.is_dir():
+        return []
+    return recent_runs(meta_dir, limit)
+
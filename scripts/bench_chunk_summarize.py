@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Benchmark: sequential vs parallel vs single-call chunk summarization in deep mode.
+
+Replays a deep-mode summarization workload (pass-1 sources, up to 5 chunks
+each) against a simulated Anthropic client with configurable latency, and
+reports per-source latency and total wall time for each chunk mode.
+No API credits are spent.
+
+Usage:
+    python3 scripts/bench_chunk_summarize.py
+    python3 scripts/bench_chunk_summarize.py --sources 24 --latency 2.5 --jitter 0.5
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from research_agent.extract import ExtractedContent
+from research_agent.modes import ResearchMode
+from research_agent.summarize import (
+    BATCH_SIZE,
+    CHUNK_SIZE,
+    MAX_CONCURRENT_CHUNKS,
+    summarize_content,
+)
+from research_agent.api_helpers import process_in_batches
+
+DEEP_MAX_CHUNKS = 5  # Matches agent._research_deep
+
+
+class SimulatedClient:
+    """Stand-in for AsyncAnthropic with a fixed latency distribution."""
+
+    def __init__(self, latency: float, jitter: float, seed: int) -> None:
+        self._latency = latency
+        self._jitter = jitter
+        self._rng = random.Random(seed)
+        self.calls = 0
+        self.messages = SimpleNamespace(create=self._create)
+
+    async def _create(self, **kwargs):
+        self.calls += 1
+        delay = max(0.01, self._latency + self._rng.uniform(-self._jitter, self._jitter))
+        await asyncio.sleep(delay)
+        text = "FACTS: Simulated. KEY EVIDENCE: None found. PERSPECTIVE: N/A"
+        n_sections = kwargs["messages"][0]["content"].count("<section index=")
+        if n_sections:
+            text = "\n".join(
+                f'<section_summary index="{i}">{text}</section_summary>'
+                for i in range(1, n_sections + 1)
+            )
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+def build_workload(num_sources: int, seed: int) -> list[ExtractedContent]:
+    """Build pages of 1-5 chunks with markdown headings, like Tavily raw_content."""
+    rng = random.Random(seed)
+    contents = []
+    for i in range(num_sources):
+        n_chunks = rng.randint(1, DEEP_MAX_CHUNKS)
+        sections = []
+        for j in range(n_chunks):
+            body = ("Finding sentence with some detail. " * (CHUNK_SIZE // 40)).strip()
+            sections.append(f"## Section {j + 1}\n\n{body}")
+        contents.append(ExtractedContent(
+            url=f"https://source-{i}.example.com/page",
+            title=f"Source {i}",
+            text="\n\n".join(sections),
+        ))
+    return contents
+
+
+async def run_mode(
+    contents: list[ExtractedContent],
+    chunk_mode: str,
+    stitch: bool,
+    latency: float,
+    jitter: float,
+    seed: int,
+) -> dict:
+    """Run summarize_content over the workload the way summarize_all does."""
+    client = SimulatedClient(latency, jitter, seed)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHUNKS)
+    rate_limit_hit = asyncio.Event()
+    per_source: list[float] = []
+
+    async def _process(content: ExtractedContent):
+        start = time.monotonic()
+        result = await summarize_content(
+            client, content, structured=True, max_chunks=DEEP_MAX_CHUNKS,
+            semaphore=semaphore, rate_limit_event=rate_limit_hit,
+            chunk_mode=chunk_mode, stitch=stitch,
+        )
+        per_source.append(time.monotonic() - start)
+        return result
+
+    start = time.monotonic()
+    await process_in_batches(
+        contents, _process, batch_size=BATCH_SIZE, rate_limit_event=rate_limit_hit,
+    )
+    total = time.monotonic() - start
+
+    per_source.sort()
+    return {
+        "total": total,
+        "p50": statistics.median(per_source),
+        "p95": per_source[int(0.95 * (len(per_source) - 1))],
+        "calls": client.calls,
+    }
+
+
+def main() -> int:
+    deep = ResearchMode.deep()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sources", type=int, default=deep.pass1_sources)
+    parser.add_argument("--latency", type=float, default=1.5, help="Mean seconds per call")
+    parser.add_argument("--jitter", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    contents = build_workload(args.sources, args.seed)
+    total_chunks = sum(
+        min(DEEP_MAX_CHUNKS, c.text.count("## ")) for c in contents
+    )
+    print(f"Deep-mode workload: {len(contents)} sources, ~{total_chunks} chunks, "
+          f"latency {args.latency}s ± {args.jitter}s, "
+          f"{MAX_CONCURRENT_CHUNKS} concurrent calls\n")
+    print(f"{'mode':<20} {'total':>8} {'src p50':>9} {'src p95':>9} {'calls':>7}")
+
+    for label, chunk_mode, stitch in (
+        ("sequential", "sequential", False),
+        ("parallel", "parallel", False),
+        ("parallel+stitch", "parallel", True),
+        ("single_call", "single_call", False),
+    ):
+        r = asyncio.run(run_mode(
+            contents, chunk_mode, stitch, args.latency, args.jitter, args.seed,
+        ))
+        print(f"{label:<20} {r['total']:>7.1f}s {r['p50']:>8.1f}s {r['p95']:>8.1f}s {r['calls']:>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Calibration benchmark: local token estimators vs real token counts.
+
+Splits saved reports (reports/*.md) into summarizer-sized chunks, then
+compares the old 4-chars-per-token estimate and the heuristic tokenizer
+against the API's count_tokens endpoint. Reports mean absolute error,
+worst-case error, the fitted calibration scale, and estimator throughput
+(cold vs memoized).
+
+count_tokens is free but needs ANTHROPIC_API_KEY. With --offline, only
+the estimators are compared against each other and timed.
+
+Usage:
+    python3 scripts/calibrate_tokenizer.py
+    python3 scripts/calibrate_tokenizer.py --offline --limit 200
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from research_agent.modes import DEFAULT_MODEL
+from research_agent.summarize import CHUNK_SIZE, _chunk_text
+from research_agent.token_budget import (
+    MESSAGE_OVERHEAD_TOKENS,
+    CharRatioTokenizer,
+    HeuristicTokenizer,
+)
+
+REPORTS_DIR = Path(__file__).resolve().parent.parent / "reports"
+
+
+def load_samples(limit: int) -> list[str]:
+    """Cut every saved report into CHUNK_SIZE pieces (how summarize sees pages)."""
+    samples: list[str] = []
+    for path in sorted(REPORTS_DIR.glob("*.md")):
+        text = path.read_text(encoding="utf-8", errors="replace")
+        samples.extend(c for c in _chunk_text(text, max_chunks=10_000) if c.strip())
+    return samples[:limit]
+
+
+def actual_counts(samples: list[str], model: str) -> list[int]:
+    """Real input-token counts from the count_tokens endpoint, minus framing."""
+    from anthropic import Anthropic
+
+    client = Anthropic()
+    counts = []
+    for text in samples:
+        result = client.messages.count_tokens(
+            model=model, messages=[{"role": "user", "content": text}],
+        )
+        counts.append(max(1, result.input_tokens - MESSAGE_OVERHEAD_TOKENS))
+    return counts
+
+
+def error_stats(estimates: list[int], actual: list[int]) -> tuple[float, float]:
+    """Mean and max absolute relative error (percent)."""
+    errors = [abs(e - a) / a * 100 for e, a in zip(estimates, actual)]
+    return statistics.mean(errors), max(errors)
+
+
+def time_estimator(fn, samples: list[str], repeat: int = 3) -> float:
+    """Microseconds per sample, best of `repeat`."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in samples:
+            fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best / len(samples) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limit", type=int, default=300, help="Max chunks to sample")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--offline", action="store_true", help="Skip count_tokens API")
+    args = parser.parse_args()
+
+    samples = load_samples(args.limit)
+    if not samples:
+        print(f"No reports found in {REPORTS_DIR}")
+        return 1
+    print(f"{len(samples)} chunks (~{CHUNK_SIZE} chars) from {REPORTS_DIR}\n")
+
+    char_ratio = CharRatioTokenizer()
+    heuristic = HeuristicTokenizer()
+    char_est = [char_ratio.count(t) for t in samples]
+    heur_est = [heuristic.count(t) for t in samples]
+
+    if not args.offline and not os.environ.get("ANTHROPIC_API_KEY"):
+        print("ANTHROPIC_API_KEY not set — running offline\n")
+        args.offline = True
+
+    if args.offline:
+        ratios = [h / c for h, c in zip(heur_est, char_est)]
+        print(f"heuristic / char_ratio: mean {statistics.mean(ratios):.2f}, "
+              f"min {min(ratios):.2f}, max {max(ratios):.2f}")
+    else:
+        actual = actual_counts(samples, args.model)
+        for text, tokens in zip(samples, actual):
+            heuristic.calibrate(text, tokens + MESSAGE_OVERHEAD_TOKENS)
+        calibrated = [heuristic.count(t) for t in samples]
+        print(f"{'estimator':<24} {'mean err':>9} {'max err':>9}")
+        for label, est in (
+            ("char_ratio (len // 4)", char_est),
+            ("heuristic", heur_est),
+            ("heuristic (calibrated)", calibrated),
+        ):
+            mean_err, max_err = error_stats(est, actual)
+            print(f"{label:<24} {mean_err:>8.1f}% {max_err:>8.1f}%")
+        print(f"\nfitted scale: {heuristic.scale:.3f} ({heuristic.samples} samples)")
+
+    cold = HeuristicTokenizer(memo_size=0)
+    warm = HeuristicTokenizer()
+    for text in samples:
+        warm.estimate(text)
+    print(f"\nthroughput: char_ratio {time_estimator(char_ratio.count, samples):.1f}µs, "
+          f"heuristic cold {time_estimator(cold.estimate, samples):.1f}µs, "
+          f"memoized {time_estimator(warm.estimate, samples):.1f}µs per chunk")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
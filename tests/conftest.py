@@ -15,6 +15,24 @@ from research_agent.relevance import SourceScore, RelevanceEvaluation
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(autouse=True)
+def isolated_report_index(tmp_path, monkeypatch):
+    """Keep saved reports, their catalog and run metadata out of the real reports/.
+
+    Tests that save reports would otherwise index them, and a later
+    run_research_async() test could be served one from cache. Agent runs
+    would also add usage, critiques and traces to the real history. The
+    catalog lives under the reports and meta dirs, so it follows them.
+    """
+    reports_dir = tmp_path / "isolated_reports"
+    meta_dir = reports_dir / "meta"
+    monkeypatch.setattr("research_agent.report_store.REPORTS_DIR", reports_dir)
+    monkeypatch.setattr("research_agent.report_store.META_DIR", meta_dir)
+    monkeypatch.setattr("research_agent.report_index.META_DIR", meta_dir)
+    monkeypatch.setattr("research_agent.agent.META_DIR", meta_dir)
+    return meta_dir
+
+
 @pytest.fixture
 def sample_html_simple():
     """Basic HTML page with article content."""
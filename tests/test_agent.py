@@ -1,5 +1,7 @@
 """Integration tests for research_agent.agent module."""
 
+import asyncio
+import dataclasses
 from pathlib import Path
 
 import pytest
@@ -16,10 +18,13 @@ from research_agent.relevance import RelevanceEvaluation, SourceScore
 from research_agent.context_result import ContextResult
 from research_agent.schema import Gap, GapStatus, SchemaResult
 from research_agent.cycle_config import CycleConfig
-from research_agent.errors import StateError
 from research_agent.coverage import CoverageGap
 from research_agent.iterate import QueryGenerationResult
 from research_agent.errors import IterationError
+from research_agent.token_budget import count_tokens
+from research_agent.results import RefreshOutcome, ResearchResult, StoredSource
+from research_agent.batch import BatchJobResult
+from research_agent.gap_cycle import GapCycleResult, GapJobResult
 
 
 class TestResearchAgentQuickMode:
@@ -69,12 +74,12 @@ class TestResearchAgentQuickMode:
     ):
         """Quick mode should complete the full research pipeline."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_report") as mock_synthesize, \
+             patch("research_agent.agent.synthesize_report_async") as mock_synthesize, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
 
             # Configure mocks
@@ -107,12 +112,12 @@ class TestResearchAgentQuickMode:
     async def test_research_quick_mode_uses_correct_source_count(self, mock_search_results):
         """Quick mode should use pass1=4, pass2=2 sources (increased for relevance filtering)."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_report") as mock_synthesize, \
+             patch("research_agent.agent.synthesize_report_async") as mock_synthesize, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
 
             mock_search.return_value = mock_search_results[:2]
@@ -150,12 +155,12 @@ class TestResearchAgentQuickMode:
     async def test_research_quick_mode_deduplicates_urls(self, mock_search_results):
         """Same URL from both passes should appear only once."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_report") as mock_synthesize, \
+             patch("research_agent.agent.synthesize_report_async") as mock_synthesize, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
 
             # Pass 1 returns results 1-2
@@ -199,12 +204,12 @@ class TestResearchAgentQuickMode:
         from research_agent.errors import SearchError
 
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_report") as mock_synthesize, \
+             patch("research_agent.agent.synthesize_report_async") as mock_synthesize, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
 
             # Pass 1 succeeds, Pass 2 fails
@@ -247,13 +252,13 @@ class TestResearchAgentStandardMode:
     async def test_research_standard_mode_completes_pipeline(self):
         """Standard mode should complete with pass1=4, pass2=3."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_draft") as mock_draft, \
-             patch("research_agent.agent.synthesize_final") as mock_final, \
+             patch("research_agent.agent.synthesize_draft_async") as mock_draft, \
+             patch("research_agent.agent.synthesize_final_async") as mock_final, \
              patch("research_agent.agent.run_skeptic_combined") as mock_skeptic, \
              patch("research_agent.agent.load_full_context") as mock_full_ctx, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
@@ -294,13 +299,13 @@ class TestResearchAgentStandardMode:
     async def test_research_standard_mode_refines_query_from_snippets(self):
         """Standard mode should refine using snippets (before fetch)."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_draft") as mock_draft, \
-             patch("research_agent.agent.synthesize_final") as mock_final, \
+             patch("research_agent.agent.synthesize_draft_async") as mock_draft, \
+             patch("research_agent.agent.synthesize_final_async") as mock_final, \
              patch("research_agent.agent.run_skeptic_combined") as mock_skeptic, \
              patch("research_agent.agent.load_full_context") as mock_full_ctx, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
@@ -341,6 +346,110 @@ class TestResearchAgentStandardMode:
             snippets_arg = refine_call[0][2]  # Third positional arg
             assert any("Snippet" in s for s in snippets_arg)
 
+    def _patch_pipeline_after_fetch(self):
+        """Stub every stage after fetching so the pipeline runs to a report."""
+        summaries = [Summary(url="https://ex1.com", title="T", summary="S")]
+        evaluation = RelevanceEvaluation(
+            decision="full_report", decision_rationale="All passed",
+            surviving_sources=tuple(summaries), dropped_sources=(),
+            total_scored=1, total_survived=1, refined_query="refined query",
+        )
+        return [
+            patch("research_agent.agent.extract_all", return_value=[
+                ExtractedContent(url="https://ex1.com", title="T", text="C " * 100),
+            ]),
+            patch("research_agent.agent.summarize_all", return_value=summaries),
+            patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock, return_value=evaluation),
+            patch("research_agent.agent.synthesize_draft_async", return_value="## Draft"),
+            patch("research_agent.agent.synthesize_final_async", return_value="Report"),
+            patch("research_agent.agent.run_skeptic_combined", return_value=MagicMock(
+                lens="combined", checklist="", critical_count=0, concern_count=0,
+            )),
+            patch("research_agent.agent.load_full_context", return_value=ContextResult.loaded("ctx")),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_pass1_search_overlaps_decomposition(self):
+        """The pass-1 search starts without waiting for query decomposition."""
+        import threading
+        from contextlib import ExitStack
+        from research_agent.decompose import DecompositionResult
+
+        searched = threading.Event()
+        overlapped = []
+
+        def fake_search(query, max_results):
+            searched.set()
+            return [SearchResult(title="R", url=f"https://ex{i}.com", snippet="S") for i in range(4)]
+
+        async def fake_decompose(*args, **kwargs):
+            overlapped.append(await asyncio.to_thread(searched.wait, 2))
+            return DecompositionResult(sub_queries=(), is_complex=False, reasoning="")
+
+        with ExitStack() as stack:
+            for p in self._patch_pipeline_after_fetch():
+                stack.enter_context(p)
+            stack.enter_context(patch("research_agent.agent.search", side_effect=fake_search))
+            stack.enter_context(patch("research_agent.agent.decompose_query_async", side_effect=fake_decompose))
+            stack.enter_context(patch("research_agent.agent.refine_query_async", return_value="refined query"))
+            stack.enter_context(patch("research_agent.agent.fetch_urls", return_value=[
+                FetchedPage(url="https://ex1.com", html="<p>x</p>", status_code=200),
+            ]))
+
+            agent = ResearchAgent(
+                api_key="test-key", mode=ResearchMode.standard(),
+                skip_critique=True, skip_iteration=True,
+            )
+            await agent.research_async("test query about wedding venues")
+
+        assert overlapped == [True]
+
+    @pytest.mark.asyncio
+    async def test_pass1_pages_fetch_during_refinement(self):
+        """Pass-1 pages are fetched while pass 2 searches, and not fetched twice."""
+        import threading
+        from contextlib import ExitStack
+        from research_agent.decompose import DecompositionResult
+
+        fetch_started = threading.Event()
+        fetch_calls = []
+        pass2_saw_fetch = []
+        pass1 = [SearchResult(title="R", url=f"https://ex{i}.com", snippet="S") for i in range(4)]
+        pass2 = [SearchResult(title="R", url=f"https://new{i}.com", snippet="S") for i in range(2)]
+
+        searches = []
+
+        def fake_search(query, max_results):
+            searches.append(query)
+            if len(searches) == 1:
+                return pass1
+            pass2_saw_fetch.append(fetch_started.wait(2))
+            return pass2
+
+        async def fake_fetch(urls):
+            fetch_calls.append(list(urls))
+            fetch_started.set()
+            return [FetchedPage(url=urls[0], html="<p>x</p>", status_code=200)]
+
+        with ExitStack() as stack:
+            for p in self._patch_pipeline_after_fetch():
+                stack.enter_context(p)
+            stack.enter_context(patch("research_agent.agent.search", side_effect=fake_search))
+            stack.enter_context(patch("research_agent.agent.decompose_query_async", return_value=DecompositionResult(
+                sub_queries=(), is_complex=False, reasoning="",
+            )))
+            stack.enter_context(patch("research_agent.agent.refine_query_async", return_value="refined query"))
+            stack.enter_context(patch("research_agent.agent.fetch_urls", side_effect=fake_fetch))
+
+            agent = ResearchAgent(
+                api_key="test-key", mode=ResearchMode.standard(),
+                skip_critique=True, skip_iteration=True, no_context=True,
+            )
+            await agent.research_async("test query about wedding venues")
+
+        assert pass2_saw_fetch == [True]
+        assert fetch_calls == [[r.url for r in pass1], [r.url for r in pass2]]
+
     def test_research_standard_mode_auto_saves_enabled(self):
         """Standard mode should have auto_save=True."""
         mode = ResearchMode.standard()
@@ -354,13 +463,13 @@ class TestResearchAgentDeepMode:
     async def test_research_deep_mode_completes_pipeline(self):
         """Deep mode should complete with fetch between passes."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_draft") as mock_draft, \
-             patch("research_agent.agent.synthesize_final") as mock_final, \
+             patch("research_agent.agent.synthesize_draft_async") as mock_draft, \
+             patch("research_agent.agent.synthesize_final_async") as mock_final, \
              patch("research_agent.agent.run_deep_skeptic_pass") as mock_skeptic, \
              patch("research_agent.agent.load_full_context") as mock_full_ctx, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
@@ -401,13 +510,13 @@ class TestResearchAgentDeepMode:
     async def test_research_deep_mode_refines_query_from_summaries(self):
         """Deep mode should refine using summaries (after fetch)."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_draft") as mock_draft, \
-             patch("research_agent.agent.synthesize_final") as mock_final, \
+             patch("research_agent.agent.synthesize_draft_async") as mock_draft, \
+             patch("research_agent.agent.synthesize_final_async") as mock_final, \
              patch("research_agent.agent.run_deep_skeptic_pass") as mock_skeptic, \
              patch("research_agent.agent.load_full_context") as mock_full_ctx, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
@@ -453,13 +562,13 @@ class TestResearchAgentDeepMode:
     async def test_research_deep_mode_fetches_new_urls_in_pass2(self):
         """Deep mode should fetch new URLs in second pass."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_draft") as mock_draft, \
-             patch("research_agent.agent.synthesize_final") as mock_final, \
+             patch("research_agent.agent.synthesize_draft_async") as mock_draft, \
+             patch("research_agent.agent.synthesize_final_async") as mock_final, \
              patch("research_agent.agent.run_deep_skeptic_pass") as mock_skeptic, \
              patch("research_agent.agent.load_full_context") as mock_full_ctx, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
@@ -505,6 +614,104 @@ class TestResearchAgentDeepMode:
             # fetch_urls should be called twice (once for each pass)
             assert mock_fetch.call_count == 2
 
+    async def _run_speculative_deep(self, summary_refinement: str):
+        """Deep run whose snippet-based refinement is "venue pricing trends 2026"."""
+        from contextlib import ExitStack
+        from research_agent.decompose import DecompositionResult
+
+        snippet = "Snippet text long enough to pass the fifty character quality gate"
+        pass1 = [SearchResult(title="R", url=f"https://pass1-{i}.com", snippet=snippet) for i in range(4)]
+        speculative = [SearchResult(title="R", url=f"https://spec-{i}.com", snippet=snippet) for i in range(2)]
+        serial = [SearchResult(title="R", url=f"https://serial-{i}.com", snippet=snippet) for i in range(2)]
+        results_by_query = {
+            "test query": pass1,
+            "venue pricing trends 2026": speculative,
+            summary_refinement: serial,
+        }
+        searches, fetches = [], []
+
+        def fake_search(query, max_results):
+            searches.append(query)
+            return results_by_query[query]
+
+        async def fake_refine(client, query, texts, **kwargs):
+            return summary_refinement if texts[0].startswith("Deep summary") else "venue pricing trends 2026"
+
+        async def fake_fetch(urls):
+            fetches.append(list(urls))
+            return [FetchedPage(url=urls[0], html="<p>x</p>", status_code=200)]
+
+        summaries = [Summary(
+            url="https://pass1-0.com", title="T",
+            summary="Deep summary content with enough detail to exceed the hundred character quality gate threshold for deep mode",
+        )]
+        evaluation = RelevanceEvaluation(
+            decision="full_report", decision_rationale="All passed",
+            surviving_sources=tuple(summaries), dropped_sources=(),
+            total_scored=1, total_survived=1, refined_query="refined",
+        )
+        with ExitStack() as stack:
+            for target, kwargs in {
+                "search": dict(side_effect=fake_search),
+                "refine_query_async": dict(side_effect=fake_refine),
+                "fetch_urls": dict(side_effect=fake_fetch),
+                "decompose_query_async": dict(return_value=DecompositionResult(
+                    sub_queries=(), is_complex=False, reasoning="",
+                )),
+                "extract_all": dict(return_value=[ExtractedContent(url="https://pass1-0.com", title="T", text="C " * 100)]),
+                "summarize_all": dict(return_value=summaries),
+                "evaluate_sources": dict(new_callable=AsyncMock, return_value=evaluation),
+                "synthesize_draft_async": dict(return_value="## Draft"),
+                "synthesize_final_async": dict(return_value="Report"),
+                "run_deep_skeptic_pass": dict(return_value=[]),
+            }.items():
+                stack.enter_context(patch(f"research_agent.agent.{target}", **kwargs))
+
+            agent = ResearchAgent(
+                api_key="test-key", mode=ResearchMode.deep(),
+                skip_critique=True, skip_iteration=True, no_context=True,
+            )
+            await agent.research_async("test query")
+        return agent, searches, fetches
+
+    @pytest.mark.asyncio
+    async def test_speculative_pass2_reused_when_refinements_agree(self):
+        """The speculative search and prefetch stand in for pass 2."""
+        agent, searches, fetches = await self._run_speculative_deep("venue pricing trends for 2026")
+
+        assert searches == ["test query", "venue pricing trends 2026"]
+        # Pass-2 pages were fetched once, by the speculative prefetch
+        assert sorted(fetches) == sorted([
+            [f"https://pass1-{i}.com" for i in range(4)],
+            ["https://spec-0.com", "https://spec-1.com"],
+        ])
+        outcome = agent.last_speculation
+        assert outcome.reused is True
+        assert outcome.speculative_query == "venue pricing trends 2026"
+        assert outcome.saved_s >= 0.0
+        assert "venue pricing trends 2026" in agent.source_counts
+
+    @pytest.mark.asyncio
+    async def test_speculative_pass2_discarded_when_refinements_differ(self):
+        """A materially different summary-based query runs its own search."""
+        agent, searches, fetches = await self._run_speculative_deep("catering contract cancellation clauses")
+
+        assert searches == ["test query", "venue pricing trends 2026", "catering contract cancellation clauses"]
+        assert ["https://serial-0.com", "https://serial-1.com"] in fetches
+        outcome = agent.last_speculation
+        assert outcome.reused is False
+        assert outcome.refined_query == "catering contract cancellation clauses"
+        assert outcome.saved_s == 0.0
+        assert "venue pricing trends 2026" not in agent.source_counts
+
+    @pytest.mark.asyncio
+    async def test_speculative_pass2_discarded_when_it_adds_terms(self):
+        """A speculative query containing the refined one plus more terms is not reused."""
+        agent, searches, _ = await self._run_speculative_deep("venue pricing")
+
+        assert searches == ["test query", "venue pricing trends 2026", "venue pricing"]
+        assert agent.last_speculation.reused is False
+
 
 class TestResearchAgentErrorHandling:
     """Tests for ResearchAgent error handling."""
@@ -527,7 +734,7 @@ class TestResearchAgentErrorHandling:
     async def test_research_raises_error_when_no_pages_fetched(self):
         """Empty fetch results should raise ResearchError."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
 
@@ -546,7 +753,7 @@ class TestResearchAgentErrorHandling:
     async def test_research_raises_error_when_no_content_extracted(self):
         """Empty extraction results should raise ResearchError."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.cascade_recover", new_callable=AsyncMock, return_value=[]) as mock_cascade, \
@@ -636,13 +843,13 @@ class TestResearchAgentRelevanceGate:
     async def test_relevance_gate_full_report_when_all_sources_pass(self, base_mocks):
         """All sources passing should produce full report."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_draft") as mock_draft, \
-             patch("research_agent.agent.synthesize_final") as mock_final, \
+             patch("research_agent.agent.synthesize_draft_async") as mock_draft, \
+             patch("research_agent.agent.synthesize_final_async") as mock_final, \
              patch("research_agent.agent.run_skeptic_combined") as mock_skeptic, \
              patch("research_agent.agent.load_full_context") as mock_full_ctx, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
@@ -680,13 +887,13 @@ class TestResearchAgentRelevanceGate:
     async def test_relevance_gate_insufficient_data_when_no_sources_pass(self, base_mocks):
         """No passing sources should trigger insufficient data response."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
              patch("research_agent.agent.generate_insufficient_data_response", new_callable=AsyncMock) as mock_insufficient, \
-             patch("research_agent.agent.synthesize_report") as mock_synthesize, \
+             patch("research_agent.agent.synthesize_report_async") as mock_synthesize, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
 
             mock_search.return_value = base_mocks["search_results"]
@@ -723,13 +930,13 @@ class TestResearchAgentRelevanceGate:
     async def test_relevance_gate_short_report_with_mixed_scores(self, base_mocks):
         """Mixed scores with some passing should produce short report."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_draft") as mock_draft, \
-             patch("research_agent.agent.synthesize_final") as mock_final, \
+             patch("research_agent.agent.synthesize_draft_async") as mock_draft, \
+             patch("research_agent.agent.synthesize_final_async") as mock_final, \
              patch("research_agent.agent.run_skeptic_combined") as mock_skeptic, \
              patch("research_agent.agent.load_full_context") as mock_full_ctx, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
@@ -773,13 +980,13 @@ class TestResearchAgentRelevanceGate:
     async def test_relevance_gate_quick_mode_all_fail_triggers_insufficient(self, base_mocks):
         """Quick mode: all 3 sources failing should trigger insufficient data."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
              patch("research_agent.agent.generate_insufficient_data_response", new_callable=AsyncMock) as mock_insufficient, \
-             patch("research_agent.agent.synthesize_report") as mock_synthesize, \
+             patch("research_agent.agent.synthesize_report_async") as mock_synthesize, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
 
             quick_summaries = base_mocks["summaries"][:3]
@@ -814,13 +1021,13 @@ class TestResearchAgentRelevanceGate:
     async def test_relevance_gate_deep_mode_completes_after_both_passes(self, base_mocks):
         """Deep mode: relevance gate should run after both search passes complete."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_draft") as mock_draft, \
-             patch("research_agent.agent.synthesize_final") as mock_final, \
+             patch("research_agent.agent.synthesize_draft_async") as mock_draft, \
+             patch("research_agent.agent.synthesize_final_async") as mock_final, \
              patch("research_agent.agent.run_deep_skeptic_pass") as mock_skeptic, \
              patch("research_agent.agent.load_full_context") as mock_full_ctx, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
@@ -828,6 +1035,8 @@ class TestResearchAgentRelevanceGate:
             # Pass 1 and Pass 2 results
             mock_search.side_effect = [
                 base_mocks["search_results"],  # Pass 1
+                # Speculative pass 2, discarded: the short summaries refine differently
+                [SearchResult(title="Spec", url="https://spec.com", snippet="Spec")],
                 [SearchResult(title="New", url="https://new.com", snippet="New")],  # Pass 2
             ]
             mock_refine.return_value = "refined query"
@@ -863,13 +1072,13 @@ class TestResearchAgentRelevanceGate:
     async def test_relevance_gate_passes_refined_query(self, base_mocks):
         """Relevance gate should receive the refined query."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_draft") as mock_draft, \
-             patch("research_agent.agent.synthesize_final") as mock_final, \
+             patch("research_agent.agent.synthesize_draft_async") as mock_draft, \
+             patch("research_agent.agent.synthesize_final_async") as mock_final, \
              patch("research_agent.agent.run_skeptic_combined") as mock_skeptic, \
              patch("research_agent.agent.load_full_context") as mock_full_ctx, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
@@ -909,12 +1118,12 @@ class TestResearchAgentContext:
     async def test_agent_loads_context_and_passes_to_synthesize(self):
         """Agent should load research context and pass it to synthesize_report."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_report") as mock_synthesize, \
+             patch("research_agent.agent.synthesize_report_async") as mock_synthesize, \
              patch("research_agent.agent.load_full_context") as mock_load_context, \
              patch("research_agent.agent.CONTEXTS_DIR") as mock_ctx_dir, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
@@ -958,12 +1167,12 @@ class TestResearchAgentContext:
     async def test_agent_works_when_context_missing(self):
         """Agent should work normally when no research context file exists."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_report") as mock_synthesize, \
+             patch("research_agent.agent.synthesize_report_async") as mock_synthesize, \
              patch("research_agent.agent.load_full_context") as mock_load_context, \
              patch("research_agent.agent.CONTEXTS_DIR") as mock_ctx_dir, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
@@ -1012,7 +1221,7 @@ class TestResearchAgentAutoDetect:
             "search": patch("research_agent.agent.search", return_value=[
                 SearchResult(title="R", url="https://ex.com", snippet="S"),
             ]),
-            "refine": patch("research_agent.agent.refine_query", return_value="q"),
+            "refine": patch("research_agent.agent.refine_query_async", return_value="q"),
             "fetch": patch("research_agent.agent.fetch_urls", return_value=[
                 FetchedPage(url="https://ex.com", html="<p>" + "x" * 200 + "</p>", status_code=200),
             ]),
@@ -1021,7 +1230,7 @@ class TestResearchAgentAutoDetect:
             ]),
             "summarize": patch("research_agent.agent.summarize_all"),
             "evaluate": patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock),
-            "synthesize": patch("research_agent.agent.synthesize_report", return_value="Report"),
+            "synthesize": patch("research_agent.agent.synthesize_report_async", return_value="Report"),
             "sleep": patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock),
         }
 
@@ -1032,7 +1241,7 @@ class TestResearchAgentAutoDetect:
         with patches["search"], patches["refine"], patches["fetch"], \
              patches["extract"], patches["synthesize"], patches["sleep"], \
              patch("research_agent.agent.CONTEXTS_DIR") as mock_ctx_dir, \
-             patch("research_agent.agent.auto_detect_context") as mock_detect, \
+             patch("research_agent.agent.auto_detect_context_async") as mock_detect, \
              patch("research_agent.agent.load_full_context") as mock_load_ctx, \
              patches["summarize"] as mock_sum, \
              patches["evaluate"] as mock_eval:
@@ -1069,7 +1278,7 @@ class TestResearchAgentAutoDetect:
              patches["extract"], patches["synthesize"] as mock_synth, \
              patches["sleep"], \
              patch("research_agent.agent.CONTEXTS_DIR") as mock_ctx_dir, \
-             patch("research_agent.agent.auto_detect_context") as mock_detect, \
+             patch("research_agent.agent.auto_detect_context_async") as mock_detect, \
              patch("research_agent.agent.load_full_context") as mock_load_ctx, \
              patches["summarize"] as mock_sum, \
              patches["evaluate"] as mock_eval:
@@ -1102,7 +1311,7 @@ class TestResearchAgentAutoDetect:
         with patches["search"], patches["refine"], patches["fetch"], \
              patches["extract"], patches["synthesize"], patches["sleep"], \
              patch("research_agent.agent.CONTEXTS_DIR") as mock_ctx_dir, \
-             patch("research_agent.agent.auto_detect_context") as mock_detect, \
+             patch("research_agent.agent.auto_detect_context_async") as mock_detect, \
              patch("research_agent.agent.load_full_context") as mock_load_ctx, \
              patches["summarize"] as mock_sum, \
              patches["evaluate"] as mock_eval:
@@ -1133,7 +1342,7 @@ class TestResearchAgentAutoDetect:
         with patches["search"], patches["refine"], patches["fetch"], \
              patches["extract"], patches["synthesize"], patches["sleep"], \
              patch("research_agent.agent.CONTEXTS_DIR") as mock_ctx_dir, \
-             patch("research_agent.agent.auto_detect_context") as mock_detect, \
+             patch("research_agent.agent.auto_detect_context_async") as mock_detect, \
              patch("research_agent.agent.load_full_context") as mock_load_ctx, \
              patches["summarize"] as mock_sum, \
              patches["evaluate"] as mock_eval:
@@ -1164,13 +1373,13 @@ class TestResearchAgentStructuredSummaries:
     async def test_deep_mode_passes_structured_true(self):
         """Deep mode should pass structured=True and max_chunks=5 to summarize_all."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_draft") as mock_draft, \
-             patch("research_agent.agent.synthesize_final") as mock_final, \
+             patch("research_agent.agent.synthesize_draft_async") as mock_draft, \
+             patch("research_agent.agent.synthesize_final_async") as mock_final, \
              patch("research_agent.agent.run_deep_skeptic_pass") as mock_skeptic, \
              patch("research_agent.agent.load_full_context") as mock_full_ctx, \
              patch("research_agent.agent.load_full_context", return_value=ContextResult.not_configured()), \
@@ -1215,13 +1424,13 @@ class TestResearchAgentStructuredSummaries:
     async def test_standard_mode_passes_structured_false(self):
         """Standard mode should not pass structured=True to summarize_all."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_draft") as mock_draft, \
-             patch("research_agent.agent.synthesize_final") as mock_final, \
+             patch("research_agent.agent.synthesize_draft_async") as mock_draft, \
+             patch("research_agent.agent.synthesize_final_async") as mock_final, \
              patch("research_agent.agent.run_skeptic_combined") as mock_skeptic, \
              patch("research_agent.agent.load_full_context") as mock_full_ctx, \
              patch("research_agent.agent.load_full_context", return_value=ContextResult.not_configured()), \
@@ -1298,13 +1507,13 @@ class TestResearchAgentGapCheck:
     async def test_pre_research_no_schema_unchanged(self):
         """With no schema_path, pipeline runs normally (backward compat)."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
              patch("research_agent.agent.load_full_context", return_value=ContextResult.not_configured()), \
-             patch("research_agent.agent.synthesize_report") as mock_synth, \
+             patch("research_agent.agent.synthesize_report_async") as mock_synth, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
 
             mock_search.return_value = [
@@ -1350,7 +1559,8 @@ class TestResearchAgentGapCheck:
 
         with patch("research_agent.agent.search") as mock_search, \
              patch("research_agent.agent.load_schema", return_value=schema_result), \
-             patch("research_agent.agent.detect_stale", return_value=[]):
+             patch("research_agent.gap_cycle.run_gap_cycle_async",
+                   new_callable=AsyncMock, return_value=GapCycleResult()):
 
             agent = ResearchAgent(
                 api_key="test-key", mode=ResearchMode.quick(),
@@ -1362,175 +1572,116 @@ class TestResearchAgentGapCheck:
             assert "3 gaps" in result
             mock_search.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_pre_research_stale_gaps_continues(self):
-        """Some stale gaps → pipeline continues with batch selection."""
-        from research_agent.schema import Gap, GapStatus, SchemaResult
-        from dataclasses import replace
-
-        gaps = (
-            Gap(id="gap-1", category="test", status=GapStatus.VERIFIED,
-                priority=3, last_verified="2020-01-01T00:00:00+00:00"),
-            Gap(id="gap-2", category="test", status=GapStatus.VERIFIED,
-                priority=3, last_verified="2099-01-01T00:00:00+00:00"),
+    @staticmethod
+    def _gap_job(gap, decision, report):
+        result = ResearchResult(
+            report=report, query=gap.id, mode="quick", sources_used=1,
+            status=decision, critique=None,
         )
-        schema_result = SchemaResult(gaps=gaps, source="/tmp/schema.yaml")
-        stale_gap = replace(gaps[0], status=GapStatus.STALE)
-
-        with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
-             patch("research_agent.agent.fetch_urls") as mock_fetch, \
-             patch("research_agent.agent.extract_all") as mock_extract, \
-             patch("research_agent.agent.summarize_all") as mock_summarize, \
-             patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.load_full_context", return_value=ContextResult.not_configured()), \
-             patch("research_agent.agent.synthesize_report") as mock_synth, \
-             patch("research_agent.agent.load_schema", return_value=schema_result), \
-             patch("research_agent.agent.detect_stale", return_value=[stale_gap]), \
-             patch("research_agent.agent.select_batch", return_value=(stale_gap,)), \
-             patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
-
-            mock_search.return_value = [
-                SearchResult(title="R", url="https://ex1.com", snippet="S")
-            ]
-            mock_refine.return_value = "test query"
-            mock_fetch.return_value = [
-                FetchedPage(url="https://ex1.com", html="<p>" + "x" * 200 + "</p>", status_code=200)
-            ]
-            mock_extract.return_value = [
-                ExtractedContent(url="https://ex1.com", title="T", text="C " * 100)
-            ]
-            mock_summarize.return_value = [
-                Summary(url="https://ex1.com", title="T", summary="S")
-            ]
-            mock_evaluate.return_value = RelevanceEvaluation(
-                decision="full_report", decision_rationale="ok",
-                surviving_sources=(Summary(url="https://ex1.com", title="T", summary="S"),),
-                dropped_sources=(), total_scored=1, total_survived=1, refined_query=None,
-            )
-            mock_synth.return_value = "Report"
-
-            agent = ResearchAgent(
-                api_key="test-key", mode=ResearchMode.quick(),
-                schema_path="/tmp/schema.yaml",
-            )
-            result = await agent.research_async("test query")
-
-            assert result == "Report"
-            mock_search.assert_called()
+        job = BatchJobResult(query=gap.id, mode="quick", result=result)
+        return GapJobResult(gap=gap, updated=gap, job=job)
 
     @pytest.mark.asyncio
-    async def test_pre_research_unknown_gaps_continues(self):
-        """Unknown gaps → pipeline continues."""
+    async def test_pre_research_stale_gaps_run_gap_cycle(self):
+        """Gaps to research → each is researched by the gap cycle, not the query."""
+        from research_agent.cycle_config import CycleConfig
         from research_agent.schema import Gap, GapStatus, SchemaResult
 
         gaps = (
             Gap(id="gap-1", category="test", status=GapStatus.UNKNOWN, priority=3),
+            Gap(id="gap-2", category="test", status=GapStatus.UNKNOWN, priority=2),
         )
         schema_result = SchemaResult(gaps=gaps, source="/tmp/schema.yaml")
+        cycle = GapCycleResult(
+            gaps=(
+                self._gap_job(gaps[0], "full_report", "# Gap one report"),
+                self._gap_job(gaps[1], "no_new_findings", "# Gap two report"),
+            ),
+            schema_saved=True,
+        )
+        config = CycleConfig(max_gaps_per_run=2)
 
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
-             patch("research_agent.agent.fetch_urls") as mock_fetch, \
-             patch("research_agent.agent.extract_all") as mock_extract, \
-             patch("research_agent.agent.summarize_all") as mock_summarize, \
-             patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
              patch("research_agent.agent.load_full_context", return_value=ContextResult.not_configured()), \
-             patch("research_agent.agent.synthesize_report") as mock_synth, \
              patch("research_agent.agent.load_schema", return_value=schema_result), \
-             patch("research_agent.agent.detect_stale", return_value=[]), \
-             patch("research_agent.agent.select_batch", return_value=gaps), \
-             patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
-
-            mock_search.return_value = [
-                SearchResult(title="R", url="https://ex1.com", snippet="S")
-            ]
-            mock_refine.return_value = "test query"
-            mock_fetch.return_value = [
-                FetchedPage(url="https://ex1.com", html="<p>" + "x" * 200 + "</p>", status_code=200)
-            ]
-            mock_extract.return_value = [
-                ExtractedContent(url="https://ex1.com", title="T", text="C " * 100)
-            ]
-            mock_summarize.return_value = [
-                Summary(url="https://ex1.com", title="T", summary="S")
-            ]
-            mock_evaluate.return_value = RelevanceEvaluation(
-                decision="full_report", decision_rationale="ok",
-                surviving_sources=(Summary(url="https://ex1.com", title="T", summary="S"),),
-                dropped_sources=(), total_scored=1, total_survived=1, refined_query=None,
-            )
-            mock_synth.return_value = "Report"
+             patch("research_agent.gap_cycle.run_gap_cycle_async",
+                   new_callable=AsyncMock, return_value=cycle) as mock_cycle:
 
             agent = ResearchAgent(
-                api_key="test-key", mode=ResearchMode.quick(),
-                schema_path="/tmp/schema.yaml",
+                api_key="test-key", mode=ResearchMode.quick(), no_context=True,
+                cycle_config=config, schema_path="/tmp/schema.yaml",
             )
             result = await agent.research_async("test query")
 
-            assert result == "Report"
-            assert agent._current_research_batch == gaps
-
-    @pytest.mark.asyncio
-    async def test_pre_research_batch_limit_respected(self):
-        """With 10 stale gaps and max_gaps_per_run=3, only 3 selected."""
-        from research_agent.schema import Gap, GapStatus, SchemaResult
-        from research_agent.cycle_config import CycleConfig
-        from dataclasses import replace
-
-        gaps = tuple(
-            Gap(id=f"gap-{i}", category="test", status=GapStatus.VERIFIED,
-                priority=3, last_verified="2020-01-01T00:00:00+00:00")
-            for i in range(10)
+        mock_search.assert_not_called()
+        mock_cycle.assert_awaited_once()
+        args, kwargs = mock_cycle.call_args
+        assert args == (Path("/tmp/schema.yaml"),)
+        assert kwargs["topic"] == "test query"
+        assert kwargs["mode"] == "quick"
+        assert kwargs["context"] == "none"
+        assert kwargs["cycle_config"] is config
+        assert "1 verified, 1 checked" in result
+        assert "## Gap: gap-1 (test) — full_report" in result
+        assert "# Gap one report" in result
+        assert "## Gap: gap-2 (test) — no_new_findings" in result
+
+    @pytest.mark.asyncio
+    async def test_profile_gap_schema_runs_gap_cycle(self, tmp_path, monkeypatch):
+        """A profile's gap_schema is used when no schema_path was given."""
+        from research_agent.context_result import ContextProfile
+        from research_agent.schema import Gap, SchemaResult
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "gaps.yaml").write_text("gaps: []\n")
+        context = ContextResult.loaded(
+            "Context", source=str(tmp_path / "contexts" / "pfe.md"),
+            profile=ContextProfile(gap_schema="gaps.yaml"),
         )
-        schema_result = SchemaResult(gaps=gaps, source="/tmp/schema.yaml")
-        stale_gaps = [replace(g, status=GapStatus.STALE) for g in gaps]
-        batch_of_3 = tuple(stale_gaps[:3])
+        gap = Gap(id="gap-1", category="test")
+        schema_result = SchemaResult(gaps=(gap,), source="gaps.yaml")
+        cycle = GapCycleResult(gaps=(self._gap_job(gap, "full_report", "# Report"),))
 
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
-             patch("research_agent.agent.fetch_urls") as mock_fetch, \
-             patch("research_agent.agent.extract_all") as mock_extract, \
-             patch("research_agent.agent.summarize_all") as mock_summarize, \
-             patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.load_full_context", return_value=ContextResult.not_configured()), \
-             patch("research_agent.agent.synthesize_report") as mock_synth, \
+             patch("research_agent.agent.load_full_context", return_value=context), \
              patch("research_agent.agent.load_schema", return_value=schema_result), \
-             patch("research_agent.agent.detect_stale", return_value=stale_gaps), \
-             patch("research_agent.agent.select_batch", return_value=batch_of_3) as mock_batch, \
-             patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
-
-            mock_search.return_value = [
-                SearchResult(title="R", url="https://ex1.com", snippet="S")
-            ]
-            mock_refine.return_value = "test query"
-            mock_fetch.return_value = [
-                FetchedPage(url="https://ex1.com", html="<p>" + "x" * 200 + "</p>", status_code=200)
-            ]
-            mock_extract.return_value = [
-                ExtractedContent(url="https://ex1.com", title="T", text="C " * 100)
-            ]
-            mock_summarize.return_value = [
-                Summary(url="https://ex1.com", title="T", summary="S")
-            ]
-            mock_evaluate.return_value = RelevanceEvaluation(
-                decision="full_report", decision_rationale="ok",
-                surviving_sources=(Summary(url="https://ex1.com", title="T", summary="S"),),
-                dropped_sources=(), total_scored=1, total_survived=1, refined_query=None,
-            )
-            mock_synth.return_value = "Report"
+             patch("research_agent.gap_cycle.run_gap_cycle_async",
+                   new_callable=AsyncMock, return_value=cycle) as mock_cycle:
 
-            config = CycleConfig(max_gaps_per_run=3)
             agent = ResearchAgent(
                 api_key="test-key", mode=ResearchMode.quick(),
-                cycle_config=config, schema_path="/tmp/schema.yaml",
+                context_path=tmp_path / "contexts" / "pfe.md",
             )
-            await agent.research_async("test query")
+            result = await agent.research_async("test query")
 
-            mock_batch.assert_called_once()
-            _, call_kwargs = mock_batch.call_args
-            assert call_kwargs.get("max_per_run", mock_batch.call_args[0][1]) == 3
-            assert agent._current_research_batch == batch_of_3
+        # The profile's schema is known before the graph starts, so the
+        # pass-1 search is never started for a run the gap cycle takes over
+        mock_search.assert_not_called()
+        assert mock_cycle.call_args.args == ((tmp_path / "gaps.yaml").resolve(),)
+        assert mock_cycle.call_args.kwargs["context"] == "pfe"
+        assert "## Gap: gap-1 (test) — full_report" in result
+
+    def test_may_use_gap_schema(self, tmp_path):
+        """Only a schema, or a context that could carry one, defers the pass-1 search."""
+        contexts = tmp_path / "contexts"
+        contexts.mkdir()
+        (contexts / "plain.md").write_text("Plain context.")
+        (contexts / "gaps.md").write_text("---\ngap_schema: gaps.yaml\n---\nContext.")
+
+        def make(**kwargs):
+            with patch("research_agent.agent.Anthropic"), \
+                 patch("research_agent.agent.AsyncAnthropic"):
+                return ResearchAgent(api_key="test-key", **kwargs)
+
+        with patch("research_agent.agent.CONTEXTS_DIR", contexts):
+            assert make(schema_path="/tmp/schema.yaml")._may_use_gap_schema({})
+            assert make(context_path=contexts / "gaps.md")._may_use_gap_schema({})
+            assert not make(context_path=contexts / "plain.md")._may_use_gap_schema({})
+            assert not make(no_context=True)._may_use_gap_schema({})
+            # Auto-detect could pick the context with a gap_schema
+            assert make()._may_use_gap_schema({})
+            (contexts / "gaps.md").unlink()
+            assert not make()._may_use_gap_schema({})
 
     @pytest.mark.asyncio
     async def test_pre_research_empty_schema_proceeds(self):
@@ -1540,13 +1691,13 @@ class TestResearchAgentGapCheck:
         schema_result = SchemaResult(gaps=(), source="/tmp/schema.yaml")
 
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
              patch("research_agent.agent.load_full_context", return_value=ContextResult.not_configured()), \
-             patch("research_agent.agent.synthesize_report") as mock_synth, \
+             patch("research_agent.agent.synthesize_report_async") as mock_synth, \
              patch("research_agent.agent.load_schema", return_value=schema_result), \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
 
@@ -1580,231 +1731,6 @@ class TestResearchAgentGapCheck:
             mock_search.assert_called()
 
 
-class TestResearchAgentPostResearch:
-    """Tests for post-research gap state updates (Session 5)."""
-
-    def _make_agent(self, schema_path="/tmp/schema.yaml"):
-        """Create agent with schema_path configured."""
-        with patch("research_agent.agent.Anthropic"), \
-             patch("research_agent.agent.AsyncAnthropic"):
-            agent = ResearchAgent(
-                api_key="test-key",
-                schema_path=schema_path,
-            )
-        return agent
-
-    def test_post_research_marks_verified_on_full_report(self):
-        """After full_report, batch gaps have status=VERIFIED."""
-        agent = self._make_agent()
-        gap = Gap(id="gap-1", category="test", status=GapStatus.UNKNOWN, priority=3)
-        agent._current_research_batch = (gap,)
-
-        schema_result = SchemaResult(gaps=(gap,), source="/tmp/schema.yaml")
-        agent._current_schema_result = schema_result
-
-        with patch("research_agent.agent.mark_verified") as mock_verify, \
-             patch("research_agent.agent.save_schema") as mock_save, \
-             patch("research_agent.agent.log_flip") as mock_log, \
-             patch("research_agent.agent.load_schema", return_value=schema_result):
-
-            verified_gap = Gap(
-                id="gap-1", category="test", status=GapStatus.VERIFIED,
-                priority=3, last_verified="2026-01-01T00:00:00+00:00",
-                last_checked="2026-01-01T00:00:00+00:00",
-            )
-            mock_verify.return_value = verified_gap
-
-            agent._update_gap_states("full_report")
-
-            mock_verify.assert_called_once_with(gap)
-            mock_save.assert_called_once()
-            saved_gaps = mock_save.call_args[0][1]
-            assert saved_gaps[0].status == GapStatus.VERIFIED
-
-    def test_post_research_marks_verified_on_short_report(self):
-        """After short_report, batch gaps have status=VERIFIED."""
-        agent = self._make_agent()
-        gap = Gap(id="gap-1", category="test", status=GapStatus.STALE, priority=3,
-                  last_verified="2020-01-01T00:00:00+00:00")
-        agent._current_research_batch = (gap,)
-
-        schema_result = SchemaResult(gaps=(gap,), source="/tmp/schema.yaml")
-        agent._current_schema_result = schema_result
-
-        with patch("research_agent.agent.mark_verified") as mock_verify, \
-             patch("research_agent.agent.save_schema") as mock_save, \
-             patch("research_agent.agent.log_flip") as mock_log, \
-             patch("research_agent.agent.load_schema", return_value=schema_result):
-
-            verified_gap = Gap(
-                id="gap-1", category="test", status=GapStatus.VERIFIED,
-                priority=3, last_verified="2026-01-01T00:00:00+00:00",
-                last_checked="2026-01-01T00:00:00+00:00",
-            )
-            mock_verify.return_value = verified_gap
-
-            agent._update_gap_states("short_report")
-
-            mock_verify.assert_called_once_with(gap)
-            mock_save.assert_called_once()
-            # Status flipped from STALE → VERIFIED, so log_flip should be called
-            mock_log.assert_called_once()
-
-    def test_post_research_marks_checked_on_no_findings(self):
-        """After no_new_findings, batch gaps have updated last_checked."""
-        agent = self._make_agent()
-        gap = Gap(id="gap-1", category="test", status=GapStatus.UNKNOWN, priority=3)
-        agent._current_research_batch = (gap,)
-
-        schema_result = SchemaResult(gaps=(gap,), source="/tmp/schema.yaml")
-        agent._current_schema_result = schema_result
-
-        with patch("research_agent.agent.mark_checked") as mock_checked, \
-             patch("research_agent.agent.save_schema") as mock_save, \
-             patch("research_agent.agent.load_schema", return_value=schema_result):
-
-            checked_gap = Gap(
-                id="gap-1", category="test", status=GapStatus.UNKNOWN,
-                priority=3, last_checked="2026-01-01T00:00:00+00:00",
-            )
-            mock_checked.return_value = checked_gap
-
-            agent._update_gap_states("no_new_findings")
-
-            mock_checked.assert_called_once_with(gap)
-            mock_save.assert_called_once()
-            saved_gaps = mock_save.call_args[0][1]
-            assert saved_gaps[0].status == GapStatus.UNKNOWN
-            assert saved_gaps[0].last_checked is not None
-
-    def test_post_research_no_update_on_insufficient(self):
-        """After insufficient_data, gap states unchanged."""
-        agent = self._make_agent()
-        gap = Gap(id="gap-1", category="test", status=GapStatus.UNKNOWN, priority=3)
-        agent._current_research_batch = (gap,)
-
-        schema_result = SchemaResult(gaps=(gap,), source="/tmp/schema.yaml")
-        agent._current_schema_result = schema_result
-
-        with patch("research_agent.agent.save_schema") as mock_save, \
-             patch("research_agent.agent.load_schema", return_value=schema_result):
-
-            agent._update_gap_states("insufficient_data")
-
-            mock_save.assert_called_once()
-            saved_gaps = mock_save.call_args[0][1]
-            # Gap should be unchanged (same object)
-            assert saved_gaps[0] is gap
-
-    def test_post_research_no_schema_no_update(self):
-        """Without schema loaded, no state writes occur."""
-        agent = self._make_agent()
-        agent._current_research_batch = (
-            Gap(id="gap-1", category="test", status=GapStatus.UNKNOWN, priority=3),
-        )
-        empty_result = SchemaResult(gaps=(), source="")
-        agent._current_schema_result = empty_result
-
-        with patch("research_agent.agent.save_schema") as mock_save, \
-             patch("research_agent.agent.load_schema", return_value=empty_result):
-
-            agent._update_gap_states("full_report")
-
-            mock_save.assert_not_called()
-
-    def test_post_research_preserves_other_gaps(self):
-        """Non-batch gaps unchanged in schema file."""
-        agent = self._make_agent()
-        batch_gap = Gap(id="gap-1", category="test", status=GapStatus.UNKNOWN, priority=3)
-        other_gap = Gap(
-            id="gap-2", category="other", status=GapStatus.VERIFIED,
-            priority=5, last_verified="2099-01-01T00:00:00+00:00",
-        )
-        agent._current_research_batch = (batch_gap,)
-
-        schema_result = SchemaResult(gaps=(batch_gap, other_gap), source="/tmp/schema.yaml")
-        agent._current_schema_result = schema_result
-
-        with patch("research_agent.agent.mark_verified") as mock_verify, \
-             patch("research_agent.agent.save_schema") as mock_save, \
-             patch("research_agent.agent.log_flip"), \
-             patch("research_agent.agent.load_schema", return_value=schema_result):
-
-            verified_gap = Gap(
-                id="gap-1", category="test", status=GapStatus.VERIFIED,
-                priority=3, last_verified="2026-01-01T00:00:00+00:00",
-                last_checked="2026-01-01T00:00:00+00:00",
-            )
-            mock_verify.return_value = verified_gap
-
-            agent._update_gap_states("full_report")
-
-            mock_save.assert_called_once()
-            saved_gaps = mock_save.call_args[0][1]
-            assert len(saved_gaps) == 2
-            # gap-1 was updated
-            assert saved_gaps[0].status == GapStatus.VERIFIED
-            assert saved_gaps[0].id == "gap-1"
-            # gap-2 was preserved unchanged
-            assert saved_gaps[1] is other_gap
-
-    def test_post_research_audit_log_written(self):
-        """Status flips recorded in gap_audit.log."""
-        agent = self._make_agent()
-        gap = Gap(id="gap-1", category="test", status=GapStatus.UNKNOWN, priority=3)
-        agent._current_research_batch = (gap,)
-
-        schema_result = SchemaResult(gaps=(gap,), source="/tmp/schema.yaml")
-        agent._current_schema_result = schema_result
-
-        with patch("research_agent.agent.mark_verified") as mock_verify, \
-             patch("research_agent.agent.save_schema"), \
-             patch("research_agent.agent.log_flip") as mock_log, \
-             patch("research_agent.agent.load_schema", return_value=schema_result):
-
-            verified_gap = Gap(
-                id="gap-1", category="test", status=GapStatus.VERIFIED,
-                priority=3, last_verified="2026-01-01T00:00:00+00:00",
-                last_checked="2026-01-01T00:00:00+00:00",
-            )
-            mock_verify.return_value = verified_gap
-
-            agent._update_gap_states("full_report")
-
-            # Status changed from UNKNOWN → VERIFIED, so log_flip should be called
-            mock_log.assert_called_once_with(
-                Path("/tmp") / "gap_audit.log",
-                "gap-1",
-                GapStatus.UNKNOWN,
-                GapStatus.VERIFIED,
-                reason="Research completed: full_report",
-            )
-
-    def test_post_research_save_failure_logged(self):
-        """StateError logged but pipeline returns successfully."""
-        agent = self._make_agent()
-        gap = Gap(id="gap-1", category="test", status=GapStatus.UNKNOWN, priority=3)
-        agent._current_research_batch = (gap,)
-
-        schema_result = SchemaResult(gaps=(gap,), source="/tmp/schema.yaml")
-        agent._current_schema_result = schema_result
-
-        with patch("research_agent.agent.mark_verified") as mock_verify, \
-             patch("research_agent.agent.save_schema", side_effect=StateError("disk full")), \
-             patch("research_agent.agent.log_flip"), \
-             patch("research_agent.agent.load_schema", return_value=schema_result):
-
-            verified_gap = Gap(
-                id="gap-1", category="test", status=GapStatus.VERIFIED,
-                priority=3, last_verified="2026-01-01T00:00:00+00:00",
-                last_checked="2026-01-01T00:00:00+00:00",
-            )
-            mock_verify.return_value = verified_gap
-
-            # Should NOT raise — graceful degradation
-            agent._update_gap_states("full_report")
-
-
 class TestCoverageGapRetry:
     """Tests for _try_coverage_retry() and its integration with _evaluate_and_synthesize."""
 
@@ -1815,6 +1741,8 @@ class TestCoverageGapRetry:
                 api_key="test-key", mode=ResearchMode.standard(),
                 skip_critique=True,
             )
+        # Post-report iteration calls the async client; its replies parse to nothing
+        agent.async_client.messages.create = AsyncMock()
         agent._start_time = 0.0
         agent._step_num = 0
         agent._step_total = 10
@@ -2134,10 +2062,10 @@ class TestCoverageGapRetry:
 
         with patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock, return_value=insufficient_eval), \
              patch.object(agent, "_try_coverage_retry", new_callable=AsyncMock, return_value=(summaries, full_eval)) as mock_retry, \
-             patch("research_agent.agent.synthesize_draft", return_value="Draft"), \
+             patch("research_agent.agent.synthesize_draft_async", return_value="Draft"), \
              patch("research_agent.agent.run_skeptic_combined", new_callable=AsyncMock) as mock_skeptic, \
              patch("research_agent.agent.load_full_context", return_value=ContextResult.loaded("ctx")), \
-             patch("research_agent.agent.synthesize_final", return_value="Full Report"):
+             patch("research_agent.agent.synthesize_final_async", return_value="Full Report"):
             mock_skeptic.return_value = MagicMock(critical_count=0, concern_count=0)
 
             result = await agent._evaluate_and_synthesize(
@@ -2162,10 +2090,10 @@ class TestCoverageGapRetry:
 
         with patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock, return_value=short_eval), \
              patch.object(agent, "_try_coverage_retry", new_callable=AsyncMock, return_value=None) as mock_retry, \
-             patch("research_agent.agent.synthesize_draft", return_value="Draft"), \
+             patch("research_agent.agent.synthesize_draft_async", return_value="Draft"), \
              patch("research_agent.agent.run_skeptic_combined", new_callable=AsyncMock) as mock_skeptic, \
              patch("research_agent.agent.load_full_context", return_value=ContextResult.loaded("ctx")), \
-             patch("research_agent.agent.synthesize_final", return_value="Short Report"):
+             patch("research_agent.agent.synthesize_final_async", return_value="Short Report"):
             mock_skeptic.return_value = MagicMock(critical_count=0, concern_count=0)
 
             result = await agent._evaluate_and_synthesize(
@@ -2191,10 +2119,10 @@ class TestCoverageGapRetry:
 
         with patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock, return_value=full_eval), \
              patch.object(agent, "_try_coverage_retry", new_callable=AsyncMock) as mock_retry, \
-             patch("research_agent.agent.synthesize_draft", return_value="Draft"), \
+             patch("research_agent.agent.synthesize_draft_async", return_value="Draft"), \
              patch("research_agent.agent.run_skeptic_combined", new_callable=AsyncMock) as mock_skeptic, \
              patch("research_agent.agent.load_full_context", return_value=ContextResult.loaded("ctx")), \
-             patch("research_agent.agent.synthesize_final", return_value="Full Report"):
+             patch("research_agent.agent.synthesize_final_async", return_value="Full Report"):
             mock_skeptic.return_value = MagicMock(critical_count=0, concern_count=0)
 
             await agent._evaluate_and_synthesize(
@@ -2336,9 +2264,9 @@ class TestQueryIteration:
         )
 
         with patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock, return_value=full_eval), \
-             patch("research_agent.agent.synthesize_draft", return_value="## Draft\nContent"), \
+             patch("research_agent.agent.synthesize_draft_async", return_value="## Draft\nContent"), \
              patch("research_agent.agent.run_skeptic_combined", new_callable=AsyncMock) as mock_skeptic, \
-             patch("research_agent.agent.synthesize_final", return_value="## Draft\nContent\n\n## Sources\n..."), \
+             patch("research_agent.agent.synthesize_final_async", return_value="## Draft\nContent\n\n## Sources\n..."), \
              patch.object(agent, "_run_iteration", new_callable=AsyncMock) as mock_iteration:
             mock_skeptic.return_value = MagicMock(critical_count=0, concern_count=0)
             mock_iteration.return_value = (
@@ -2364,7 +2292,7 @@ class TestQueryIteration:
         )
 
         with patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock, return_value=full_eval), \
-             patch("research_agent.agent.synthesize_report", return_value="# Report\nContent"), \
+             patch("research_agent.agent.synthesize_report_async", return_value="# Report\nContent"), \
              patch.object(agent, "_run_iteration", new_callable=AsyncMock) as mock_iteration:
 
             result = await agent._evaluate_and_synthesize(
@@ -2384,9 +2312,9 @@ class TestQueryIteration:
         )
 
         with patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock, return_value=full_eval), \
-             patch("research_agent.agent.synthesize_draft", return_value="Draft"), \
+             patch("research_agent.agent.synthesize_draft_async", return_value="Draft"), \
              patch("research_agent.agent.run_skeptic_combined", new_callable=AsyncMock) as mock_skeptic, \
-             patch("research_agent.agent.synthesize_final", return_value="Full Report"), \
+             patch("research_agent.agent.synthesize_final_async", return_value="Full Report"), \
              patch.object(agent, "_run_iteration", new_callable=AsyncMock) as mock_iteration:
             mock_skeptic.return_value = MagicMock(critical_count=0, concern_count=0)
 
@@ -2407,9 +2335,9 @@ class TestQueryIteration:
         )
 
         with patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock, return_value=full_eval), \
-             patch("research_agent.agent.synthesize_draft", return_value="Draft"), \
+             patch("research_agent.agent.synthesize_draft_async", return_value="Draft"), \
              patch("research_agent.agent.run_skeptic_combined", new_callable=AsyncMock) as mock_skeptic, \
-             patch("research_agent.agent.synthesize_final", return_value="Full Report"), \
+             patch("research_agent.agent.synthesize_final_async", return_value="Full Report"), \
              patch.object(agent, "_run_iteration", new_callable=AsyncMock, side_effect=IterationError("API timeout")):
             mock_skeptic.return_value = MagicMock(critical_count=0, concern_count=0)
 
@@ -2452,9 +2380,9 @@ class TestQueryIteration:
         )
 
         with patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock, return_value=full_eval), \
-             patch("research_agent.agent.synthesize_draft", return_value="Draft"), \
+             patch("research_agent.agent.synthesize_draft_async", return_value="Draft"), \
              patch("research_agent.agent.run_skeptic_combined", new_callable=AsyncMock) as mock_skeptic, \
-             patch("research_agent.agent.synthesize_final", return_value="Full Report"), \
+             patch("research_agent.agent.synthesize_final_async", return_value="Full Report"), \
              patch.object(agent, "_run_iteration", new_callable=AsyncMock, return_value=("Full Report", 0)):
             mock_skeptic.return_value = MagicMock(critical_count=0, concern_count=0)
 
@@ -2465,6 +2393,51 @@ class TestQueryIteration:
         assert result == "Full Report"
         assert agent.iteration_status == "no_new_sources"
 
+    @pytest.mark.asyncio
+    async def test_critique_runs_alongside_iteration(self):
+        """Self-critique doesn't wait for iteration to finish."""
+        agent = self._make_agent()
+        agent._skip_critique = False
+        summaries = self._make_summaries(4)
+        full_eval = self._make_evaluation("full_report", surviving=summaries, total_scored=4)
+        critique_started = asyncio.Event()
+
+        async def slow_iteration(*args):
+            await asyncio.wait_for(critique_started.wait(), timeout=2)
+            return "Report\n\n## Follow-Up: more", 2
+
+        async def critique(**kwargs):
+            critique_started.set()
+
+        with patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock, return_value=full_eval), \
+             patch("research_agent.agent.synthesize_draft_async", return_value="## Draft\nContent"), \
+             patch("research_agent.agent.run_skeptic_combined", new_callable=AsyncMock) as mock_skeptic, \
+             patch("research_agent.agent.synthesize_final_async", return_value="Report"), \
+             patch.object(agent, "_run_iteration", side_effect=slow_iteration), \
+             patch.object(agent, "_run_critique", side_effect=critique):
+            mock_skeptic.return_value = MagicMock(critical_count=0, concern_count=0)
+            result = await agent._evaluate_and_synthesize("test query", summaries, "refined")
+
+        assert result.endswith("## Follow-Up: more")
+        assert agent.iteration_status == "completed"
+        assert agent.last_source_count == 6
+
+    @pytest.mark.asyncio
+    async def test_last_source_urls_deduplicated(self):
+        """last_source_urls lists each surviving source URL once, in order."""
+        agent = self._make_agent(skip_iteration=True)
+        summaries = self._make_summaries(2) + self._make_summaries(1)
+        full_eval = self._make_evaluation("full_report", surviving=summaries, total_scored=3)
+
+        with patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock, return_value=full_eval), \
+             patch("research_agent.agent.synthesize_draft_async", return_value="## Draft\nContent"), \
+             patch("research_agent.agent.run_skeptic_combined", new_callable=AsyncMock) as mock_skeptic, \
+             patch("research_agent.agent.synthesize_final_async", return_value="Report"):
+            mock_skeptic.return_value = MagicMock(critical_count=0, concern_count=0)
+            await agent._evaluate_and_synthesize("test query", summaries, "refined")
+
+        assert agent.last_source_urls == ("https://example1.com/page", "https://example2.com/page")
+
 
 class TestIterationSections(TestQueryIteration):
     """Tests for iteration_sections property."""
@@ -2479,9 +2452,9 @@ class TestIterationSections(TestQueryIteration):
         )
 
         with patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock, return_value=full_eval), \
-             patch("research_agent.agent.synthesize_draft", return_value="Draft"), \
+             patch("research_agent.agent.synthesize_draft_async", return_value="Draft"), \
              patch("research_agent.agent.run_skeptic_combined", new_callable=AsyncMock) as mock_skeptic, \
-             patch("research_agent.agent.synthesize_final", return_value="Full Report"):
+             patch("research_agent.agent.synthesize_final_async", return_value="Full Report"):
             mock_skeptic.return_value = MagicMock(critical_count=0, concern_count=0)
 
             await agent._evaluate_and_synthesize("test query", summaries, "refined")
@@ -2502,9 +2475,9 @@ class TestIterationSections(TestQueryIteration):
             return report + "\n\n## Deeper Dive: topic\n\nContent here.", 2
 
         with patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock, return_value=full_eval), \
-             patch("research_agent.agent.synthesize_draft", return_value="Draft"), \
+             patch("research_agent.agent.synthesize_draft_async", return_value="Draft"), \
              patch("research_agent.agent.run_skeptic_combined", new_callable=AsyncMock) as mock_skeptic, \
-             patch("research_agent.agent.synthesize_final", return_value="Full Report"), \
+             patch("research_agent.agent.synthesize_final_async", return_value="Full Report"), \
              patch.object(agent, "_run_iteration", new_callable=AsyncMock, side_effect=mock_run_iteration):
             mock_skeptic.return_value = MagicMock(critical_count=0, concern_count=0)
 
@@ -2591,14 +2564,14 @@ class TestPlanningModelRouting:
         from research_agent.decompose import DecompositionResult
 
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.decompose_query") as mock_decompose, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.decompose_query_async") as mock_decompose, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_draft") as mock_draft, \
-             patch("research_agent.agent.synthesize_final") as mock_final, \
+             patch("research_agent.agent.synthesize_draft_async") as mock_draft, \
+             patch("research_agent.agent.synthesize_final_async") as mock_final, \
              patch("research_agent.agent.run_skeptic_combined") as mock_skeptic, \
              patch("research_agent.agent.load_full_context") as mock_full_ctx, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
@@ -2648,12 +2621,12 @@ class TestPlanningModelRouting:
         from research_agent.modes import AUTO_DETECT_MODEL
 
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_report") as mock_synthesize, \
+             patch("research_agent.agent.synthesize_report_async") as mock_synthesize, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
 
             mock_search.return_value = [
@@ -2694,13 +2667,13 @@ class TestSourceCounts:
     async def test_standard_mode_populates_source_counts(self):
         """Standard mode should populate source_counts with original + refined query counts."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_draft") as mock_draft, \
-             patch("research_agent.agent.synthesize_final") as mock_final, \
+             patch("research_agent.agent.synthesize_draft_async") as mock_draft, \
+             patch("research_agent.agent.synthesize_final_async") as mock_final, \
              patch("research_agent.agent.run_skeptic_combined") as mock_skeptic, \
              patch("research_agent.agent.load_full_context") as mock_full_ctx, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
@@ -2756,13 +2729,13 @@ class TestSourceCountsDeep:
     async def test_deep_mode_populates_source_counts(self):
         """Deep mode should populate source_counts with pass1 + refined query counts."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_draft") as mock_draft, \
-             patch("research_agent.agent.synthesize_final") as mock_final, \
+             patch("research_agent.agent.synthesize_draft_async") as mock_draft, \
+             patch("research_agent.agent.synthesize_final_async") as mock_final, \
              patch("research_agent.agent.run_deep_skeptic_pass") as mock_skeptic, \
              patch("research_agent.agent.load_full_context") as mock_full_ctx, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
@@ -2778,7 +2751,9 @@ class TestSourceCountsDeep:
                 SearchResult(title="New2", url="https://new2.com", snippet="Snippet content"),
                 SearchResult(title="Dup", url="https://ex0.com", snippet="Snippet content"),
             ]
-            mock_search.side_effect = [pass1, pass2]
+            # Speculative pass 2 from the short snippets, discarded for the refined query
+            speculative = [SearchResult(title="Spec", url="https://spec.com", snippet="Snippet content")]
+            mock_search.side_effect = [pass1, speculative, pass2]
             mock_refine.return_value = "deep refined query"
             mock_fetch.return_value = [
                 FetchedPage(url="https://ex0.com", html="<p>" + "x" * 200 + "</p>", status_code=200)
@@ -2830,6 +2805,170 @@ class TestSourceCountsDefensiveCopy:
         assert agent.source_counts == {"query1": 5, "query2": 3}
 
 
+class TestUsageAccounting:
+    """Verify the run-scoped usage ledger is exposed and persisted."""
+
+    @staticmethod
+    def _fake_pipeline(stages):
+        async def run(query):
+            import time
+            from types import SimpleNamespace
+            from research_agent.usage import record_usage
+            for stage in stages:
+                response = SimpleNamespace(usage=SimpleNamespace(input_tokens=100, output_tokens=20))
+                record_usage(stage, "claude-sonnet-4-20250514", response, time.monotonic())
+            return "Report"
+        return run
+
+    def test_last_usage_none_before_run(self):
+        agent = ResearchAgent(api_key="test-key", mode=ResearchMode.quick())
+        assert agent.last_usage is None
+
+    @pytest.mark.asyncio
+    async def test_usage_recorded_and_saved(self, tmp_path):
+        agent = ResearchAgent(api_key="test-key", mode=ResearchMode.quick())
+        with patch.object(agent, "_run_research", side_effect=self._fake_pipeline(["summarize", "synthesize"])), \
+             patch("research_agent.agent.META_DIR", tmp_path):
+            await agent.research_async("test query")
+
+        usage = agent.last_usage
+        assert usage.total.calls == 2
+        assert set(usage.by_stage) == {"summarize", "synthesize"}
+        saved = list(tmp_path.glob("usage-*.json"))
+        assert len(saved) == 1
+
+    @pytest.mark.asyncio
+    async def test_usage_saved_when_run_fails(self, tmp_path):
+        agent = ResearchAgent(api_key="test-key", mode=ResearchMode.quick())
+
+        async def failing(query):
+            await self._fake_pipeline(["decompose"])(query)
+            raise ResearchError("boom")
+
+        with patch.object(agent, "_run_research", side_effect=failing), \
+             patch("research_agent.agent.META_DIR", tmp_path):
+            with pytest.raises(ResearchError):
+                await agent.research_async("test query")
+
+        assert agent.last_usage.total.calls == 1
+        assert len(list(tmp_path.glob("usage-*.json"))) == 1
+
+    @pytest.mark.asyncio
+    async def test_nothing_saved_without_usage(self, tmp_path):
+        agent = ResearchAgent(api_key="test-key", mode=ResearchMode.quick())
+        with patch.object(agent, "_run_research", side_effect=self._fake_pipeline([])), \
+             patch("research_agent.agent.META_DIR", tmp_path):
+            await agent.research_async("test query")
+        assert list(tmp_path.glob("usage-*.json")) == []
+
+
+class TestTracing:
+    """Verify trace=True writes a Chrome trace of the run."""
+
+    @pytest.mark.asyncio
+    async def test_trace_written_with_root_span(self, tmp_path):
+        import json
+
+        async def pipeline(query):
+            from research_agent.tracing import span
+            with span("stage.test"):
+                return "Report"
+
+        agent = ResearchAgent(api_key="test-key", mode=ResearchMode.quick(), trace=True)
+        with patch.object(agent, "_run_research", side_effect=pipeline), \
+             patch("research_agent.agent.META_DIR", tmp_path):
+            await agent.research_async("test query")
+
+        path = agent.last_trace_path
+        assert path is not None and path.parent == tmp_path / "traces"
+        events = json.loads(path.read_text())["traceEvents"]
+        names = {e["name"] for e in events if e["ph"] == "X"}
+        assert names == {"research", "stage.test"}
+
+    @pytest.mark.asyncio
+    async def test_no_trace_by_default(self, tmp_path):
+        agent = ResearchAgent(api_key="test-key", mode=ResearchMode.quick())
+        with patch.object(agent, "_run_research", AsyncMock(return_value="Report")), \
+             patch("research_agent.agent.META_DIR", tmp_path):
+            await agent.research_async("test query")
+        assert agent.last_trace_path is None
+        assert not (tmp_path / "traces").exists()
+
+
+class TestProgressEvents:
+    """Verify pipeline steps are reported to the progress listener."""
+
+    def test_next_step_emits_stage_event(self):
+        from research_agent.progress import StageEvent, progress_scope
+
+        agent = ResearchAgent(api_key="test-key", mode=ResearchMode.quick())
+        agent._start_time = 0.0
+        agent._step_total = 4
+        events = []
+        with progress_scope(events.append), \
+             patch("research_agent.agent.time.monotonic", return_value=2.5):
+            agent._next_step("Searching...")
+            agent._next_step("Fetching 3 pages...")
+        assert events == [
+            StageEvent(step=1, total=4, message="Searching...", elapsed_s=2.5),
+            StageEvent(step=2, total=4, message="Fetching 3 pages...", elapsed_s=2.5),
+        ]
+
+
+class TestResearchStream:
+    """Verify research_stream() yields progress events, then the result."""
+
+    @pytest.mark.asyncio
+    async def test_yields_events_then_result(self, tmp_path):
+        from research_agent.progress import ResultEvent, StageEvent, TextDelta, emit
+
+        agent = ResearchAgent(api_key="test-key", mode=ResearchMode.quick())
+
+        async def pipeline(query):
+            agent._step_total = 2
+            agent._next_step("Searching...")
+            await asyncio.to_thread(emit, TextDelta("# Rep"))
+            emit(TextDelta("ort"))
+            return "# Report"
+
+        with patch.object(agent, "_run_research", side_effect=pipeline), \
+             patch("research_agent.agent.META_DIR", tmp_path):
+            events = [event async for event in agent.research_stream("test query")]
+
+        assert isinstance(events[0], StageEvent)
+        assert events[0].message == "Searching..."
+        assert events[1:] == [TextDelta("# Rep"), TextDelta("ort"), ResultEvent("# Report")]
+
+    @pytest.mark.asyncio
+    async def test_failure_raises_from_iterator(self, tmp_path):
+        agent = ResearchAgent(api_key="test-key", mode=ResearchMode.quick())
+        with patch.object(agent, "_run_research", AsyncMock(side_effect=ResearchError("boom"))), \
+             patch("research_agent.agent.META_DIR", tmp_path):
+            with pytest.raises(ResearchError, match="boom"):
+                async for _ in agent.research_stream("test query"):
+                    pass
+
+    @pytest.mark.asyncio
+    async def test_closing_early_cancels_run(self, tmp_path):
+        cancelled = asyncio.Event()
+        agent = ResearchAgent(api_key="test-key", mode=ResearchMode.quick())
+
+        async def pipeline(query):
+            agent._next_step("Searching...")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with patch.object(agent, "_run_research", side_effect=pipeline), \
+             patch("research_agent.agent.META_DIR", tmp_path):
+            stream = agent.research_stream("test query")
+            await anext(stream)
+            await stream.aclose()
+        assert cancelled.is_set()
+
+
 class TestIterationSectionsPopulation(TestQueryIteration):
     """Verify _run_iteration populates iteration_sections via real code path."""
 
@@ -2846,11 +2985,11 @@ class TestIterationSectionsPopulation(TestQueryIteration):
         refined = QueryGenerationResult(items=("refined q",), rationale="ok")
         followup = QueryGenerationResult(items=(), rationale="none")
 
-        with patch("research_agent.agent.generate_refined_queries", return_value=refined), \
-             patch("research_agent.agent.generate_followup_questions", return_value=followup), \
+        with patch("research_agent.agent.generate_refined_queries_async", return_value=refined), \
+             patch("research_agent.agent.generate_followup_questions_async", return_value=followup), \
              patch.object(agent, "_search_sub_queries", new_callable=AsyncMock) as mock_search, \
              patch.object(agent, "_fetch_extract_summarize", new_callable=AsyncMock) as mock_fes, \
-             patch("research_agent.agent.synthesize_mini_report") as mock_mini:
+             patch("research_agent.agent.synthesize_mini_report_async") as mock_mini:
 
             mock_search.return_value = [
                 SearchResult(title="New", url="https://new.com", snippet="S"),
@@ -2865,6 +3004,78 @@ class TestIterationSectionsPopulation(TestQueryIteration):
             assert agent.iteration_sections == ("## Deeper Dive: refined q\n\nNew content.",)
             assert "Deeper Dive" in report
 
+    async def _run_two_query_iteration(self, agent, batched, individual):
+        evaluation = self._make_evaluation(
+            "full_report", surviving=self._make_summaries(4), total_scored=4,
+        )
+        refined = QueryGenerationResult(items=("refined q",), rationale="ok")
+        followup = QueryGenerationResult(items=("follow q",), rationale="ok")
+
+        with patch("research_agent.agent.generate_refined_queries_async", return_value=refined), \
+             patch("research_agent.agent.generate_followup_questions_async", return_value=followup), \
+             patch.object(agent, "_search_sub_queries", new_callable=AsyncMock) as mock_search, \
+             patch.object(agent, "_fetch_extract_summarize", new_callable=AsyncMock) as mock_fes, \
+             patch("research_agent.agent.synthesize_mini_reports_async", new_callable=AsyncMock) as mock_batch, \
+             patch("research_agent.agent.synthesize_mini_report_async", new_callable=AsyncMock) as mock_mini:
+            mock_search.return_value = [SearchResult(title="New", url="https://new.com", snippet="S")]
+            mock_fes.return_value = [Summary(url="https://new.com", title="New", summary="Content")]
+            if isinstance(batched, Exception):
+                mock_batch.side_effect = batched
+            else:
+                mock_batch.return_value = batched
+            mock_mini.side_effect = individual
+            await agent._run_iteration("test", "Base report", evaluation)
+        return mock_batch, mock_mini
+
+    @pytest.mark.asyncio
+    async def test_batched_mini_reports_fill_gaps_individually(self):
+        agent = self._make_agent()
+
+        async def individual(client, q, summaries, section_title, **kwargs):
+            return f"## {section_title}\n\nSingle."
+
+        mock_batch, mock_mini = await self._run_two_query_iteration(
+            agent, [None, "## Follow-Up: follow q\n\nBatched."], individual,
+        )
+
+        mock_batch.assert_called_once()
+        assert mock_batch.call_args.args[1] == [
+            ("refined q", "Deeper Dive: refined q"), ("follow q", "Follow-Up: follow q"),
+        ]
+        assert [c.args[1] for c in mock_mini.call_args_list] == ["refined q"]
+        assert agent.iteration_sections == (
+            "## Deeper Dive: refined q\n\nSingle.",
+            "## Follow-Up: follow q\n\nBatched.",
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_one_call_per_section(self):
+        from research_agent.errors import SynthesisError
+
+        agent = self._make_agent()
+
+        async def individual(client, q, summaries, section_title, **kwargs):
+            return f"## {section_title}\n\nSingle."
+
+        _, mock_mini = await self._run_two_query_iteration(
+            agent, SynthesisError("Mini-reports timed out"), individual,
+        )
+
+        assert mock_mini.call_count == 2
+        assert len(agent.iteration_sections) == 2
+
+    @pytest.mark.asyncio
+    async def test_unbatched_mode_writes_sections_separately(self):
+        agent = self._make_agent(dataclasses.replace(ResearchMode.standard(), batch_mini_reports=False))
+
+        async def individual(client, q, summaries, section_title, **kwargs):
+            return f"## {section_title}\n\nSingle."
+
+        mock_batch, mock_mini = await self._run_two_query_iteration(agent, [], individual)
+
+        mock_batch.assert_not_called()
+        assert mock_mini.call_count == 2
+
 
 class TestDoubleHaikuRouting:
     """Integration test: both planning_model and relevance_model route to Haiku."""
@@ -2876,14 +3087,14 @@ class TestDoubleHaikuRouting:
         from research_agent.decompose import DecompositionResult
 
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.decompose_query") as mock_decompose, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.decompose_query_async") as mock_decompose, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_draft") as mock_draft, \
-             patch("research_agent.agent.synthesize_final") as mock_final, \
+             patch("research_agent.agent.synthesize_draft_async") as mock_draft, \
+             patch("research_agent.agent.synthesize_final_async") as mock_final, \
              patch("research_agent.agent.run_skeptic_combined") as mock_skeptic, \
              patch("research_agent.agent.load_full_context") as mock_full_ctx, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
@@ -2951,14 +3162,14 @@ class TestSnippetQualityGate:
     async def test_standard_mode_uses_noun_phrases_on_short_snippets(self):
         """Should use extract_noun_phrases when avg snippet < 50 chars."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.extract_noun_phrases") as mock_noun, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_draft") as mock_draft, \
-             patch("research_agent.agent.synthesize_final") as mock_final, \
+             patch("research_agent.agent.synthesize_draft_async") as mock_draft, \
+             patch("research_agent.agent.synthesize_final_async") as mock_final, \
              patch("research_agent.agent.run_skeptic_combined") as mock_skeptic, \
              patch("research_agent.agent.load_full_context") as mock_full_ctx, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
@@ -3005,14 +3216,14 @@ class TestSnippetQualityGate:
     async def test_standard_mode_uses_refine_on_normal_snippets(self):
         """Should use refine_query when avg snippet >= 50 chars."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.extract_noun_phrases") as mock_noun, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_draft") as mock_draft, \
-             patch("research_agent.agent.synthesize_final") as mock_final, \
+             patch("research_agent.agent.synthesize_draft_async") as mock_draft, \
+             patch("research_agent.agent.synthesize_final_async") as mock_final, \
              patch("research_agent.agent.run_skeptic_combined") as mock_skeptic, \
              patch("research_agent.agent.load_full_context") as mock_full_ctx, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
@@ -3060,14 +3271,14 @@ class TestSnippetQualityGate:
     async def test_deep_mode_uses_noun_phrases_on_short_summaries(self):
         """Should use extract_noun_phrases when avg summary < 100 chars."""
         with patch("research_agent.agent.search") as mock_search, \
-             patch("research_agent.agent.refine_query") as mock_refine, \
+             patch("research_agent.agent.refine_query_async") as mock_refine, \
              patch("research_agent.agent.extract_noun_phrases") as mock_noun, \
              patch("research_agent.agent.fetch_urls") as mock_fetch, \
              patch("research_agent.agent.extract_all") as mock_extract, \
              patch("research_agent.agent.summarize_all") as mock_summarize, \
              patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock) as mock_evaluate, \
-             patch("research_agent.agent.synthesize_draft") as mock_draft, \
-             patch("research_agent.agent.synthesize_final") as mock_final, \
+             patch("research_agent.agent.synthesize_draft_async") as mock_draft, \
+             patch("research_agent.agent.synthesize_final_async") as mock_final, \
              patch("research_agent.agent.run_deep_skeptic_pass") as mock_skeptic, \
              patch("research_agent.agent.load_full_context") as mock_full_ctx, \
              patch("research_agent.agent.asyncio.sleep", new_callable=AsyncMock):
@@ -3108,5 +3319,378 @@ class TestSnippetQualityGate:
             agent = ResearchAgent(api_key="test-key", mode=ResearchMode.deep())
             await agent.research_async("test query")
 
-            mock_noun.assert_called_once()
+            # Once for the speculative pass 2 (short snippets), once for the summaries
+            assert mock_noun.call_count == 2
             mock_refine.assert_not_called()
+
+
+class TestResearchAgentCheckpoint:
+    """Stage checkpoints and resume for long runs."""
+
+    @staticmethod
+    def _deep_mocks():
+        summaries = [Summary(url="https://ex1.com", title="T", summary="S " * 60)]
+        return dict(
+            search=MagicMock(return_value=[
+                SearchResult(title="R", url=f"https://ex{i}.com", snippet="S") for i in range(4)
+            ]),
+            refine_query_async=AsyncMock(return_value="refined query"),
+            fetch_urls=AsyncMock(return_value=[
+                FetchedPage(url="https://ex1.com", html="<p>x</p>", status_code=200)
+            ]),
+            extract_all=MagicMock(return_value=[
+                ExtractedContent(url="https://ex1.com", title="T", text="C " * 100)
+            ]),
+            summarize_all=AsyncMock(return_value=summaries),
+            evaluate_sources=AsyncMock(return_value=RelevanceEvaluation(
+                decision="full_report",
+                decision_rationale="All passed",
+                surviving_sources=tuple(summaries),
+                dropped_sources=(),
+                total_scored=1,
+                total_survived=1,
+                refined_query="refined query",
+            )),
+            synthesize_draft_async=AsyncMock(return_value="Draft"),
+            run_deep_skeptic_pass=AsyncMock(return_value=[]),
+            synthesize_final_async=AsyncMock(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_finished_stages(self, tmp_path):
+        from research_agent.skeptic import SkepticFinding
+
+        mocks = self._deep_mocks()
+        mocks["run_deep_skeptic_pass"].return_value = [
+            SkepticFinding(lens="evidence_alignment", checklist="OK", critical_count=0, concern_count=1),
+        ]
+        mocks["synthesize_final_async"].side_effect = [ResearchError("Synthesis timed out"), "Deep Report"]
+        patches = [patch(f"research_agent.agent.{name}", mock) for name, mock in mocks.items()]
+        patches.append(patch("research_agent.agent.META_DIR", tmp_path))
+        patches.append(patch("research_agent.agent.CONTEXTS_DIR", tmp_path / "no-contexts"))
+        for p in patches:
+            p.start()
+        try:
+            agent = ResearchAgent(
+                api_key="test-key", mode=ResearchMode.deep(),
+                checkpoint=True, skip_critique=True, skip_iteration=True,
+            )
+            with pytest.raises(ResearchError, match="timed out"):
+                await agent.research_async("wedding venue pricing trends")
+            run_id = agent.last_run_id
+            assert (tmp_path / "runs" / run_id / "findings.json").is_file()
+            calls_before = {name: mock.call_count for name, mock in mocks.items()}
+
+            resumed = ResearchAgent(
+                api_key="test-key", mode=ResearchMode.deep(),
+                resume_run_id=run_id, skip_critique=True, skip_iteration=True,
+            )
+            report = await resumed.research_async("wedding venue pricing trends")
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert report == "Deep Report"
+        for name, mock in mocks.items():
+            if name != "synthesize_final_async":
+                assert mock.call_count == calls_before[name], name
+        findings = mocks["synthesize_final_async"].call_args.args[3]
+        assert findings[0].concern_count == 1
+        assert resumed.last_gate_decision == "full_report"
+        # Finished runs don't keep their checkpoints
+        assert not (tmp_path / "runs" / run_id).exists()
+
+    @pytest.mark.asyncio
+    async def test_resume_rejects_different_query(self, tmp_path):
+        from research_agent.checkpoint import RunCheckpoint
+
+        checkpoint = RunCheckpoint.create("wedding venue pricing trends", "deep", tmp_path / "runs")
+        agent = ResearchAgent(
+            api_key="test-key", mode=ResearchMode.deep(), resume_run_id=checkpoint.run_id,
+        )
+        with patch("research_agent.agent.META_DIR", tmp_path):
+            with pytest.raises(ResearchError, match="same query and mode"):
+                await agent.research_async("catering cost benchmarks 2026")
+
+    def test_checkpointing_off_by_default(self):
+        agent = ResearchAgent(api_key="test-key")
+        assert agent.last_run_id is None
+
+
+class TestLatencyBudgetDegradation:
+    """Tests for the steps that degrade when a run is behind its latency budget."""
+
+    def _make_agent(self, mode=None):
+        from research_agent.latency_budget import LatencyBudget
+
+        with patch("research_agent.agent.Anthropic"), \
+             patch("research_agent.agent.AsyncAnthropic"):
+            agent = ResearchAgent(api_key="test-key", mode=mode or ResearchMode.standard())
+        agent._start_time = 0.0
+        agent._step_num = 0
+        agent._step_total = 10
+        # 70s into a 60s budget: behind at every decision point
+        now = [100.0]
+        agent._budget = LatencyBudget(60.0, clock=lambda: now[0])
+        now[0] += 70.0
+        return agent
+
+    def _degradations(self, agent):
+        return [(d.stage, d.action) for d in agent._budget.report().degradations]
+
+    @pytest.mark.asyncio
+    async def test_summarizes_one_chunk_per_page(self):
+        agent = self._make_agent()
+        content = ExtractedContent(url="https://example1.com", title="T", text="C " * 100)
+
+        with patch.object(agent, "_fetch_extract", new_callable=AsyncMock, return_value=[content]), \
+             patch("research_agent.agent.summarize_all", new_callable=AsyncMock) as mock_summarize:
+            mock_summarize.return_value = [Summary(url=content.url, title="T", summary="S")]
+            await agent._fetch_extract_summarize([], max_chunks=3)
+
+        assert mock_summarize.call_args.kwargs["max_chunks"] == 1
+        assert self._degradations(agent) == [("summarize", "summarized 1 chunk per page")]
+
+    @pytest.mark.asyncio
+    async def test_deep_mode_falls_back_to_combined_skeptic(self):
+        agent = self._make_agent(ResearchMode.deep())
+
+        with patch("research_agent.agent.run_deep_skeptic_pass", new_callable=AsyncMock) as mock_deep, \
+             patch("research_agent.agent.run_skeptic_combined", new_callable=AsyncMock) as mock_combined:
+            mock_combined.return_value = MagicMock(critical_count=0, concern_count=1)
+            findings = await agent._run_skeptic("Draft", None)
+
+        mock_deep.assert_not_called()
+        assert findings == [mock_combined.return_value]
+        assert self._degradations(agent) == [("skeptic", "combined skeptic pass instead of three")]
+
+    @pytest.mark.asyncio
+    async def test_skips_critique(self):
+        agent = self._make_agent()
+
+        with patch("research_agent.agent.evaluate_report_async", new_callable=AsyncMock) as mock_critique:
+            await agent._run_critique("test query", 4, 1, [], "full_report")
+
+        mock_critique.assert_not_called()
+        assert self._degradations(agent) == [("critique", "skipped self-critique")]
+
+    @pytest.mark.asyncio
+    async def test_skips_coverage_retry(self):
+        agent = self._make_agent()
+        agent._skip_critique = True
+        summaries = [Summary(url="https://example1.com/page", title="Source 1", summary="Useful content.")]
+        evaluation = RelevanceEvaluation(
+            decision="insufficient_data",
+            decision_rationale="Test",
+            surviving_sources=(),
+            dropped_sources=(SourceScore(url="https://ex.com", title="T", score=2, explanation="Bad"),),
+            total_scored=1,
+            total_survived=0,
+            refined_query="refined query",
+        )
+
+        with patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock, return_value=evaluation), \
+             patch.object(agent, "_try_coverage_retry", new_callable=AsyncMock) as mock_retry, \
+             patch("research_agent.agent.generate_insufficient_data_response",
+                   new_callable=AsyncMock, return_value="Insufficient"):
+            await agent._evaluate_and_synthesize("test query", summaries, "refined")
+
+        mock_retry.assert_not_called()
+        assert self._degradations(agent) == [("coverage_retry", "skipped coverage retry")]
+
+    @pytest.mark.asyncio
+    async def test_iteration_timeout_shrinks_to_remaining_budget(self):
+        agent = self._make_agent()
+        evaluation = MagicMock()
+
+        async def slow_iteration(*args):
+            await asyncio.sleep(10)
+
+        with patch("research_agent.agent.MIN_ITERATION_TIMEOUT", 0.05), \
+             patch.object(agent, "_run_iteration", side_effect=slow_iteration):
+            report, added = await agent._iterate("test query", "Report", evaluation)
+
+        assert (report, added) == ("Report", 0)
+        assert agent.iteration_status == "error"
+        assert self._degradations(agent) == [("iteration", "iteration timeout 0s")]
+
+    def test_finish_records_last_budget(self):
+        agent = self._make_agent()
+        agent._budget.skip("critique", "skipped self-critique")
+        agent._finish_budget()
+
+        assert agent.last_budget.budget_s == 60.0
+        assert agent.last_budget.over_budget_s == 10.0
+        assert [d.stage for d in agent.last_budget.degradations] == ["critique"]
+
+
+class TestSourcePacking:
+    """Tests for packing surviving sources once per synthesis."""
+
+    def _make_agent(self, mode):
+        with patch("research_agent.agent.Anthropic"), \
+             patch("research_agent.agent.AsyncAnthropic"):
+            agent = ResearchAgent(
+                api_key="test-key", mode=mode, skip_critique=True, skip_iteration=True,
+            )
+        agent._start_time = 0.0
+        agent._step_num = 0
+        agent._step_total = 10
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_draft_and_final_share_budgeted_pack(self):
+        summaries = [
+            Summary(url=f"https://site{i}.com", title=f"S{i}", summary=" ".join(f"w{i}x{j}" for j in range(300)))
+            for i in range(5)
+        ]
+        scores = (3, 5, 4, 5, 4)
+        evaluation = RelevanceEvaluation(
+            decision="full_report",
+            decision_rationale="Test",
+            surviving_sources=tuple(summaries),
+            dropped_sources=(),
+            total_scored=5,
+            total_survived=5,
+            refined_query=None,
+            surviving_scores=tuple(
+                SourceScore(url=s.url, title=s.title, score=score, explanation="")
+                for s, score in zip(summaries, scores)
+            ),
+        )
+        per_source = count_tokens(summaries[0].summary)
+        agent = self._make_agent(dataclasses.replace(ResearchMode.standard(), source_tokens=per_source * 2))
+
+        with patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock, return_value=evaluation), \
+             patch("research_agent.agent.synthesize_draft_async", new_callable=AsyncMock, return_value="Draft") as mock_draft, \
+             patch("research_agent.agent.run_skeptic_combined", new_callable=AsyncMock) as mock_skeptic, \
+             patch("research_agent.agent.synthesize_final_async", new_callable=AsyncMock, return_value="Report") as mock_final:
+            mock_skeptic.return_value = MagicMock(critical_count=0, concern_count=0)
+            await agent._evaluate_and_synthesize("test query", summaries, "refined")
+
+        packed = mock_draft.call_args.kwargs["sources"]
+        assert mock_final.call_args.kwargs["sources"] is packed
+        assert packed.urls == ("https://site1.com", "https://site3.com")
+
+
+class TestIncrementalRefresh:
+    """Tests for refreshing a saved report from its stored sources."""
+
+    SOURCES = (
+        StoredSource(url="https://a.com/1", title="A", score=5, summaries=("Stored A",),
+                     etag='"a1"', content_hash="hash-a"),
+        StoredSource(url="https://b.org/2", title="B", score=4, summaries=("Stored B1", "Stored B2"),
+                     last_modified="Mon", content_hash="hash-b"),
+    )
+
+    def _make_agent(self):
+        with patch("research_agent.agent.Anthropic"), \
+             patch("research_agent.agent.AsyncAnthropic"):
+            return ResearchAgent(
+                api_key="test-key", mode=ResearchMode.standard(),
+                skip_critique=True, skip_iteration=True, no_context=True,
+            )
+
+    @pytest.fixture(autouse=True)
+    def _no_run_files(self):
+        with patch("research_agent.agent.save_usage"), \
+             patch("research_agent.agent.load_critique_history", return_value=None):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_unchanged_sources_reuse_saved_report(self, tmp_path):
+        """Not-modified sources are neither summarized nor re-synthesized."""
+        saved = tmp_path / "report.md"
+        saved.write_text("# Saved report")
+        agent = self._make_agent()
+        pages = [FetchedPage(url=s.url, html="", status_code=304, etag=s.etag) for s in self.SOURCES]
+
+        with patch("research_agent.agent.fetch_urls", new_callable=AsyncMock, return_value=pages) as mock_fetch, \
+             patch("research_agent.agent.search", return_value=[]), \
+             patch("research_agent.agent.summarize_all", new_callable=AsyncMock) as mock_summarize, \
+             patch("research_agent.agent.synthesize_final_async", new_callable=AsyncMock) as mock_final:
+            report = await agent.refresh_async("test query", self.SOURCES, saved)
+
+        assert report == "# Saved report"
+        validators = mock_fetch.call_args.kwargs["validators"]
+        assert validators["https://a.com/1"].etag == '"a1"'
+        assert validators["https://b.org/2"].last_modified == "Mon"
+        mock_summarize.assert_not_called()
+        mock_final.assert_not_called()
+        assert agent.last_refresh == RefreshOutcome(
+            report="report.md", unchanged=2, unverified=0, changed=0, new=0, reused_report=True,
+        )
+        assert agent.last_sources == self.SOURCES
+
+    @pytest.mark.asyncio
+    async def test_only_changed_and_new_pages_summarized(self, tmp_path):
+        """Changed and delta-search pages are summarized and scored; stored ones are reused."""
+        saved = tmp_path / "report.md"
+        saved.write_text("# Saved report")
+        agent = self._make_agent()
+        pages = [
+            FetchedPage(url="https://a.com/1", html="", status_code=304, etag='"a1"'),
+            FetchedPage(url="https://b.org/2", html="<p>new</p>", status_code=200, etag='"b2"'),
+        ]
+        changed = ExtractedContent(url="https://b.org/2", title="B", text="New text for B")
+        new = ExtractedContent(url="https://c.net/3", title="C", text="Text for C")
+        fresh_summaries = [
+            Summary(url="https://b.org/2", title="B", summary="New B"),
+            Summary(url="https://c.net/3", title="C", summary="New C"),
+        ]
+        fresh_eval = RelevanceEvaluation(
+            decision="short_report", decision_rationale="", surviving_sources=tuple(fresh_summaries),
+            dropped_sources=(), total_scored=2, total_survived=2, refined_query="test query",
+            surviving_scores=(
+                SourceScore(url="https://b.org/2", title="B", score=4, explanation=""),
+                SourceScore(url="https://c.net/3", title="C", score=5, explanation=""),
+            ),
+        )
+        search_results = [
+            SearchResult(title="A", url="https://a.com/1", snippet="known"),
+            SearchResult(title="C", url="https://c.net/3", snippet="new"),
+        ]
+
+        with patch("research_agent.agent.fetch_urls", new_callable=AsyncMock, return_value=pages), \
+             patch("research_agent.agent.extract_all", return_value=[changed]), \
+             patch("research_agent.agent.search", return_value=search_results), \
+             patch.object(agent, "_fetch_extract", new_callable=AsyncMock, return_value=[new]) as mock_delta, \
+             patch("research_agent.agent.summarize_all", new_callable=AsyncMock, return_value=fresh_summaries) as mock_summarize, \
+             patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock, return_value=fresh_eval) as mock_eval, \
+             patch("research_agent.agent.synthesize_draft_async", new_callable=AsyncMock, return_value="Draft"), \
+             patch("research_agent.agent.run_skeptic_combined", new_callable=AsyncMock) as mock_skeptic, \
+             patch("research_agent.agent.synthesize_final_async", new_callable=AsyncMock, return_value="Refreshed") as mock_final:
+            mock_skeptic.return_value = MagicMock(critical_count=0, concern_count=0)
+            report = await agent.refresh_async("test query", self.SOURCES, saved)
+
+        assert report == "Refreshed"
+        assert [r.url for r in mock_delta.call_args.args[0]] == ["https://c.net/3"]
+        assert mock_summarize.call_args.args[1] == [changed, new]
+        assert mock_eval.call_args.kwargs["summaries"] == fresh_summaries
+        # B's stored summaries are replaced by its new one
+        synthesized = [s.summary for s in mock_final.call_args.args[4]]
+        assert synthesized == ["Stored A", "New B", "New C"]
+        assert agent.last_refresh == RefreshOutcome(
+            report="report.md", unchanged=1, unverified=0, changed=1, new=1,
+        )
+        stored = {s.url: s for s in agent.last_sources}
+        assert stored["https://a.com/1"] == self.SOURCES[0]
+        assert stored["https://b.org/2"].summaries == ("New B",)
+        assert stored["https://b.org/2"].etag == '"b2"'
+        assert stored["https://b.org/2"].content_hash not in ("", "hash-b")
+
+    @pytest.mark.asyncio
+    async def test_unreachable_source_kept_as_stored(self, tmp_path):
+        """A source that can't be re-fetched keeps its summaries but counts as unverified."""
+        agent = self._make_agent()
+        pages = [FetchedPage(url="https://a.com/1", html="", status_code=304)]
+
+        with patch("research_agent.agent.fetch_urls", new_callable=AsyncMock, return_value=pages), \
+             patch("research_agent.agent.search", return_value=[]), \
+             patch("research_agent.agent.summarize_all", new_callable=AsyncMock) as mock_summarize:
+            unchanged, unverified, changed = await agent._revalidate(self.SOURCES)
+
+        assert unchanged == [self.SOURCES[0]]
+        assert unverified == [self.SOURCES[1]]
+        assert changed == []
+        mock_summarize.assert_not_called()
@@ -0,0 +1,219 @@
+"""Tests for research_agent.batch module."""
+
+import asyncio
+import json
+import warnings
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from research_agent.batch import (
+    BatchLimits,
+    BatchQuery,
+    BatchResult,
+    limited_client,
+    load_batch_file,
+    run_batch,
+    run_batch_async,
+)
+from research_agent.errors import ResearchError
+from research_agent.shared import CallSlots, current_shared
+from research_agent.usage import UsageSummary, UsageTotals
+
+ENV_BOTH = {"ANTHROPIC_API_KEY": "test-key", "TAVILY_API_KEY": "test-key"}
+
+
+def _usage(cost: float, calls: int = 2) -> UsageSummary:
+    totals = UsageTotals(calls=calls, input_tokens=100 * calls, cost_usd=cost)
+    return UsageSummary(total=totals, by_stage={"summarize": totals})
+
+
+class _FakeAgents:
+    """Stands in for ResearchAgent; records concurrency and shared scopes."""
+
+    def __init__(self, fail_on: str = "", delay: float = 0.02):
+        self.fail_on = fail_on
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.shared_seen = set()
+        self.kwargs = []
+
+    def __call__(self, **kwargs):
+        self.kwargs.append(kwargs)
+        agent = MagicMock()
+        agent.last_source_count = 4
+        agent.last_gate_decision = "full_report"
+        agent.last_critique = None
+        agent.iteration_status = "skipped"
+        agent.iteration_sections = ()
+        agent.source_counts = {}
+        agent.last_usage = _usage(0.25)
+
+        async def research_async(query):
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            self.shared_seen.add(id(current_shared()))
+            await asyncio.sleep(self.delay)
+            self.in_flight -= 1
+            if query == self.fail_on:
+                raise ResearchError("Search failed: nothing")
+            return f"# {query}"
+
+        agent.research_async = research_async
+        return agent
+
+
+class TestLoadBatchFile:
+    def test_text_file(self, tmp_path):
+        path = tmp_path / "queries.txt"
+        path.write_text("# venues\nwedding venue pricing\n\n  catering trends  \n")
+        assert load_batch_file(path) == [
+            BatchQuery(query="wedding venue pricing"),
+            BatchQuery(query="catering trends"),
+        ]
+
+    def test_jsonl_file(self, tmp_path):
+        path = tmp_path / "queries.jsonl"
+        path.write_text("\n".join([
+            json.dumps({"query": "a b c", "mode": "quick", "context": "none"}),
+            json.dumps("plain string query"),
+        ]))
+        assert load_batch_file(path) == [
+            BatchQuery(query="a b c", mode="quick", context="none"),
+            BatchQuery(query="plain string query"),
+        ]
+
+    @pytest.mark.parametrize("line", ["{not json", '{"mode": "quick"}', "[1, 2]"])
+    def test_malformed_jsonl_line(self, tmp_path, line):
+        path = tmp_path / "queries.jsonl"
+        path.write_text(line)
+        with pytest.raises(ResearchError, match=":1:"):
+            load_batch_file(path)
+
+    def test_empty_or_missing_file(self, tmp_path):
+        path = tmp_path / "queries.txt"
+        path.write_text("# only comments\n")
+        with pytest.raises(ResearchError, match="No queries"):
+            load_batch_file(path)
+        with pytest.raises(ResearchError, match="Could not read"):
+            load_batch_file(tmp_path / "missing.txt")
+
+
+class TestBatchLimits:
+    def test_rejects_zero(self):
+        with pytest.raises(ValueError, match="max_search_calls"):
+            BatchLimits(max_search_calls=0)
+
+
+class TestBatchResult:
+    def test_throughput(self):
+        ok = SimpleNamespace(ok=True)
+        failed = SimpleNamespace(ok=False)
+        result = BatchResult(jobs=(ok, ok, failed), elapsed_s=60.0)
+        assert (result.succeeded, result.failed) == (2, 1)
+        assert result.queries_per_minute == pytest.approx(2.0)
+        assert BatchResult(jobs=(), elapsed_s=0.0).queries_per_minute == 0.0
+
+
+class TestLimitedClient:
+    @pytest.mark.asyncio
+    async def test_async_create_holds_slot(self):
+        slots = CallSlots(1)
+
+        class FakeAsyncMessages:
+            async def create(self, **kwargs):
+                return slots._semaphore._value
+
+        async_client = limited_client(slots, SimpleNamespace(messages=FakeAsyncMessages()))
+        assert await async_client.messages.create(model="m") == 0
+        assert slots._semaphore._value == 1
+
+    @pytest.mark.asyncio
+    async def test_async_stream_holds_slot(self):
+        from contextlib import asynccontextmanager
+
+        slots = CallSlots(1)
+
+        class FakeAsyncMessages:
+            @asynccontextmanager
+            async def stream(self, **kwargs):
+                yield slots._semaphore._value
+
+        async_client = limited_client(slots, SimpleNamespace(messages=FakeAsyncMessages()))
+        async with async_client.messages.stream(model="m") as held:
+            assert held == 0
+        assert slots._semaphore._value == 1
+
+
+class TestRunBatch:
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    async def test_runs_queries_concurrently_within_limit(self):
+        agents = _FakeAgents()
+        queries = [f"query number {i}" for i in range(5)]
+        with patch("research_agent.ResearchAgent", agents):
+            result = await run_batch_async(
+                queries, mode="quick", limits=BatchLimits(max_concurrent_queries=2),
+            )
+
+        assert [job.query for job in result.jobs] == queries
+        assert all(job.ok and job.mode == "quick" for job in result.jobs)
+        assert result.jobs[0].result.report == "# query number 0"
+        assert agents.peak == 2
+        # Every job sees the same shared caches and the same client
+        assert len(agents.shared_seen) == 1 and id(None) not in agents.shared_seen
+        assert len({id(kw["async_client"]) for kw in agents.kwargs}) == 1
+        assert all("client" not in kw for kw in agents.kwargs)
+        assert result.usage.total.cost_usd == pytest.approx(1.25)
+        assert result.usage.by_stage["summarize"].calls == 10
+        assert set(result.cache_stats) == {"search", "fetch", "summary"}
+
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    async def test_failed_query_does_not_stop_batch(self):
+        agents = _FakeAgents(fail_on="query two here")
+        finished = []
+        with patch("research_agent.ResearchAgent", agents):
+            result = await run_batch_async(
+                ["query one here", "query two here", "", BatchQuery("query three", mode="bogus")],
+                on_result=finished.append,
+            )
+
+        assert [job.ok for job in result.jobs] == [True, False, False, False]
+        assert "Search failed" in result.jobs[1].error
+        assert "empty" in result.jobs[2].error
+        assert "Invalid mode" in result.jobs[3].error
+        assert result.failed == 3
+        assert len(finished) == 4
+
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    async def test_per_query_overrides(self):
+        agents = _FakeAgents()
+        with patch("research_agent.ResearchAgent", agents):
+            await run_batch_async(
+                [BatchQuery("deep query here", mode="deep", context="none"), "default query"],
+                mode="quick", skip_critique=True,
+            )
+        assert agents.kwargs[0]["mode"].name == "deep"
+        assert agents.kwargs[0]["no_context"] is True
+        assert agents.kwargs[1]["mode"].name == "quick"
+        assert all(kw["skip_critique"] for kw in agents.kwargs)
+
+    async def test_empty_batch_and_missing_key(self):
+        with pytest.raises(ResearchError, match="no queries"):
+            await run_batch_async([])
+        with patch.dict("os.environ", {}, clear=True):
+            with pytest.raises(ResearchError, match="ANTHROPIC_API_KEY"):
+                await run_batch_async(["some query here"])
+
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    def test_sync_wrapper(self):
+        with patch("research_agent.ResearchAgent", _FakeAgents()):
+            result = run_batch(["query one here"], mode="quick")
+        assert result.succeeded == 1
+
+    async def test_sync_wrapper_rejects_running_loop(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            with pytest.raises(ResearchError, match="run_batch_async"):
+                run_batch(["query one here"])
@@ -0,0 +1,183 @@
+"""Tests for the benchmarks record/replay harness."""
+
+import asyncio
+
+import pytest
+from anthropic import RateLimitError
+
+from benchmarks.cassette import Cassette, anthropic_key, system_key
+from benchmarks.record import _RecordingMessages, record_boundaries, record_clients
+from benchmarks.run import run_replay
+from benchmarks.standins import AnthropicStandIn, FaultConfig, WebStandIn
+from research_agent import ResearchAgent, ResearchMode, fetch, search
+from research_agent.token_budget import HeuristicTokenizer
+
+REQUEST = {
+    "model": "claude-sonnet-4-20250514",
+    "max_tokens": 100,
+    "system": "You are evaluating whether a web source is relevant.",
+    "messages": [{"role": "user", "content": "Respond with SCORE: [number]"}],
+}
+
+
+@pytest.fixture
+def no_latency():
+    return FaultConfig(latency_scale=0.0)
+
+
+class TestCassette:
+    def test_save_load_round_trip(self, tmp_path):
+        cassette = Cassette(query="q", mode="quick")
+        cassette.put("search", "tavily|q|5", {"results": [], "latency_s": 0.1})
+        cassette.put("anthropic", anthropic_key(REQUEST), {
+            "system_key": system_key(REQUEST), "response": {"id": "m"}, "latency_s": 0.2,
+        })
+        cassette.save(tmp_path / "c.json")
+
+        loaded = Cassette.load(tmp_path / "c.json")
+        assert loaded.query == "q" and loaded.mode == "quick"
+        assert loaded.get("search", "tavily|q|5")["latency_s"] == 0.1
+        assert loaded.get("fetch", "https://missing.example") is None
+        assert loaded.stats() == {
+            "hits": {"anthropic": 0, "search": 1, "fetch": 0, "jina": 0, "tavily_extract": 0},
+            "misses": {"anthropic": 0, "search": 0, "fetch": 1, "jina": 0, "tavily_extract": 0},
+        }
+
+    def test_anthropic_falls_back_to_same_call_site(self):
+        cassette = Cassette()
+        for i in range(2):
+            request = dict(REQUEST, messages=[{"role": "user", "content": f"prompt {i}"}])
+            cassette.put("anthropic", anthropic_key(request), {
+                "system_key": system_key(REQUEST), "response": {"id": f"m{i}"},
+            })
+        changed = dict(REQUEST, messages=[{"role": "user", "content": "new prompt"}])
+        ids = [cassette.get_anthropic(changed)["response"]["id"] for _ in range(3)]
+        assert ids == ["m0", "m1", "m0"]
+        assert cassette.get_anthropic(dict(REQUEST, system="other")) is None
+        assert cassette.stats()["misses"]["anthropic"] == 1
+
+
+class TestAnthropicStandIn:
+    def test_create_through_sdk(self, no_latency):
+        with AnthropicStandIn(faults=no_latency) as standin:
+            response = standin.client().messages.create(**REQUEST)
+        assert response.content[0].text.startswith("SCORE: ")
+        assert response.usage.input_tokens > 0
+        assert standin.counters.snapshot() == {"create": 1}
+
+    def test_stream_through_sdk(self, no_latency):
+        request = dict(
+            REQUEST, max_tokens=2000, system="You are a research analyst.",
+            messages=[{"role": "user", "content": "Write the report."}],
+        )
+        with AnthropicStandIn(faults=no_latency) as standin:
+            with standin.client().messages.stream(**request) as stream:
+                text = "".join(stream.text_stream)
+                final = stream.get_final_message()
+        assert len(text) > 500
+        assert final.content[0].text == text
+        assert final.usage.output_tokens > 0
+
+    @pytest.mark.asyncio
+    async def test_async_client(self, no_latency):
+        with AnthropicStandIn(faults=no_latency) as standin:
+            response = await standin.async_client().messages.create(**REQUEST)
+        assert response.content[0].text.startswith("SCORE: ")
+
+    def test_injected_rate_limit(self):
+        faults = FaultConfig(latency_scale=0.0, rate_limit_rate=1.0)
+        with AnthropicStandIn(faults=faults) as standin:
+            client = standin.client().with_options(max_retries=0)
+            with pytest.raises(RateLimitError):
+                client.messages.create(**REQUEST)
+        assert standin.counters.snapshot() == {"rate_limited": 1}
+
+    def test_serves_recorded_response(self, no_latency):
+        live = Cassette()
+        with AnthropicStandIn(faults=no_latency) as standin:
+            recording = _RecordingMessages(standin.client().messages, live, is_async=False)
+            recorded = recording.create(**REQUEST)
+        assert len(live.entries["anthropic"]) == 1
+
+        with AnthropicStandIn(live, no_latency) as standin:
+            replayed = standin.client().messages.create(**REQUEST)
+        assert replayed.id == recorded.id
+        assert live.stats()["hits"]["anthropic"] == 1
+
+
+    async def test_records_async_stream(self, no_latency):
+        request = dict(
+            REQUEST, max_tokens=2000, system="You are a research analyst.",
+            messages=[{"role": "user", "content": "Write the report."}],
+        )
+        live = Cassette()
+        with AnthropicStandIn(faults=no_latency) as standin:
+            recording = _RecordingMessages(standin.async_client().messages, live, is_async=True)
+            async with recording.stream(**request) as stream:
+                text = "".join([chunk async for chunk in stream.text_stream])
+
+        [entry] = live.entries["anthropic"].values()
+        assert entry["stream"] is True
+        assert entry["response"]["content"][0]["text"] == text
+
+
+class TestWebStandIn:
+    def test_search_and_fetch(self, no_latency):
+        with WebStandIn(faults=no_latency) as web:
+            results = search._search_tavily("venue pricing", 4, "key")
+            page = asyncio.run(fetch._fetch_single(None, results[1].url, asyncio.Semaphore(1)))
+        assert len(results) == 4
+        assert results[0].raw_content and not results[1].raw_content
+        assert page.status_code == 200 and "<article>" in page.html
+        assert web.counters.snapshot() == {"search_tavily": 1, "fetch": 1}
+
+    def test_record_then_replay(self, no_latency):
+        cassette = Cassette()
+        with WebStandIn(faults=no_latency):
+            with record_boundaries(cassette):
+                recorded = search._search_tavily("venue pricing", 3, "key")
+        assert list(cassette.entries["search"]) == ["tavily|venue pricing|3"]
+
+        cassette.entries["search"]["tavily|venue pricing|3"]["results"][0]["title"] = "Recorded"
+        with WebStandIn(cassette, no_latency):
+            replayed = search._search_tavily("venue pricing", 3, "key")
+        assert replayed[0].title == "Recorded"
+        assert [r.url for r in replayed] == [r.url for r in recorded]
+
+
+class TestRunReplay:
+    def test_quick_mode_end_to_end(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "replay")
+        monkeypatch.setenv("TAVILY_API_KEY", "replay")
+        result = run_replay("quick", "wedding venue pricing trends", faults=FaultConfig(latency_scale=0.0))
+
+        assert result["error"] == ""
+        assert result["report_chars"] > 0
+        assert result["claude_calls"] > 0
+        assert result["claude_calls_by_stage"]["summarize"] > 0
+        assert result["web_calls"]["fetch"] > 0
+        assert "stage.fetch_extract_summarize" in result["stages_s"]
+        assert result["peak_rss_mb"] > 0
+
+
+class TestRecord:
+    def test_records_quick_run_through_async_streaming(self, tmp_path, monkeypatch, no_latency):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "replay")
+        monkeypatch.setenv("TAVILY_API_KEY", "replay")
+        # Replayed usage would calibrate the shared tokenizer for later tests
+        monkeypatch.setattr("research_agent.token_budget._tokenizer", HeuristicTokenizer())
+        cassette = Cassette()
+        with AnthropicStandIn(faults=no_latency) as claude, WebStandIn(faults=no_latency):
+            agent = ResearchAgent(mode=ResearchMode.quick(), no_context=True)
+            agent.client = claude.client()
+            agent.async_client = claude.async_client()
+            record_clients(agent, cassette)
+            with record_boundaries(cassette):
+                report = agent.research("wedding venue pricing trends")
+
+        streamed = [e for e in cassette.entries["anthropic"].values() if e["stream"]]
+        assert report
+        assert streamed
+        assert cassette.entries["search"] and cassette.entries["fetch"]
@@ -0,0 +1,273 @@
+"""Tests for research_agent.catalog module."""
+
+import json
+import os
+import sqlite3
+
+import pytest
+import yaml
+
+from research_agent import catalog
+from research_agent.catalog import (
+    catalog_path,
+    index_critique,
+    index_run,
+    list_reports,
+    open_reports_catalog,
+    rebuild_catalog,
+    recent_critiques,
+    recent_runs,
+    search_reports,
+    source_domains,
+)
+from research_agent.report_index import get_entry, load_sources, record_report
+from research_agent.results import StoredSource
+
+
+@pytest.fixture
+def reports(tmp_path, monkeypatch):
+    reports_dir = tmp_path / "reports"
+    reports_dir.mkdir()
+    monkeypatch.setattr("research_agent.report_store.REPORTS_DIR", reports_dir)
+    return reports_dir
+
+
+def _settle(directory):
+    """Age a directory's mtime so the catalog trusts it to skip a rescan."""
+    past = os.stat(directory).st_mtime_ns - 60_000_000_000
+    os.utime(directory, ns=(past, past))
+
+
+def _report_row(reports_dir, filename):
+    conn = open_reports_catalog(reports_dir)
+    try:
+        conn.row_factory = sqlite3.Row
+        return conn.execute("SELECT * FROM reports WHERE filename = ?", (filename,)).fetchone()
+    finally:
+        conn.close()
+
+
+class TestListReports:
+    def test_newest_first_undated_last(self, reports):
+        (reports / "notes.md").write_text("x")
+        (reports / "b_2026-02-03_183703056652.md").write_text("x")
+        (reports / "2026-03-01_120000_a.md").write_text("x")
+        (reports / "a_2026-02-03_100000000000.md").write_text("x")
+        (reports / "data.json").write_text("{}")
+
+        assert [r.filename for r in list_reports(reports)] == [
+            "2026-03-01_120000_a.md",
+            "a_2026-02-03_100000000000.md",
+            "b_2026-02-03_183703056652.md",
+            "notes.md",
+        ]
+        assert catalog_path(reports / "meta").is_file()
+
+    def test_added_and_deleted_files_picked_up(self, reports):
+        (reports / "one.md").write_text("x")
+        assert [r.filename for r in list_reports(reports)] == ["one.md"]
+
+        (reports / "one.md").unlink()
+        (reports / "two.md").write_text("x")
+        assert [r.filename for r in list_reports(reports)] == ["two.md"]
+
+    def test_unchanged_directory_not_rescanned(self, reports, monkeypatch):
+        (reports / "one.md").write_text("x")
+        list_reports(reports)
+        _settle(reports)
+        list_reports(reports)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("rescanned an unchanged directory")
+        monkeypatch.setattr(catalog.os, "scandir", fail)
+        assert [r.filename for r in list_reports(reports)] == ["one.md"]
+
+    def test_existing_catalog_opened_without_schema_writes(self, reports, monkeypatch):
+        (reports / "one.md").write_text("x")
+        list_reports(reports)
+
+        monkeypatch.setattr(catalog, "_SCHEMA", "not sql")
+        assert [r.filename for r in list_reports(reports)] == ["one.md"]
+
+    def test_symlink_outside_directory_not_indexed(self, reports, tmp_path):
+        outside = tmp_path / "outside.md"
+        outside.write_text("x")
+        (reports / "link.md").symlink_to(outside)
+        (reports / "real.md").write_text("x")
+
+        assert [r.filename for r in list_reports(reports)] == ["real.md"]
+
+    def test_unopenable_catalog_falls_back_to_scan(self, reports):
+        catalog_path(reports / "meta").mkdir(parents=True)
+        (reports / "one.md").write_text("x")
+
+        assert [r.filename for r in list_reports(reports)] == ["one.md"]
+
+
+class TestIndexReport:
+    def test_saved_metadata_kept_across_rescans(self, reports):
+        path = reports / "solar_2026-02-03_183703056652.md"
+        path.write_text("# Solar Recycling\n\nBody.")
+        record_report(path, "Solar recycling?", "deep", "energy",
+                      ("https://www.epa.gov/a", "https://epa.gov/b", "https://nrel.gov/c"), "full_report")
+        (reports / "other.md").write_text("x")
+
+        row = _report_row(reports, path.name)
+        assert (row["title"], row["query"], row["mode"], row["context"], row["status"]) == (
+            "Solar Recycling", "Solar recycling?", "deep", "energy", "full_report",
+        )
+        assert row["source_domains"] == "epa.gov nrel.gov"
+
+    def test_record_report_indexes_the_report(self, reports):
+        path = reports / "r1.md"
+        path.write_text("# Report")
+        record_report(path, "Solar panel recycling costs", "standard", None,
+                      ("https://a.com",), "short_report")
+
+        assert _report_row(reports, "r1.md")["status"] == "short_report"
+
+    def test_missing_file_ignored(self, reports):
+        record_report(reports / "gone.md", "solar recycling", "standard", None, (), "full_report")
+        assert _report_row(reports, "gone.md") is None
+
+    def test_source_domains(self):
+        assert source_domains(["https://www.a.com/x", "http://b.org", "https://a.com/y", "bad"]) == (
+            "a.com", "b.org",
+        )
+
+
+@pytest.fixture
+def searchable(reports):
+    def save(name, body, mode="standard", status="full_report", urls=()):
+        path = reports / name
+        path.write_text(body)
+        record_report(path, name, mode, None, urls, status)
+
+    save("solar_2026-01-10_100000000000.md",
+         "# Solar Panel Recycling\n\nSilicon and silver recovery from end-of-life panels.",
+         mode="deep", urls=("https://www.epa.gov/a", "https://news.nrel.gov/b"))
+    save("wind_2026-02-10_100000000000.md",
+         "# Wind Turbine Blades\n\nBlade recycling is harder than solar panel recycling.",
+         urls=("https://windeurope.org/x",))
+    save("batteries_2026-03-10_100000000000.md",
+         "# Battery Recycling\n\nLithium recovery.", status="short_report")
+    return reports
+
+
+def _names(matches):
+    return [m.filename.split("_")[0] for m in matches]
+
+
+class TestSearchReports:
+    def test_text_ranked_with_snippets(self, searchable):
+        matches = search_reports(searchable, "solar recycling")
+
+        assert _names(matches) == ["solar", "wind"]
+        assert matches[0].score > matches[1].score > 0
+        assert matches[0].title == "Solar Panel Recycling"
+        assert matches[0].source_domains == ("epa.gov", "news.nrel.gov")
+        assert "**" in matches[0].snippet
+
+    def test_phrases_and_operators_taken_literally(self, searchable):
+        assert _names(search_reports(searchable, '"silver recovery"')) == ["solar"]
+        assert _names(search_reports(searchable, '"recovery silver"')) == []
+        assert _names(search_reports(searchable, "lithium OR NEAR(")) == []
+
+    def test_filters(self, searchable):
+        assert _names(search_reports(searchable, mode="deep")) == ["solar"]
+        assert _names(search_reports(searchable, status="short_report")) == ["batteries"]
+        assert _names(search_reports(searchable, domain="nrel.gov")) == ["solar"]
+        assert _names(search_reports(searchable, domain="https://epa.gov/")) == ["solar"]
+        assert _names(search_reports(searchable, domain="europe.org")) == []
+        assert _names(search_reports(searchable, since="2026-02-01", until="2026-02-28")) == ["wind"]
+
+    def test_no_text_lists_newest_first(self, searchable):
+        matches = search_reports(searchable, limit=2)
+
+        assert _names(matches) == ["batteries", "wind"]
+        assert matches[0].score == 0.0
+        assert matches[0].snippet == ""
+
+    def test_hand_added_report_searchable(self, searchable):
+        (searchable / "notes.md").write_text("# Notes\n\nPerovskite cells.")
+
+        [match] = search_reports(searchable, "perovskite")
+        assert (match.filename, match.mode, match.date) == ("notes.md", "", "")
+
+    @pytest.mark.parametrize("filters, message", [
+        ({"status": "great"}, "status must be one of"),
+        ({"since": "2026-13-01"}, "since must be a YYYY-MM-DD date"),
+        ({"limit": 0}, "limit must be >= 1"),
+    ])
+    def test_invalid_filters_rejected(self, searchable, filters, message):
+        with pytest.raises(ValueError, match=message):
+            search_reports(searchable, **filters)
+
+
+class TestRecentCritiques:
+    def test_newest_first_with_unreadable_counted(self, tmp_path):
+        meta = tmp_path / "meta"
+        meta.mkdir()
+        for i, text in enumerate(["overall_pass: true\n", "{{{not yaml", "overall_pass: false\n"]):
+            path = meta / f"critique-{i}.yaml"
+            path.write_text(text)
+            os.utime(path, (1000 + i, 1000 + i))
+
+        assert recent_critiques(meta, limit=2) == [{"overall_pass": False}, None]
+
+    def test_saved_critique_indexed_directly(self, tmp_path):
+        meta = tmp_path / "meta"
+        meta.mkdir()
+        path = meta / "critique-1.yaml"
+        path.write_text(yaml.dump({"overall_pass": True, "mean_score": 4.0}))
+        index_critique(path, {"overall_pass": True, "mean_score": 4.0})
+
+        conn = sqlite3.connect(catalog_path(meta))
+        try:
+            assert conn.execute("SELECT name, overall_pass, mean_score FROM critiques").fetchall() == [
+                ("critique-1.yaml", 1, 4.0),
+            ]
+        finally:
+            conn.close()
+
+
+class TestRecentRuns:
+    def test_newest_first_malformed_skipped(self, tmp_path):
+        meta = tmp_path / "meta"
+        meta.mkdir()
+        run = {"query": "q", "mode": "quick", "total": {"cost_usd": 0.1}}
+        (meta / "usage-1.json").write_text(json.dumps(run))
+        (meta / "usage-2.json").write_text("{broken")
+        (meta / "usage-3.json").write_text(json.dumps({"no": "total"}))
+        path = meta / "usage-4.json"
+        path.write_text(json.dumps({**run, "query": "newest"}))
+        index_run(path, {**run, "query": "newest"})
+
+        assert [r["query"] for r in recent_runs(meta, limit=5)] == ["newest", "q"]
+
+
+class TestRebuildCatalog:
+    def test_rebuild_keeps_index_entries(self, reports):
+        path = reports / "r1.md"
+        path.write_text("# Report")
+        source = StoredSource(url="https://a.com", title="A", score=4, summaries=("S",))
+        record_report(path, "Solar panel recycling costs", "deep", None,
+                      ("https://a.com",), "full_report", sources=[source])
+        (reports / "meta" / "critique-1.yaml").write_text("overall_pass: true\n")
+
+        stats = rebuild_catalog(reports)
+
+        assert (stats.reports, stats.critiques, stats.runs, stats.index_entries) == (1, 1, 0, 1)
+        assert get_entry("r1.md").mode == "deep"
+        assert load_sources("r1.md") == (source,)
+        assert _report_row(reports, "r1.md")["source_domains"] == "a.com"
+
+    def test_corrupt_catalog_recreated_from_files(self, reports):
+        (reports / "r1.md").write_text("# Report")
+        catalog_path(reports / "meta").parent.mkdir(parents=True)
+        catalog_path(reports / "meta").write_bytes(b"not a database")
+
+        stats = rebuild_catalog(reports)
+
+        assert (stats.reports, stats.index_entries) == (1, 0)
+        assert [r.filename for r in list_reports(reports)] == ["r1.md"]
@@ -0,0 +1,84 @@
+"""Tests for research_agent.checkpoint module."""
+
+import pytest
+
+from research_agent.checkpoint import (
+    MANIFEST_NAME,
+    RunCheckpoint,
+    evaluation_from_dict,
+    evaluation_to_dict,
+    from_rows,
+    to_rows,
+)
+from research_agent.errors import GateDecision, ResearchError
+from research_agent.extract import ExtractedContent
+from research_agent.relevance import RelevanceEvaluation, SourceScore
+from research_agent.search import SearchResult
+from research_agent.summarize import Summary
+
+
+class TestRows:
+    def test_round_trip(self):
+        results = [SearchResult(title="T", url="https://a.example", snippet="S", raw_content="R")]
+        contents = [ExtractedContent(url="https://a.example", title="T", text="x", source_tier="snippet")]
+        assert from_rows(SearchResult, to_rows(results)) == results
+        assert from_rows(ExtractedContent, to_rows(contents)) == contents
+
+    def test_summary_cache_field_not_saved(self):
+        summary = Summary(url="https://a.example", title="T", summary="S")
+        summary.safe_summary  # populate the sanitize cache
+        rows = to_rows([summary])
+        assert set(rows[0]) == {"url", "title", "summary", "source_tier"}
+        assert from_rows(Summary, rows) == [summary]
+
+    def test_evaluation_round_trip(self):
+        evaluation = RelevanceEvaluation(
+            decision=GateDecision.SHORT_REPORT,
+            decision_rationale="Few sources",
+            surviving_sources=(Summary(url="https://a.example", title="A", summary="S"),),
+            dropped_sources=(SourceScore(url="https://b.example", title="B", score=1, explanation="off"),),
+            total_scored=2,
+            total_survived=1,
+            refined_query=None,
+            surviving_scores=(SourceScore(url="https://a.example", title="A", score=4, explanation="on"),),
+        )
+        restored = evaluation_from_dict(evaluation_to_dict(evaluation))
+        assert restored == evaluation
+        assert restored.decision is GateDecision.SHORT_REPORT
+
+
+class TestRunCheckpoint:
+    def test_create_save_and_reopen(self, tmp_path):
+        checkpoint = RunCheckpoint.create("venue pricing", "deep", tmp_path)
+        assert (checkpoint.directory / MANIFEST_NAME).is_file()
+        checkpoint.save("draft", {"draft": "Draft text"})
+
+        reopened = RunCheckpoint.open(checkpoint.run_id, tmp_path)
+        assert (reopened.query, reopened.mode) == ("venue pricing", "deep")
+        assert reopened.load("draft") == {"draft": "Draft text"}
+        assert reopened.load("findings") is None
+        assert reopened.completed_stages() == ("draft",)
+
+    def test_unreadable_stage_is_rerun(self, tmp_path):
+        checkpoint = RunCheckpoint.create("venue pricing", "deep", tmp_path)
+        (checkpoint.directory / "draft.json").write_text("{truncated")
+        assert checkpoint.load("draft") is None
+
+    def test_discard(self, tmp_path):
+        checkpoint = RunCheckpoint.create("venue pricing", "deep", tmp_path)
+        checkpoint.discard()
+        assert not checkpoint.directory.exists()
+        with pytest.raises(ResearchError, match="No resumable run"):
+            RunCheckpoint.open(checkpoint.run_id, tmp_path)
+
+    @pytest.mark.parametrize("run_id", ["../escape", "", "a/b", ".hidden"])
+    def test_rejects_unsafe_run_ids(self, tmp_path, run_id):
+        with pytest.raises(ResearchError, match="Invalid run ID"):
+            RunCheckpoint.open(run_id, tmp_path)
+
+    def test_write_failure_does_not_raise(self, tmp_path):
+        blocker = tmp_path / "runs"
+        blocker.write_text("not a directory")
+        checkpoint = RunCheckpoint.create("venue pricing", "deep", blocker)
+        checkpoint.save("draft", {"draft": "x"})
+        assert checkpoint.load("draft") is None
@@ -11,6 +11,7 @@ from research_agent.context import (
     load_critique_history,
     resolve_context_path,
     auto_detect_context,
+    auto_detect_context_async,
     list_available_contexts,
     CONTEXTS_DIR,
     _validate_critique_yaml,
@@ -1075,3 +1076,32 @@ class TestParseTemplateFrontmatterDetection:
         has_fm2 = plain.strip().startswith("---")
         is_error2 = has_fm2 and tmpl2 is None and prof2 is None
         assert not is_error2  # not a parse error — just no frontmatter
+
+
+class TestAutoDetectContextAsync:
+    """Tests for auto_detect_context_async()."""
+
+    async def test_selects_matching_context(self, tmp_path, monkeypatch):
+        from unittest.mock import AsyncMock, MagicMock
+
+        ctx_dir = tmp_path / "contexts"
+        ctx_dir.mkdir()
+        (ctx_dir / "pfe.md").write_text("# Pacific Flow\n\nMusic entertainment.")
+        (ctx_dir / "tech.md").write_text("# Tech Startup\n\nSaaS platform.")
+        monkeypatch.setattr("research_agent.context.CONTEXTS_DIR", ctx_dir)
+        client = MagicMock()
+        client.messages.create = AsyncMock(return_value=MagicMock(content=[MagicMock(text="pfe")]))
+
+        result = await auto_detect_context_async(client, "Who are PFE's competitors?")
+
+        assert result == ctx_dir / "pfe.md"
+
+    async def test_no_contexts_skips_api(self, tmp_path, monkeypatch):
+        from unittest.mock import AsyncMock, MagicMock
+
+        monkeypatch.setattr("research_agent.context.CONTEXTS_DIR", tmp_path / "nope")
+        client = MagicMock()
+        client.messages.create = AsyncMock()
+
+        assert await auto_detect_context_async(client, "any query") is None
+        client.messages.create.assert_not_called()
@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, patch, AsyncMock
 from research_agent.critique import (
     CritiqueResult,
     evaluate_report,
+    evaluate_report_async,
     save_critique,
     _parse_critique_response,
 )
@@ -260,17 +261,17 @@ class TestSaveCritique:
 # --- Agent integration: _run_critique ---
 
 class TestAgentCritiqueIntegration:
-    def test_quick_mode_skips_critique(self):
+    async def test_quick_mode_skips_critique(self):
         """Quick mode should not call evaluate_report."""
         from research_agent.agent import ResearchAgent
         from research_agent.modes import ResearchMode
 
         agent = ResearchAgent(mode=ResearchMode.quick())
-        with patch("research_agent.agent.evaluate_report") as mock_eval:
-            agent._run_critique("q", 3, 1, None, "full_report")
+        with patch("research_agent.agent.evaluate_report_async") as mock_eval:
+            await agent._run_critique("q", 3, 1, None, "full_report")
             mock_eval.assert_not_called()
 
-    def test_standard_mode_calls_critique(self):
+    async def test_standard_mode_calls_critique(self):
         """Standard mode should call evaluate_report and save_critique."""
         from research_agent.agent import ResearchAgent
         from research_agent.modes import ResearchMode
@@ -280,22 +281,22 @@ class TestAgentCritiqueIntegration:
             source_diversity=3, claim_support=3, coverage=3,
             geographic_balance=3, actionability=3, weaknesses="", suggestions="",
         )
-        with patch("research_agent.agent.evaluate_report", return_value=fake_result) as mock_eval, \
+        with patch("research_agent.agent.evaluate_report_async", return_value=fake_result) as mock_eval, \
              patch("research_agent.agent.save_critique") as mock_save:
-            agent._run_critique("q", 5, 2, [], "full_report")
+            await agent._run_critique("q", 5, 2, [], "full_report")
             mock_eval.assert_called_once()
             mock_save.assert_called_once()
             assert agent._last_critique is fake_result
 
-    def test_critique_error_caught_gracefully(self):
+    async def test_critique_error_caught_gracefully(self):
         """Pipeline should complete even if critique throws OSError."""
         from research_agent.agent import ResearchAgent
         from research_agent.modes import ResearchMode
 
         agent = ResearchAgent(mode=ResearchMode.standard())
-        with patch("research_agent.agent.evaluate_report", side_effect=OSError("disk full")):
+        with patch("research_agent.agent.evaluate_report_async", side_effect=OSError("disk full")):
             # Should not raise
-            agent._run_critique("q", 5, 2, [], "full_report")
+            await agent._run_critique("q", 5, 2, [], "full_report")
             assert agent._last_critique is None
 
 
@@ -376,6 +377,7 @@ class TestCritiqueContextThreading:
         from research_agent.modes import ResearchMode
         from research_agent.relevance import RelevanceEvaluation
         from research_agent.context_result import ContextResult
+        from research_agent.summarize import Summary
 
         agent = ResearchAgent(mode=ResearchMode.standard())
         agent._start_time = 0.0
@@ -385,7 +387,7 @@ class TestCritiqueContextThreading:
         fake_eval = RelevanceEvaluation(
             decision="full_report",
             decision_rationale="sufficient sources",
-            surviving_sources=(MagicMock(summary="s1"),),
+            surviving_sources=(Summary(url="https://example.com", title="T", summary="s1"),),
             dropped_sources=(),
             total_scored=1,
             total_survived=1,
@@ -394,10 +396,10 @@ class TestCritiqueContextThreading:
         fake_finding = MagicMock(critical_count=0, concern_count=0)
 
         with patch("research_agent.agent.evaluate_sources", new_callable=AsyncMock, return_value=fake_eval), \
-             patch("research_agent.agent.synthesize_draft", return_value="draft"), \
+             patch("research_agent.agent.synthesize_draft_async", return_value="draft"), \
              patch("research_agent.agent.load_full_context", return_value=ContextResult.not_configured(source="")), \
              patch("research_agent.agent.run_skeptic_combined", new_callable=AsyncMock, return_value=fake_finding), \
-             patch("research_agent.agent.synthesize_final", return_value="# Report") as mock_synth, \
+             patch("research_agent.agent.synthesize_final_async", return_value="# Report") as mock_synth, \
              patch.object(agent, "_run_critique"), \
              patch.object(agent, "_run_iteration", new_callable=AsyncMock, return_value=("# Report", 0)):
             await agent._evaluate_and_synthesize(
@@ -408,3 +410,34 @@ class TestCritiqueContextThreading:
             )
             _, kwargs = mock_synth.call_args
             assert kwargs["critique_guidance"] == "Focus on coverage"
+
+
+# --- evaluate_report_async ---
+
+
+class TestEvaluateReportAsync:
+    async def test_parses_scores(self):
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(return_value=MagicMock(
+            content=[MagicMock(text=(
+                "SOURCE_DIVERSITY: 4\nCLAIM_SUPPORT: 3\nCOVERAGE: 4\n"
+                "GEOGRAPHIC_BALANCE: 2\nACTIONABILITY: 3\n"
+                "WEAKNESSES: thin sources\nSUGGESTIONS: search more broadly"
+            ))]
+        ))
+
+        result = await evaluate_report_async(
+            mock_client, "AI music licensing", "standard", 6, 2, [], "full_report",
+        )
+
+        assert result.source_diversity == 4
+        assert result.weaknesses == "thin sources"
+
+    async def test_empty_response_returns_defaults(self):
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(return_value=MagicMock(content=[]))
+
+        result = await evaluate_report_async(
+            mock_client, "q", "standard", 5, 1, None, "full_report",
+        )
+        assert result == CritiqueResult.fallback()
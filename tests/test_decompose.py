@@ -6,6 +6,7 @@ from unittest.mock import patch, MagicMock
 
 from research_agent.decompose import (
     decompose_query,
+    decompose_query_async,
     DecompositionResult,
     _validate_sub_queries,
     _parse_decomposition_response,
@@ -474,3 +475,39 @@ class TestNoveltyQueriesParam:
         ]
         validated = _validate_sub_queries(sub_queries, original)
         assert "blockchain cryptocurrency exchange regulations" not in validated
+
+
+class TestDecomposeQueryAsync:
+    """Tests for decompose_query_async()."""
+
+    async def test_complex_query_decomposes(self, mock_anthropic_response):
+        from unittest.mock import AsyncMock
+
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(return_value=mock_anthropic_response(
+            "TYPE: COMPLEX\n"
+            "REASONING: Pricing and venues are separate angles\n"
+            "SUB_QUERIES:\n"
+            "- luxury wedding entertainment pricing data\n"
+            "- San Diego premium wedding venue requirements"
+        ))
+
+        result = await decompose_query_async(mock_client, "San Diego luxury wedding entertainment market")
+
+        assert result.is_complex is True
+        assert len(result.sub_queries) == 2
+        mock_client.messages.create.assert_awaited_once()
+
+    async def test_api_error_falls_back_to_original(self):
+        from unittest.mock import AsyncMock
+        from anthropic import APIError
+
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(
+            side_effect=APIError(message="fail", request=MagicMock(), body=None)
+        )
+
+        result = await decompose_query_async(mock_client, "Python async best practices")
+
+        assert result.sub_queries == ("Python async best practices",)
+        assert result.is_complex is False
@@ -9,6 +9,7 @@ from research_agent.fetch import (
     is_safe_url,
     fetch_urls,
     FetchedPage,
+    PageValidators,
 )
 
 
@@ -328,3 +329,59 @@ class TestFetchUrls:
                 results = await fetch_urls(["https://example.com"])
 
                 assert len(results) == 0
+
+    async def test_fetch_urls_records_validators(self, mock_httpx_response):
+        """ETag and Last-Modified are kept for a later conditional fetch."""
+        mock_response = mock_httpx_response()
+        mock_response.headers.update({"etag": '"v1"', "last-modified": "Mon, 05 Oct 2026 10:00:00 GMT"})
+
+        with patch("research_agent.fetch.is_safe_url", new_callable=AsyncMock, return_value=True):
+            with patch("research_agent.fetch.httpx.AsyncClient") as mock_client_class:
+                mock_client = AsyncMock()
+                mock_client.stream = MagicMock(return_value=_make_stream_ctx(mock_response))
+                mock_client_class.return_value.__aenter__.return_value = mock_client
+
+                [page] = await fetch_urls(["https://example.com"])
+
+                assert page.etag == '"v1"'
+                assert page.last_modified == "Mon, 05 Oct 2026 10:00:00 GMT"
+                assert page.not_modified is False
+
+
+class TestConditionalFetch:
+    """Tests for fetch_urls() with validators from an earlier fetch."""
+
+    async def test_not_modified_page_returned_without_body(self, mock_httpx_response):
+        mock_response = mock_httpx_response(status_code=304, text="")
+        validators = {"https://example.com": PageValidators(etag='"v1"', last_modified="Mon")}
+
+        with patch("research_agent.fetch.is_safe_url", new_callable=AsyncMock, return_value=True):
+            with patch("research_agent.fetch.httpx.AsyncClient") as mock_client_class:
+                mock_client = AsyncMock()
+                mock_client.stream = MagicMock(return_value=_make_stream_ctx(mock_response))
+                mock_client_class.return_value.__aenter__.return_value = mock_client
+
+                [page] = await fetch_urls(["https://example.com"], validators=validators)
+
+                assert page.not_modified is True
+                assert page.html == ""
+                assert page.etag == '"v1"'
+                _, kwargs = mock_client.stream.call_args
+                assert kwargs["headers"] == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon"}
+
+    async def test_unconditional_fetch_sends_no_validators(self, mock_httpx_response):
+        mock_response = mock_httpx_response()
+
+        with patch("research_agent.fetch.is_safe_url", new_callable=AsyncMock, return_value=True):
+            with patch("research_agent.fetch.httpx.AsyncClient") as mock_client_class:
+                mock_client = AsyncMock()
+                mock_client.stream = MagicMock(return_value=_make_stream_ctx(mock_response))
+                mock_client_class.return_value.__aenter__.return_value = mock_client
+
+                await fetch_urls(["https://example.com"])
+
+                _, kwargs = mock_client.stream.call_args
+                assert kwargs["headers"] == {}
+
+    def test_validators_without_values_add_no_headers(self):
+        assert PageValidators().headers() == {}
@@ -0,0 +1,172 @@
+"""Tests for research_agent.gap_cycle module."""
+
+import asyncio
+import warnings
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from research_agent.cycle_config import CycleConfig
+from research_agent.errors import ResearchError, StateError
+from research_agent.gap_cycle import gap_query, run_gap_cycle, run_gap_cycle_async
+from research_agent.schema import Gap, GapStatus, load_schema
+from research_agent.shared import current_shared
+from research_agent.state import save_schema
+from research_agent.usage import UsageSummary
+
+ENV_BOTH = {"ANTHROPIC_API_KEY": "test-key", "TAVILY_API_KEY": "test-key"}
+
+FRESH = datetime.now(timezone.utc).isoformat()
+
+
+class _GapAgents:
+    """Stands in for ResearchAgent; the gate decision depends on the query."""
+
+    def __init__(self, decisions: dict[str, str]):
+        self.decisions = decisions
+        self.kwargs = []
+        self.queries = []
+        self.shared_seen = set()
+
+    def __call__(self, **kwargs):
+        self.kwargs.append(kwargs)
+        agent = MagicMock()
+        agent.last_source_count = 3
+        agent.last_critique = None
+        agent.iteration_status = "skipped"
+        agent.iteration_sections = ()
+        agent.source_counts = {}
+        agent.last_usage = UsageSummary()
+
+        async def research_async(query):
+            self.queries.append(query)
+            self.shared_seen.add(id(current_shared()))
+            await asyncio.sleep(0.01)
+            for key, decision in self.decisions.items():
+                if key in query:
+                    if decision == "error":
+                        raise ResearchError("Search failed: nothing")
+                    agent.last_gate_decision = decision
+                    return f"# {query}"
+            agent.last_gate_decision = "insufficient_data"
+            return f"# {query}"
+
+        agent.research_async = research_async
+        return agent
+
+
+def _write_schema(tmp_path, gaps):
+    path = tmp_path / "schema.yaml"
+    save_schema(path, tuple(gaps))
+    return path
+
+
+class TestGapQuery:
+    def test_uses_category_and_id_words(self):
+        gap = Gap(id="venue_pricing-2026", category="market")
+        assert gap_query(gap) == "market: venue pricing 2026"
+
+    def test_topic_prefix(self):
+        gap = Gap(id="pricing", category="market")
+        assert gap_query(gap, "  San Diego weddings ") == "San Diego weddings — market: pricing"
+
+
+class TestRunGapCycle:
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    async def test_each_gap_follows_its_own_decision(self, tmp_path):
+        path = _write_schema(tmp_path, [
+            Gap(id="pricing", category="market", priority=5),
+            Gap(id="competitors", category="market", priority=4),
+            Gap(id="reviews", category="reputation", priority=3),
+            Gap(id="staffing", category="ops", priority=2),
+            Gap(id="fresh", category="ops", status=GapStatus.VERIFIED,
+                last_verified=FRESH, last_checked=FRESH),
+        ])
+        agents = _GapAgents({
+            "pricing": "full_report",
+            "competitors": "no_new_findings",
+            "reviews": "insufficient_data",
+            "staffing": "error",
+        })
+        with patch("research_agent.ResearchAgent", agents):
+            result = await run_gap_cycle_async(path, topic="weddings", mode="quick")
+
+        assert [g.gap.id for g in result.gaps] == ["pricing", "competitors", "reviews", "staffing"]
+        assert result.verified == ("pricing",)
+        assert result.checked == ("competitors",)
+        assert result.schema_saved
+        assert result.batch.failed == 1
+        # One shared scope for every gap; the runner owns the schema
+        assert len(agents.shared_seen) == 1
+        assert all(kw["use_gap_schema"] is False for kw in agents.kwargs)
+        assert "weddings — market: pricing" in agents.queries
+
+        saved = {g.id: g for g in load_schema(path).gaps}
+        assert saved["pricing"].status == GapStatus.VERIFIED
+        assert saved["competitors"].status == GapStatus.UNKNOWN
+        assert saved["competitors"].last_checked is not None
+        assert saved["reviews"] == Gap(id="reviews", category="reputation", priority=3)
+        assert saved["staffing"] == Gap(id="staffing", category="ops", priority=2)
+        assert saved["fresh"].last_verified == FRESH
+        assert (tmp_path / "gap_audit.log").exists()
+
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    async def test_selection_respects_max_gaps_and_saves_once(self, tmp_path):
+        path = _write_schema(tmp_path, [
+            Gap(id=f"gap{i}", category="market", priority=i) for i in range(1, 5)
+        ])
+        agents = _GapAgents({"gap": "full_report"})
+        with patch("research_agent.ResearchAgent", agents), \
+             patch("research_agent.gap_cycle.save_schema", wraps=save_schema) as mock_save:
+            result = await run_gap_cycle_async(
+                path, mode="quick", cycle_config=CycleConfig(max_gaps_per_run=2),
+            )
+        assert result.verified == ("gap4", "gap3")
+        mock_save.assert_called_once()
+        assert len(mock_save.call_args.args[1]) == 4
+
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    async def test_no_state_change_skips_save(self, tmp_path):
+        path = _write_schema(tmp_path, [Gap(id="pricing", category="market")])
+        with patch("research_agent.ResearchAgent", _GapAgents({})), \
+             patch("research_agent.gap_cycle.save_schema") as mock_save:
+            result = await run_gap_cycle_async(path, mode="quick")
+        assert result.verified == result.checked == ()
+        assert not result.schema_saved
+        mock_save.assert_not_called()
+
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    async def test_save_failure_logged_not_raised(self, tmp_path):
+        path = _write_schema(tmp_path, [Gap(id="pricing", category="market")])
+        with patch("research_agent.ResearchAgent", _GapAgents({"pricing": "full_report"})), \
+             patch("research_agent.gap_cycle.save_schema", side_effect=StateError("disk full")):
+            result = await run_gap_cycle_async(path, mode="quick")
+        assert result.verified == ("pricing",)
+        assert not result.schema_saved
+
+    async def test_all_fresh_returns_empty_result(self, tmp_path):
+        path = _write_schema(tmp_path, [
+            Gap(id="pricing", category="market", status=GapStatus.VERIFIED,
+                last_verified=FRESH, last_checked=FRESH),
+        ])
+        result = await run_gap_cycle_async(path)
+        assert result.gaps == () and result.batch is None
+
+    async def test_missing_schema_raises(self, tmp_path):
+        with pytest.raises(ResearchError, match="No gaps"):
+            await run_gap_cycle_async(tmp_path / "missing.yaml")
+
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    def test_sync_wrapper(self, tmp_path):
+        path = _write_schema(tmp_path, [Gap(id="pricing", category="market")])
+        with patch("research_agent.ResearchAgent", _GapAgents({"pricing": "short_report"})):
+            result = run_gap_cycle(path, mode="quick")
+        assert result.verified == ("pricing",)
+
+    async def test_sync_wrapper_rejects_running_loop(self, tmp_path):
+        path = _write_schema(tmp_path, [Gap(id="pricing", category="market")])
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            with pytest.raises(ResearchError, match="run_gap_cycle_async"):
+                run_gap_cycle(path)
@@ -5,7 +5,9 @@ from unittest.mock import MagicMock, patch
 
 from research_agent.iterate import (
     generate_refined_queries,
+    generate_refined_queries_async,
     generate_followup_questions,
+    generate_followup_questions_async,
     QueryGenerationResult,
     _parse_refined_response,
     _parse_followup_response,
@@ -584,3 +586,47 @@ class TestIterationError:
     def test_carries_message(self):
         err = IterationError("API call failed")
         assert str(err) == "API call failed"
+
+
+# --- Async variants ---
+
+
+class TestAsyncVariants:
+    """Tests for the *_async query generation functions."""
+
+    async def test_refined_queries_async(self, mock_anthropic_response):
+        from unittest.mock import AsyncMock
+
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(return_value=mock_anthropic_response(
+            "MISSING: The draft lacks recent variance approval data\n"
+            "QUERY: recent zoning variance approvals San Diego"
+        ))
+
+        result = await generate_refined_queries_async(
+            mock_client, "zoning laws San Diego", "Draft about zoning basics..."
+        )
+
+        assert result.items == ("recent zoning variance approvals San Diego",)
+
+    async def test_followups_async_raises_iteration_error(self):
+        from unittest.mock import AsyncMock
+        from anthropic import APIError
+
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(
+            side_effect=APIError(message="fail", request=MagicMock(), body=None)
+        )
+
+        with pytest.raises(IterationError, match="Follow-up question generation failed"):
+            await generate_followup_questions_async(
+                mock_client, "zoning laws San Diego", "## Overview\nReport", num_questions=2,
+            )
+
+    async def test_followups_async_zero_questions_skips_api(self):
+        mock_client = MagicMock()
+        result = await generate_followup_questions_async(
+            mock_client, "zoning laws San Diego", "Report", num_questions=0,
+        )
+        assert result.items == ()
+        mock_client.messages.create.assert_not_called()
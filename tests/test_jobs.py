@@ -0,0 +1,142 @@
+"""Tests for research_agent.jobs module."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from research_agent.errors import ResearchError
+from research_agent.jobs import JobQueue, JobStatus
+from research_agent.progress import SourcesEvent, StageEvent, emit
+from research_agent.results import ResearchResult
+
+
+def _result(query, mode="standard"):
+    return ResearchResult(
+        report=f"# {query}", query=query, mode=mode,
+        sources_used=3, status="full_report", critique=None,
+    )
+
+
+class FakeResearch:
+    """Stands in for run_research_async; each call blocks until released."""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self, query, mode="standard", context=None, **kwargs):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            emit(StageEvent(step=1, total=4, message="Searching...", elapsed_s=0.0))
+            emit(SourcesEvent(decision="full_report", kept=3, dropped=1))
+            await self.release.wait()
+            if query == "boom":
+                raise ResearchError("Search failed")
+            return _result(query, mode)
+        finally:
+            self.running -= 1
+
+
+@pytest.fixture
+def fake():
+    research = FakeResearch()
+    with patch("research_agent.run_research_async", research):
+        yield research
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestJobQueue:
+    async def test_runs_job_and_reports_result(self, fake):
+        saved = []
+        queue = JobQueue(on_success=lambda q, r: saved.append(q) or "report.md")
+        job_id = queue.submit("venue pricing")
+        await _settle()
+
+        running = queue.status(job_id)
+        assert running.status is JobStatus.RUNNING
+        assert (running.step, running.step_total, running.stage) == (1, 4, "Searching...")
+        assert running.sources_kept == 3
+        assert running.gate_decision == "full_report"
+        assert running.eta_s is not None
+
+        fake.release.set()
+        done = await queue.wait(job_id)
+        assert done.status is JobStatus.SUCCEEDED
+        assert done.result.report == "# venue pricing"
+        assert done.saved_to == "report.md"
+        assert done.eta_s is None
+        assert saved == ["venue pricing"]
+
+    async def test_limits_concurrent_workers(self, fake):
+        queue = JobQueue(max_workers=2)
+        job_ids = [queue.submit(f"query {i}") for i in range(4)]
+        await _settle()
+
+        statuses = [queue.status(j).status for j in job_ids]
+        assert statuses.count(JobStatus.RUNNING) == 2
+        assert queue.status(job_ids[3]).queue_position == 1
+
+        fake.release.set()
+        for job_id in job_ids:
+            await queue.wait(job_id)
+        assert fake.peak == 2
+
+    async def test_refuses_when_queue_full(self, fake):
+        queue = JobQueue(max_workers=1, max_queued=1)
+        queue.submit("first")
+        queue.submit("second")
+        with pytest.raises(ResearchError, match="queue is full"):
+            queue.submit("third")
+        fake.release.set()
+
+    async def test_failed_job_records_error(self, fake):
+        queue = JobQueue()
+        job_id = queue.submit("boom")
+        fake.release.set()
+        snapshot = await queue.wait(job_id)
+        assert snapshot.status is JobStatus.FAILED
+        assert snapshot.error == "Search failed"
+        assert snapshot.result is None
+
+    async def test_cancel_running_and_queued(self, fake):
+        queue = JobQueue(max_workers=1)
+        running = queue.submit("first")
+        queued = queue.submit("second")
+        await _settle()
+
+        assert queue.cancel(queued) is True
+        assert queue.cancel(running) is True
+        assert (await queue.wait(running)).status is JobStatus.CANCELLED
+        assert (await queue.wait(queued)).status is JobStatus.CANCELLED
+        assert fake.running == 0
+        assert queue.cancel(running) is False
+
+    async def test_unknown_job_id(self, fake):
+        with pytest.raises(ResearchError, match="Unknown job ID"):
+            JobQueue().status("nope")
+
+    async def test_prunes_oldest_finished_jobs(self, fake):
+        fake.release.set()
+        queue = JobQueue(max_finished=1)
+        first = queue.submit("first")
+        await queue.wait(first)
+        second = queue.submit("second")
+        await queue.wait(second)
+        queue.submit("third")
+
+        with pytest.raises(ResearchError):
+            queue.status(first)
+        assert queue.status(second).status is JobStatus.SUCCEEDED
+
+    def test_rejects_invalid_limits(self):
+        with pytest.raises(ValueError):
+            JobQueue(max_workers=0)
+        with pytest.raises(ValueError):
+            JobQueue(max_queued=-1)
@@ -0,0 +1,60 @@
+"""Tests for research_agent.latency_budget module."""
+
+from research_agent.latency_budget import LatencyBudget
+from research_agent.tracing import Trace, trace_scope
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLatencyBudget:
+    def test_behind_once_past_stage_allowance(self):
+        clock = FakeClock()
+        budget = LatencyBudget(60.0, clock=clock)
+        clock.now += 20.0
+        assert budget.behind("summarize") is False  # allowance 21s
+        clock.now += 2.0
+        assert budget.behind("summarize") is True
+        assert budget.behind("critique") is False
+        assert budget.remaining() == 38.0
+
+    def test_zero_budget_is_never_behind(self):
+        clock = FakeClock()
+        budget = LatencyBudget(0.0, clock=clock)
+        clock.now += 1000.0
+        assert budget.behind("summarize") is False
+
+    def test_degraded_records_step_duration(self):
+        clock = FakeClock()
+        budget = LatencyBudget(60.0, clock=clock)
+        clock.now += 40.0
+        with budget.degraded("skeptic", "combined skeptic pass"):
+            clock.now += 5.0
+        budget.skip("critique", "skipped self-critique")
+
+        report = budget.report()
+        assert [(d.stage, d.action) for d in report.degradations] == [
+            ("skeptic", "combined skeptic pass"),
+            ("critique", "skipped self-critique"),
+        ]
+        skeptic, critique = report.degradations
+        assert skeptic.elapsed_s == 40.0
+        assert skeptic.allowance_s == 36.0
+        assert skeptic.duration_s == 5.0
+        assert critique.duration_s == 0.0
+        assert report.elapsed_s == 45.0
+        assert report.over_budget_s == -15.0
+
+    def test_degraded_step_is_traced(self):
+        trace = Trace()
+        budget = LatencyBudget(60.0)
+        with trace_scope(trace):
+            budget.skip("coverage_retry", "skipped coverage retry")
+        assert [(s.name, s.args["action"]) for s in trace.spans] == [
+            ("budget.coverage_retry", "skipped coverage retry"),
+        ]
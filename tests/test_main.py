@@ -1,9 +1,11 @@
 """Tests for CLI functions in research_agent.cli."""
 
 import re
+import subprocess
+import sys
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -11,9 +13,9 @@ from research_agent.cli import (
     list_reports,
     main,
     show_costs,
+    show_usage_history,
 )
 from research_agent.report_store import (
-    REPORTS_DIR,
     _NEW_FORMAT,
     _OLD_FORMAT,
     get_auto_save_path,
@@ -53,9 +55,10 @@ class TestSanitizeFilename:
 class TestGetAutoSavePath:
     """Tests for get_auto_save_path()."""
 
-    def test_returns_path_in_reports_directory(self):
-        path = get_auto_save_path("test query")
-        assert path.parent == REPORTS_DIR
+    def test_returns_path_in_reports_directory(self, tmp_path):
+        with patch("research_agent.report_store.REPORTS_DIR", tmp_path):
+            path = get_auto_save_path("test query")
+        assert path.parent == tmp_path
 
     def test_filename_is_query_first(self):
         path = get_auto_save_path("GraphQL vs REST")
@@ -203,6 +206,29 @@ class TestShowCosts:
         assert str(deep.max_sources) in output
 
 
+class TestShowUsageHistory:
+    """Tests for show_usage_history()."""
+
+    def test_no_runs(self, tmp_path, capsys):
+        show_usage_history(5, meta_dir=tmp_path)
+        assert "No recorded runs" in capsys.readouterr().out
+
+    def test_prints_runs_and_stages(self, tmp_path, capsys):
+        from research_agent.usage import UsageLedger, UsageRecord, save_usage
+        ledger = UsageLedger()
+        ledger.add(UsageRecord("summarize", "claude-haiku-4-5", 12000, 800))
+        ledger.add(UsageRecord("synthesize", "claude-sonnet-4", 9000, 3000))
+        save_usage(ledger.summary(), "what is x", "standard", tmp_path)
+
+        show_usage_history(5, meta_dir=tmp_path)
+        output = capsys.readouterr().out
+        assert "last 1 runs" in output
+        assert "what is x" in output
+        assert "summarize" in output
+        assert "synthesize" in output
+        assert "21000 in" in output
+
+
 class TestResearchModeCostEstimate:
     """Tests for cost_estimate field on ResearchMode."""
 
@@ -234,3 +260,170 @@ class TestCliMain:
 
         assert exc.value.code == 0
         assert "No context files found in contexts/." in capsys.readouterr().out
+
+    def test_search_filters_and_prints_snippets(self, tmp_path, capsys, monkeypatch):
+        from research_agent.report_index import record_report
+
+        reports = tmp_path / "reports"
+        reports.mkdir()
+        monkeypatch.setattr("research_agent.report_store.REPORTS_DIR", reports)
+        for name, mode in (("solar_2026-02-03_183703056652.md", "deep"),
+                           ("solar_2026-01-03_183703056652.md", "standard")):
+            (reports / name).write_text("# Solar Recycling\n\nSilicon recovery is rising.")
+            record_report(reports / name, "solar recycling", mode, None, (), "full_report")
+
+        with patch("research_agent.cli.REPORTS_DIR", reports), \
+             patch("sys.argv", ["main.py", "--search", "silicon mode:deep"]):
+            with pytest.raises(SystemExit) as exc:
+                main()
+
+        assert exc.value.code == 0
+        output = capsys.readouterr().out
+        assert "Matching reports (1):" in output
+        assert "2026-02-03  deep      full_report       solar_2026-02-03_183703056652.md" in output
+        assert "**Silicon** recovery" in output
+
+    def test_search_rejects_invalid_filter(self, tmp_path, capsys):
+        reports = tmp_path / "reports"
+        reports.mkdir()
+        with patch("research_agent.report_store.REPORTS_DIR", reports), \
+             patch("sys.argv", ["main.py", "--search", "status:great"]):
+            with pytest.raises(SystemExit) as exc:
+                main()
+
+        assert exc.value.code == 1
+        assert "status must be one of" in capsys.readouterr().err
+
+    def test_rebuild_index_prints_counts(self, tmp_path, capsys):
+        reports = tmp_path / "reports"
+        reports.mkdir()
+        (reports / "graphql_vs_rest_2026-02-03_183703056652.md").write_text("# GraphQL")
+
+        with patch("research_agent.report_store.REPORTS_DIR", reports), \
+             patch("research_agent.cli.REPORTS_DIR", reports), \
+             patch("sys.argv", ["main.py", "--rebuild-index"]):
+            with pytest.raises(SystemExit) as exc:
+                main()
+
+        assert exc.value.code == 0
+        assert "Rebuilt report catalog: 1 reports, 0 critiques, 0 runs" in capsys.readouterr().out
+
+    def test_cli_import_skips_pipeline_dependencies(self):
+        """Informational commands must not pay for the research pipeline."""
+        heavy = ("anthropic", "httpx", "trafilatura", "ddgs", "tavily", "lxml")
+        code = (
+            "import sys, research_agent.cli; "
+            f"print([m for m in {heavy!r} if m in sys.modules])"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        )
+        assert proc.stdout.strip() == "[]"
+
+    def test_batch_saves_each_report_and_prints_summary(self, tmp_path, capsys, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        monkeypatch.setenv("TAVILY_API_KEY", "test-key")
+        batch_file = tmp_path / "queries.txt"
+        batch_file.write_text("wedding venue pricing\ncatering cost trends\n")
+
+        def fake_agent(**kwargs):
+            agent = MagicMock()
+            agent.research_async = AsyncMock(side_effect=lambda q: f"# {q}\n\nBody.")
+            agent.last_source_count = 3
+            agent.last_gate_decision = "full_report"
+            agent.last_usage = None
+            return agent
+
+        saved = iter([tmp_path / "reports" / "a.md", tmp_path / "reports" / "b.md"])
+        with patch("research_agent.ResearchAgent", side_effect=fake_agent), \
+             patch("research_agent.cli.get_auto_save_path", side_effect=lambda q: next(saved)), \
+             patch("research_agent.cli.RESEARCH_LOG_PATH", tmp_path / "log.md"), \
+             patch("sys.argv", ["main.py", "--batch", str(batch_file), "--quick",
+                                "--concurrency", "2"]):
+            with pytest.raises(SystemExit) as exc:
+                main()
+
+        assert exc.value.code == 0
+        reports = sorted(p.read_text() for p in (tmp_path / "reports").glob("*.md"))
+        assert reports == ["# catering cost trends\n\nBody.", "# wedding venue pricing\n\nBody."]
+        out = capsys.readouterr().out
+        assert "Batch: 2/2 queries" in out
+        assert "shared cache: search" in out
+
+    def test_batch_and_query_are_exclusive(self, tmp_path):
+        with patch("sys.argv", ["main.py", "some query", "--batch", str(tmp_path / "q.txt")]):
+            with pytest.raises(SystemExit) as exc:
+                main()
+        assert exc.value.code == 2
+
+    def test_resume_uses_checkpointed_query_and_mode(self, tmp_path):
+        from research_agent.checkpoint import RunCheckpoint
+
+        checkpoint = RunCheckpoint.create("wedding venue pricing", "deep", tmp_path / "runs")
+        agent = MagicMock()
+        agent.research.return_value = "# Report"
+        agent.last_critique = None
+        agent.iteration_status = "skipped"
+        with patch("research_agent.ResearchAgent", return_value=agent) as mock_cls, \
+             patch("research_agent.cli.META_DIR", tmp_path), \
+             patch("research_agent.cli.RESEARCH_LOG_PATH", tmp_path / "log.md"), \
+             patch("research_agent.cli.get_auto_save_path", return_value=tmp_path / "r.md"), \
+             patch("sys.argv", ["main.py", "--resume", checkpoint.run_id]):
+            main()
+
+        kwargs = mock_cls.call_args.kwargs
+        assert kwargs["mode"].name == "deep"
+        assert kwargs["resume_run_id"] == checkpoint.run_id
+        agent.research.assert_called_once_with("wedding venue pricing")
+
+    def test_refresh_uses_indexed_query_and_reindexes_unchanged_report(self, tmp_path, monkeypatch):
+        from research_agent.report_index import get_entry, load_sources, record_report
+        from research_agent.results import RefreshOutcome, StoredSource
+
+        reports = tmp_path / "reports"
+        reports.mkdir()
+        monkeypatch.setattr("research_agent.report_store.REPORTS_DIR", reports)
+        saved = reports / "wedding_venue_pricing.md"
+        saved.write_text("# Saved")
+        sources = (StoredSource(url="https://a.com", title="A", score=4, summaries=("S",)),)
+        record_report(saved, "wedding venue pricing", "deep", None, ("https://a.com",),
+                      "full_report", sources=sources)
+        before = get_entry(saved.name).timestamp
+
+        agent = MagicMock()
+        agent.refresh.return_value = "# Saved"
+        agent.last_refresh = RefreshOutcome(
+            report=saved.name, unchanged=1, unverified=0, changed=0, new=0, reused_report=True,
+        )
+        agent.last_sources = sources
+        agent.last_source_urls = ("https://a.com",)
+        agent.last_gate_decision = "full_report"
+        agent.last_critique = None
+        agent.iteration_status = "skipped"
+        with patch("research_agent.ResearchAgent", return_value=agent) as mock_cls, \
+             patch("research_agent.cli.RESEARCH_LOG_PATH", tmp_path / "log.md"), \
+             patch("research_agent.cli.get_auto_save_path") as mock_path, \
+             patch("sys.argv", ["main.py", "--refresh", saved.name]):
+            main()
+
+        assert mock_cls.call_args.kwargs["mode"].name == "deep"
+        agent.refresh.assert_called_once_with("wedding venue pricing", sources, saved)
+        mock_path.assert_not_called()
+        assert list(reports.glob("*.md")) == [saved]
+        assert get_entry(saved.name).timestamp >= before
+        assert load_sources(saved.name) == sources
+
+    def test_refresh_without_stored_sources(self, capsys):
+        with patch("sys.argv", ["main.py", "--refresh", "missing.md"]):
+            with pytest.raises(SystemExit) as exc:
+                main()
+        assert exc.value.code == 1
+        assert "no stored sources" in capsys.readouterr().err
+
+    def test_resume_unknown_run(self, tmp_path, capsys):
+        with patch("research_agent.cli.META_DIR", tmp_path), \
+             patch("sys.argv", ["main.py", "--resume", "20260101-000000-abcdef"]):
+            with pytest.raises(SystemExit) as exc:
+                main()
+        assert exc.value.code == 1
+        assert "No resumable run" in capsys.readouterr().err
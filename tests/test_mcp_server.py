@@ -230,6 +230,33 @@ class TestListSavedReports:
         assert "No saved reports found" in result.data
 
 
+class TestSearchReports:
+    async def test_ranked_matches_with_snippets(self, client, tmp_path, monkeypatch):
+        from research_agent.report_index import record_report
+
+        reports = tmp_path / "reports"
+        reports.mkdir()
+        monkeypatch.setattr("research_agent.report_store.REPORTS_DIR", reports)
+        path = reports / "solar_2026-02-28_120000.md"
+        path.write_text("# Solar Panel Recycling\n\nSilicon recovery rates are rising.")
+        record_report(path, "solar panel recycling", "deep", None,
+                      ("https://www.epa.gov/solar",), "full_report")
+        (reports / "wind_2026-02-27_090000.md").write_text("# Wind Turbines\n\nBlade waste.")
+
+        result = await client.call_tool("search_reports", {"query": "silicon", "mode": "deep"})
+
+        text = result.data
+        assert "1 matching reports" in text
+        assert "solar_2026-02-28_120000.md (2026-02-28, deep, full_report)" in text
+        assert "Sources: epa.gov" in text
+        assert "**Silicon**" in text
+
+    async def test_invalid_filter_rejected(self, client, isolated_report_index):
+        isolated_report_index.parent.mkdir()
+        with pytest.raises(ToolError, match="since must be a YYYY-MM-DD date"):
+            await client.call_tool("search_reports", {"since": "last week"})
+
+
 # ---------------------------------------------------------------------------
 # get_report
 # ---------------------------------------------------------------------------
@@ -330,6 +357,42 @@ class TestGetReport:
 # ---------------------------------------------------------------------------
 
 
+class TestRefreshReport:
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    @patch("research_agent.refresh_report_async")
+    async def test_unchanged_report_reindexed_not_resaved(self, mock_refresh, client, tmp_path):
+        """A refresh that reused the saved report re-indexes it instead of saving a copy."""
+        from research_agent.results import RefreshOutcome, ResearchResult, StoredSource
+
+        reports_dir = tmp_path / "reports"
+        reports_dir.mkdir()
+        (reports_dir / "test_report.md").write_text("# Saved")
+        sources = (StoredSource(url="https://a.com", title="A", score=4, summaries=("S",)),)
+        mock_refresh.return_value = ResearchResult(
+            report="# Saved", query="test query", mode="standard",
+            sources_used=1, status="full_report", sources=sources,
+            refresh=RefreshOutcome(
+                report="test_report.md", unchanged=1, unverified=0, changed=0, new=0,
+                reused_report=True,
+            ),
+        )
+
+        with patch("research_agent.report_store.REPORTS_DIR", reports_dir), \
+                patch("research_agent.safe_io.atomic_write") as mock_write, \
+                patch("research_agent.report_index.record_report") as mock_record:
+            result = await client.call_tool("refresh_report", {"filename": "test_report.md"})
+
+        mock_write.assert_not_called()
+        assert mock_record.call_args.kwargs["sources"] == sources
+        text = result.data
+        assert "Saved: test_report.md" in text
+        assert "Refresh: 1 unchanged, 0 unverified, 0 changed, 0 new (report unchanged)" in text
+
+    async def test_path_traversal_rejected(self, client):
+        with pytest.raises(ToolError, match="Invalid filename"):
+            await client.call_tool("refresh_report", {"filename": "../../.env"})
+
+
 class TestListResearchModes:
     async def test_returns_all_modes(self, client):
         """Lists all three modes with details."""
@@ -676,6 +739,180 @@ class TestRunResearchParams:
         text = result.data
         assert "Iteration: completed" in text
 
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    @patch("research_agent.run_research_async")
+    async def test_use_cache_opt_in(self, mock_run, client):
+        """Only use_cache=True lets run_research_async serve a saved report."""
+        from research_agent.report_index import DEFAULT_FRESHNESS
+        from research_agent.results import ResearchResult
+
+        mock_run.return_value = ResearchResult(
+            report="# Report", query="test", mode="quick",
+            sources_used=4, status="full_report", critique=None,
+        )
+
+        await client.call_tool("run_research", {"query": "test", "mode": "quick"})
+        assert mock_run.call_args[1]["freshness"] is None
+
+        await client.call_tool(
+            "run_research", {"query": "test", "mode": "quick", "use_cache": True}
+        )
+        assert mock_run.call_args[1]["freshness"] is DEFAULT_FRESHNESS
+
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    @patch("research_agent.run_research_async")
+    async def test_cached_result_marked_and_not_saved_again(self, mock_run, client):
+        """A report served from cache is flagged in the header and not re-saved."""
+        from research_agent.results import CacheHit, ResearchResult
+
+        mock_run.return_value = ResearchResult(
+            report="# Cached", query="test query", mode="standard",
+            sources_used=6, status="full_report",
+            cache=CacheHit(
+                filename="test_query_2026-10-18_101010101010.md",
+                matched_query="Test query?", similarity=1.0,
+                timestamp=0.0, age_s=7200.0, refresh_suggested=True,
+            ),
+        )
+
+        with patch("research_agent.safe_io.atomic_write") as mock_write:
+            result = await client.call_tool(
+                "run_research", {"query": "test query", "mode": "standard"}
+            )
+
+        mock_write.assert_not_called()
+        text = result.data
+        assert "Saved: test_query_2026-10-18_101010101010.md" in text
+        assert "Cache: hit (2.0h old, refresh suggested" in text
+        assert "# Cached" in text
+
+
+class TestRunResearchProgress:
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    @patch("research_agent.run_research_async")
+    async def test_sends_progress_notifications(self, mock_run, client):
+        """Pipeline steps and report text reach the client as progress."""
+        from research_agent.progress import SourcesEvent, StageEvent, TextDelta, emit
+        from research_agent.results import ResearchResult
+
+        async def fake_run(query, **kwargs):
+            emit(StageEvent(step=1, total=2, message="Searching...", elapsed_s=0.0))
+            emit(SourcesEvent(decision="full_report", kept=4, dropped=1))
+            emit(StageEvent(step=2, total=2, message="Synthesizing...", elapsed_s=1.0))
+            emit(TextDelta("# Rep"))
+            emit(TextDelta("ort"))
+            return ResearchResult(
+                report="# Report", query=query, mode="quick",
+                sources_used=4, status="full_report", critique=None,
+            )
+
+        mock_run.side_effect = fake_run
+        updates = []
+
+        async def on_progress(progress, total, message):
+            updates.append((progress, total, message))
+
+        result = await client.call_tool(
+            "run_research", {"query": "test query", "mode": "quick"},
+            progress_handler=on_progress,
+        )
+
+        assert "# Report" in result.data
+        messages = [message for _, _, message in updates]
+        assert messages[:3] == ["[1/2] Searching...", "Kept 4 sources (full_report)", "[2/2] Synthesizing..."]
+        assert "".join(messages[3:]) == "# Report"
+        progress = [value for value, _, _ in updates]
+        assert progress == sorted(set(progress))
+        assert all(total == 2 for _, total, _ in updates)
+
+
+# ---------------------------------------------------------------------------
+# Background jobs — start_research, get_research_status, get_research_result
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def job_queue():
+    """Fresh job queue per test; the server's queue is bound to one loop."""
+    import research_agent.mcp_server as server
+
+    server._job_queue = None
+    yield
+    server._job_queue = None
+
+
+class TestResearchJobs:
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    @patch("research_agent.run_research_async")
+    async def test_start_poll_and_fetch(self, mock_run, client, job_queue):
+        """A started job can be polled and its report fetched."""
+        import asyncio
+
+        from research_agent.progress import StageEvent, emit
+        from research_agent.results import ResearchResult
+
+        release = asyncio.Event()
+
+        async def fake_run(query, **kwargs):
+            emit(StageEvent(step=2, total=5, message="Fetching 8 pages...", elapsed_s=1.0))
+            await release.wait()
+            return ResearchResult(
+                report="# Background Report", query=query, mode="quick",
+                sources_used=3, status="full_report", critique=None,
+            )
+
+        mock_run.side_effect = fake_run
+
+        started = await client.call_tool(
+            "start_research", {"query": "test query", "mode": "quick"}
+        )
+        job_id = started.data.split()[1]
+        await asyncio.sleep(0)
+
+        status = await client.call_tool("get_research_status", {"job_id": job_id})
+        assert "running" in status.data
+        assert "Step 2/5: Fetching 8 pages..." in status.data
+
+        with pytest.raises(ToolError, match="still running"):
+            await client.call_tool("get_research_result", {"job_id": job_id})
+
+        release.set()
+        import research_agent.mcp_server as server
+        await server._jobs().wait(job_id)
+
+        result = await client.call_tool("get_research_result", {"job_id": job_id})
+        assert "Mode: quick" in result.data
+        assert "# Background Report" in result.data
+
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    @patch("research_agent.run_research_async")
+    async def test_cancel_research(self, mock_run, client, job_queue):
+        """cancel_research stops a running job; its result is then an error."""
+        import asyncio
+
+        async def never_finishes(query, **kwargs):
+            await asyncio.Event().wait()
+
+        mock_run.side_effect = never_finishes
+
+        started = await client.call_tool("start_research", {"query": "test query"})
+        job_id = started.data.split()[1]
+
+        cancelled = await client.call_tool("cancel_research", {"job_id": job_id})
+        assert "Cancelled" in cancelled.data
+        with pytest.raises(ToolError, match="was cancelled"):
+            await client.call_tool("get_research_result", {"job_id": job_id})
+
+    async def test_unknown_job_id_returns_tool_error(self, client, job_queue):
+        """Status of an unknown job is a ToolError."""
+        with pytest.raises(ToolError, match="Unknown job ID"):
+            await client.call_tool("get_research_status", {"job_id": "missing"})
+
+    async def test_start_rejects_invalid_mode(self, client, job_queue):
+        """start_research validates its arguments like run_research."""
+        with pytest.raises(ToolError, match="Invalid mode"):
+            await client.call_tool("start_research", {"query": "q", "mode": "turbo"})
+
 
 # ---------------------------------------------------------------------------
 # Transport validation
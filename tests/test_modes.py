@@ -548,6 +548,95 @@ class TestNoveltyQueries:
         assert ResearchMode.deep().novelty_queries <= MAX_SUB_QUERIES
 
 
+class TestChunkMode:
+    """Tests for chunk_mode / stitch_chunks fields on ResearchMode."""
+
+    @staticmethod
+    def _make(**kwargs):
+        return ResearchMode(
+            name="test", max_sources=5, search_passes=1,
+            word_target=500, max_tokens=1000, auto_save=False,
+            synthesis_instructions="Test",
+            pass1_sources=3, pass2_sources=2,
+            min_sources_full_report=3, min_sources_short_report=1,
+            **kwargs,
+        )
+
+    def test_built_in_modes_default_to_sequential(self):
+        for factory in (ResearchMode.quick, ResearchMode.standard, ResearchMode.deep):
+            mode = factory()
+            assert mode.chunk_mode == "sequential"
+            assert mode.stitch_chunks is False
+
+    def test_parallel_with_stitch_accepted(self):
+        mode = self._make(chunk_mode="parallel", stitch_chunks=True)
+        assert mode.chunk_mode == "parallel"
+
+    def test_rejects_unknown_chunk_mode(self):
+        with pytest.raises(ValueError, match="chunk_mode must be"):
+            self._make(chunk_mode="threaded")
+
+    def test_stitch_requires_parallel(self):
+        with pytest.raises(ValueError, match="stitch_chunks requires"):
+            self._make(stitch_chunks=True)
+
+    def test_validation_matches_summarize_chunk_modes(self):
+        """modes.py validation stays in sync with summarize.CHUNK_MODES."""
+        from research_agent.summarize import CHUNK_MODES
+        for chunk_mode in CHUNK_MODES:
+            assert self._make(chunk_mode=chunk_mode).chunk_mode == chunk_mode
+
+
+class TestSpeculativePass2:
+    """Tests for the speculative_pass2 field on ResearchMode."""
+
+    def test_only_deep_mode_speculates(self):
+        assert ResearchMode.deep().speculative_pass2 is True
+        assert ResearchMode.standard().speculative_pass2 is False
+        assert ResearchMode.quick().speculative_pass2 is False
+
+    def test_requires_pass2_sources(self):
+        with pytest.raises(ValueError, match="speculative_pass2 requires"):
+            dataclasses.replace(ResearchMode.deep(), pass2_sources=0)
+
+
+class TestLatencyBudget:
+    """Tests for the latency_budget_s field on ResearchMode."""
+
+    def test_budget_grows_with_mode_depth(self):
+        assert ResearchMode.quick().latency_budget_s == 30.0
+        assert ResearchMode.standard().latency_budget_s == 60.0
+        assert ResearchMode.deep().latency_budget_s == 300.0
+
+    def test_rejects_negative_budget(self):
+        with pytest.raises(ValueError, match="latency_budget_s must be >= 0"):
+            dataclasses.replace(ResearchMode.standard(), latency_budget_s=-1.0)
+
+    def test_zero_disables_budget(self):
+        assert dataclasses.replace(ResearchMode.standard(), latency_budget_s=0.0).latency_budget_s == 0.0
+
+
+class TestSourceTokens:
+    """Tests for the source_tokens field on ResearchMode."""
+
+    def test_budget_grows_with_mode_depth(self):
+        assert ResearchMode.quick().source_tokens < ResearchMode.standard().source_tokens
+        assert ResearchMode.standard().source_tokens < ResearchMode.deep().source_tokens
+
+    def test_rejects_negative_budget(self):
+        with pytest.raises(ValueError, match="source_tokens must be >= 0"):
+            dataclasses.replace(ResearchMode.standard(), source_tokens=-1)
+
+
+class TestBatchMiniReports:
+    """Tests for the batch_mini_reports field on ResearchMode."""
+
+    def test_iterating_modes_batch(self):
+        assert ResearchMode.standard().batch_mini_reports is True
+        assert ResearchMode.deep().batch_mini_reports is True
+        assert ResearchMode.quick().batch_mini_reports is False
+
+
 class TestToModeInfo:
     """Tests for ResearchMode.to_mode_info() conversion."""
 
@@ -0,0 +1,35 @@
+"""Tests for research_agent.progress module."""
+
+import asyncio
+
+from research_agent.progress import SourcesEvent, StageEvent, emit, progress_scope
+
+
+class TestProgressScope:
+    def test_emit_without_scope_is_noop(self):
+        emit(StageEvent(step=1, total=3, message="Searching...", elapsed_s=0.0))
+
+    def test_scope_receives_events(self):
+        events = []
+        stage = StageEvent(step=1, total=3, message="Searching...", elapsed_s=0.0)
+        sources = SourcesEvent(decision="full_report", kept=4, dropped=1)
+        with progress_scope(events.append):
+            emit(stage)
+            emit(sources)
+        emit(stage)  # outside the scope
+        assert events == [stage, sources]
+
+    async def test_events_from_threads_reach_listener(self):
+        events = []
+        stage = StageEvent(step=2, total=3, message="Fetching...", elapsed_s=1.0)
+        with progress_scope(events.append):
+            await asyncio.to_thread(emit, stage)
+        assert events == [stage]
+
+    def test_failing_listener_is_ignored(self, caplog):
+        def broken(event):
+            raise RuntimeError("listener bug")
+
+        with progress_scope(broken):
+            emit(StageEvent(step=1, total=3, message="Searching...", elapsed_s=0.0))
+        assert "Progress listener failed" in caplog.text
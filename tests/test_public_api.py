@@ -9,10 +9,14 @@ import pytest
 
 import research_agent
 from research_agent import (
+    FreshnessPolicy,
+    RefreshOutcome,
     ResearchError,
     ResearchResult,
     ModeInfo,
+    StoredSource,
     list_modes,
+    refresh_report_async,
     run_research,
     run_research_async,
 )
@@ -44,28 +48,61 @@ class TestVersion:
 class TestAll:
     def test_all_contains_expected_names(self):
         expected = {
+            "BatchJobResult",
+            "BatchLimits",
+            "BatchQuery",
+            "BatchResult",
+            "CacheHit",
             "ContextResult",
             "ContextStatus",
             "CritiqueResult",
+            "FreshnessPolicy",
+            "GapCycleResult",
+            "JobQueue",
+            "JobSnapshot",
+            "JobStatus",
             "ModeInfo",
+            "RefreshOutcome",
             "ReportInfo",
+            "ReportMatch",
             "ReportTemplate",
             "ResearchAgent",
             "ResearchError",
             "GateDecision",
             "ResearchMode",
             "ResearchResult",
+            "ResultEvent",
+            "SourcesEvent",
+            "StageEvent",
+            "StoredSource",
+            "TextDelta",
             "critique_report_file",
             "get_reports",
             "list_available_contexts",
             "list_modes",
             "load_critique_history",
+            "refresh_report",
+            "refresh_report_async",
             "resolve_context_path",
+            "run_batch",
+            "run_batch_async",
+            "run_gap_cycle",
+            "run_gap_cycle_async",
             "run_research",
             "run_research_async",
+            "search_reports",
         }
         assert set(research_agent.__all__) == expected
 
+    def test_all_names_resolve(self):
+        for name in research_agent.__all__:
+            assert getattr(research_agent, name) is not None
+        assert "ResearchAgent" in dir(research_agent)
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            research_agent.NoSuchName
+
 
 # --- list_modes ---
 
@@ -246,6 +283,162 @@ class TestRunResearchAsyncHappyPath:
         assert result.critique is fake_critique
         assert result.critique.source_diversity == 4
 
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    @patch("research_agent.ResearchAgent")
+    async def test_includes_usage_in_result(self, mock_agent_cls):
+        from research_agent.usage import UsageSummary, UsageTotals
+        usage = UsageSummary(total=UsageTotals(calls=3, input_tokens=900, output_tokens=90))
+
+        agent_instance = mock_agent_cls.return_value
+        agent_instance.research_async = AsyncMock(return_value="# Report")
+        agent_instance.last_source_count = 5
+        agent_instance.last_gate_decision = "full_report"
+        agent_instance.last_critique = None
+        agent_instance.last_usage = usage
+
+        result = await run_research_async("test query", mode="quick")
+
+        assert result.usage is usage
+
+
+class TestRunResearchAsyncCache:
+    @pytest.fixture
+    def saved_report(self, tmp_path, monkeypatch):
+        """A standard-mode report saved and indexed in a temporary reports/."""
+        from research_agent.report_index import record_report
+
+        reports = tmp_path / "reports"
+        reports.mkdir()
+        monkeypatch.setattr("research_agent.report_store.REPORTS_DIR", reports)
+        path = reports / "health_effects_of_microplastics_2026-10-18_101010101010.md"
+        path.write_text("# Saved report")
+        record_report(
+            path, "Health effects of microplastics?", "standard", None,
+            ("https://a.com/1", "https://b.com/2"), "full_report",
+        )
+        return path
+
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    @patch("research_agent.ResearchAgent")
+    async def test_near_match_served_from_cache(self, mock_agent_cls, saved_report):
+        agent_instance = mock_agent_cls.return_value
+        agent_instance.research_async = AsyncMock(return_value="# New report")
+
+        result = await run_research_async(
+            "microplastic health effects", mode="standard", freshness=FreshnessPolicy(),
+        )
+
+        agent_instance.research_async.assert_not_called()
+        assert result.report == "# Saved report"
+        assert result.query == "microplastic health effects"
+        assert result.status == "full_report"
+        assert result.sources_used == 2
+        assert result.cache.filename == saved_report.name
+        assert result.cache.matched_query == "Health effects of microplastics?"
+        assert result.cache.refresh_suggested is False
+
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    @patch("research_agent.ResearchAgent")
+    async def test_cache_off_by_default(self, mock_agent_cls, saved_report):
+        agent_instance = mock_agent_cls.return_value
+        agent_instance.research_async = AsyncMock(return_value="# New report")
+        agent_instance.last_gate_decision = "full_report"
+        agent_instance.last_source_urls = ("https://c.com",)
+
+        result = await run_research_async("health effects of microplastics", mode="standard")
+
+        assert result.report == "# New report"
+        assert result.cache is None
+        assert result.source_urls == ("https://c.com",)
+
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    @patch("research_agent.ResearchAgent")
+    async def test_other_mode_or_context_runs(self, mock_agent_cls, saved_report):
+        agent_instance = mock_agent_cls.return_value
+        agent_instance.research_async = AsyncMock(return_value="# New report")
+        agent_instance.last_gate_decision = "full_report"
+
+        deep = await run_research_async(
+            "health effects of microplastics", mode="deep", freshness=FreshnessPolicy(),
+        )
+        no_context = await run_research_async(
+            "health effects of microplastics", mode="standard", context="none",
+            freshness=FreshnessPolicy(),
+        )
+
+        assert deep.cache is None and no_context.cache is None
+        assert agent_instance.research_async.await_count == 2
+
+
+class TestRefreshReport:
+    SOURCES = (
+        StoredSource(url="https://a.com/1", title="A", score=4, summaries=("Summary A",), etag='"a"'),
+    )
+
+    @pytest.fixture
+    def saved_report(self, tmp_path, monkeypatch):
+        """A standard-mode report indexed with its stored sources."""
+        from research_agent.report_index import record_report
+
+        reports = tmp_path / "reports"
+        reports.mkdir()
+        monkeypatch.setattr("research_agent.report_store.REPORTS_DIR", reports)
+        path = reports / "health_effects_of_microplastics_2026-10-18_101010101010.md"
+        path.write_text("# Saved report")
+        record_report(
+            path, "Health effects of microplastics?", "standard", None,
+            ("https://a.com/1",), "full_report", sources=self.SOURCES,
+        )
+        return path
+
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    @patch("research_agent.ResearchAgent")
+    async def test_refresh_uses_stored_sources(self, mock_agent_cls, saved_report):
+        agent_instance = mock_agent_cls.return_value
+        agent_instance.refresh_async = AsyncMock(return_value="# Refreshed")
+        agent_instance.last_refresh = RefreshOutcome(
+            report=saved_report.name, unchanged=0, unverified=0, changed=1, new=0,
+        )
+
+        result = await refresh_report_async(saved_report.name, skip_critique=True)
+
+        agent_instance.refresh_async.assert_awaited_once_with(
+            "Health effects of microplastics?", self.SOURCES, saved_report,
+        )
+        assert mock_agent_cls.call_args.kwargs["skip_critique"] is True
+        assert result.report == "# Refreshed"
+        assert result.query == "Health effects of microplastics?"
+        assert result.refresh.changed == 1
+
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    async def test_unknown_or_sourceless_report_rejected(self, saved_report):
+        from research_agent.report_index import record_report
+
+        with pytest.raises(ResearchError, match="No indexed report"):
+            await refresh_report_async("missing.md")
+
+        sourceless = saved_report.with_name("older_report.md")
+        sourceless.write_text("# Older report")
+        record_report(sourceless, "Health effects of microplastics?", "standard", None, (), "full_report")
+        with pytest.raises(ResearchError, match="No stored sources"):
+            await refresh_report_async(sourceless.name)
+
+    @patch.dict("os.environ", ENV_BOTH, clear=True)
+    @patch("research_agent.ResearchAgent")
+    async def test_auto_refresh_replaces_stale_cache_hit(self, mock_agent_cls, saved_report):
+        agent_instance = mock_agent_cls.return_value
+        agent_instance.refresh_async = AsyncMock(return_value="# Refreshed")
+        agent_instance.research_async = AsyncMock(return_value="# New report")
+
+        result = await run_research_async(
+            "health effects of microplastics", mode="standard",
+            freshness=FreshnessPolicy(max_age_s=0, auto_refresh=True),
+        )
+
+        agent_instance.research_async.assert_not_called()
+        assert result.report == "# Refreshed"
+        assert result.cache is None
+
 
 # --- event loop collision ---
 
@@ -817,10 +817,10 @@ class TestAggregateBySource:
         ]
         result = _aggregate_by_source(summaries, scored)
         assert len(result) == 2
-        assert result[0]["score"] == 4
-        assert result[1]["score"] == 2
-        assert result[0]["chunk_count"] == 1
-        assert result[1]["chunk_count"] == 1
+        assert result[0].score == 4
+        assert result[1].score == 2
+        assert result[0].chunk_count == 1
+        assert result[1].chunk_count == 1
 
     def test_multi_chunk_uses_max_score(self):
         """Multiple chunks from same URL should use the highest score."""
@@ -836,10 +836,10 @@ class TestAggregateBySource:
         ]
         result = _aggregate_by_source(summaries, scored)
         assert len(result) == 1
-        assert result[0]["score"] == 4
-        assert result[0]["explanation"] == "Best"
-        assert result[0]["chunk_count"] == 3
-        assert len(result[0]["all_summaries"]) == 3
+        assert result[0].score == 4
+        assert result[0].explanation == "Best"
+        assert result[0].chunk_count == 3
+        assert len(result[0].all_summaries) == 3
 
     def test_exception_defaults_to_score_3(self):
         """Exceptions from gather should default to score 3."""
@@ -848,8 +848,8 @@ class TestAggregateBySource:
         ]
         scored = [RuntimeError("API failed")]
         result = _aggregate_by_source(summaries, scored)
-        assert result[0]["score"] == 3
-        assert "exception" in result[0]["explanation"].lower()
+        assert result[0].score == 3
+        assert "exception" in result[0].explanation.lower()
 
     def test_preserves_insertion_order(self):
         """Sources should appear in the order their first chunk was seen."""
@@ -864,8 +864,17 @@ class TestAggregateBySource:
             SourceScore(url="https://a.com", title="A", score=5, explanation="Great"),
         ]
         result = _aggregate_by_source(summaries, scored)
-        assert result[0]["url"] == "https://a.com"
-        assert result[1]["url"] == "https://b.com"
+        assert result[0].url == "https://a.com"
+        assert result[1].url == "https://b.com"
+
+    def test_records_are_slotted(self):
+        summaries = [Summary(url="https://a.com", title="", summary="A1")]
+        scored = [SourceScore(url="https://a.com", title="", score=4, explanation="Ok")]
+        (aggregate,) = _aggregate_by_source(summaries, scored)
+        assert aggregate.title == "Untitled"
+        assert not hasattr(aggregate, "__dict__")
+        assert not hasattr(scored[0], "__dict__")
+        assert scored[0] == SourceScore(url="https://a.com", title="", score=4, explanation="Ok")
 
 
 class TestSourceAggregation:
@@ -894,6 +903,7 @@ class TestSourceAggregation:
 
         assert result.total_survived == 1  # 1 unique source
         assert len(result.surviving_sources) == 3  # all 3 chunks kept
+        assert [(s.url, s.score) for s in result.surviving_scores] == [("https://a.com", 4)]
 
     async def test_multi_chunk_source_all_dropped_when_max_fails(self):
         """When a source's max score fails, all its chunks are dropped."""
@@ -0,0 +1,205 @@
+"""Tests for research_agent.report_index module."""
+
+import json
+
+import pytest
+
+from research_agent.report_index import (
+    DAY_S,
+    FreshnessPolicy,
+    find_cached_report,
+    fingerprint_similarity,
+    get_entry,
+    load_index,
+    load_sources,
+    normalize_query,
+    query_fingerprint,
+    record_report,
+)
+from research_agent.results import StoredSource
+
+
+@pytest.fixture
+def reports(tmp_path, monkeypatch):
+    reports_dir = tmp_path / "reports"
+    reports_dir.mkdir()
+    monkeypatch.setattr("research_agent.report_store.REPORTS_DIR", reports_dir)
+    return reports_dir
+
+
+def _save(reports, name, query, mode="standard", context=None, status="full_report"):
+    path = reports / name
+    path.write_text(f"# Report for {query}")
+    record_report(path, query, mode, context, ("https://a.com",), status)
+    return path
+
+
+class TestFingerprint:
+    def test_normalize_query(self):
+        assert normalize_query("  What   is  GLP-1?  ") == "what is glp-1"
+
+    def test_word_order_and_plurals_ignored(self):
+        assert query_fingerprint("effects of microplastics on health") == query_fingerprint(
+            "microplastic health effect"
+        )
+
+    def test_similarity(self):
+        assert fingerprint_similarity(("a", "b"), ("a", "b")) == 1.0
+        assert fingerprint_similarity(("a", "b"), ("a", "c")) == pytest.approx(1 / 3)
+        assert fingerprint_similarity((), ("a",)) == 0.0
+
+    def test_negation_never_similar(self):
+        safe = query_fingerprint("are microplastics in bottled water harmful to human health")
+        not_safe = query_fingerprint("are microplastics in bottled water not harmful to human health")
+
+        assert "not" in not_safe
+        assert fingerprint_similarity(safe, not_safe) == 0.0
+        assert fingerprint_similarity(not_safe, not_safe) == 1.0
+
+
+class TestFreshnessPolicy:
+    def test_refresh_window_shorter_than_max_age_rejected(self):
+        with pytest.raises(ValueError, match="refresh_window_s"):
+            FreshnessPolicy(max_age_s=10, refresh_window_s=5)
+
+    def test_similarity_out_of_range_rejected(self):
+        with pytest.raises(ValueError, match="min_similarity"):
+            FreshnessPolicy(min_similarity=0)
+
+
+class TestRecordReport:
+    def test_entry_written(self, reports):
+        _save(reports, "r1.md", "Solar panel recycling costs")
+
+        [entry] = load_index()
+        assert entry.filename == "r1.md"
+        assert entry.normalized_query == "solar panel recycling costs"
+        assert entry.context == ""
+        assert entry.source_urls == ("https://a.com",)
+        assert entry.fingerprint == ("cost", "panel", "recycling", "solar")
+
+    def test_entries_for_deleted_reports_pruned(self, reports):
+        first = _save(reports, "r1.md", "Solar panel recycling costs")
+        first.unlink()
+        _save(reports, "r2.md", "Wind turbine blade recycling")
+
+        assert [e.filename for e in load_index()] == ["r2.md"]
+
+    def test_unreadable_legacy_index_ignored(self, reports, isolated_report_index):
+        isolated_report_index.mkdir(parents=True)
+        (isolated_report_index / "report_index.json").write_text("{not json")
+        assert load_index() == []
+
+        _save(reports, "r1.md", "Solar panel recycling costs")
+        assert [e.filename for e in load_index()] == ["r1.md"]
+        assert not (isolated_report_index / "report_index.json").exists()
+
+
+class TestLegacyIndexImport:
+    def test_json_index_and_sources_imported_once(self, reports, isolated_report_index):
+        (reports / "r1.md").write_text("# Report")
+        sources_dir = isolated_report_index / "sources"
+        sources_dir.mkdir(parents=True)
+        (sources_dir / "r1.json").write_text(json.dumps({"sources": [
+            {"url": "https://a.com", "title": "A", "score": 4, "summaries": ["S"]},
+        ]}))
+        entry = {
+            "filename": "r1.md", "query": "Solar panel recycling costs",
+            "normalized_query": "solar panel recycling costs", "mode": "standard",
+            "context": "", "timestamp": 1000.0, "status": "full_report",
+            "fingerprint": ["cost", "panel", "recycling", "solar"],
+            "source_urls": ["https://a.com"],
+        }
+        gone = dict(entry, filename="gone.md")
+        (isolated_report_index / "report_index.json").write_text(
+            json.dumps({"reports": [entry, gone]})
+        )
+
+        [imported] = load_index()
+
+        assert imported.timestamp == 1000.0
+        assert imported.fingerprint == ("cost", "panel", "recycling", "solar")
+        assert load_sources("r1.md")[0].summaries == ("S",)
+        assert (isolated_report_index / "report_index.json.migrated").is_file()
+        assert not sources_dir.exists()
+
+
+class TestStoredSources:
+    def test_sources_round_trip(self, reports):
+        source = StoredSource(
+            url="https://a.com", title="A", score=4, summaries=("One", "Two"),
+            etag='"v1"', content_hash="abc",
+        )
+        path = reports / "r1.md"
+        path.write_text("# Report")
+        record_report(path, "Solar panel recycling costs", "standard", None, ("https://a.com",),
+                      "full_report", sources=[source])
+
+        assert load_sources("r1.md") == (source,)
+        assert get_entry("r1.md").query == "Solar panel recycling costs"
+        assert get_entry("missing.md") is None
+
+    def test_no_sources_kept_reads_as_empty(self, reports):
+        _save(reports, "r1.md", "Solar panel recycling costs")
+        assert load_sources("r1.md") == ()
+
+    def test_sources_of_deleted_reports_pruned(self, reports):
+        path = reports / "r1.md"
+        path.write_text("# Report")
+        record_report(path, "Solar panel recycling costs", "standard", None, (), "full_report",
+                      sources=[StoredSource(url="https://a.com", title="A", score=4, summaries=("S",))])
+        path.unlink()
+        _save(reports, "r2.md", "Wind turbine blade recycling")
+
+        assert get_entry("r1.md") is None
+        path.write_text("# Report")
+        assert load_sources("r1.md") == ()
+
+
+class TestFindCachedReport:
+    def test_fresh_near_match_served(self, reports):
+        _save(reports, "r1.md", "Solar panel recycling costs?")
+
+        cached = find_cached_report("solar panels recycling cost", "standard", None)
+
+        assert cached.report == "# Report for Solar panel recycling costs?"
+        assert cached.hit.filename == "r1.md"
+        assert cached.hit.similarity == 1.0
+        assert cached.hit.refresh_suggested is False
+
+    def test_different_question_missed(self, reports):
+        _save(reports, "r1.md", "Solar panel recycling costs")
+        assert find_cached_report("solar panel efficiency records", "standard", None) is None
+
+    def test_mode_context_and_status_must_match(self, reports):
+        _save(reports, "r1.md", "Solar panel recycling costs", context="energy")
+        _save(reports, "r2.md", "Solar panel recycling costs", status="insufficient_data")
+
+        assert find_cached_report("Solar panel recycling costs", "deep", "energy") is None
+        assert find_cached_report("Solar panel recycling costs", "standard", None) is None
+        assert find_cached_report("Solar panel recycling costs", "standard", "Energy").hit.filename == "r1.md"
+
+    def test_age_decides_refresh_or_miss(self, reports):
+        _save(reports, "r1.md", "Solar panel recycling costs")
+        [entry] = load_index()
+        policy = FreshnessPolicy(max_age_s=DAY_S, refresh_window_s=7 * DAY_S)
+
+        stale = find_cached_report(
+            "Solar panel recycling costs", "standard", None, policy, now=entry.timestamp + 2 * DAY_S,
+        )
+        assert stale.hit.refresh_suggested is True
+        assert stale.hit.age_s == 2 * DAY_S
+
+        assert find_cached_report(
+            "Solar panel recycling costs", "standard", None, policy, now=entry.timestamp + 8 * DAY_S,
+        ) is None
+
+    def test_newest_of_equal_matches_wins(self, reports):
+        _save(reports, "old.md", "Solar panel recycling costs")
+        _save(reports, "new.md", "Solar panel recycling costs")
+
+        assert find_cached_report("Solar panel recycling costs", "standard", None).hit.filename == "new.md"
+
+    def test_missing_report_file_skipped(self, reports):
+        _save(reports, "r1.md", "Solar panel recycling costs").unlink()
+        assert find_cached_report("Solar panel recycling costs", "standard", None) is None
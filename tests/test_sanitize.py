@@ -1,8 +1,19 @@
 """Tests for sanitize_content() — single canonical location."""
 
+import html
+import random
+
+import pytest
+
 from research_agent.sanitize import sanitize_content
 
 
+def _reference_sanitize(text: str) -> str:
+    """The original five-pass implementation, kept as the behavioral spec."""
+    text = text.replace("\x00", "")
+    return html.unescape(text).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
 class TestSanitizeContent:
     """Tests for sanitize_content() function."""
 
@@ -112,3 +123,24 @@ class TestPromptInjectionDefense:
         result = sanitize_content(payload)
         assert "</research_context>" not in result
         assert "<system>" not in result
+
+
+class TestSanitizeEquivalence:
+    """The fast path must match the original implementation exactly."""
+
+    ALPHABET = ["a", " ", "&", "<", ">", ";", "#", "x", "3", "C", "amp", "lt", "gt",
+                "\x00", "&amp;", "&lt;", "&#60;", "&#x3C;", "&am\x00p;", "é", "\n"]
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_reference_on_random_input(self, seed):
+        rng = random.Random(seed)
+        for _ in range(200):
+            text = "".join(rng.choices(self.ALPHABET, k=rng.randint(0, 40)))
+            assert sanitize_content(text) == _reference_sanitize(text), repr(text)
+
+    def test_null_removed_before_unescape(self):
+        assert sanitize_content("&am\x00p;") == "&amp;"
+
+    def test_clean_text_not_copied(self):
+        text = "plain text with no markup " * 100
+        assert sanitize_content(text) is text
@@ -9,6 +9,7 @@ from research_agent.search import (
     search,
     _search_tavily,
     refine_query,
+    refine_query_async,
     extract_noun_phrases,
     filter_blocked_urls,
     SearchResult,
@@ -511,3 +512,30 @@ class TestFilterBlockedUrls:
         filtered = filter_blocked_urls(results, ("blocked.com",))
         assert len(filtered) == 1
         assert filtered[0].url == "https://allowed.com/b"
+
+
+class TestRefineQueryAsync:
+    """Tests for refine_query_async()."""
+
+    async def test_returns_refined_query(self, mock_anthropic_response):
+        from unittest.mock import AsyncMock
+
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(
+            return_value=mock_anthropic_response("asyncio task group cancellation patterns")
+        )
+
+        result = await refine_query_async(mock_client, "python async", ["Summary one"])
+
+        assert result == "asyncio task group cancellation patterns"
+
+    async def test_api_error_returns_original(self):
+        from unittest.mock import AsyncMock
+        from anthropic import APIError
+
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(
+            side_effect=APIError(message="fail", request=MagicMock(), body=None)
+        )
+
+        assert await refine_query_async(mock_client, "python async", ["Summary"]) == "python async"
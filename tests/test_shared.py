@@ -0,0 +1,192 @@
+"""Tests for research_agent.shared module."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from research_agent.extract import ExtractedContent
+from research_agent.fetch import FetchedPage, fetch_urls
+from research_agent.search import SearchResult, search
+from research_agent.shared import (
+    CallSlots,
+    SharedCache,
+    SharedResources,
+    current_shared,
+    shared_scope,
+)
+from research_agent.summarize import Summary, summarize_all
+
+
+class TestSharedCache:
+    def test_computes_once(self):
+        cache = SharedCache()
+        calls = []
+        for _ in range(3):
+            assert cache.get_or_compute("k", lambda: calls.append(1) or "v") == "v"
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses, len(cache)) == (2, 1, 1)
+
+    def test_concurrent_threads_share_one_computation(self):
+        cache = SharedCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.05)
+            return "v"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_compute("k", compute)))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == ["v"] * 5
+        assert len(calls) == 1
+
+    def test_rejected_value_is_recomputed(self):
+        cache = SharedCache()
+        assert cache.get_or_compute("k", lambda: [], keep=bool) == []
+        assert cache.get_or_compute("k", lambda: [1], keep=bool) == [1]
+        assert cache.get_or_compute("k", lambda: [2], keep=bool) == [1]
+
+    def test_failure_is_not_cached(self):
+        cache = SharedCache()
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_compute("k", fail)
+        assert cache.get_or_compute("k", lambda: "v") == "v"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_share_one_computation(self):
+        cache = SharedCache()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "v"
+
+        results = await asyncio.gather(
+            *[cache.get_or_compute_async("k", compute) for _ in range(5)]
+        )
+        assert results == ["v"] * 5
+        assert len(calls) == 1
+        assert cache.hits == 4
+
+
+class TestCallSlots:
+    def test_rejects_zero_limit(self):
+        with pytest.raises(ValueError):
+            CallSlots(0)
+
+    @pytest.mark.asyncio
+    async def test_caps_calls_and_serves_waiters_in_order(self):
+        slots = CallSlots(2)
+        in_flight = 0
+        peak = 0
+        order = []
+
+        async def call(i):
+            nonlocal in_flight, peak
+            async with slots.hold_async():
+                order.append(i)
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*[call(i) for i in range(6)])
+        assert peak == 2
+        assert order == list(range(6))
+
+
+class TestSharedScope:
+    def test_scope_sets_and_resets(self):
+        resources = SharedResources()
+        assert current_shared() is None
+        with shared_scope(resources):
+            assert current_shared() is resources
+        assert current_shared() is None
+
+    def test_stats(self):
+        resources = SharedResources()
+        resources.searches.get_or_compute(("q", 5), lambda: [1])
+        resources.searches.get_or_compute(("q", 5), lambda: [1])
+        assert resources.stats()["search"] == {"hits": 1, "misses": 1, "size": 1}
+        assert resources.stats()["fetch"] == {"hits": 0, "misses": 0, "size": 0}
+
+
+class TestSharedSearch:
+    def test_search_results_shared_and_copied(self, monkeypatch):
+        monkeypatch.setenv("TAVILY_API_KEY", "key")
+        results = [SearchResult(title="t", url="https://a.example", snippet="s")]
+        with patch("research_agent.search._search_tavily", return_value=results) as mock_search:
+            with shared_scope(SharedResources()):
+                first = search("venue pricing", 5)
+                first.append("mutated")
+                second = search("venue pricing", 5)
+                search("venue pricing", 3)
+        assert second == results
+        assert mock_search.call_count == 2
+
+    def test_search_uncached_outside_scope(self, monkeypatch):
+        monkeypatch.setenv("TAVILY_API_KEY", "key")
+        results = [SearchResult(title="t", url="https://a.example", snippet="s")]
+        with patch("research_agent.search._search_tavily", return_value=results) as mock_search:
+            search("venue pricing", 5)
+            search("venue pricing", 5)
+        assert mock_search.call_count == 2
+
+
+class TestSharedFetch:
+    @pytest.mark.asyncio
+    async def test_pages_and_failures_shared(self):
+        async def fake_fetch(client, url, semaphore, dns_cache=None):
+            if "bad" in url:
+                return None
+            return FetchedPage(url=url, html="<p>x</p>", status_code=200)
+
+        resources = SharedResources()
+        urls = ["https://a.example", "https://bad.example"]
+        with patch("research_agent.fetch._fetch_single", side_effect=fake_fetch) as mock_fetch:
+            with shared_scope(resources):
+                first = await fetch_urls(urls)
+                second = await fetch_urls(urls)
+        assert [p.url for p in first] == [p.url for p in second] == ["https://a.example"]
+        assert mock_fetch.call_count == 2
+        assert resources.stats()["fetch"]["hits"] == 2
+
+
+class TestSharedSummaries:
+    @pytest.mark.asyncio
+    async def test_same_content_and_settings_summarized_once(self):
+        content = ExtractedContent(url="https://a.example", title="A", text="Body text.")
+        summary = [Summary(url=content.url, title="A", summary="Short.")]
+        mock = AsyncMock(return_value=summary)
+        with patch("research_agent.summarize.summarize_content", mock):
+            with shared_scope(SharedResources()):
+                first = await summarize_all(None, [content], model="m")
+                second = await summarize_all(None, [content], model="m")
+                await summarize_all(None, [content], model="m", structured=True)
+        assert first == second == summary
+        assert mock.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_summaries_are_retried(self):
+        content = ExtractedContent(url="https://a.example", title="A", text="Body text.")
+        summary = [Summary(url=content.url, title="A", summary="Short.")]
+        mock = AsyncMock(side_effect=[[], summary])
+        with patch("research_agent.summarize.summarize_content", mock):
+            with shared_scope(SharedResources()):
+                assert await summarize_all(None, [content], model="m") == []
+                assert await summarize_all(None, [content], model="m") == summary
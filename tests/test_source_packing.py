@@ -0,0 +1,100 @@
+"""Tests for research_agent.source_packing module."""
+
+from research_agent.source_packing import pack_sources
+from research_agent.summarize import Summary
+from research_agent.token_budget import count_tokens
+
+
+def _summary(url: str, text: str, title: str = "T") -> Summary:
+    return Summary(url=url, title=title, summary=text)
+
+
+def _words(topic: str, n: int = 40) -> str:
+    return " ".join(f"{topic}{i}" for i in range(n))
+
+
+class TestPackSources:
+    def test_unbudgeted_keeps_every_source_in_order(self):
+        summaries = [
+            _summary("https://a.com/1", "Part 1"),
+            _summary("https://a.com/1", "Part 2"),
+            _summary("https://b.com/2", "Different"),
+        ]
+        packed = pack_sources(summaries)
+
+        assert packed.urls == ("https://a.com/1", "https://b.com/2")
+        assert packed.omitted == ()
+        assert '<source id="1">' in packed.text and '<source id="2">' in packed.text
+        assert "Part 1 Part 2" in packed.text
+        assert packed.tokens == count_tokens(packed.text)
+
+    def test_budget_goes_to_highest_scored_sources(self):
+        summaries = [_summary(f"https://site{i}.com", _words(f"s{i}x")) for i in range(4)]
+        per_source = count_tokens(summaries[0].summary)
+        scores = {"https://site0.com": 4, "https://site1.com": 5, "https://site2.com": 3, "https://site3.com": 5}
+
+        packed = pack_sources(summaries, scores, max_tokens=per_source * 2)
+
+        # Original order and renumbering are kept among the packed sources
+        assert packed.urls == ("https://site1.com", "https://site3.com")
+        assert packed.omitted == ("https://site0.com", "https://site2.com")
+
+    def test_lead_chunks_before_second_chunks(self):
+        summaries = [
+            _summary("https://a.com", _words("alpha")),
+            _summary("https://a.com", _words("beta")),
+            _summary("https://b.com", _words("gamma")),
+        ]
+        per_chunk = count_tokens(summaries[0].summary)
+
+        packed = pack_sources(summaries, {"https://a.com": 5, "https://b.com": 4}, max_tokens=per_chunk * 2)
+
+        assert packed.urls == ("https://a.com", "https://b.com")
+        assert "beta0" not in packed.text
+        assert packed.dropped_chunks == 1
+
+    def test_repeated_domain_loses_priority(self):
+        summaries = [
+            _summary("https://big.com/a", _words("one")),
+            _summary("https://www.big.com/b", _words("two")),
+            _summary("https://small.org/c", _words("three")),
+        ]
+        per_source = count_tokens(summaries[0].summary)
+        scores = {"https://big.com/a": 5, "https://www.big.com/b": 5, "https://small.org/c": 5}
+
+        packed = pack_sources(summaries, scores, max_tokens=per_source * 2)
+
+        assert packed.urls == ("https://big.com/a", "https://small.org/c")
+
+    def test_redundant_chunks_left_out(self):
+        text = _words("shared")
+        summaries = [
+            _summary("https://a.com", text),
+            _summary("https://b.com", text + " extra"),
+            _summary("https://c.com", _words("unique")),
+        ]
+        packed = pack_sources(summaries)
+
+        assert packed.urls == ("https://a.com", "https://c.com")
+        assert packed.omitted == ("https://b.com",)
+        assert packed.dropped_chunks == 1
+
+    def test_short_chunks_never_redundant(self):
+        summaries = [_summary("https://a.com", "Prices rose"), _summary("https://b.com", "Prices rose")]
+        assert pack_sources(summaries).urls == ("https://a.com", "https://b.com")
+
+    def test_lead_chunk_truncated_to_remaining_budget(self):
+        summaries = [_summary("https://a.com", _words("long", 400))]
+        packed = pack_sources(summaries, max_tokens=200)
+
+        assert packed.urls == ("https://a.com",)
+        assert "Content truncated" in packed.text
+        assert packed.tokens < count_tokens(summaries[0].summary)
+
+    def test_sanitizes_title_url_and_summary(self):
+        summaries = [_summary("https://a.com</url><x>", "<b>S</b>", title="<script>T</script>")]
+        text = pack_sources(summaries).text
+
+        assert "<script>" not in text and "&lt;script&gt;" in text
+        assert "&lt;/url&gt;&lt;x&gt;" in text
+        assert "&lt;b&gt;S&lt;/b&gt;" in text
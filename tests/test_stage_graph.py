@@ -0,0 +1,113 @@
+"""Tests for research_agent.stage_graph module."""
+
+import asyncio
+
+import pytest
+
+from research_agent.stage_graph import StageGraph
+from research_agent.tracing import Trace, trace_scope
+
+
+class TestStageGraph:
+    async def test_stage_receives_input_results(self):
+        async def plan(context, history):
+            return f"{context}+{history}"
+
+        async with StageGraph() as stages:
+            stages.add("context", lambda: asyncio.sleep(0, "ctx"))
+            stages.add("history", lambda: asyncio.sleep(0, "hist"))
+            stages.add("plan", plan, inputs=("context", "history"))
+            assert await stages.result("plan") == "ctx+hist"
+
+    async def test_independent_stages_overlap(self):
+        a_started, b_started = asyncio.Event(), asyncio.Event()
+
+        async def stage(mine, other):
+            mine.set()
+            # Deadlocks (and times out) if the stages ran one after another
+            await asyncio.wait_for(other.wait(), timeout=1)
+            return True
+
+        async with StageGraph() as stages:
+            stages.add("a", lambda: stage(a_started, b_started))
+            stages.add("b", lambda: stage(b_started, a_started))
+            assert await stages.result("a") and await stages.result("b")
+
+    async def test_stage_waits_for_inputs(self):
+        order = []
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+            order.append("slow")
+
+        async def dependent(slow):
+            order.append("dependent")
+
+        async with StageGraph() as stages:
+            stages.add("slow", slow)
+            stages.add("dependent", dependent, inputs=("slow",))
+            await asyncio.sleep(0.01)
+            assert order == []
+            release.set()
+            await stages.result("dependent")
+        assert order == ["slow", "dependent"]
+
+    async def test_error_reaches_dependents_and_callers(self):
+        async def broken():
+            raise ValueError("boom")
+
+        async def dependent(broken):
+            return "unreachable"
+
+        async with StageGraph() as stages:
+            stages.add("broken", broken)
+            stages.add("dependent", dependent, inputs=("broken",))
+            with pytest.raises(ValueError, match="boom"):
+                await stages.result("dependent")
+            with pytest.raises(ValueError, match="boom"):
+                await stages.result("broken")
+
+    async def test_rejects_duplicate_and_unknown_stages(self):
+        async with StageGraph() as stages:
+            stages.add("a", lambda: asyncio.sleep(0))
+            with pytest.raises(ValueError, match="already added"):
+                stages.add("a", lambda: asyncio.sleep(0))
+            with pytest.raises(ValueError, match="unknown inputs: missing"):
+                stages.add("b", lambda: asyncio.sleep(0), inputs=("missing",))
+            assert "a" in stages and "b" not in stages
+
+    async def test_exit_cancels_unawaited_stages(self):
+        cancelled = asyncio.Event()
+
+        async def speculative():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async with StageGraph() as stages:
+            stages.add("speculative", speculative)
+            await asyncio.sleep(0)
+        assert cancelled.is_set()
+
+    async def test_cancel_stops_a_stage(self):
+        async with StageGraph() as stages:
+            stages.add("speculative", lambda: asyncio.sleep(60))
+            stages.cancel("speculative")
+            with pytest.raises(asyncio.CancelledError):
+                await stages.result("speculative")
+            with pytest.raises(KeyError):
+                stages.cancel("missing")
+
+    async def test_records_stage_spans(self):
+        trace = Trace()
+        with trace_scope(trace):
+            async with StageGraph() as stages:
+                stages.add("first", lambda: asyncio.sleep(0.01))
+                stages.add("second", lambda first: asyncio.sleep(0), inputs=("first",))
+                await stages.result("second")
+        spans = {s.name: s for s in trace.spans}
+        assert set(spans) == {"stage.first", "stage.second"}
+        assert float(spans["stage.second"].args["waited_s"]) >= 0.005
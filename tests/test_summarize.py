@@ -8,17 +8,21 @@ from unittest.mock import MagicMock, AsyncMock, patch
 from research_agent.summarize import (
     _chunk_text,
     _extract_prior_context,
+    _build_page_outline,
+    _parse_section_summaries,
     summarize_chunk,
     summarize_content,
     summarize_all,
     Summary,
     CHUNK_SIZE,
+    CHUNK_TOKENS,
     MAX_CHUNKS_PER_SOURCE,
     BATCH_SIZE,
     RATE_LIMIT_BACKOFF,
     MAX_CONCURRENT_CHUNKS,
 )
 from research_agent.extract import ExtractedContent
+from research_agent.token_budget import count_tokens
 
 
 class TestChunkText:
@@ -588,6 +592,21 @@ class TestStructuredSummaries:
         default_chunks = _chunk_text(long_text)
         assert len(default_chunks) == MAX_CHUNKS_PER_SOURCE
 
+    def test_chunk_tokens_sizes_chunks_by_tokenizer(self):
+        """chunk_tokens gives dense text shorter chunks than prose."""
+        prose = "This is a paragraph of plain prose.\n\n" * 400
+        table = "| 2023 | 1,234.56 | 78% |\n" * 600
+        prose_chunks = _chunk_text(prose, max_chunks=2, chunk_tokens=CHUNK_TOKENS)
+        table_chunks = _chunk_text(table, max_chunks=2, chunk_tokens=CHUNK_TOKENS)
+
+        assert len(prose_chunks) == len(table_chunks) == 2
+        assert len(table_chunks[0]) < len(prose_chunks[0])
+        assert count_tokens(table_chunks[0]) <= CHUNK_TOKENS
+
+    def test_chunk_tokens_short_text_single_chunk(self):
+        assert _chunk_text("Short.", chunk_tokens=CHUNK_TOKENS) == ["Short."]
+        assert _chunk_text("", chunk_tokens=CHUNK_TOKENS) == [""]
+
     def test_max_chunks_default_is_3(self):
         """Default max_chunks should be MAX_CHUNKS_PER_SOURCE (3)."""
         long_text = "This is a paragraph.\n\n" * 500
@@ -686,6 +705,34 @@ class TestSummarySourceTier:
         assert summaries[0].source_tier == "snippet"
 
 
+class TestSummarySafeSummary:
+    """Sanitized summary text is computed once per Summary."""
+
+    def test_matches_sanitize_content(self):
+        s = Summary(url="https://ex.com", title="T", summary="<b>Fish &amp; chips</b>")
+        assert s.safe_summary == "&lt;b&gt;Fish &amp; chips&lt;/b&gt;"
+
+    def test_sanitizes_once(self):
+        s = Summary(url="https://ex.com", title="T", summary="a < b")
+        with patch("research_agent.summarize.sanitize_content", wraps=lambda t: t + "!") as mock_sanitize:
+            assert s.safe_summary == "a < b!"
+            assert s.safe_summary == "a < b!"
+        assert mock_sanitize.call_count == 1
+
+    def test_slotted(self):
+        s = Summary(url="https://ex.com", title="T", summary="x")
+        assert not hasattr(s, "__dict__")
+        assert s.safe_summary == "x"  # cache slot is writable despite frozen
+
+    def test_cache_ignored_by_equality_and_repr(self):
+        a = Summary(url="https://ex.com", title="T", summary="x & y")
+        b = Summary(url="https://ex.com", title="T", summary="x & y")
+        a.safe_summary
+        assert a == b
+        assert hash(a) == hash(b)
+        assert "_safe_summary" not in repr(a)
+
+
 class TestExtractPriorContext:
     """Tests for _extract_prior_context()."""
 
@@ -785,3 +832,306 @@ class TestCrossChunkContext:
         assert "<prior_chunk_context>" in call_prompts[1]
         assert "chunk 2 of" in call_prompts[1]
         assert "Summary for this chunk." in call_prompts[1]
+
+
+class TestBuildPageOutline:
+    """Tests for _build_page_outline() local header builder."""
+
+    def test_title_only_when_no_headings(self):
+        """Plain text yields just the title."""
+        assert _build_page_outline("My Page", "Just some text.") == "My Page"
+
+    def test_collects_markdown_headings(self):
+        """Markdown headings are listed after the title, deduplicated."""
+        text = "# My Page\n\nIntro\n\n## Pricing\n\nx\n\n## Pricing\n\n### Support Plans ##\n"
+        outline = _build_page_outline("My Page", text)
+        assert outline == "My Page — sections: Pricing; Support Plans"
+
+    def test_caps_headings_and_length(self):
+        """Outline respects max_headings and max_chars."""
+        text = "\n".join(f"## Heading number {i}" for i in range(50))
+        outline = _build_page_outline("T", text, max_headings=3)
+        assert outline.count(";") == 2
+        long_outline = _build_page_outline("T", text, max_headings=50, max_chars=60)
+        assert len(long_outline) <= 63
+        assert long_outline.endswith("...")
+
+    def test_empty_title_and_text(self):
+        """Nothing to describe returns empty string."""
+        assert _build_page_outline("", "plain") == ""
+
+
+class TestParallelChunkMode:
+    """Tests for chunk_mode='parallel' and optional stitching."""
+
+    @staticmethod
+    def _long_content():
+        text = (
+            "## Overview\n\n" + "Paragraph one content. " * 200
+            + "\n\n## Details\n\n" + "Paragraph two content. " * 200
+        )
+        return ExtractedContent(url="https://ex.com", title="T", text=text)
+
+    @pytest.mark.asyncio
+    async def test_parallel_uses_outline_not_prior_context(self):
+        """Every chunk gets the page outline; none gets prior-chunk context."""
+        mock_client = AsyncMock()
+        prompts = []
+
+        async def track_create(**kwargs):
+            prompts.append(kwargs["messages"][0]["content"])
+            resp = MagicMock()
+            resp.content = [MagicMock(text="Chunk summary.")]
+            return resp
+
+        mock_client.messages.create.side_effect = track_create
+
+        result = await summarize_content(
+            mock_client, self._long_content(), chunk_mode="parallel",
+        )
+
+        assert len(result) == len(prompts) >= 2
+        for i, prompt in enumerate(prompts, 1):
+            assert "<prior_chunk_context>" not in prompt
+            assert "<page_outline>" in prompt
+            assert "sections: Overview; Details" in prompt
+
+    @pytest.mark.asyncio
+    async def test_parallel_runs_chunks_concurrently(self):
+        """Chunks of one source overlap in flight instead of serializing."""
+        mock_client = AsyncMock()
+        in_flight = 0
+        peak = 0
+
+        async def slow_create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            resp = MagicMock()
+            resp.content = [MagicMock(text="Summary.")]
+            return resp
+
+        mock_client.messages.create.side_effect = slow_create
+
+        await summarize_content(
+            mock_client, self._long_content(), chunk_mode="parallel",
+            semaphore=asyncio.Semaphore(MAX_CONCURRENT_CHUNKS),
+        )
+        assert peak >= 2
+
+    @pytest.mark.asyncio
+    async def test_parallel_keeps_chunk_order_and_skips_failures(self):
+        """Failed chunks are dropped; survivors stay in chunk order."""
+        mock_client = AsyncMock()
+        responses = iter(["First.", None, "Third."])
+
+        async def create(**kwargs):
+            text = next(responses)
+            if text is None:
+                raise RuntimeError("boom")
+            resp = MagicMock()
+            resp.content = [MagicMock(text=text)]
+            return resp
+
+        mock_client.messages.create.side_effect = create
+        content = ExtractedContent(url="https://ex.com", title="T", text="word " * 3000)
+
+        result = await summarize_content(mock_client, content, chunk_mode="parallel")
+        assert [s.summary for s in result] == ["First.", "Third."]
+
+    @pytest.mark.asyncio
+    async def test_stitch_merges_into_single_summary(self):
+        """stitch=True adds one merge call and returns one summary per source."""
+        mock_client = AsyncMock()
+        prompts = []
+
+        async def create(**kwargs):
+            prompts.append(kwargs["messages"][0]["content"])
+            resp = MagicMock()
+            text = "Merged." if "<chunk_summaries>" in prompts[-1] else "Part."
+            resp.content = [MagicMock(text=text)]
+            return resp
+
+        mock_client.messages.create.side_effect = create
+
+        result = await summarize_content(
+            mock_client, self._long_content(), chunk_mode="parallel", stitch=True,
+        )
+        assert [s.summary for s in result] == ["Merged."]
+        assert sum("<chunk_summaries>" in p for p in prompts) == 1
+
+    @pytest.mark.asyncio
+    async def test_stitch_failure_keeps_chunk_summaries(self):
+        """If the merge call fails, per-chunk summaries are returned."""
+        from anthropic import APIError
+
+        mock_client = AsyncMock()
+
+        async def create(**kwargs):
+            if "<chunk_summaries>" in kwargs["messages"][0]["content"]:
+                raise APIError(message="err", request=MagicMock(), body=None)
+            resp = MagicMock()
+            resp.content = [MagicMock(text="Part.")]
+            return resp
+
+        mock_client.messages.create.side_effect = create
+
+        result = await summarize_content(
+            mock_client, self._long_content(), chunk_mode="parallel", stitch=True,
+        )
+        assert len(result) >= 2
+        assert all(s.summary == "Part." for s in result)
+
+    @pytest.mark.asyncio
+    async def test_single_chunk_parallel_matches_sequential(self):
+        """Short pages take the same single-call path in both modes."""
+        mock_client = AsyncMock()
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="Summary.")]
+        mock_client.messages.create.return_value = mock_response
+        content = ExtractedContent(url="https://ex.com", title="T", text="Short.")
+
+        result = await summarize_content(
+            mock_client, content, chunk_mode="parallel", stitch=True,
+        )
+        assert len(result) == 1
+        assert mock_client.messages.create.call_count == 1
+        prompt = mock_client.messages.create.call_args.kwargs["messages"][0]["content"]
+        assert "<page_outline>" not in prompt
+
+    @pytest.mark.asyncio
+    async def test_summarize_all_threads_chunk_mode(self):
+        """summarize_all forwards chunk_mode and stitch to summarize_content."""
+        with patch("research_agent.summarize.summarize_content", new_callable=AsyncMock) as mock_sc:
+            mock_sc.return_value = []
+            content = ExtractedContent(url="https://ex.com", title="T", text="x")
+            await summarize_all(AsyncMock(), [content], chunk_mode="parallel", stitch=True)
+            kwargs = mock_sc.call_args.kwargs
+            assert kwargs["chunk_mode"] == "parallel"
+            assert kwargs["stitch"] is True
+
+
+class TestParseSectionSummaries:
+    """Tests for _parse_section_summaries() helper."""
+
+    def test_parses_indexed_sections(self):
+        text = (
+            '<section_summary index="1">First.</section_summary>\n'
+            '<section_summary index="2">\nSecond.\n</section_summary>'
+        )
+        assert _parse_section_summaries(text, 2) == {1: "First.", 2: "Second."}
+
+    def test_ignores_out_of_range_empty_and_duplicate(self):
+        text = (
+            '<section_summary index="0">Zero.</section_summary>'
+            '<section_summary index="1">One.</section_summary>'
+            '<section_summary index="1">Again.</section_summary>'
+            '<section_summary index="2">  </section_summary>'
+            '<section_summary index="5">Five.</section_summary>'
+        )
+        assert _parse_section_summaries(text, 3) == {1: "One."}
+
+    def test_no_tags_returns_empty(self):
+        assert _parse_section_summaries("Just prose.", 2) == {}
+
+
+class TestSingleCallChunkMode:
+    """Tests for chunk_mode='single_call'."""
+
+    @staticmethod
+    def _long_content():
+        return ExtractedContent(url="https://ex.com", title="T", text="word " * 3000)
+
+    @staticmethod
+    def _sections_response(indexes):
+        return "\n".join(
+            f'<section_summary index="{i}">Section {i}.</section_summary>' for i in indexes
+        )
+
+    @pytest.mark.asyncio
+    async def test_one_request_split_into_per_chunk_summaries(self):
+        """All chunks go out in one request and come back as one Summary each."""
+        mock_client = AsyncMock()
+        prompts = []
+
+        async def create(**kwargs):
+            prompts.append(kwargs)
+            n = kwargs["messages"][0]["content"].count("<section index=")
+            resp = MagicMock()
+            resp.content = [MagicMock(text=self._sections_response(range(1, n + 1)))]
+            return resp
+
+        mock_client.messages.create.side_effect = create
+
+        result = await summarize_content(
+            mock_client, self._long_content(), chunk_mode="single_call",
+        )
+        assert len(prompts) == 1
+        n = prompts[0]["messages"][0]["content"].count("<section index=")
+        assert n >= 2
+        assert [s.summary for s in result] == [f"Section {i}." for i in range(1, n + 1)]
+        assert all(s.url == "https://ex.com" for s in result)
+        assert prompts[0]["max_tokens"] == 500 * n
+
+    @pytest.mark.asyncio
+    async def test_missing_sections_fall_back_to_per_chunk_calls(self):
+        """Sections absent from the response are summarized individually."""
+        mock_client = AsyncMock()
+        prompts = []
+
+        async def create(**kwargs):
+            prompt = kwargs["messages"][0]["content"]
+            prompts.append(prompt)
+            resp = MagicMock()
+            if "<section index=" in prompt:
+                resp.content = [MagicMock(text=self._sections_response([1]))]
+            else:
+                resp.content = [MagicMock(text="Fallback.")]
+            return resp
+
+        mock_client.messages.create.side_effect = create
+
+        result = await summarize_content(
+            mock_client, self._long_content(), chunk_mode="single_call",
+        )
+        assert result[0].summary == "Section 1."
+        assert len(result) == len(prompts)
+        assert all(s.summary == "Fallback." for s in result[1:])
+
+    @pytest.mark.asyncio
+    async def test_api_error_falls_back_for_every_chunk(self):
+        """If the combined call fails, every chunk is summarized on its own."""
+        from anthropic import APIError
+
+        mock_client = AsyncMock()
+
+        async def create(**kwargs):
+            if "<section index=" in kwargs["messages"][0]["content"]:
+                raise APIError(message="err", request=MagicMock(), body=None)
+            resp = MagicMock()
+            resp.content = [MagicMock(text="Fallback.")]
+            return resp
+
+        mock_client.messages.create.side_effect = create
+
+        result = await summarize_content(
+            mock_client, self._long_content(), chunk_mode="single_call",
+        )
+        assert len(result) >= 2
+        assert all(s.summary == "Fallback." for s in result)
+
+    @pytest.mark.asyncio
+    async def test_short_page_uses_regular_single_chunk_path(self):
+        """Single-chunk pages don't use section tags."""
+        mock_client = AsyncMock()
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="Summary.")]
+        mock_client.messages.create.return_value = mock_response
+        content = ExtractedContent(url="https://ex.com", title="T", text="Short.")
+
+        result = await summarize_content(mock_client, content, chunk_mode="single_call")
+        assert [s.summary for s in result] == ["Summary."]
+        prompt = mock_client.messages.create.call_args.kwargs["messages"][0]["content"]
+        assert "<section index=" not in prompt
@@ -17,6 +17,12 @@ from research_agent.synthesize import (
     synthesize_draft,
     synthesize_final,
     synthesize_mini_report,
+    synthesize_mini_report_async,
+    synthesize_mini_reports,
+    synthesize_mini_reports_async,
+    synthesize_draft_async,
+    synthesize_final_async,
+    synthesize_report_async,
 )
 from research_agent.evidence import ABSTENTION_INSTRUCTION, EVIDENCE_TIERS, EVIDENCE_TIER_INSTRUCTION, EVIDENCE_TIER_REMINDER
 from research_agent.skeptic import SkepticFinding
@@ -434,6 +440,75 @@ class TestSynthesizeDraft:
         assert "&lt;script&gt;" in prompt
 
 
+class _AsyncStream:
+    """Async context manager mimicking AsyncAnthropic's message stream."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    async def text_stream(self):
+        for chunk in self._chunks:
+            yield chunk
+
+    async def get_final_message(self):
+        return MagicMock()
+
+
+def _make_async_streaming_client(*chunks):
+    """Create a mock async client that streams the given chunks."""
+    mock_client = MagicMock()
+    mock_client.messages.stream.return_value = _AsyncStream(list(chunks))
+    return mock_client
+
+
+class TestAsyncSynthesis:
+    """Tests for the *_async synthesis variants."""
+
+    async def test_draft_streams_on_async_client(self, capsys):
+        client = _make_async_streaming_client("## Executive ", "Summary\nDraft content.")
+        result = await synthesize_draft_async(client, "test query", SAMPLE_SUMMARIES)
+        assert result == "## Executive Summary\nDraft content."
+        assert "Draft content." in capsys.readouterr().err
+
+    async def test_text_goes_to_progress_listener_instead_of_stderr(self, capsys):
+        from research_agent.progress import TextDelta, progress_scope
+
+        events = []
+        client = _make_async_streaming_client("Report ", "body.")
+        with progress_scope(events.append):
+            await synthesize_report_async(client, "test query", SAMPLE_SUMMARIES)
+        assert [e.text for e in events if isinstance(e, TextDelta)] == ["Report ", "body.", "\n"]
+        assert capsys.readouterr().err == ""
+
+    async def test_report_prepends_limited_disclaimer(self):
+        client = _make_async_streaming_client("Short report.")
+        result = await synthesize_report_async(
+            client, "test query", SAMPLE_SUMMARIES,
+            limited_sources=True, dropped_count=3, total_count=5,
+        )
+        assert result.startswith("**Note:** Only 2 of 5 sources")
+        assert result.endswith("\n\nShort report.")
+
+    async def test_final_combines_draft_and_final_sections(self):
+        client = _make_async_streaming_client("## Recommendations\nDo X.")
+        result = await synthesize_final_async(
+            client, "test query", "## Draft", [], SAMPLE_SUMMARIES,
+        )
+        assert result == "## Draft\n\n## Recommendations\nDo X."
+
+    async def test_empty_response_raises(self):
+        client = _make_async_streaming_client("")
+        with pytest.raises(SynthesisError, match="empty response"):
+            await synthesize_final_async(client, "test query", "## Draft", [], SAMPLE_SUMMARIES)
+
+
 class TestFormatSkepticFindings:
     """Tests for _format_skeptic_findings()."""
 
@@ -1256,3 +1331,99 @@ class TestAbstentionInstruction:
         assert EVIDENCE_TIER_REMINDER in prompt
         assert "<critical_findings>" in prompt
         assert "<skeptic_findings>" in prompt
+
+
+class TestSynthesizeMiniReportAsync:
+    """Tests for synthesize_mini_report_async()."""
+
+    async def test_returns_section_with_heading(self):
+        from unittest.mock import AsyncMock
+
+        client = MagicMock()
+        client.messages.create = AsyncMock(
+            return_value=MagicMock(content=[MagicMock(text="New findings [Source 1].")])
+        )
+
+        result = await synthesize_mini_report_async(
+            client, "follow-up question", SAMPLE_SUMMARIES, section_title="Follow-Up: X",
+        )
+
+        assert result == "## Follow-Up: X\n\nNew findings [Source 1]."
+
+    async def test_raises_on_empty_summaries(self):
+        with pytest.raises(SynthesisError, match="No summaries"):
+            await synthesize_mini_report_async(MagicMock(), "q", [], section_title="X")
+
+
+class TestSynthesizeMiniReports:
+    """Tests for synthesize_mini_reports() batched sections."""
+
+    SECTIONS = [("refined q", "Deeper Dive: refined q"), ("follow q", "Follow-Up: follow q")]
+
+    def test_splits_sections_in_order(self):
+        client = _make_create_client(
+            '<section_report index="2">Second [Source 1].</section_report>\n'
+            '<section_report index="1">First.</section_report>'
+        )
+        result = synthesize_mini_reports(client, self.SECTIONS, SAMPLE_SUMMARIES, max_tokens=500)
+
+        assert result == [
+            "## Deeper Dive: refined q\n\nFirst.",
+            "## Follow-Up: follow q\n\nSecond [Source 1].",
+        ]
+        kwargs = client.messages.create.call_args.kwargs
+        assert kwargs["max_tokens"] == 1000
+        prompt = kwargs["messages"][0]["content"]
+        assert '<question index="2">follow q</question>' in prompt
+        assert prompt.count("<source id=") == len({s.url for s in SAMPLE_SUMMARIES})
+
+    def test_missing_empty_and_out_of_range_sections_are_none(self):
+        client = _make_create_client(
+            '<section_report index="1"> </section_report>'
+            '<section_report index="3">Extra.</section_report>'
+        )
+        assert synthesize_mini_reports(client, self.SECTIONS, SAMPLE_SUMMARIES) == [None, None]
+
+    def test_headings_are_normalized(self):
+        client = _make_create_client(
+            '<section_report index="1">## Deeper Dive\nBody.\n## Detail\nMore.\n### Kept</section_report>'
+            '<section_report index="2">Plain.</section_report>'
+        )
+        first, _ = synthesize_mini_reports(client, self.SECTIONS, SAMPLE_SUMMARIES)
+
+        assert first == "## Deeper Dive: refined q\n\nBody.\n### Detail\nMore.\n### Kept"
+
+    def test_opening_sub_heading_and_unrelated_heading_are_kept(self):
+        client = _make_create_client(
+            '<section_report index="1">### Pricing\nBody.</section_report>'
+            '<section_report index="2">## Venue Costs\nMore.</section_report>'
+        )
+        result = synthesize_mini_reports(client, self.SECTIONS, SAMPLE_SUMMARIES)
+
+        assert result == [
+            "## Deeper Dive: refined q\n\n### Pricing\nBody.",
+            "## Follow-Up: follow q\n\n### Venue Costs\nMore.",
+        ]
+
+    def test_raises_on_empty_summaries(self):
+        with pytest.raises(SynthesisError, match="No summaries"):
+            synthesize_mini_reports(MagicMock(), self.SECTIONS, [])
+
+    async def test_async_uses_shared_packed_sources(self):
+        from unittest.mock import AsyncMock
+        from research_agent.source_packing import pack_sources
+
+        client = MagicMock()
+        client.messages.create = AsyncMock(return_value=MagicMock(content=[MagicMock(
+            text='<section_report index="1">A.</section_report><section_report index="2">B.</section_report>'
+        )]))
+        packed = pack_sources(SAMPLE_SUMMARIES[:1])
+
+        result = await synthesize_mini_reports_async(
+            client, self.SECTIONS, SAMPLE_SUMMARIES, sources=packed,
+        )
+
+        assert result == ["## Deeper Dive: refined q\n\nA.", "## Follow-Up: follow q\n\nB."]
+        prompt = client.messages.create.call_args.kwargs["messages"][0]["content"]
+        assert packed.text in prompt
+
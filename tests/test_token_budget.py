@@ -1,15 +1,23 @@
 """Tests for token budget utilities."""
 
 from dataclasses import FrozenInstanceError
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from research_agent.token_budget import (
     COMPONENT_PRIORITY,
     BudgetAllocation,
+    CharRatioTokenizer,
+    HeuristicTokenizer,
+    MAX_SCALE,
+    MESSAGE_OVERHEAD_TOKENS,
     allocate_budget,
+    calibrate_from_usage,
     count_tokens,
+    get_tokenizer,
+    prefix_chars_for_tokens,
+    set_tokenizer,
     truncate_to_budget,
 )
 
@@ -69,6 +77,147 @@ class TestCountTokens:
             assert result >= 1
 
 
+# --- tokenizer tests ---
+
+
+@pytest.fixture
+def fresh_tokenizer():
+    """Install a fresh HeuristicTokenizer and restore the previous one."""
+    tokenizer = HeuristicTokenizer()
+    previous = set_tokenizer(tokenizer)
+    yield tokenizer
+    set_tokenizer(previous)
+
+
+class TestHeuristicTokenizer:
+    def test_english_prose_close_to_char_ratio(self):
+        """Plain English stays near the old 4-chars-per-token estimate."""
+        text = "The committee reviewed the proposal and approved the budget. " * 20
+        estimate = HeuristicTokenizer().count(text)
+        assert 0.7 <= estimate / (len(text) / 4) <= 1.3
+
+    def test_dense_text_costs_more_than_char_ratio(self):
+        """Tables, CJK and non-Latin text get more tokens than len // 4."""
+        char_ratio = CharRatioTokenizer()
+        tokenizer = HeuristicTokenizer()
+        for text in (
+            "| 2023 | 1,234.56 | 78% |\n" * 20,
+            "東京は日本の首都です。" * 20,
+            "Привет, как дела? " * 20,
+        ):
+            assert tokenizer.count(text) > 1.5 * char_ratio.count(text)
+
+    def test_empty_and_minimum(self):
+        tokenizer = HeuristicTokenizer()
+        assert tokenizer.count("") == 0
+        assert tokenizer.count("a") == 1
+
+    def test_estimate_is_memoized(self):
+        """Repeated strings hit the LRU memo instead of re-scanning."""
+        tokenizer = HeuristicTokenizer()
+        text = "Some repeated prompt component. " * 50
+        first = tokenizer.estimate(text)
+        with patch("research_agent.token_budget._raw_estimate") as mock_raw:
+            assert tokenizer.estimate(text) == first
+            mock_raw.assert_not_called()
+
+    def test_memo_is_bounded(self):
+        tokenizer = HeuristicTokenizer(memo_size=3)
+        for i in range(10):
+            tokenizer.estimate(f"text number {i}")
+        assert len(tokenizer._memo) == 3
+
+    def test_memo_keyed_on_text_not_hash(self):
+        """Strings whose hashes collide still get their own estimates."""
+        class Colliding(str):
+            def __hash__(self):
+                return 0
+
+        tokenizer = HeuristicTokenizer()
+        assert tokenizer.estimate(Colliding("aaaa bbbb")) == 2
+        assert tokenizer.estimate(Colliding("a b c d e")) == 5
+
+    def test_memo_bounded_by_characters(self):
+        tokenizer = HeuristicTokenizer()
+        with patch("research_agent.token_budget.MEMO_MAX_CHARS", 100):
+            tokenizer.estimate("a" * 60)
+            tokenizer.estimate("b" * 60)
+            tokenizer.estimate("c" * 200)
+        assert list(tokenizer._memo) == ["b" * 60]
+
+    def test_calibrate_first_sample_sets_scale(self):
+        tokenizer = HeuristicTokenizer()
+        text = "word " * 100
+        raw = tokenizer.estimate(text)
+        tokenizer.calibrate(text, int(raw * 1.2) + MESSAGE_OVERHEAD_TOKENS)
+        assert tokenizer.scale == pytest.approx(1.2, abs=0.02)
+        assert tokenizer.count(text) == pytest.approx(raw * 1.2, abs=2)
+
+    def test_calibrate_smooths_and_clamps(self):
+        tokenizer = HeuristicTokenizer()
+        text = "word " * 100
+        tokenizer.calibrate(text, 10_000)
+        assert tokenizer.scale == MAX_SCALE
+        tokenizer.calibrate(text, tokenizer.estimate(text) + MESSAGE_OVERHEAD_TOKENS)
+        assert 1.0 < tokenizer.scale < MAX_SCALE
+
+    def test_calibrate_ignores_non_positive(self):
+        tokenizer = HeuristicTokenizer()
+        tokenizer.calibrate("word " * 10, 0)
+        assert tokenizer.scale == 1.0
+        assert tokenizer.samples == 0
+
+
+class TestTokenizerRegistry:
+    def test_count_tokens_uses_active_tokenizer(self):
+        previous = set_tokenizer(CharRatioTokenizer(chars_per_token=2))
+        try:
+            assert count_tokens("a" * 10) == 5
+        finally:
+            set_tokenizer(previous)
+        assert get_tokenizer() is previous
+
+    def test_calibrate_from_usage(self, fresh_tokenizer):
+        text = "word " * 100
+        usage = MagicMock(input_tokens=fresh_tokenizer.estimate(text) * 2)
+        calibrate_from_usage(text, usage)
+        assert fresh_tokenizer.samples == 1
+
+    def test_calibrate_from_usage_ignores_mock_usage(self, fresh_tokenizer):
+        """Non-integer input_tokens (mocked responses) are ignored."""
+        calibrate_from_usage("word " * 100, MagicMock())
+        calibrate_from_usage("word " * 100, None)
+        assert fresh_tokenizer.samples == 0
+
+    def test_calibrate_from_usage_skips_uncalibratable(self):
+        previous = set_tokenizer(CharRatioTokenizer())
+        try:
+            calibrate_from_usage("text", MagicMock(input_tokens=10))  # no error
+        finally:
+            set_tokenizer(previous)
+
+
+class TestPrefixCharsForTokens:
+    def test_whole_text_when_it_fits(self, fresh_tokenizer):
+        assert prefix_chars_for_tokens("short text", 100) == len("short text")
+
+    def test_prefix_fits_budget(self, fresh_tokenizer):
+        text = "word " * 1000
+        end = prefix_chars_for_tokens(text, 50)
+        assert 45 <= count_tokens(text[:end]) <= 50
+
+    def test_start_offset(self, fresh_tokenizer):
+        text = "x" * 100 + "word " * 100
+        end = prefix_chars_for_tokens(text, 10, start=100)
+        assert end > 100
+        assert count_tokens(text[100:end]) <= 10
+
+    def test_dense_text_gives_shorter_prefix(self, fresh_tokenizer):
+        prose = "The results were reported in the annual review. " * 50
+        table = "| 2023 | 1,234.56 | 78% |\n" * 100
+        assert prefix_chars_for_tokens(table, 100) < prefix_chars_for_tokens(prose, 100)
+
+
 # --- BudgetAllocation tests ---
 
 
@@ -0,0 +1,148 @@
+"""Tests for research_agent.tracing module."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from research_agent.tracing import (
+    Trace,
+    current_trace,
+    span,
+    trace_scope,
+    traced,
+)
+
+
+def _by_name(trace: Trace) -> dict:
+    return {s.name: s for s in trace.spans}
+
+
+class TestSpan:
+    def test_noop_without_trace(self):
+        assert current_trace() is None
+        with span("anything", x=1) as s:
+            assert s is None
+
+    def test_records_nested_spans(self):
+        trace = Trace()
+        with trace_scope(trace):
+            with span("outer", query="q"):
+                with span("inner"):
+                    pass
+        spans = _by_name(trace)
+        assert spans["outer"].args == {"query": "q"}
+        assert spans["inner"].parent == "outer"
+        assert spans["outer"].parent == ""
+        assert spans["inner"].end_ns >= spans["inner"].start_ns
+        assert current_trace() is None
+
+    def test_records_error_and_reraises(self):
+        trace = Trace()
+        with trace_scope(trace):
+            with pytest.raises(ValueError):
+                with span("failing"):
+                    raise ValueError("boom")
+        assert trace.spans[0].error == "ValueError"
+        assert trace.spans[0].end_ns > 0
+
+    def test_long_args_truncated(self):
+        trace = Trace()
+        with trace_scope(trace):
+            with span("s", text="x" * 1000):
+                pass
+        assert len(trace.spans[0].args["text"]) == 200
+
+
+class TestTraced:
+    def test_sync_function(self):
+        @traced("unit.sync", args=("a",))
+        def add(a, b):
+            return a + b
+
+        assert add(1, 2) == 3  # untraced call works
+        trace = Trace()
+        with trace_scope(trace):
+            assert add(2, b=3) == 5
+        (s,) = trace.spans
+        assert s.name == "unit.sync"
+        assert s.args == {"a": "2"}
+
+    @pytest.mark.asyncio
+    async def test_async_function_and_dotted_args(self):
+        @traced("unit.async", args=("item.url",))
+        async def fetch(item):
+            await asyncio.sleep(0)
+            return item.url
+
+        assert asyncio.iscoroutinefunction(fetch)
+        trace = Trace()
+        with trace_scope(trace):
+            assert await fetch(SimpleNamespace(url="https://a.com")) == "https://a.com"
+        assert trace.spans[0].args == {"item.url": "https://a.com"}
+
+    def test_default_name(self):
+        @traced()
+        def helper():
+            pass
+
+        trace = Trace()
+        with trace_scope(trace):
+            helper()
+        assert trace.spans[0].name.endswith("helper")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_get_separate_lanes(self):
+        @traced("unit.work")
+        async def work():
+            await asyncio.sleep(0.01)
+
+        trace = Trace()
+        with trace_scope(trace):
+            with span("root"):
+                await asyncio.gather(work(), work())
+        work_spans = [s for s in trace.spans if s.name == "unit.work"]
+        assert {s.parent for s in work_spans} == {"root"}
+        assert len({s.lane for s in work_spans}) == 2
+
+    @pytest.mark.asyncio
+    async def test_to_thread_inherits_trace(self):
+        @traced("unit.blocking")
+        def blocking():
+            return 1
+
+        trace = Trace()
+        with trace_scope(trace):
+            with span("root"):
+                await asyncio.to_thread(blocking)
+        assert _by_name(trace)["unit.blocking"].parent == "root"
+
+
+class TestChromeTrace:
+    def test_export_format(self, tmp_path):
+        trace = Trace()
+        with trace_scope(trace):
+            with span("stage.fetch", url="https://a.com"):
+                with span("fetch.url"):
+                    pass
+        path = trace.save(tmp_path)
+        data = json.loads(path.read_text())
+
+        complete = [e for e in data["traceEvents"] if e["ph"] == "X"]
+        meta = [e for e in data["traceEvents"] if e["ph"] == "M"]
+        assert {e["name"] for e in complete} == {"stage.fetch", "fetch.url"}
+        for e in complete:
+            assert e["dur"] >= 0 and e["ts"] >= 0
+            assert e["pid"] == 1
+        child = next(e for e in complete if e["name"] == "fetch.url")
+        assert child["cat"] == "fetch"
+        assert child["args"]["parent"] == "stage.fetch"
+        assert meta and meta[0]["name"] == "thread_name"
+
+    def test_open_span_exported_with_duration(self):
+        trace = Trace()
+        with trace_scope(trace):
+            with span("running"):
+                events = trace.to_chrome_trace()["traceEvents"]
+        assert events[0]["dur"] >= 0
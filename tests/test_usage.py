@@ -0,0 +1,182 @@
+"""Tests for research_agent.usage module."""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from research_agent.usage import (
+    UsageLedger,
+    UsageRecord,
+    UsageSummary,
+    UsageTotals,
+    combine_usage,
+    current_ledger,
+    load_usage_history,
+    model_pricing,
+    record_usage,
+    save_usage,
+    usage_scope,
+)
+
+
+def _response(input_tokens=100, output_tokens=50, cache_write=0, cache_read=0):
+    return SimpleNamespace(usage=SimpleNamespace(
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cache_creation_input_tokens=cache_write,
+        cache_read_input_tokens=cache_read,
+    ))
+
+
+class TestPricing:
+    def test_longest_prefix_wins(self):
+        assert model_pricing("claude-sonnet-4-20250514") == (3.0, 15.0)
+        assert model_pricing("claude-haiku-4-5-20251001") == (1.0, 5.0)
+
+    def test_unknown_model(self):
+        assert model_pricing("gpt-4") is None
+        record = UsageRecord(stage="x", model="gpt-4", input_tokens=1000, output_tokens=1000)
+        assert record.cost_usd == 0.0
+
+    def test_cost_includes_cache_tokens(self):
+        record = UsageRecord(
+            stage="summarize", model="claude-sonnet-4-20250514",
+            input_tokens=1_000_000, output_tokens=1_000_000,
+            cache_creation_input_tokens=1_000_000, cache_read_input_tokens=1_000_000,
+        )
+        assert record.cost_usd == pytest.approx(3.0 + 15.0 + 3.75 + 0.3)
+
+
+class TestRecordUsage:
+    def test_noop_outside_scope(self):
+        assert current_ledger() is None
+        record_usage("summarize", "m", _response(), time.monotonic())  # no error
+
+    def test_records_into_active_ledger(self):
+        ledger = UsageLedger()
+        with usage_scope(ledger):
+            record_usage("summarize", "claude-sonnet-4", _response(cache_read=10), time.monotonic())
+        assert current_ledger() is None
+        (record,) = ledger.records
+        assert record.stage == "summarize"
+        assert record.input_tokens == 100
+        assert record.output_tokens == 50
+        assert record.cache_read_input_tokens == 10
+        assert record.latency_s >= 0
+
+    def test_ignores_mocked_usage(self):
+        ledger = UsageLedger()
+        with usage_scope(ledger):
+            record_usage("summarize", "m", MagicMock(), time.monotonic())
+            record_usage("summarize", "m", SimpleNamespace(), time.monotonic())
+        assert ledger.records == ()
+
+    def test_missing_cache_fields_default_to_zero(self):
+        ledger = UsageLedger()
+        response = SimpleNamespace(usage=SimpleNamespace(
+            input_tokens=5, output_tokens=2, cache_creation_input_tokens=None,
+        ))
+        with usage_scope(ledger):
+            record_usage("decompose", "m", response, time.monotonic())
+        assert ledger.records[0].cache_creation_input_tokens == 0
+        assert ledger.records[0].cache_read_input_tokens == 0
+
+    @pytest.mark.asyncio
+    async def test_follows_tasks_and_threads(self):
+        """Async tasks and to_thread calls record into the run's ledger."""
+        ledger = UsageLedger()
+
+        async def async_call():
+            record_usage("relevance", "m", _response(), time.monotonic())
+
+        def sync_call():
+            record_usage("decompose", "m", _response(), time.monotonic())
+
+        with usage_scope(ledger):
+            await asyncio.gather(async_call(), async_call(), asyncio.to_thread(sync_call))
+        assert sorted(r.stage for r in ledger.records) == ["decompose", "relevance", "relevance"]
+
+
+class TestLedgerSummary:
+    def test_totals_by_stage_and_model(self):
+        ledger = UsageLedger()
+        ledger.add(UsageRecord("summarize", "claude-haiku-4-5", 1000, 100, latency_s=1.0))
+        ledger.add(UsageRecord("summarize", "claude-haiku-4-5", 2000, 200, latency_s=2.0))
+        ledger.add(UsageRecord("synthesize", "claude-sonnet-4", 5000, 1000, latency_s=10.0))
+
+        summary = ledger.summary()
+        assert summary.total.calls == 3
+        assert summary.total.input_tokens == 8000
+        assert summary.total.output_tokens == 1300
+        assert summary.total.latency_s == pytest.approx(13.0)
+        assert summary.by_stage["summarize"].calls == 2
+        assert summary.by_stage["summarize"].input_tokens == 3000
+        assert summary.by_model["claude-sonnet-4"].cost_usd == pytest.approx(
+            (5000 * 3.0 + 1000 * 15.0) / 1_000_000
+        )
+
+    def test_empty_ledger(self):
+        summary = UsageLedger().summary()
+        assert summary.total.calls == 0
+        assert summary.by_stage == {}
+
+
+class TestPersistence:
+    def test_save_and_load_round_trip(self, tmp_path):
+        ledger = UsageLedger()
+        ledger.add(UsageRecord("summarize", "claude-haiku-4-5", 1000, 100))
+        path = save_usage(ledger.summary(), "query", "standard", tmp_path)
+
+        data = json.loads(path.read_text())
+        assert data["query"] == "query"
+        assert data["mode"] == "standard"
+        assert data["by_stage"]["summarize"]["input_tokens"] == 1000
+
+        history = load_usage_history(tmp_path)
+        assert len(history) == 1
+        assert history[0]["total"]["calls"] == 1
+
+    def test_load_newest_first_with_limit(self, tmp_path):
+        for i in range(4):
+            (tmp_path / f"usage-{1000 + i}.json").write_text(
+                json.dumps({"query": f"q{i}", "total": {"calls": i}})
+            )
+        history = load_usage_history(tmp_path, limit=2)
+        assert [h["query"] for h in history] == ["q3", "q2"]
+
+    def test_load_skips_malformed(self, tmp_path):
+        (tmp_path / "usage-1.json").write_text("{not json")
+        (tmp_path / "usage-2.json").write_text(json.dumps({"total": "bad"}))
+        (tmp_path / "usage-3.json").write_text(json.dumps({"total": {"calls": 1}}))
+        assert len(load_usage_history(tmp_path)) == 1
+
+    def test_load_missing_dir(self, tmp_path):
+        assert load_usage_history(tmp_path / "nope") == []
+
+
+class TestCombineUsage:
+    def test_sums_totals_stages_and_models(self):
+        a = UsageSummary(
+            total=UsageTotals(calls=2, input_tokens=100, cost_usd=0.1),
+            by_stage={"summarize": UsageTotals(calls=2, input_tokens=100, cost_usd=0.1)},
+            by_model={"m": UsageTotals(calls=2, input_tokens=100, cost_usd=0.1)},
+        )
+        b = UsageSummary(
+            total=UsageTotals(calls=1, output_tokens=50, cost_usd=0.2),
+            by_stage={"synthesize": UsageTotals(calls=1, output_tokens=50, cost_usd=0.2)},
+            by_model={"m": UsageTotals(calls=1, output_tokens=50, cost_usd=0.2)},
+        )
+        combined = combine_usage([a, b])
+        assert combined.total.calls == 3
+        assert combined.total.cost_usd == pytest.approx(0.3)
+        assert set(combined.by_stage) == {"summarize", "synthesize"}
+        assert combined.by_model["m"] == UsageTotals(
+            calls=3, input_tokens=100, output_tokens=50, cost_usd=0.3,
+        )
+
+    def test_empty(self):
+        assert combine_usage([]) == UsageSummary()